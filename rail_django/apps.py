@@ -19,6 +19,17 @@ class AppConfig(AppConfig):
             dispatch_uid="rail_django.sqlite_connection_configuration",
         )
 
+        try:
+            from rail_django.core.model_versions import (
+                ensure_model_version_signals,
+                model_version_signals_required,
+            )
+
+            if model_version_signals_required():
+                ensure_model_version_signals()
+        except Exception as exc:
+            logger.debug("Failed to connect model version signals: %s", exc)
+
         # Register existing templates for models that might have been loaded early
         try:
             from rail_django.extensions.templating.registry import (
@@ -133,6 +144,7 @@ def _prebuild_graphql_schemas_on_startup() -> None:
                 continue
             schema_registry.get_schema_instance(schema_name)
             prebuilt += 1
+            _compile_persisted_queries_on_startup(schema_name)
         except Exception as exc:
             logger.debug(
                 "Deferred schema prebuild for '%s' at startup: %s",
@@ -144,6 +156,19 @@ def _prebuild_graphql_schemas_on_startup() -> None:
         logger.info("Prebuilt %s GraphQL schema(s) on startup.", prebuilt)
 
 
+def _compile_persisted_queries_on_startup(schema_name: str) -> None:
+    try:
+        from rail_django.extensions.persisted_queries import warm_persisted_queries
+
+        warm_persisted_queries(schema_name)
+    except Exception as exc:
+        logger.warning(
+            "Failed to compile persisted queries for '%s' at startup: %s",
+            schema_name,
+            exc,
+        )
+
+
 def _normalize_sqlite_journal_mode(raw_mode: object) -> str | None:
     mode = str(raw_mode or "").strip().upper()
     if not mode:
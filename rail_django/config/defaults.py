@@ -57,6 +57,8 @@ LIBRARY_DEFAULTS: dict[str, Any] = {
         "enable_estimated_counts": True,
         "estimated_count_min_rows": 50000,
         "default_count_mode": "auto",
+        "count_cache_timeout": 300,
+        "count_cap": 10000,
         "additional_lookup_fields": {},
         "require_model_permissions": True,
         "model_permission_codename": "view",
@@ -66,6 +68,8 @@ LIBRARY_DEFAULTS: dict[str, Any] = {
         "fts_config": "english",
         "fts_search_type": "websearch",
         "fts_rank_threshold": None,
+        "quick_search_backend": "auto",
+        "workload_sample_rate": 0.0,
         # Security & Complexity Limits
         "max_filter_depth": 5,
         "max_filter_clauses": 50,
@@ -115,6 +119,14 @@ LIBRARY_DEFAULTS: dict[str, Any] = {
         "query_cache_timeout": 300,
         "query_cache_user_specific": False,
         "query_cache_scope": "schema",
+        "document_cache_size": 500,
+        "query_plan_cache_size": 1000,
+        "json_decoder": None,
+        "json_encoder": None,
+        "streaming_responses": False,
+        "streaming_chunk_size": 65536,
+        "incremental_delivery": False,
+        "http_conditional_caching": False,
     },
     "persisted_query_settings": {
         "enabled": False,
@@ -126,6 +138,7 @@ LIBRARY_DEFAULTS: dict[str, Any] = {
         "allowlist_path": None,
         "hash_algorithm": "sha256",
         "max_query_length": 0,
+        "compile_allowlist": False,
     },
     "multitenancy_settings": {
         "enabled": True,
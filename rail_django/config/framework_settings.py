@@ -269,6 +269,10 @@ AUDIT_REDACTION_MASK = "***REDACTED***"
 # Anomaly Detection (requires Redis)
 SECURITY_REDIS_URL = None  # e.g., "redis://localhost:6379/0"
 SECURITY_REDIS_PREFIX = "rail:security:"
+# Dotted path of the anomaly backend class (defaults to the Redis backend)
+SECURITY_ANOMALY_BACKEND = None
+# Seconds between blocklist version polls; 0 checks the backend on every lookup
+SECURITY_BLOCKLIST_REFRESH_INTERVAL = 1.0
 SECURITY_ANOMALY_THRESHOLDS = {
     "login_failure_per_ip": 10,
     "login_failure_per_user": 5,
@@ -37,6 +37,10 @@ CACHES = {
     }
 }
 
+SECURITY_ANOMALY_BACKEND = (
+    "rail_django.security.anomaly.backends.memory.InMemoryAnomalyBackend"
+)
+
 
 def _sqlite_json_valid(value):
     if value is None:
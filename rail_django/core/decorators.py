@@ -90,6 +90,32 @@ def field(
     return decorator
 
 
+def ordering_expression(expression: Any):
+    """
+    Decorator declaring the ORM expression equivalent to a model property.
+
+    Ordering by the property then becomes an annotation plus ``ORDER BY`` in
+    SQL instead of sorting materialized rows in Python. ``expression`` may be
+    a callable returning the expression, to defer building it.
+
+    Example:
+        @property
+        @ordering_expression(Concat("first_name", Value(" "), "last_name"))
+        def full_name(self):
+            return f"{self.first_name} {self.last_name}"
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        wrapper._graphql_ordering_expression = expression
+        return wrapper
+
+    return decorator
+
+
 def mutation(
     input_type: Optional[type[graphene.InputObjectType]] = None,
     output_type: Optional[type[graphene.ObjectType]] = None,
@@ -0,0 +1,297 @@
+"""
+Parsed and validated GraphQL document cache.
+
+Clients tend to send a small, fixed set of operations many times over, so
+parsing and validating the same query text on every request is wasted work.
+This module keeps a bounded LRU of parsed ``DocumentNode`` objects keyed by
+``(schema name, schema version, sha256(query))`` together with the validation
+errors computed against the schema that produced them.
+
+The cache is shared by the multi-schema view (GET checks, introspection
+detection and execution) and by the security and complexity middlewares,
+which read the request document through :func:`get_request_document`.
+
+Values derived from a document (depth, complexity, field lists, ...) can be
+memoized next to it with :meth:`DocumentCache.get_artifact`, so analyses that
+only depend on the document text run once per distinct operation. Artifacts
+live on the cache entry and are dropped with it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Optional, Sequence, TypeVar
+
+from graphql import (
+    DocumentNode,
+    FragmentDefinitionNode,
+    GraphQLError,
+    OperationDefinitionNode,
+    parse,
+    validate,
+)
+
+from ..config_proxy import get_setting
+
+DEFAULT_DOCUMENT_CACHE_SIZE = 500
+
+T = TypeVar("T")
+
+# Attribute used to attach the cached document to the GraphQL context.
+REQUEST_DOCUMENT_ATTR = "_rail_graphql_document"
+
+
+def hash_query(query: str) -> str:
+    """Return the sha256 hex digest used to identify a query text."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedDocument:
+    """A parsed document plus the validation results computed for it."""
+
+    query_hash: str
+    document: DocumentNode
+    _validations: list[tuple[Any, Any, list[GraphQLError]]] = field(
+        default_factory=list, repr=False
+    )
+    # Single-operation documents of a multi-operation document, by operation.
+    _operation_documents: dict[int, DocumentNode] = field(
+        default_factory=dict, repr=False
+    )
+    # Artifacts keyed by (id of entry.document or operation document, key).
+    _artifacts: dict[tuple[int, Hashable], Any] = field(
+        default_factory=dict, repr=False
+    )
+
+    def get_validation_errors(
+        self, schema: Any, rules: Optional[Sequence[Any]] = None
+    ) -> Optional[list[GraphQLError]]:
+        """Return cached validation errors for *schema*/*rules*, if any."""
+        for cached_schema, cached_rules, errors in self._validations:
+            if cached_schema is schema and cached_rules == _rules_key(rules):
+                return errors
+        return None
+
+    def set_validation_errors(
+        self,
+        schema: Any,
+        rules: Optional[Sequence[Any]],
+        errors: list[GraphQLError],
+    ) -> None:
+        key = _rules_key(rules)
+        self._validations = [
+            entry
+            for entry in self._validations
+            if not (entry[0] is schema and entry[1] == key)
+        ]
+        self._validations.append((schema, key, errors))
+
+
+def _rules_key(rules: Optional[Sequence[Any]]) -> Optional[tuple[Any, ...]]:
+    if rules is None:
+        return None
+    return tuple(rules)
+
+
+class DocumentCache:
+    """Thread-safe bounded LRU of parsed and validated GraphQL documents."""
+
+    def __init__(self, max_size: int = DEFAULT_DOCUMENT_CACHE_SIZE):
+        self.max_size = max(0, int(max_size))
+        self._entries: OrderedDict[tuple[str, str, str], CachedDocument] = (
+            OrderedDict()
+        )
+        # Documents owned by cached entries (the entries keep them alive).
+        self._documents: dict[int, CachedDocument] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_document(
+        self,
+        query: str,
+        *,
+        schema_name: Optional[str] = None,
+        schema_version: Any = None,
+    ) -> CachedDocument:
+        """Return the cached document for *query*, parsing it on a miss.
+
+        Raises:
+            GraphQLError: If the query text cannot be parsed. Syntax errors
+                are not cached.
+        """
+        query_hash = hash_query(query)
+        key = (str(schema_name or ""), str(schema_version or 0), query_hash)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = CachedDocument(query_hash=query_hash, document=parse(query))
+        if self.max_size <= 0:
+            return entry
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing
+            self._entries[key] = entry
+            self._documents[id(entry.document)] = entry
+            while len(self._entries) > self.max_size:
+                _key, evicted = self._entries.popitem(last=False)
+                self._documents.pop(id(evicted.document), None)
+                for document in evicted._operation_documents.values():
+                    self._documents.pop(id(document), None)
+        return entry
+
+    def get_operation_document(
+        self, entry: CachedDocument, operation: OperationDefinitionNode
+    ) -> DocumentNode:
+        """Return a document holding *operation* of *entry* and its fragments.
+
+        The document is built once per operation, so artifacts computed for
+        it are shared by later requests executing the same operation.
+        """
+        with self._lock:
+            document = entry._operation_documents.get(id(operation))
+            if document is not None:
+                return document
+            fragments = [
+                definition
+                for definition in entry.document.definitions
+                if isinstance(definition, FragmentDefinitionNode)
+            ]
+            document = DocumentNode(definitions=[operation, *fragments])
+            entry._operation_documents[id(operation)] = document
+            if self._documents.get(id(entry.document)) is entry:
+                self._documents[id(document)] = entry
+            return document
+
+    def validate(
+        self,
+        entry: CachedDocument,
+        schema: Any,
+        rules: Optional[Sequence[Any]] = None,
+        max_errors: Optional[int] = None,
+    ) -> list[GraphQLError]:
+        """Validate *entry* against *schema*, reusing earlier results."""
+        errors = entry.get_validation_errors(schema, rules)
+        if errors is not None:
+            return errors
+        errors = validate(schema, entry.document, rules, max_errors)
+        with self._lock:
+            entry.set_validation_errors(schema, rules, errors)
+        return errors
+
+    def get_artifact(
+        self,
+        document: DocumentNode | CachedDocument,
+        key: Hashable,
+        factory: Callable[[], T],
+    ) -> T:
+        """Return the value memoized for (*document*, *key*), computing it once.
+
+        *document* is a cache entry, its document or one of its operation
+        documents; the value is stored on the entry and evicted with it.
+        Other documents are built per request and could never be looked up
+        again, so their values are computed without being stored.
+        """
+        if isinstance(document, CachedDocument):
+            entry, document = document, document.document
+        else:
+            with self._lock:
+                entry = self._documents.get(id(document))
+        if entry is None:
+            return factory()
+
+        cache_key = (id(document), key)
+        try:
+            return entry._artifacts[cache_key]
+        except KeyError:
+            pass
+        value = factory()
+        with self._lock:
+            entry._artifacts.setdefault(cache_key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._documents.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "artifacts": sum(len(entry._artifacts) for entry in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_document_cache: Optional[DocumentCache] = None
+_document_cache_lock = threading.Lock()
+
+
+def get_document_cache() -> DocumentCache:
+    """Return the process-wide document cache, creating it on first use."""
+    global _document_cache
+    if _document_cache is not None:
+        return _document_cache
+    with _document_cache_lock:
+        if _document_cache is None:
+            size = get_setting(
+                "performance_settings.document_cache_size",
+                DEFAULT_DOCUMENT_CACHE_SIZE,
+            )
+            try:
+                size = int(size)
+            except (TypeError, ValueError):
+                size = DEFAULT_DOCUMENT_CACHE_SIZE
+            _document_cache = DocumentCache(size)
+        return _document_cache
+
+
+def reset_document_cache() -> None:
+    """Drop the process-wide cache so it is rebuilt from current settings."""
+    global _document_cache
+    with _document_cache_lock:
+        _document_cache = None
+
+
+def get_request_document(info: Any) -> DocumentNode:
+    """Return the document being executed for a resolver ``info``.
+
+    Uses the cached document attached to the context by the view when it
+    contains the executing operation (or the cached single-operation document
+    of a multi-operation entry), and otherwise rebuilds a document from
+    ``info.operation`` and ``info.fragments``.
+    """
+    context = getattr(info, "context", None)
+    entry = getattr(context, REQUEST_DOCUMENT_ATTR, None)
+    operation = getattr(info, "operation", None)
+    if isinstance(entry, CachedDocument) and operation is not None:
+        operations = [
+            definition
+            for definition in entry.document.definitions
+            if isinstance(definition, OperationDefinitionNode)
+        ]
+        if len(operations) == 1 and operations[0] is operation:
+            return entry.document
+        if any(candidate is operation for candidate in operations):
+            return get_document_cache().get_operation_document(entry, operation)
+    fragments = list((getattr(info, "fragments", None) or {}).values())
+    definitions = [operation] if operation is not None else []
+    return DocumentNode(definitions=definitions + fragments)
@@ -0,0 +1,126 @@
+"""
+Execution context shared by the GraphQL views.
+
+Model instances completed as one list (a root queryset, a page of items, a
+nested relation) are recorded as *peers* on the request context. Relation
+loaders resolving a field on one instance use its peers to batch the lookup
+for the whole list, including lists returned by custom root resolvers the
+query optimizer never saw.
+
+Under async execution (the ASGI view) the request context is marked so the
+generated resolvers return awaitables reading through Django's async ORM
+API; synchronous work runs in worker threads via :func:`run_in_worker`.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Sequence
+
+from asgiref.sync import sync_to_async
+from django.db import models
+from graphql import ExecutionContext
+
+REQUEST_PEERS_ATTR = "_rail_relation_peers"
+ASYNC_EXECUTION_ATTR = "_rail_async_execution"
+ATTRIBUTE_RESOLVER_ATTR = "_rail_attribute_resolver"
+
+_sync_only = threading.local()
+
+
+def add_peers(context: Any, instances: Sequence[Any]) -> None:
+    """Record *instances* as one peer group on the request context.
+
+    Instances already belonging to a group keep it, so the widest group
+    (usually the first one seen) wins.
+    """
+    if context is None or len(instances) < 2:
+        return
+    peers = getattr(context, REQUEST_PEERS_ATTR, None)
+    if not isinstance(peers, dict):
+        peers = {}
+        try:
+            setattr(context, REQUEST_PEERS_ATTR, peers)
+        except Exception:
+            return
+    group = list(instances)
+    for instance in group:
+        peers.setdefault(id(instance), group)
+
+
+def get_peers(context: Any, instance: Any) -> Sequence[Any]:
+    """Return the peer group of *instance*, or an empty tuple."""
+    peers = getattr(context, REQUEST_PEERS_ATTR, None)
+    if not isinstance(peers, dict):
+        return ()
+    return peers.get(id(instance), ())
+
+
+def mark_async_execution(context: Any) -> None:
+    """Mark *context* as executed by ``AsyncExecutionMiddleware``."""
+    if context is None:
+        return
+    try:
+        setattr(context, ASYNC_EXECUTION_ATTR, True)
+    except Exception:
+        pass
+
+
+def is_async_execution(info: Any) -> bool:
+    """Return True when resolvers for *info* may return awaitables."""
+    if getattr(_sync_only, "depth", 0):
+        return False
+    context = getattr(info, "context", None)
+    return bool(getattr(context, ASYNC_EXECUTION_ATTR, False))
+
+
+def mark_attribute_resolver(resolver: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark *resolver* as reading a model attribute without side effects.
+
+    Under async execution it then runs on the event loop when the field is
+    already loaded, like a default resolver.
+    """
+    setattr(resolver, ATTRIBUTE_RESOLVER_ATTR, True)
+    return resolver
+
+
+@contextmanager
+def synchronous_execution() -> Iterator[None]:
+    """Make resolvers called in this thread return plain values.
+
+    Used where a result must be complete when the resolver returns, such as
+    the query result cache storing it.
+    """
+    _sync_only.depth = getattr(_sync_only, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _sync_only.depth -= 1
+
+
+def run_in_worker(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Awaitable[Any]:
+    """Run *func* in the request's worker thread and return an awaitable of its result.
+
+    Django's ASGI handler gives each request its own thread-sensitive
+    executor, which the async ORM API uses too, so every call of a request
+    shares one thread and one database connection. Django closes or recycles
+    it at the end of the request (``CONN_MAX_AGE``).
+    """
+    return sync_to_async(func, thread_sensitive=True)(*args, **kwargs)
+
+
+class PeerTrackingExecutionContext(ExecutionContext):
+    """Execution context recording completed model lists as peer groups."""
+
+    def complete_list_value(self, return_type, field_nodes, info, path, result):
+        if isinstance(result, models.QuerySet):
+            result = list(result)
+        if (
+            isinstance(result, list)
+            and len(result) > 1
+            and isinstance(result[0], models.Model)
+        ):
+            add_peers(self.context_value, result)
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
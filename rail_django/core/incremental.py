@@ -0,0 +1,509 @@
+"""
+Incremental delivery (``@defer`` / ``@stream``) for GraphQL query operations.
+
+graphql-core 3.2 executes a whole operation before returning, so this module
+adds the two directives and an execution context that leaves their work
+pending:
+
+* fragments marked ``@defer`` are not collected with the rest of the
+  selection set; their fields are executed on the already resolved parent
+  value once the initial result has been built;
+* list fields marked ``@stream`` complete their first ``initialCount`` items
+  in the initial result and the remaining items in later payloads.
+
+:func:`execute_incremental` returns the initial :class:`ExecutionResult`
+and an :class:`IncrementalExecution` iterating the subsequent payloads in
+the shape used by the ``multipart/mixed`` incremental delivery format::
+
+    {"incremental": [{"data": {...}, "path": [...], "label": "..."}], "hasNext": true}
+
+Resolvers run synchronously; subsequent payloads are computed while the
+previous ones are being sent.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from graphql import (
+    DirectiveLocation,
+    DocumentNode,
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLArgument,
+    GraphQLBoolean,
+    GraphQLDirective,
+    GraphQLError,
+    GraphQLInt,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+    InlineFragmentNode,
+    OperationType,
+    SelectionSetNode,
+    located_error,
+    specified_directives,
+)
+from graphql.execution.collect_fields import (
+    does_fragment_condition_match,
+    get_field_entry_key,
+    should_include_node,
+)
+from graphql.execution.values import get_directive_values
+from graphql.pyutils import Path, is_iterable
+
+try:
+    from graphql.execution.execute import CollectedErrors
+except ImportError:  # pragma: no cover - private API; older releases use ``errors``
+    CollectedErrors = None
+
+from .document_cache import get_document_cache
+from .execution import PeerTrackingExecutionContext
+
+# Remaining streamed items are sent in payloads of at most this many items.
+STREAM_BATCH_SIZE = 100
+
+GraphQLDeferDirective = GraphQLDirective(
+    name="defer",
+    locations=[DirectiveLocation.FRAGMENT_SPREAD, DirectiveLocation.INLINE_FRAGMENT],
+    args={
+        "if": GraphQLArgument(
+            GraphQLNonNull(GraphQLBoolean),
+            default_value=True,
+            description="Deferred when true or undefined.",
+        ),
+        "label": GraphQLArgument(GraphQLString, description="Unique name"),
+    },
+    description="Directs the executor to defer this fragment when the `if` argument is true or undefined.",
+)
+
+GraphQLStreamDirective = GraphQLDirective(
+    name="stream",
+    locations=[DirectiveLocation.FIELD],
+    args={
+        "if": GraphQLArgument(
+            GraphQLNonNull(GraphQLBoolean),
+            default_value=True,
+            description="Stream when true or undefined.",
+        ),
+        "label": GraphQLArgument(GraphQLString, description="Unique name"),
+        "initialCount": GraphQLArgument(
+            GraphQLInt,
+            default_value=0,
+            description="Number of items to return immediately",
+        ),
+    },
+    description="Directs the executor to stream plural fields when the `if` argument is true or undefined.",
+)
+
+INCREMENTAL_DIRECTIVES = (GraphQLDeferDirective, GraphQLStreamDirective)
+_INCREMENTAL_DIRECTIVE_NAMES = frozenset(
+    directive.name for directive in INCREMENTAL_DIRECTIVES
+)
+
+
+def get_incremental_directives() -> list[GraphQLDirective]:
+    """Return the directives of a schema supporting incremental delivery."""
+    return [*specified_directives, *INCREMENTAL_DIRECTIVES]
+
+
+def schema_supports_incremental_delivery(schema: GraphQLSchema) -> bool:
+    return schema.get_directive("defer") is GraphQLDeferDirective
+
+
+def document_uses_incremental_delivery(document: DocumentNode) -> bool:
+    """Return whether *document* contains ``@defer`` or ``@stream``."""
+    return get_document_cache().get_artifact(
+        document, "incremental_directives", lambda: _has_incremental_directives(document)
+    )
+
+
+def _has_incremental_directives(document: DocumentNode) -> bool:
+    stack: list[Any] = list(document.definitions)
+    while stack:
+        node = stack.pop()
+        for directive in getattr(node, "directives", None) or ():
+            if directive.name.value in _INCREMENTAL_DIRECTIVE_NAMES:
+                return True
+        selection_set = getattr(node, "selection_set", None)
+        if selection_set is not None:
+            stack.extend(selection_set.selections)
+    return False
+
+
+FieldMap = Dict[str, List[FieldNode]]
+DeferredFields = List[Tuple[Optional[str], FieldMap]]
+
+
+def _defer_label(node: Any, variable_values: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    defer = get_directive_values(GraphQLDeferDirective, node, variable_values)
+    if not defer or not defer.get("if", True):
+        return False, None
+    return True, defer.get("label")
+
+
+def collect_incremental_fields(
+    schema: GraphQLSchema,
+    fragments: Dict[str, FragmentDefinitionNode],
+    variable_values: Dict[str, Any],
+    runtime_type: GraphQLObjectType,
+    selection_sets: Sequence[SelectionSetNode],
+) -> Tuple[FieldMap, DeferredFields]:
+    """Collect fields like graphql-core, setting ``@defer`` fragments aside.
+
+    Returns the fields to execute now and one ``(label, fields)`` entry per
+    deferred fragment.
+    """
+    fields: FieldMap = {}
+    deferred: DeferredFields = []
+    visited: Set[str] = set()
+    for selection_set in selection_sets:
+        _collect(
+            schema, fragments, variable_values, runtime_type,
+            selection_set, fields, deferred, visited,
+        )
+    return fields, deferred
+
+
+def _collect(
+    schema: GraphQLSchema,
+    fragments: Dict[str, FragmentDefinitionNode],
+    variable_values: Dict[str, Any],
+    runtime_type: GraphQLObjectType,
+    selection_set: SelectionSetNode,
+    fields: FieldMap,
+    deferred: Optional[DeferredFields],
+    visited: Set[str],
+) -> None:
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if not should_include_node(variable_values, selection):
+                continue
+            fields.setdefault(get_field_entry_key(selection), []).append(selection)
+            continue
+
+        if isinstance(selection, InlineFragmentNode):
+            if not should_include_node(
+                variable_values, selection
+            ) or not does_fragment_condition_match(schema, selection, runtime_type):
+                continue
+            fragment_selection_set = selection.selection_set
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            if name in visited or not should_include_node(variable_values, selection):
+                continue
+            visited.add(name)
+            fragment = fragments.get(name)
+            if not fragment or not does_fragment_condition_match(
+                schema, fragment, runtime_type
+            ):
+                continue
+            fragment_selection_set = fragment.selection_set
+        else:  # pragma: no cover
+            continue
+
+        is_deferred, label = _defer_label(selection, variable_values)
+        if is_deferred and deferred is not None:
+            # Nested deferred fragments are delivered with their parent.
+            deferred_fields: FieldMap = {}
+            _collect(
+                schema, fragments, variable_values, runtime_type,
+                fragment_selection_set, deferred_fields, None, visited,
+            )
+            if deferred_fields:
+                deferred.append((label, deferred_fields))
+            continue
+        _collect(
+            schema, fragments, variable_values, runtime_type,
+            fragment_selection_set, fields, deferred, visited,
+        )
+
+
+def is_deferred_selection(info: Any, *field_names: str) -> bool:
+    """Return whether the named sub-fields are only selected inside ``@defer`` fragments.
+
+    Resolvers use this to postpone work that only deferred fields need.
+    """
+    found_deferred = False
+    stack: list[tuple[SelectionSetNode, bool]] = [
+        (node.selection_set, False)
+        for node in getattr(info, "field_nodes", None) or ()
+        if node.selection_set is not None
+    ]
+    fragments = getattr(info, "fragments", None) or {}
+    variable_values = getattr(info, "variable_values", None) or {}
+    visited: Set[str] = set()
+    while stack:
+        selection_set, in_deferred = stack.pop()
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                if selection.name.value in field_names:
+                    if not in_deferred:
+                        return False
+                    found_deferred = True
+                continue
+            if isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                if name in visited:
+                    continue
+                visited.add(name)
+                fragment = fragments.get(name)
+                if fragment is None:
+                    continue
+                fragment_selection_set = fragment.selection_set
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_selection_set = selection.selection_set
+            else:  # pragma: no cover
+                continue
+            is_deferred, _label = _defer_label(selection, variable_values)
+            stack.append((fragment_selection_set, in_deferred or is_deferred))
+    return found_deferred
+
+
+@dataclass
+class SubsequentPayload:
+    """One entry of the ``incremental`` list of a subsequent payload."""
+
+    path: List[Any]
+    label: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+    items: Optional[List[Any]] = None
+    errors: List[GraphQLError] = field(default_factory=list)
+
+    @property
+    def is_stream(self) -> bool:
+        return self.items is not None
+
+
+@dataclass
+class _DeferredFragment:
+    label: Optional[str]
+    parent_type: GraphQLObjectType
+    source: Any
+    path: Optional[Path]
+    fields: FieldMap
+
+    def execute(self, context: "IncrementalExecutionContext") -> SubsequentPayload:
+        payload = SubsequentPayload(
+            path=self.path.as_list() if self.path else [], label=self.label
+        )
+        try:
+            payload.data = context.ensure_sync(
+                context.execute_fields(self.parent_type, self.source, self.path, self.fields)
+            )
+        except GraphQLError as error:
+            context.add_error(error, self.path)
+        return payload
+
+
+@dataclass
+class _StreamedItems:
+    label: Optional[str]
+    item_type: Any
+    field_nodes: List[FieldNode]
+    info: Any
+    path: Path
+    start: int
+    items: List[Any]
+
+    def execute(self, context: "IncrementalExecutionContext") -> SubsequentPayload:
+        completed: List[Any] = []
+        for offset, item in enumerate(self.items):
+            item_path = self.path.add_key(self.start + offset, None)
+            try:
+                completed.append(
+                    context.ensure_sync(
+                        context.complete_value(
+                            self.item_type, self.field_nodes, self.info, item_path, item
+                        )
+                    )
+                )
+            except Exception as raw_error:
+                error = located_error(raw_error, self.field_nodes, item_path.as_list())
+                context.add_error(error, item_path)
+                completed.append(None)
+        return SubsequentPayload(
+            path=self.path.add_key(self.start, None).as_list(),
+            label=self.label,
+            items=completed,
+        )
+
+
+class IncrementalExecutionContext(PeerTrackingExecutionContext):
+    """Execution context leaving ``@defer`` and ``@stream`` work pending."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.pending: Deque[Any] = deque()
+        self._incremental_subfields: Dict[Tuple, Tuple[FieldMap, DeferredFields]] = {}
+
+    @property
+    def execution_errors(self) -> List[GraphQLError]:
+        """Errors recorded so far (``collected_errors`` or ``errors``, by release)."""
+        if CollectedErrors is None:
+            return self.errors
+        return self.collected_errors.errors
+
+    def add_error(self, error: GraphQLError, path: Optional[Path]) -> None:
+        if CollectedErrors is None:
+            self.errors.append(error)
+        else:
+            self.collected_errors.add(error, path)
+
+    def reset_errors(self) -> None:
+        if CollectedErrors is None:
+            self.errors = []
+        else:
+            self.collected_errors = CollectedErrors()
+
+    def ensure_sync(self, value: Any) -> Any:
+        if self.is_awaitable(value):
+            close = getattr(value, "close", None)
+            if close is not None:
+                close()
+            raise GraphQLError("Incremental delivery requires synchronous resolvers.")
+        return value
+
+    def execute_operation(self, operation, root_value):
+        if operation.operation != OperationType.QUERY:
+            return super().execute_operation(operation, root_value)
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return super().execute_operation(operation, root_value)
+        fields, deferred = collect_incremental_fields(
+            self.schema, self.fragments, self.variable_values, root_type,
+            [operation.selection_set],
+        )
+        self._defer(root_type, root_value, None, deferred)
+        return self.execute_fields(root_type, root_value, None, fields)
+
+    def collect_subfields(self, return_type, field_nodes):
+        return self._collect_incremental_subfields(return_type, field_nodes)[0]
+
+    def complete_object_value(self, return_type, field_nodes, info, path, result):
+        completed = super().complete_object_value(
+            return_type, field_nodes, info, path, result
+        )
+        deferred = self._collect_incremental_subfields(return_type, field_nodes)[1]
+        if deferred:
+            self._defer(return_type, result, path, deferred)
+        return completed
+
+    def complete_list_value(self, return_type, field_nodes, info, path, result):
+        stream = get_directive_values(
+            GraphQLStreamDirective, field_nodes[0], self.variable_values
+        )
+        if not stream or not stream.get("if", True) or not is_iterable(result):
+            return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+        items = list(result)
+        initial_count = max(0, int(stream.get("initialCount") or 0))
+        for start in range(initial_count, len(items), STREAM_BATCH_SIZE):
+            self.pending.append(
+                _StreamedItems(
+                    label=stream.get("label"),
+                    item_type=return_type.of_type,
+                    field_nodes=field_nodes,
+                    info=info,
+                    path=path,
+                    start=start,
+                    items=items[start : start + STREAM_BATCH_SIZE],
+                )
+            )
+        return super().complete_list_value(
+            return_type, field_nodes, info, path, items[:initial_count]
+        )
+
+    def _collect_incremental_subfields(self, return_type, field_nodes):
+        key = (
+            (return_type, id(field_nodes[0]))
+            if len(field_nodes) == 1
+            else tuple((return_type, *map(id, field_nodes)))
+        )
+        collected = self._incremental_subfields.get(key)
+        if collected is None:
+            collected = collect_incremental_fields(
+                self.schema, self.fragments, self.variable_values, return_type,
+                [node.selection_set for node in field_nodes if node.selection_set],
+            )
+            self._incremental_subfields[key] = collected
+        return collected
+
+    def _defer(self, parent_type, source, path, deferred: DeferredFields) -> None:
+        for label, fields in deferred:
+            self.pending.append(_DeferredFragment(label, parent_type, source, path, fields))
+
+    def iter_subsequent_payloads(self) -> Iterator[Tuple[SubsequentPayload, bool]]:
+        """Execute the pending work, yielding ``(payload, has_next)`` pairs."""
+        while self.pending:
+            record = self.pending.popleft()
+            self.reset_errors()
+            payload = record.execute(self)
+            payload.errors = list(self.execution_errors)
+            yield payload, bool(self.pending)
+
+
+class IncrementalExecution:
+    """Subsequent payloads of an operation executed with :func:`execute_incremental`."""
+
+    def __init__(self, context: Optional[IncrementalExecutionContext]):
+        self._context = context
+
+    @property
+    def has_next(self) -> bool:
+        return self._context is not None and bool(self._context.pending)
+
+    def __iter__(self) -> Iterator[Tuple[SubsequentPayload, bool]]:
+        if self._context is None:
+            return iter(())
+        return self._context.iter_subsequent_payloads()
+
+
+def execute_incremental(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    root_value: Any = None,
+    context_value: Any = None,
+    variable_values: Optional[Dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+    middleware: Any = None,
+    execution_context_class: Optional[type] = None,
+) -> Tuple[ExecutionResult, IncrementalExecution]:
+    """Execute a query, returning its initial result and pending payloads.
+
+    ``execution_context_class`` may be a subclass of
+    :class:`IncrementalExecutionContext`; any other class is ignored.
+    """
+    context_class = IncrementalExecutionContext
+    if execution_context_class is not None and issubclass(
+        execution_context_class, IncrementalExecutionContext
+    ):
+        context_class = execution_context_class
+
+    context = context_class.build(
+        schema,
+        document,
+        root_value,
+        context_value,
+        variable_values,
+        operation_name,
+        middleware=middleware,
+    )
+    if isinstance(context, list):
+        return ExecutionResult(data=None, errors=context), IncrementalExecution(None)
+
+    try:
+        data = context.ensure_sync(
+            context.execute_operation(context.operation, root_value)
+        )
+    except GraphQLError as error:
+        context.add_error(error, None)
+        context.pending.clear()
+        data = None
+    result = context.build_response(data, context.execution_errors)
+    return result, IncrementalExecution(context)
@@ -26,6 +26,7 @@ from .config import (
     FieldGuardConfig,
     FilterFieldConfig,
     FilteringConfig,
+    HttpCacheConfig,
     OperationGuardConfig,
     OrderingConfig,
     PipelineConfig,
@@ -51,4 +52,5 @@ __all__ = [
     "AccessControlConfig",
     "ClassificationConfig",
     "PipelineConfig",
+    "HttpCacheConfig",
 ]
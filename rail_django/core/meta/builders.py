@@ -16,6 +16,7 @@ from .config import (
     ClassificationConfig,
     FieldExposureConfig,
     FilteringConfig,
+    HttpCacheConfig,
     OrderingConfig,
     PipelineConfig,
     ResolverConfig,
@@ -135,12 +136,14 @@ def build_ordering_config(meta_config: Any, model_class: Any) -> OrderingConfig:
                 allowed=list(raw.allowed),
                 default=list(raw.default),
                 allow_related=raw.allow_related,
+                expressions=dict(raw.expressions),
             )
         elif isinstance(raw, dict):
             config = OrderingConfig(
                 allowed=list(raw.get("allowed", [])),
                 default=list(raw.get("default", [])),
                 allow_related=raw.get("allow_related", True),
+                expressions=dict(raw.get("expressions", {})),
             )
         elif isinstance(raw, (list, tuple)):
             values = list(raw)
@@ -353,6 +356,48 @@ def build_pipeline_config(meta_config: Any) -> PipelineConfig:
     return PipelineConfig()
 
 
+def _coerce_http_cache_config(raw: Any) -> HttpCacheConfig:
+    if isinstance(raw, HttpCacheConfig):
+        values = {
+            "enabled": raw.enabled,
+            "max_age": raw.max_age,
+            "public": raw.public,
+            "stale_while_revalidate": raw.stale_while_revalidate,
+            "operations": raw.operations,
+        }
+    elif isinstance(raw, dict):
+        values = raw
+    else:
+        return HttpCacheConfig()
+    return HttpCacheConfig(
+        enabled=bool(values.get("enabled", True)),
+        max_age=max(0, int(values.get("max_age", 0) or 0)),
+        public=bool(values.get("public", False)),
+        stale_while_revalidate=max(
+            0, int(values.get("stale_while_revalidate", 0) or 0)
+        ),
+        operations={
+            str(name): _coerce_http_cache_config(value)
+            for name, value in (values.get("operations") or {}).items()
+        },
+    )
+
+
+def build_http_cache_config(meta_config: Any) -> HttpCacheConfig:
+    """
+    Construct HTTP caching configuration for GET queries.
+
+    Args:
+        meta_config: The model's GraphQLMeta configuration class
+
+    Returns:
+        Normalized HttpCacheConfig instance
+    """
+    if not meta_config:
+        return HttpCacheConfig()
+    return _coerce_http_cache_config(getattr(meta_config, "http_cache", None))
+
+
 def build_abac_policies_config(meta_config: Any) -> list[ABACPolicyConfig]:
     """
     Construct ABAC policy configuration list.
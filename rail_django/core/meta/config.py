@@ -79,11 +79,15 @@ class OrderingConfig:
         allowed: Allowed field names for order_by (without +/- prefixes).
         default: Default ordering applied when no client value is provided.
         allow_related: Whether related/path based ordering is permitted.
+        expressions: Mapping of model property names to equivalent ORM
+                     expressions (or callables returning one) so ordering by
+                     the property runs in SQL instead of in Python.
     """
 
     allowed: list[str] = field(default_factory=list)
     default: list[str] = field(default_factory=list)
     allow_related: bool = True
+    expressions: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -103,6 +107,36 @@ class ResolverConfig:
     fields: dict[str, Union[str, Callable]] = field(default_factory=dict)
 
 
+@dataclass
+class HttpCacheConfig:
+    """
+    HTTP caching of GET queries reading this model.
+
+    Applies when ``performance_settings.http_conditional_caching`` is enabled.
+    Responses always carry an ETag; these settings shape Cache-Control.
+
+    Attributes:
+        enabled: Set to False to never tag or cache queries on this model.
+        max_age: Seconds a response may be reused without revalidation.
+                 0 sends ``no-cache`` (revalidate with the ETag every time).
+        public: Let shared caches (CDNs) store responses of anonymous requests.
+        stale_while_revalidate: Seconds an expired response may still be served
+                                while the cache revalidates it.
+        operations: Overrides per query operation ("retrieve", "list",
+                    "paginated", "group", "history").
+    """
+
+    enabled: bool = True
+    max_age: int = 0
+    public: bool = False
+    stale_while_revalidate: int = 0
+    operations: dict[str, "HttpCacheConfig"] = field(default_factory=dict)
+
+    def for_operation(self, operation: str) -> "HttpCacheConfig":
+        """Return the configuration applying to *operation*."""
+        return self.operations.get(operation, self)
+
+
 @dataclass
 class RoleConfig:
     """Declarative role configuration scoped to a GraphQL model."""
@@ -22,6 +22,7 @@ from .builders import (
     build_classification_config,
     build_field_config,
     build_filtering_config,
+    build_http_cache_config,
     build_ordering_config,
     build_pipeline_config,
     build_resolver_config,
@@ -41,6 +42,7 @@ from .config import (
     FieldGuardConfig,
     FilterFieldConfig,
     FilteringConfig,
+    HttpCacheConfig,
     OperationGuardConfig,
     OrderingConfig,
     PipelineConfig,
@@ -83,6 +85,9 @@ class GraphQLMeta(GraphQLMetaAPIMixin):
                 resolvers = GraphQLMeta.Resolvers(
                     queries={"list": "resolve_custom_list"}
                 )
+                http_cache = GraphQLMeta.HttpCache(
+                    max_age=60, operations={"retrieve": GraphQLMeta.HttpCache(max_age=300)}
+                )
     """
 
     # Class-level aliases for configuration classes
@@ -99,6 +104,7 @@ class GraphQLMeta(GraphQLMetaAPIMixin):
     Pipeline = PipelineConfig
     RelationOperation = RelationOperationConfig
     FieldRelation = FieldRelationConfig
+    HttpCache = HttpCacheConfig
 
     def __init__(self, model_class: type[models.Model]):
         """
@@ -132,6 +138,7 @@ class GraphQLMeta(GraphQLMetaAPIMixin):
             self._meta_config
         )
         self.pipeline_config: PipelineConfig = build_pipeline_config(self._meta_config)
+        self.http_cache: HttpCacheConfig = build_http_cache_config(self._meta_config)
         self.abac_policies: list[ABACPolicyConfig] = build_abac_policies_config(
             self._meta_config
         )
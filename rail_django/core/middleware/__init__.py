@@ -20,13 +20,16 @@ Middleware Classes:
     - RateLimitingMiddleware: Rate limiting
     - PluginMiddleware: Plugin execution hooks
     - CORSMiddleware: CORS handling
+    - AsyncExecutionMiddleware: Async execution bridge for the ASGI view
 
 Functions:
+    - after_resolve: Post-process a resolver result that may be awaitable
     - get_middleware_stack: Get the middleware stack for a schema
+    - get_compiled_middleware: Get the compiled middleware chain for a schema
     - create_middleware_resolver: Create a resolver with middleware applied
 """
 
-from .base import BaseMiddleware, MiddlewareSettings
+from .base import BaseMiddleware, MiddlewareSettings, after_resolve
 from .auth import AuthenticationMiddleware, FieldPermissionMiddleware
 from .security import (
     AccessGuardMiddleware,
@@ -41,9 +44,12 @@ from .performance import (
     RateLimitingMiddleware,
 )
 from .plugin import CORSMiddleware, PluginMiddleware
+from .async_execution import AsyncExecutionMiddleware
 from .stack import (
     DEFAULT_MIDDLEWARE,
+    CompiledMiddlewareChain,
     create_middleware_resolver,
+    get_compiled_middleware,
     get_middleware_stack,
 )
 
@@ -51,6 +57,7 @@ __all__ = [
     # Base classes
     "BaseMiddleware",
     "MiddlewareSettings",
+    "after_resolve",
     # Authentication middleware
     "AuthenticationMiddleware",
     "FieldPermissionMiddleware",
@@ -67,8 +74,12 @@ __all__ = [
     # Plugin middleware
     "CORSMiddleware",
     "PluginMiddleware",
+    # Async execution
+    "AsyncExecutionMiddleware",
     # Stack management
     "DEFAULT_MIDDLEWARE",
+    "CompiledMiddlewareChain",
     "create_middleware_resolver",
+    "get_compiled_middleware",
     "get_middleware_stack",
 ]
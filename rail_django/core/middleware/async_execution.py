@@ -0,0 +1,195 @@
+"""
+Async execution middleware for Rail Django GraphQL.
+
+This module bridges the synchronous resolver and middleware stack to
+graphql-core's async executor, as used by the ASGI GraphQL view.
+"""
+
+import logging
+from functools import partial
+from inspect import isawaitable
+from typing import Any, Callable
+
+from django.core.exceptions import SynchronousOnlyOperation
+from django.db import models
+from django.db.models import QuerySet
+from django.db.models.manager import BaseManager
+from graphene.types.resolver import attr_resolver, dict_or_attr_resolver, dict_resolver
+from graphene.utils.str_converters import to_camel_case
+from graphql import default_field_resolver
+
+from ..execution import ATTRIBUTE_RESOLVER_ATTR, mark_async_execution, run_in_worker
+from .base import BaseMiddleware
+
+try:
+    from graphene_django import DjangoObjectType
+except ImportError:
+    DjangoObjectType = None
+
+try:
+    from promise import Promise
+except ImportError:
+    Promise = None
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_RESOLVERS = {
+    attr_resolver,
+    dict_or_attr_resolver,
+    dict_resolver,
+    default_field_resolver,
+}
+if DjangoObjectType is not None:
+    _DEFAULT_RESOLVERS.add(DjangoObjectType.resolve_id)
+
+
+class AsyncExecutionMiddleware(BaseMiddleware):
+    """Middleware running the synchronous resolver stack under async execution.
+
+    It must be the outermost middleware. Root fields run their whole
+    middleware chain and resolver in the request's worker thread
+    (``run_in_worker``), so the event loop stays free while the query
+    executes and concurrent requests run in parallel. Generated list,
+    retrieve and paginated resolvers return awaitables under async
+    execution, which are awaited on the event loop.
+
+    Nested fields with a default attribute resolver resolve on the event
+    loop unless they read a deferred field or an unloaded relation; other
+    nested fields run once in a worker thread. Only default resolvers, which
+    have no side effects, are retried in a worker when they hit the
+    database. Unevaluated querysets and DataLoader promises are resolved in
+    a worker as well.
+    """
+
+    def __init__(self, schema_name=None):
+        super().__init__(schema_name)
+        self._model_fields: dict[tuple[type, str], Any] = {}
+        self._default_resolvers: dict[tuple[str, str], bool] = {}
+
+    def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
+        """Resolve a field, returning an awaitable when it needs the database.
+
+        Args:
+            next_resolver: Next resolver in the chain to call.
+            root: Root value passed to the resolver.
+            info: GraphQL resolve info containing context and field information.
+            **kwargs: Additional arguments passed to the resolver.
+
+        Returns:
+            The resolver result, or an awaitable of it.
+        """
+        path = getattr(info, "path", None)
+        if path is None or getattr(path, "prev", None) is None:
+            mark_async_execution(getattr(info, "context", None))
+            return _resolve_in_worker(next_resolver, root, info, kwargs)
+
+        if not self._has_default_resolver(info):
+            return _resolve_in_worker(next_resolver, root, info, kwargs)
+
+        if isinstance(root, models.Model) and not self._is_loaded(root, info.field_name):
+            return _resolve_in_worker(next_resolver, root, info, kwargs)
+
+        try:
+            result = next_resolver(root, info, **kwargs)
+        except SynchronousOnlyOperation:
+            logger.debug(
+                "Resolving %s.%s in a worker thread",
+                getattr(info.parent_type, "name", ""),
+                info.field_name,
+            )
+            return _resolve_in_worker(next_resolver, root, info, kwargs)
+
+        if _needs_fetch(result):
+            return run_in_worker(_fetch, result)
+        return result
+
+    def _has_default_resolver(self, info: Any) -> bool:
+        """Return True when the field is read by a default attribute resolver."""
+        parent_type = info.parent_type
+        key = (getattr(parent_type, "name", ""), info.field_name)
+        try:
+            return self._default_resolvers[key]
+        except KeyError:
+            pass
+        field = getattr(parent_type, "fields", {}).get(info.field_name)
+        resolver = getattr(field, "resolve", None)
+        while isinstance(resolver, partial):
+            resolver = resolver.func
+        is_default = (
+            resolver is None
+            or resolver in _DEFAULT_RESOLVERS
+            or getattr(resolver, ATTRIBUTE_RESOLVER_ATTR, False)
+        )
+        self._default_resolvers[key] = is_default
+        return is_default
+
+    def _is_loaded(self, instance: models.Model, field_name: str) -> bool:
+        """Return False when reading *field_name* from *instance* may query."""
+        key = (type(instance), field_name)
+        try:
+            field = self._model_fields[key]
+        except KeyError:
+            field = None
+            for candidate in instance._meta.get_fields():
+                if to_camel_case(_field_name(candidate)) == field_name:
+                    field = candidate
+                    break
+            self._model_fields[key] = field
+        if field is None:
+            return True
+        try:
+            if field.many_to_many or field.one_to_many:
+                prefetched = getattr(instance, "_prefetched_objects_cache", {})
+                return any(name in prefetched for name in {_field_name(field), field.name})
+            if field.concrete and field.attname not in instance.__dict__:
+                # Deferred by only()/defer().
+                return False
+            if not field.is_relation:
+                return True
+            if field.is_cached(instance):
+                return True
+            # A forward relation with a null key resolves without a query.
+            return field.concrete and instance.__dict__[field.attname] is None
+        except (AttributeError, KeyError):
+            return False
+
+
+def _field_name(field: Any) -> str:
+    if field.auto_created and not field.concrete:
+        return field.get_accessor_name() or field.name
+    return field.name
+
+
+def _resolve_and_fetch(next_resolver: Callable, root: Any, info: Any, kwargs: dict) -> Any:
+    return _fetch(next_resolver(root, info, **kwargs))
+
+
+async def _resolve_in_worker(
+    next_resolver: Callable, root: Any, info: Any, kwargs: dict
+) -> Any:
+    """Run the resolver chain once in a worker, then await what it returned."""
+    result = await run_in_worker(_resolve_and_fetch, next_resolver, root, info, kwargs)
+    if isawaitable(result):
+        result = await result
+        if _needs_fetch(result):
+            result = await run_in_worker(_fetch, result)
+    return result
+
+
+def _needs_fetch(value: Any) -> bool:
+    if isinstance(value, BaseManager):
+        return True
+    if Promise is not None and isinstance(value, Promise):
+        return True
+    return isinstance(value, QuerySet) and value._result_cache is None
+
+
+def _fetch(value: Any) -> Any:
+    """Evaluate querysets, managers and promises so iterating them runs no query."""
+    if Promise is not None and isinstance(value, Promise):
+        value = value.get()
+    if isinstance(value, BaseManager):
+        value = value.all()
+    if isinstance(value, QuerySet):
+        return list(value)
+    return value
@@ -14,7 +14,7 @@ from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 from graphql import GraphQLError
 
-from .base import BaseMiddleware
+from .base import BaseMiddleware, OperationInfo, after_resolve
 from ..security import get_auth_manager
 from ..exceptions import ValidationError as GraphQLValidationError
 from ...config_proxy import get_setting
@@ -29,14 +29,20 @@ from ...security.field_permissions import (
 
 logger = logging.getLogger(__name__)
 
+# Request attribute memoizing the blocklist decision for the client IP.
+REQUEST_IP_BLOCKED_ATTR = "_rail_ip_blocked"
+
 
 class AuthenticationMiddleware(BaseMiddleware):
     """Middleware for handling authentication.
 
     This middleware authenticates users via the configured auth manager
-    and attaches the user to the request context.
+    and attaches the user to the request context. Root fields resolve
+    before their children, so it only runs on root fields.
     """
 
+    root_only = True
+
     def __init__(self, schema_name: Optional[str] = None):
         """Initialize authentication middleware.
 
@@ -46,6 +52,9 @@ class AuthenticationMiddleware(BaseMiddleware):
         super().__init__(schema_name)
         self.auth_manager = get_auth_manager(schema_name)
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_authentication_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Authenticate user and add to context.
 
@@ -61,12 +70,20 @@ class AuthenticationMiddleware(BaseMiddleware):
         if not self.settings.enable_authentication_middleware:
             return next_resolver(root, info, **kwargs)
 
-        # Check if IP is blocked
-        request = getattr(info.context, "request", None) or info.context
+        self._authenticate(info.context)
+        return next_resolver(root, info, **kwargs)
+
+    def resolve_operation(self, next_operation: Callable[[], Any], operation: OperationInfo) -> Any:
+        """Authenticate the user once before the operation executes."""
+        self._authenticate(operation.context)
+        return next_operation()
+
+    def _authenticate(self, context: Any) -> None:
+        """Reject blocked client IPs and attach the user to *context*."""
+        # Check if IP is blocked (once per request)
+        request = getattr(context, "request", None) or context
         if request and hasattr(request, "META"):
-            client_ip = request.META.get("REMOTE_ADDR", "unknown")
-            detector = get_anomaly_detector()
-            if detector.is_ip_blocked(client_ip):
+            if self._is_request_ip_blocked(request):
                 security.emit(
                     EventType.AUTH_TOKEN_INVALID,
                     request=request,
@@ -76,11 +93,20 @@ class AuthenticationMiddleware(BaseMiddleware):
                 raise GraphQLError("Access denied")
 
         # Authenticate user if not already done
-        if not hasattr(info.context, 'user'):
-            user = self.auth_manager.authenticate_user(info.context)
-            info.context.user = user
+        if not hasattr(context, 'user'):
+            context.user = self.auth_manager.authenticate_user(context)
 
-        return next_resolver(root, info, **kwargs)
+    @staticmethod
+    def _is_request_ip_blocked(request: Any) -> bool:
+        """Check the client IP against the blocklist, memoized on the request."""
+        request_state = getattr(request, "__dict__", None)
+        if request_state is not None and REQUEST_IP_BLOCKED_ATTR in request_state:
+            return request_state[REQUEST_IP_BLOCKED_ATTR]
+        client_ip = request.META.get("REMOTE_ADDR", "unknown")
+        blocked = bool(get_anomaly_detector().is_ip_blocked(client_ip))
+        if request_state is not None:
+            request_state[REQUEST_IP_BLOCKED_ATTR] = blocked
+        return blocked
 
 
 class FieldPermissionMiddleware(BaseMiddleware):
@@ -108,6 +134,18 @@ class FieldPermissionMiddleware(BaseMiddleware):
             get_setting("security_settings.enable_field_permissions", True, schema_name)
         )
 
+    def is_enabled(self) -> bool:
+        return (
+            self.settings.enable_field_permission_middleware
+            and self.enable_field_permissions
+        )
+
+    def applies_to(self, parent_type: Any, field_name: str) -> bool:
+        """Skip introspection fields, which are never permission-checked."""
+        if (field_name or "").startswith("__"):
+            return False
+        return not (getattr(parent_type, "name", "") or "").startswith("__")
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Apply field permission checks.
 
@@ -135,7 +173,9 @@ class FieldPermissionMiddleware(BaseMiddleware):
             kwargs = self._enforce_input_permissions(user, info, kwargs)
 
         result = next_resolver(root, info, **kwargs)
-        return self._apply_output_permissions(user, info, root, result)
+        return after_resolve(
+            result, lambda value: self._apply_output_permissions(user, info, root, value)
+        )
 
     @staticmethod
     def _is_root_field(info: Any) -> bool:
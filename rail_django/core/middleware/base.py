@@ -7,8 +7,11 @@ including configuration management via MiddlewareSettings.
 
 import logging
 from dataclasses import dataclass
+from inspect import isawaitable
 from typing import Any, Callable, Optional
 
+from ..execution import run_in_worker
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +84,38 @@ class MiddlewareSettings:
         return cls(**filtered_settings)
 
 
+@dataclass
+class OperationInfo:
+    """The operation passed to ``BaseMiddleware.resolve_operation``.
+
+    Attributes:
+        schema: The GraphQL schema being executed.
+        document: The parsed document.
+        operation: The ``OperationDefinitionNode`` being executed.
+        context: The context value shared by the resolvers.
+        variable_values: Variables of the request.
+        root_fields: Root field names by response key, fragments included.
+        root_nodes: Root ``FieldNode`` by response key.
+    """
+
+    schema: Any
+    document: Any
+    operation: Any
+    context: Any
+    variable_values: Optional[dict[str, Any]]
+    root_fields: dict[str, str]
+    root_nodes: dict[str, Any]
+
+    @property
+    def operation_type(self) -> str:
+        return self.operation.operation.value if self.operation is not None else "unknown"
+
+    @property
+    def operation_name(self) -> Optional[str]:
+        name_node = getattr(self.operation, "name", None)
+        return getattr(name_node, "value", None) or None
+
+
 class BaseMiddleware:
     """Base class for GraphQL middleware.
 
@@ -90,8 +125,13 @@ class BaseMiddleware:
     Attributes:
         schema_name: The name of the schema this middleware is associated with.
         settings: MiddlewareSettings instance for this middleware.
+        root_only: Whether the middleware only acts on root fields. Compiled
+            middleware chains never call it for nested fields, and run it
+            once per operation when it overrides ``resolve_operation``.
     """
 
+    root_only: bool = False
+
     def __init__(self, schema_name: Optional[str] = None):
         """Initialize the middleware.
 
@@ -117,3 +157,89 @@ class BaseMiddleware:
             The result from the resolver chain.
         """
         return next_resolver(root, info, **kwargs)
+
+    def resolve_operation(self, next_operation: Callable[[], Any], operation: OperationInfo) -> Any:
+        """Run once per operation around its execution.
+
+        Only called for ``root_only`` middleware overriding it. The GraphQL
+        views call it before any field resolves, and ``resolve`` is then
+        skipped for the root fields of that operation. Exceptions raised
+        before ``next_operation`` are reported as errors of every root field.
+
+        Args:
+            next_operation: Callable executing the operation.
+            operation: The operation about to be executed.
+
+        Returns:
+            The ``ExecutionResult``, or an awaitable of it.
+        """
+        return next_operation()
+
+    def is_enabled(self) -> bool:
+        """Return whether this middleware does any work for its schema.
+
+        Disabled middleware is dropped when the middleware chain is compiled.
+        """
+        return True
+
+    def applies_to(self, parent_type: Any, field_name: str) -> bool:
+        """Return whether this middleware targets a nested field.
+
+        Called once per (parent type, field) when compiling the chain used
+        for non-root fields of a schema.
+
+        Args:
+            parent_type: The GraphQL type owning the field.
+            field_name: The field name.
+
+        Returns:
+            False to skip this middleware for the field.
+        """
+        return True
+
+
+def after_resolve(
+    result: Any,
+    on_result: Optional[Callable[[Any], Any]] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+    *,
+    in_worker: bool = True,
+) -> Any:
+    """Apply *on_result* to a resolver result, awaiting it first if needed.
+
+    Under async execution generated resolvers return awaitables. Once such a
+    result completes, *on_result* is applied to its value, or *on_error* is
+    called with the exception it raised before it propagates. Callbacks run
+    in a worker thread unless *in_worker* is False, as they may query the
+    database. Plain results are passed to *on_result* directly; callers
+    handle errors raised synchronously themselves.
+
+    Args:
+        result: The value returned by the next resolver.
+        on_result: Callable returning the (possibly replaced) result.
+        on_error: Callable notified of an exception raised while awaiting.
+        in_worker: Run the callbacks in a worker thread.
+
+    Returns:
+        The processed result, or an awaitable of it.
+    """
+    if not isawaitable(result):
+        return on_result(result) if on_result is not None else result
+
+    async def finish():
+        try:
+            value = await result
+        except Exception as exc:
+            if on_error is not None:
+                if in_worker:
+                    await run_in_worker(on_error, exc)
+                else:
+                    on_error(exc)
+            raise
+        if on_result is None:
+            return value
+        if in_worker:
+            return await run_in_worker(on_result, value)
+        return on_result(value)
+
+    return finish()
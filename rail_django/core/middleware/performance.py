@@ -9,10 +9,9 @@ import logging
 import time
 from typing import Any, Callable, Optional
 
-from graphql import DocumentNode
-
 from ...config_proxy import get_setting
-from .base import BaseMiddleware
+from .base import BaseMiddleware, OperationInfo, after_resolve
+from ..document_cache import get_request_document
 from ..performance import get_complexity_analyzer
 from ..services import get_rate_limiter
 
@@ -45,6 +44,11 @@ class PerformanceMiddleware(BaseMiddleware):
     request.
     """
 
+    root_only = True
+
+    def is_enabled(self) -> bool:
+        return self.settings.enable_performance_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Monitor performance of root-level GraphQL operations.
 
@@ -67,9 +71,7 @@ class PerformanceMiddleware(BaseMiddleware):
 
         start_time = time.time()
 
-        try:
-            result = next_resolver(root, info, **kwargs)
-
+        def completed(result: Any) -> Any:
             # Check performance threshold
             duration_ms = (time.time() - start_time) * 1000
 
@@ -84,10 +86,41 @@ class PerformanceMiddleware(BaseMiddleware):
 
             return result
 
+        def failed(e: Exception) -> None:
+            duration_ms = (time.time() - start_time) * 1000
+            logger.error(f"GraphQL operation failed after {duration_ms:.2f}ms: {str(e)}")
+
+        try:
+            result = next_resolver(root, info, **kwargs)
         except Exception as e:
+            failed(e)
+            raise
+        return after_resolve(result, completed, failed, in_worker=False)
+
+    def resolve_operation(self, next_operation: Callable[[], Any], operation: OperationInfo) -> Any:
+        """Time the whole operation once instead of each root field."""
+        start_time = time.time()
+        field_names = ", ".join(operation.root_fields.values())
+
+        def completed(result: Any) -> Any:
+            duration_ms = (time.time() - start_time) * 1000
+            if duration_ms > self.settings.performance_threshold_ms and self.settings.log_performance:
+                logger.warning(
+                    f"Slow GraphQL {operation.operation_type}: {field_names} "
+                    f"(duration: {duration_ms:.2f}ms, threshold: {self.settings.performance_threshold_ms}ms)"
+                )
+            return result
+
+        def failed(e: Exception) -> None:
             duration_ms = (time.time() - start_time) * 1000
             logger.error(f"GraphQL operation failed after {duration_ms:.2f}ms: {str(e)}")
+
+        try:
+            result = next_operation()
+        except Exception as e:
+            failed(e)
             raise
+        return after_resolve(result, completed, failed, in_worker=False)
 
 
 class QueryComplexityMiddleware(BaseMiddleware):
@@ -97,6 +130,8 @@ class QueryComplexityMiddleware(BaseMiddleware):
     rejects queries that exceed configured limits for depth or complexity.
     """
 
+    root_only = True
+
     def __init__(self, schema_name: Optional[str] = None):
         """Initialize query complexity middleware.
 
@@ -106,6 +141,9 @@ class QueryComplexityMiddleware(BaseMiddleware):
         super().__init__(schema_name)
         self.complexity_analyzer = get_complexity_analyzer(schema_name)
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_query_complexity_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Analyze and limit query complexity.
 
@@ -136,38 +174,67 @@ class QueryComplexityMiddleware(BaseMiddleware):
         operation_type = info.operation.operation.value if info.operation else "unknown"
         if operation_type != "query":
             return next_resolver(root, info, **kwargs)
-        if not self._should_limit_query(info):
+        name_node = getattr(info.operation, "name", None)
+        if not self._should_limit_query(
+            [getattr(info, "field_name", "")], getattr(name_node, "value", None)
+        ):
             return next_resolver(root, info, **kwargs)
 
-        # Analyze query complexity
-        query_string = str(info.operation)
-        fragments = list(getattr(info, "fragments", {}).values())
-        document = (
-            DocumentNode(definitions=[info.operation] + fragments)
-            if info.operation is not None
-            else None
+        # Analyze query complexity on the shared, already parsed document
+        document = get_request_document(info) if info.operation is not None else None
+        self._validate_limits(
+            getattr(info, "context", None),
+            getattr(info, "schema", None),
+            document,
+            getattr(info, "variable_values", None),
         )
-        try:
-            depth, complexity = self.complexity_analyzer.analyze_query(query_string)
-            metrics = getattr(info.context, "_graphql_metrics", None)
-            if metrics is not None:
-                metrics.query_depth = depth
-                metrics.query_complexity = complexity
-        except Exception:
-            pass
+        return next_resolver(root, info, **kwargs)
+
+    def resolve_operation(self, next_operation: Callable[[], Any], operation: OperationInfo) -> Any:
+        """Analyze and limit the complexity of a query once before it executes."""
+        if operation.operation_type == "query" and self._should_limit_query(
+            operation.root_fields.values(), operation.operation_name
+        ):
+            self._validate_limits(
+                operation.context,
+                operation.schema,
+                operation.document,
+                operation.variable_values,
+            )
+        return next_operation()
+
+    def _validate_limits(self, context: Any, schema: Any, document: Any, variables: Any) -> None:
+        """Raise ValueError when *document* exceeds the configured limits."""
+        analysis = None
+        if document is not None:
+            try:
+                analysis = self._analyze_document(context, document)
+                metrics = getattr(context, "_graphql_metrics", None)
+                if metrics is not None:
+                    metrics.query_depth, metrics.query_complexity = analysis
+            except Exception:
+                pass
         validation_errors = self.complexity_analyzer.validate_query_limits(
-            query_string,
-            schema=getattr(info, "schema", None),
+            schema=schema,
             document=document,
-            user=getattr(getattr(info, "context", None), "user", None),
+            user=getattr(context, "user", None),
+            variables=variables,
+            document_analysis=analysis,
         )
 
         if validation_errors:
             raise ValueError(f"Query complexity validation failed: {'; '.join(validation_errors)}")
 
-        return next_resolver(root, info, **kwargs)
+    def _analyze_document(self, context: Any, document: Any) -> tuple[int, int]:
+        """Return (depth, complexity), reusing a compiled persisted query's scores."""
+        from ...extensions.persisted_queries import get_request_compiled_query
+
+        compiled = get_request_compiled_query(context, document)
+        if compiled is not None:
+            return compiled.depth, compiled.complexity
+        return self.complexity_analyzer.analyze_document(document)
 
-    def _should_limit_query(self, info: Any) -> bool:
+    def _should_limit_query(self, field_names: Any, operation_name: Optional[str]) -> bool:
         """Apply query limits only to queries explicitly listed in settings."""
         selectors = _normalize_query_selector_list(
             get_setting(
@@ -179,13 +246,11 @@ class QueryComplexityMiddleware(BaseMiddleware):
         if not selectors:
             return False
 
-        field_name = str(getattr(info, "field_name", "") or "").strip().lower()
-        operation = getattr(info, "operation", None)
-        name_node = getattr(operation, "name", None)
-        operation_name = ""
-        if name_node and getattr(name_node, "value", None):
-            operation_name = str(name_node.value).strip().lower()
-        return field_name in selectors or operation_name in selectors
+        if str(operation_name or "").strip().lower() in selectors:
+            return True
+        return any(
+            str(field_name or "").strip().lower() in selectors for field_name in field_names
+        )
 
 
 class RateLimitingMiddleware(BaseMiddleware):
@@ -195,6 +260,8 @@ class RateLimitingMiddleware(BaseMiddleware):
     abuse and ensure fair resource usage.
     """
 
+    root_only = True
+
     def __init__(self, schema_name: Optional[str] = None):
         """Initialize rate limiting middleware.
 
@@ -204,6 +271,9 @@ class RateLimitingMiddleware(BaseMiddleware):
         super().__init__(schema_name)
         self.rate_limiter = get_rate_limiter(schema_name)
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_rate_limiting_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Apply rate limiting to GraphQL operations.
 
@@ -225,17 +295,31 @@ class RateLimitingMiddleware(BaseMiddleware):
         if not self._is_root_field(info):
             return next_resolver(root, info, **kwargs)
 
-        result = self.rate_limiter.check("graphql", request=info.context)
+        self._check_limits(info.context, self._is_login_field(info))
+        return next_resolver(root, info, **kwargs)
+
+    def resolve_operation(self, next_operation: Callable[[], Any], operation: OperationInfo) -> Any:
+        """Apply rate limiting once per operation."""
+        self._check_limits(
+            operation.context,
+            any(
+                (field_name or "").lower() == "login"
+                for field_name in operation.root_fields.values()
+            ),
+        )
+        return next_operation()
+
+    def _check_limits(self, request: Any, is_login: bool) -> None:
+        """Raise PermissionError when *request* exceeds its rate limits."""
+        result = self.rate_limiter.check("graphql", request=request)
         if not result.allowed:
             raise PermissionError("Rate limit exceeded")
 
-        if self._is_login_field(info):
-            login_result = self.rate_limiter.check("graphql_login", request=info.context)
+        if is_login:
+            login_result = self.rate_limiter.check("graphql_login", request=request)
             if not login_result.allowed:
                 raise PermissionError("Rate limit exceeded (login)")
 
-        return next_resolver(root, info, **kwargs)
-
     @staticmethod
     def _is_root_field(info: Any) -> bool:
         """Check if this is a root field resolution."""
@@ -8,7 +8,7 @@ handling for GraphQL operations.
 import logging
 from typing import Any, Callable, Optional
 
-from .base import BaseMiddleware
+from .base import BaseMiddleware, after_resolve
 from ...config_proxy import get_setting
 from ...plugins.base import plugin_manager
 
@@ -33,6 +33,9 @@ class PluginMiddleware(BaseMiddleware):
             get_setting("plugin_settings.enable_execution_hooks", True, schema_name)
         )
 
+    def is_enabled(self) -> bool:
+        return self.enabled
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Execute plugin hooks around field resolution.
 
@@ -67,9 +70,7 @@ class PluginMiddleware(BaseMiddleware):
         if decision and decision.handled:
             return decision.result
 
-        try:
-            result = next_resolver(root, info, **kwargs)
-        except Exception as exc:
+        def failed(exc: Exception) -> None:
             plugin_manager.run_after_resolve(
                 schema_name, info, root, kwargs, None, exc, context
             )
@@ -77,22 +78,29 @@ class PluginMiddleware(BaseMiddleware):
                 plugin_manager.run_after_operation(
                     schema_name, operation_type, operation_name, info, None, exc, context
                 )
-            raise
 
-        after_resolve = plugin_manager.run_after_resolve(
-            schema_name, info, root, kwargs, result, None, context
-        )
-        if after_resolve and after_resolve.handled:
-            result = after_resolve.result
-
-        if is_root:
-            after_operation = plugin_manager.run_after_operation(
-                schema_name, operation_type, operation_name, info, result, None, context
+        def completed(result: Any) -> Any:
+            after_resolve_decision = plugin_manager.run_after_resolve(
+                schema_name, info, root, kwargs, result, None, context
             )
-            if after_operation and after_operation.handled:
-                result = after_operation.result
+            if after_resolve_decision and after_resolve_decision.handled:
+                result = after_resolve_decision.result
+
+            if is_root:
+                after_operation = plugin_manager.run_after_operation(
+                    schema_name, operation_type, operation_name, info, result, None, context
+                )
+                if after_operation and after_operation.handled:
+                    result = after_operation.result
 
-        return result
+            return result
+
+        try:
+            result = next_resolver(root, info, **kwargs)
+        except Exception as exc:
+            failed(exc)
+            raise
+        return after_resolve(result, completed, failed)
 
     @staticmethod
     def _get_plugin_context(info: Any) -> dict[str, Any]:
@@ -132,6 +140,13 @@ class CORSMiddleware(BaseMiddleware):
     but this middleware can add additional CORS-related logic if needed.
     """
 
+    def is_enabled(self) -> bool:
+        # The base implementation is a pass-through; keep only subclasses.
+        return (
+            self.settings.enable_cors_middleware
+            and type(self).resolve is not CORSMiddleware.resolve
+        )
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Handle CORS for GraphQL requests.
 
@@ -13,7 +13,7 @@ from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 
 from ...config_proxy import get_setting
-from .base import BaseMiddleware
+from .base import BaseMiddleware, OperationInfo, after_resolve
 from ..security import get_input_validator
 from ..exceptions import ValidationError as GraphQLValidationError
 
@@ -53,6 +53,15 @@ class ValidationMiddleware(BaseMiddleware):
         super().__init__(schema_name)
         self.input_validator = get_input_validator(schema_name)
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_validation_middleware
+
+    def applies_to(self, parent_type: Any, field_name: str) -> bool:
+        """Only fields declaring arguments can receive input to validate."""
+        fields = getattr(parent_type, "fields", None) or {}
+        field = fields.get(field_name)
+        return field is None or bool(getattr(field, "args", None))
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Validate GraphQL inputs.
 
@@ -92,6 +101,8 @@ class AccessGuardMiddleware(BaseMiddleware):
     access controls at the schema level.
     """
 
+    root_only = True
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Enforce access control policies.
 
@@ -110,13 +121,31 @@ class AccessGuardMiddleware(BaseMiddleware):
         if not self._is_root_field(info):
             return next_resolver(root, info, **kwargs)
 
+        self._check_access(
+            getattr(info, "context", None),
+            restricts_introspection=self._is_restricted_introspection_field(info),
+        )
+        return next_resolver(root, info, **kwargs)
+
+    def resolve_operation(self, next_operation: Callable[[], Any], operation: OperationInfo) -> Any:
+        """Enforce access control once before the operation executes."""
+        self._check_access(
+            operation.context,
+            restricts_introspection=any(
+                field_name in {"__schema", "__type"}
+                for field_name in operation.root_fields.values()
+            ),
+        )
+        return next_operation()
+
+    def _check_access(self, request: Any, *, restricts_introspection: bool) -> None:
+        """Raise PermissionError when *request* may not run the operation."""
         from ..settings import SchemaSettings
         from ..security import is_introspection_allowed
 
-        schema_name = getattr(info.context, "schema_name", None)
+        schema_name = getattr(request, "schema_name", None)
         schema_settings = SchemaSettings.from_schema(schema_name)
-        user = getattr(info.context, "user", None)
-        request = getattr(info, "context", None)
+        user = getattr(request, "user", None)
 
         is_open_test_endpoint = False
         try:
@@ -134,7 +163,7 @@ class AccessGuardMiddleware(BaseMiddleware):
             if not user or not getattr(user, "is_authenticated", False):
                 raise PermissionError("Authentication required")
 
-        if self._is_restricted_introspection_field(info):
+        if restricts_introspection:
             if not is_introspection_allowed(
                 user,
                 schema_name,
@@ -142,8 +171,6 @@ class AccessGuardMiddleware(BaseMiddleware):
             ):
                 raise PermissionError("Introspection not permitted")
 
-        return next_resolver(root, info, **kwargs)
-
     @staticmethod
     def _is_root_field(info: Any) -> bool:
         """Check if this is a root field resolution."""
@@ -166,6 +193,8 @@ class GraphQLAuditMiddleware(BaseMiddleware):
     tracking who performed what action and when.
     """
 
+    root_only = True
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Record an audit entry for each root GraphQL operation.
 
@@ -199,51 +228,120 @@ class GraphQLAuditMiddleware(BaseMiddleware):
             and not self._should_audit_query(info)
         ):
             return next_resolver(root, info, **kwargs)
-        event_type = self._resolve_event_type(operation_type, info.field_name, EventType)
-
-        additional_data = {
-            "graphql_operation": operation_type,
-            "graphql_field": info.field_name,
-            "schema_name": getattr(getattr(info, "context", None), "schema_name", None),
-        }
 
-        operation_name = self._get_operation_name(info)
-        if operation_name:
-            additional_data["graphql_operation_name"] = operation_name
+        emit = self._event_emitter(
+            operation_type,
+            self._get_operation_name(info),
+            getattr(info, "variable_values", None),
+            getattr(info, "context", None),
+        )
 
-        variables = getattr(info, "variable_values", None)
-        if isinstance(variables, dict) and variables:
-            additional_data["variable_keys"] = sorted(variables.keys())
+        def completed(result: Any) -> Any:
+            emit(info.field_name)
+            return result
 
-        request = getattr(info, "context", None)
-        # Handle case where context is not a request (e.g. tests)
-        if request and not hasattr(request, "META") and hasattr(request, "request"):
-             request = request.request
+        def failed(exc: Exception) -> None:
+            emit(info.field_name, str(exc))
 
-        success = True
-        error_message = None
+        try:
+            result = next_resolver(root, info, **kwargs)
+        except Exception as exc:
+            failed(exc)
+            raise
+        return after_resolve(result, completed, failed)
 
-        resolver = next_resolver
+    def resolve_operation(self, next_operation: Callable[[], Any], operation: OperationInfo) -> Any:
+        """Record an audit entry for each root field once the operation completes."""
+        if not getattr(settings, "GRAPHQL_ENABLE_AUDIT_LOGGING", True):
+            return next_operation()
+
+        operation_type = operation.operation_type
+        audited = {
+            key: field_name
+            for key, field_name in operation.root_fields.items()
+            if field_name != "__typename"
+            and (
+                operation_type != "query"
+                or self._is_audited_query(field_name, operation.operation_name)
+            )
+        }
+        if not audited:
+            return next_operation()
 
         try:
-            result = resolver(root, info, **kwargs)
+            emit = self._event_emitter(
+                operation_type,
+                operation.operation_name,
+                operation.variable_values,
+                operation.context,
+            )
+        except Exception:
+            return next_operation()
+
+        def completed(result: Any) -> Any:
+            field_errors: dict[str, str] = {}
+            operation_error = None
+            for error in getattr(result, "errors", None) or []:
+                path = getattr(error, "path", None)
+                message = getattr(error, "message", None) or str(error)
+                if path:
+                    field_errors.setdefault(str(path[0]), message)
+                elif operation_error is None:
+                    operation_error = message
+            for key, field_name in audited.items():
+                emit(field_name, field_errors.get(key, operation_error))
             return result
+
+        def failed(exc: Exception) -> None:
+            for field_name in audited.values():
+                emit(field_name, str(exc))
+
+        try:
+            result = next_operation()
         except Exception as exc:
-            success = False
-            error_message = str(exc)
+            failed(exc)
             raise
-        finally:
+        return after_resolve(result, completed, failed)
+
+    def _event_emitter(
+        self,
+        operation_type: str,
+        operation_name: Optional[str],
+        variables: Any,
+        request: Any,
+    ) -> Callable[..., None]:
+        """Return a callable emitting the audit event of one root field."""
+        from ...security import security, EventType, Outcome
+
+        schema_name = getattr(request, "schema_name", None)
+        # Handle case where context is not a request (e.g. tests)
+        if request and not hasattr(request, "META") and hasattr(request, "request"):
+            request = request.request
+
+        def emit(field_name: str, error_message: Optional[str] = None) -> None:
+            additional_data = {
+                "graphql_operation": operation_type,
+                "graphql_field": field_name,
+                "schema_name": schema_name,
+            }
+            if operation_name:
+                additional_data["graphql_operation_name"] = operation_name
+            if isinstance(variables, dict) and variables:
+                additional_data["variable_keys"] = sorted(variables.keys())
+
             security.emit(
-                event_type,
+                self._resolve_event_type(operation_type, field_name, EventType),
                 request=request if hasattr(request, "META") else None,
-                outcome=Outcome.SUCCESS if success else Outcome.FAILURE,
+                outcome=Outcome.FAILURE if error_message is not None else Outcome.SUCCESS,
                 error=error_message,
                 context=additional_data,
                 resource_type="graphql_field",
-                resource_name=info.field_name,
+                resource_name=field_name,
                 action=f"GraphQL {operation_type}"
             )
 
+        return emit
+
     def _is_root_field(self, info: Any) -> bool:
         """Check if this is a root field resolution."""
         path = getattr(info, "path", None)
@@ -271,8 +369,27 @@ class GraphQLAuditMiddleware(BaseMiddleware):
         if not selectors:
             return False
 
-        field_name = str(getattr(info, "field_name", "") or "").strip().lower()
-        operation_name = str(self._get_operation_name(info) or "").strip().lower()
+        return self._is_audited_query(
+            getattr(info, "field_name", ""), self._get_operation_name(info), selectors
+        )
+
+    def _is_audited_query(
+        self,
+        field_name: Optional[str],
+        operation_name: Optional[str],
+        selectors: Optional[set[str]] = None,
+    ) -> bool:
+        """Return whether a query root field or operation is listed for auditing."""
+        if selectors is None:
+            selectors = _normalize_query_selector_list(
+                get_setting(
+                    "security_settings.audited_query_fields",
+                    [],
+                    schema_name=self.schema_name,
+                )
+            )
+        field_name = str(field_name or "").strip().lower()
+        operation_name = str(operation_name or "").strip().lower()
         return field_name in selectors or operation_name in selectors
 
     def _resolve_event_type(
@@ -317,6 +434,9 @@ class ErrorHandlingMiddleware(BaseMiddleware):
     resolution, providing consistent error handling and logging.
     """
 
+    def is_enabled(self) -> bool:
+        return self.settings.enable_error_handling_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Handle and format GraphQL errors.
 
@@ -336,30 +456,35 @@ class ErrorHandlingMiddleware(BaseMiddleware):
             return next_resolver(root, info, **kwargs)
 
         try:
-            return next_resolver(root, info, **kwargs)
+            result = next_resolver(root, info, **kwargs)
+        except Exception as e:
+            self._log_error(info, e)
+            raise
+        return after_resolve(
+            result, on_error=lambda e: self._log_error(info, e), in_worker=False
+        )
 
-        except PermissionError as e:
+    @staticmethod
+    def _log_error(info: Any, e: Exception) -> None:
+        """Log an error raised while resolving a field."""
+        if isinstance(e, PermissionError):
             # Handle permission errors
             logger.warning(f"Permission denied: {str(e)}")
-            raise
+            return
 
-        except ValueError as e:
+        if isinstance(e, ValueError):
             # Handle validation errors
             logger.warning(f"Validation error: {str(e)}")
-            raise
-
-        except Exception as e:
-            # Handle unexpected errors
-            operation_type = info.operation.operation.value if info.operation else "unknown"
-            field_name = info.field_name
+            return
 
-            logger.error(
-                f"Unexpected error in GraphQL {operation_type} {field_name}: {str(e)}",
-                exc_info=True
-            )
+        # Handle unexpected errors
+        operation_type = info.operation.operation.value if info.operation else "unknown"
+        field_name = info.field_name
 
-            # Re-raise the original exception
-            raise
+        logger.error(
+            f"Unexpected error in GraphQL {operation_type} {field_name}: {str(e)}",
+            exc_info=e
+        )
 
 
 class LoggingMiddleware(BaseMiddleware):
@@ -369,6 +494,19 @@ class LoggingMiddleware(BaseMiddleware):
     including timing information and error details.
     """
 
+    def __init__(self, schema_name: Optional[str] = None):
+        """Initialize logging middleware.
+
+        Args:
+            schema_name: Optional schema name for schema-specific settings.
+        """
+        super().__init__(schema_name)
+        # Nested fields are only logged for field-level logs and errors.
+        self.root_only = not (self.settings.log_field_level or self.settings.log_errors)
+
+    def is_enabled(self) -> bool:
+        return self.settings.enable_logging_middleware
+
     def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
         """Log GraphQL operations.
 
@@ -409,9 +547,7 @@ class LoggingMiddleware(BaseMiddleware):
 
         start_time = time.time()
 
-        try:
-            result = next_resolver(root, info, **kwargs)
-
+        def completed(result: Any) -> Any:
             # Log successful completion
             if should_log:
                 duration = (time.time() - start_time) * 1000
@@ -422,7 +558,7 @@ class LoggingMiddleware(BaseMiddleware):
 
             return result
 
-        except Exception as e:
+        def failed(e: Exception) -> None:
             # Log errors
             if self.settings.log_errors:
                 duration = (time.time() - start_time) * 1000
@@ -431,7 +567,12 @@ class LoggingMiddleware(BaseMiddleware):
                     f"(duration: {duration:.2f}ms, error: {str(e)})"
                 )
 
+        try:
+            result = next_resolver(root, info, **kwargs)
+        except Exception as e:
+            failed(e)
             raise
+        return after_resolve(result, completed, failed, in_worker=False)
 
     @staticmethod
     def _is_introspection_field(info: Any) -> bool:
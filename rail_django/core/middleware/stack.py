@@ -10,12 +10,33 @@ Middleware instances are **cached per schema** so they are created once at
 first use instead of being re-instantiated on every single GraphQL request.
 Call ``clear_middleware_cache()`` when schema configuration changes at
 runtime (very rare outside test suites).
+
+Each stack is also **compiled** into a :class:`CompiledMiddlewareChain`:
+disabled middleware is dropped, ``root_only`` middleware overriding
+``resolve_operation`` runs once per operation around execution (see
+:meth:`CompiledMiddlewareChain.run_operation`), other ``root_only``
+middleware is only called for root fields, and the chain for each nested
+field keeps only the middleware whose ``applies_to`` accepts it.  Fields
+without any remaining middleware call their resolver directly.
 """
 
 import threading
-from typing import Any, Callable, List, Optional
+from functools import partial, reduce
+from typing import Any, Callable, List, Optional, Sequence
+
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationType,
+    get_operation_ast,
+    is_non_null_type,
+    located_error,
+)
 
-from .base import BaseMiddleware
+from .base import BaseMiddleware, OperationInfo
 from .auth import AuthenticationMiddleware, FieldPermissionMiddleware
 from .security import (
     AccessGuardMiddleware,
@@ -64,8 +85,15 @@ DEFAULT_MIDDLEWARE = [mw for mw in DEFAULT_MIDDLEWARE if mw is not None]
 # Middleware stack cache – avoids re-instantiation on every request
 # ---------------------------------------------------------------------------
 _middleware_cache: dict[Optional[str], List[BaseMiddleware]] = {}
+_compiled_middleware_cache: dict[tuple, "CompiledMiddlewareChain"] = {}
 _middleware_cache_lock = threading.Lock()
 
+# Context attribute listing the operations whose operation middleware ran.
+OPERATION_MIDDLEWARE_ATTR = "_rail_operation_middleware"
+
+# Bound on composed per-field resolvers kept by a compiled chain.
+COMPOSED_RESOLVER_CACHE_SIZE = 10000
+
 
 def get_middleware_stack(schema_name: Optional[str] = None) -> List[BaseMiddleware]:
     """Get the middleware stack for a schema.
@@ -106,6 +134,274 @@ def clear_middleware_cache() -> None:
     """
     with _middleware_cache_lock:
         _middleware_cache.clear()
+        _compiled_middleware_cache.clear()
+
+
+def _is_middleware_enabled(middleware: Any) -> bool:
+    is_enabled = getattr(middleware, "is_enabled", None)
+    if is_enabled is None:
+        return True
+    return bool(is_enabled())
+
+
+def _middleware_resolver(middleware: Any) -> Callable:
+    resolve = getattr(middleware, "resolve", None)
+    return resolve if resolve is not None else middleware
+
+
+def _runs_per_operation(middleware: Any) -> bool:
+    resolve_operation = getattr(type(middleware), "resolve_operation", None)
+    return bool(getattr(middleware, "root_only", False)) and resolve_operation not in (
+        None,
+        BaseMiddleware.resolve_operation,
+    )
+
+
+class CompiledMiddlewareChain:
+    """A middleware stack compiled into minimal per-field chains.
+
+    Instances are passed to graphql-core as the only middleware and compose
+    the same way graphql-core composes a middleware list: the first
+    middleware of the stack is the innermost one. Composed resolvers are
+    cached per field and resolver, which is the field's own resolver when
+    the chain is the innermost middleware.
+
+    Args:
+        middleware_stack: Middleware instances in stack order.
+    """
+
+    def __init__(self, middleware_stack: Sequence[Any]):
+        self.middleware = [
+            middleware for middleware in middleware_stack if _is_middleware_enabled(middleware)
+        ]
+        self.operation_middleware = [
+            middleware for middleware in self.middleware if _runs_per_operation(middleware)
+        ]
+        self._root_resolvers = tuple(_middleware_resolver(middleware) for middleware in self.middleware)
+        self._operation_root_resolvers = tuple(
+            _middleware_resolver(middleware)
+            for middleware in self.middleware
+            if middleware not in self.operation_middleware
+        )
+        self._field_middleware = [
+            middleware
+            for middleware in self.middleware
+            if not getattr(middleware, "root_only", False)
+        ]
+        self._chains: dict[tuple[str, str, str], tuple[Callable, ...]] = {}
+        self._composed: dict[tuple[str, str, str, Callable], Callable] = {}
+
+    def get_field_chain(
+        self, parent_type: Any, field_name: str, is_root: bool, operation_ran: bool = False
+    ) -> tuple[Callable, ...]:
+        """Return the middleware ``resolve`` callables applied to a field."""
+        kind = ("operation_root" if operation_ran else "root") if is_root else "field"
+        key = (kind, getattr(parent_type, "name", ""), field_name)
+        chain = self._chains.get(key)
+        if chain is None:
+            if kind == "root":
+                chain = self._root_resolvers
+            elif kind == "operation_root":
+                chain = self._operation_root_resolvers
+            else:
+                chain = tuple(
+                    _middleware_resolver(middleware)
+                    for middleware in self._field_middleware
+                    if _applies_to(middleware, parent_type, field_name)
+                )
+            self._chains[key] = chain
+        return chain
+
+    def resolve(self, next_resolver: Callable, root: Any, info: Any, **kwargs) -> Any:
+        """Run the compiled chain for the field being resolved."""
+        path = getattr(info, "path", None)
+        is_root = path is None or getattr(path, "prev", None) is None
+        operation_ran = is_root and self._operation_ran(info)
+        parent_type = getattr(info, "parent_type", None)
+        field_name = getattr(info, "field_name", "")
+        key = (
+            ("operation_root" if operation_ran else "root") if is_root else "field",
+            getattr(parent_type, "name", ""),
+            field_name,
+            next_resolver,
+        )
+        resolver = self._composed.get(key)
+        if resolver is None:
+            chain = self.get_field_chain(parent_type, field_name, is_root, operation_ran)
+            resolver = reduce(
+                lambda chained, middleware: partial(middleware, chained), chain, next_resolver
+            )
+            if len(self._composed) >= COMPOSED_RESOLVER_CACHE_SIZE:
+                self._composed.clear()
+            self._composed[key] = resolver
+        return resolver(root, info, **kwargs)
+
+    def run_operation(
+        self,
+        execute: Callable[[], Any],
+        *,
+        schema: Any,
+        document: Any,
+        operation_name: Optional[str],
+        context: Any,
+        variable_values: Optional[dict] = None,
+    ) -> Any:
+        """Run the operation middleware once around *execute*.
+
+        Root fields of the operation then skip that middleware. Exceptions
+        raised by the middleware before execution are reported as errors of
+        every root field, as they were when it ran inside their resolvers.
+
+        Args:
+            execute: Callable executing the operation.
+            schema: The ``GraphQLSchema`` being executed.
+            document: The parsed document.
+            operation_name: Name of the operation to execute.
+            context: The context value passed to ``execute``.
+            variable_values: Variables of the request.
+
+        Returns:
+            The ``ExecutionResult``, or an awaitable of it.
+        """
+        if not self.operation_middleware:
+            return execute()
+        try:
+            operation = get_operation_ast(document, operation_name)
+        except Exception:
+            operation = None
+        if operation is None:
+            return execute()
+
+        root_nodes = _collect_root_fields(document, operation.selection_set)
+        info = OperationInfo(
+            schema=schema,
+            document=document,
+            operation=operation,
+            context=context,
+            variable_values=variable_values,
+            root_fields={key: node.name.value for key, node in root_nodes.items()},
+            root_nodes=root_nodes,
+        )
+        started = False
+
+        def execute_operation() -> Any:
+            nonlocal started
+            started = True
+            _mark_operation(context, operation)
+            return execute()
+
+        run = execute_operation
+        for middleware in self.operation_middleware:
+            run = partial(middleware.resolve_operation, run, info)
+        try:
+            return run()
+        except Exception as exc:
+            if started:
+                raise
+            return _operation_error_result(info, exc)
+
+    @staticmethod
+    def _operation_ran(info: Any) -> bool:
+        marked = getattr(getattr(info, "context", None), OPERATION_MIDDLEWARE_ATTR, None)
+        return bool(marked) and id(getattr(info, "operation", None)) in marked
+
+
+def _mark_operation(context: Any, operation: Any) -> None:
+    marked = getattr(context, OPERATION_MIDDLEWARE_ATTR, None)
+    if not isinstance(marked, set):
+        marked = set()
+        try:
+            setattr(context, OPERATION_MIDDLEWARE_ATTR, marked)
+        except Exception:
+            return
+    marked.add(id(operation))
+
+
+def _collect_root_fields(document: Any, selection_set: Any) -> dict[str, FieldNode]:
+    fragments = {
+        definition.name.value: definition
+        for definition in getattr(document, "definitions", ()) or ()
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    fields: dict[str, FieldNode] = {}
+    pending = list(getattr(selection_set, "selections", ()) or ())
+    seen_fragments: set[str] = set()
+    while pending:
+        selection = pending.pop(0)
+        if isinstance(selection, FieldNode):
+            key = selection.alias.value if selection.alias else selection.name.value
+            fields.setdefault(key, selection)
+        elif isinstance(selection, InlineFragmentNode):
+            pending.extend(selection.selection_set.selections)
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = fragments.get(name)
+            if fragment is not None and name not in seen_fragments:
+                seen_fragments.add(name)
+                pending.extend(fragment.selection_set.selections)
+    return fields
+
+
+def _operation_error_result(info: OperationInfo, exc: Exception) -> ExecutionResult:
+    root_type = {
+        OperationType.QUERY: getattr(info.schema, "query_type", None),
+        OperationType.MUTATION: getattr(info.schema, "mutation_type", None),
+        OperationType.SUBSCRIPTION: getattr(info.schema, "subscription_type", None),
+    }.get(info.operation.operation)
+    root_type_fields = getattr(root_type, "fields", {}) or {}
+    data: Optional[dict[str, Any]] = {}
+    errors = []
+    for key, node in info.root_nodes.items():
+        field_name = info.root_fields[key]
+        if field_name == "__typename":
+            data[key] = getattr(root_type, "name", None)
+            continue
+        errors.append(located_error(exc, [node], [key]))
+        field = root_type_fields.get(field_name)
+        if data is not None and field is not None and is_non_null_type(field.type):
+            data = None
+        if data is not None:
+            data[key] = None
+    if not errors:
+        errors.append(located_error(exc))
+    return ExecutionResult(data=data or None, errors=errors)
+
+
+def _applies_to(middleware: Any, parent_type: Any, field_name: str) -> bool:
+    applies_to = getattr(middleware, "applies_to", None)
+    if applies_to is None:
+        return True
+    return bool(applies_to(parent_type, field_name))
+
+
+def get_compiled_middleware(
+    schema_name: Optional[str] = None, extra_middleware: Sequence[Any] = ()
+) -> CompiledMiddlewareChain:
+    """Get the compiled middleware chain for a schema.
+
+    The chain wraps the instances returned by :func:`get_middleware_stack`
+    and is cached alongside them.
+
+    Args:
+        schema_name: Optional schema name for schema-specific middleware.
+        extra_middleware: Middleware applied inside the stack, such as the
+            schema builder's own middleware.
+
+    Returns:
+        The compiled middleware chain.
+    """
+    key = (schema_name, tuple(id(middleware) for middleware in extra_middleware))
+    cached = _compiled_middleware_cache.get(key)
+    if cached is not None:
+        return cached
+
+    middleware_stack = get_middleware_stack(schema_name)
+    with _middleware_cache_lock:
+        cached = _compiled_middleware_cache.get(key)
+        if cached is None:
+            cached = CompiledMiddlewareChain([*extra_middleware, *middleware_stack])
+            _compiled_middleware_cache[key] = cached
+        return cached
 
 
 def create_middleware_resolver(middleware_stack: List[BaseMiddleware]) -> Callable:
@@ -0,0 +1,239 @@
+"""
+Per-model data versions for cache invalidation.
+
+Every model has an opaque version token stored in the Django cache. Writes
+seen through ``post_save``, ``post_delete`` and ``m2m_changed`` replace the
+token, so cache entries whose key embeds the versions of the models they read
+become unreachable as soon as one of those models changes. Bulk write paths
+wrap their loops in ``batched_model_version_bumps()`` so each model is bumped
+once per batch instead of once per row.
+
+Versions read or bumped by this process are also kept in memory, so callers
+that accept a short delay before other processes' writes become visible can
+pass ``max_age`` to ``get_model_version_map()`` and skip the cache round trip.
+
+The signal handlers are only connected when a feature reading versions is
+configured (``count_mode`` ``cached``, the query result cache or HTTP
+conditional caching) in the settings or in a schema registered at runtime,
+or on the first version read. Cached counts fall back to exact counts while
+they are not connected. Without them, every ORM
+write would pay for cache round trips and ``QuerySet.delete()`` would lose
+Django's fast delete path.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+logger = logging.getLogger(__name__)
+
+MODEL_VERSION_PREFIX = "rail_django:model_version"
+
+_SIGNALS_CONNECTED = False
+
+_batch_state = threading.local()
+
+# Versions this process read from or wrote to the cache: key -> (version, when).
+_local_versions: dict[str, tuple[str, float]] = {}
+_local_lock = threading.Lock()
+
+
+def _version_key(model: type[models.Model]) -> str:
+    return f"{MODEL_VERSION_PREFIX}:{model._meta.concrete_model._meta.label_lower}"
+
+
+def get_model_version(model: type[models.Model]) -> str:
+    """Return the current version token of *model*."""
+    ensure_model_version_signals()
+    key = _version_key(model)
+    try:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, uuid.uuid4().hex, None)
+            version = cache.get(key)
+    except Exception as exc:
+        logger.debug("Model version lookup failed for %s: %s", key, exc)
+        return "unversioned"
+    return str(version or "unversioned")
+
+
+def _remember_version(key: str, version: str, when: float) -> None:
+    with _local_lock:
+        current = _local_versions.get(key)
+        # A bump made after this read started wins over the value read.
+        if current is None or current[1] <= when:
+            _local_versions[key] = (version, when)
+
+
+def get_model_version_map(
+    model_list: Iterable[type[models.Model]],
+    max_age: float = 0.0,
+) -> dict[str, str]:
+    """
+    Return ``{label: version}`` for *model_list* with at most one cache round trip.
+
+    Versions this process read or bumped less than *max_age* seconds ago are
+    served from memory; writes made by other processes become visible within
+    that delay.
+    """
+    ensure_model_version_signals()
+    unique = {m._meta.label_lower: m for m in model_list}
+    keys = {label: _version_key(model) for label, model in unique.items()}
+    now = time.monotonic()
+    versions = {}
+    if max_age > 0:
+        with _local_lock:
+            for label, key in keys.items():
+                local = _local_versions.get(key)
+                if local is not None and now - local[1] < max_age:
+                    versions[label] = local[0]
+    missing = {label: key for label, key in keys.items() if label not in versions}
+    if not missing:
+        return versions
+    try:
+        found = cache.get_many(list(set(missing.values())))
+    except Exception as exc:
+        logger.debug("Model version lookup failed: %s", exc)
+        found = {}
+    for label, key in missing.items():
+        version = found.get(key)
+        if version is None:
+            versions[label] = get_model_version(unique[label])
+            continue
+        versions[label] = str(version)
+        _remember_version(key, versions[label], now)
+    return versions
+
+
+def clear_local_model_versions() -> None:
+    """Forget the versions kept in process memory."""
+    with _local_lock:
+        _local_versions.clear()
+
+
+def get_model_versions(model_list: Iterable[type[models.Model]]) -> tuple[str, ...]:
+    """Return the version tokens of *model_list*, ordered by model label."""
+    unique = {m._meta.concrete_model._meta.label_lower: m for m in model_list}
+    return tuple(f"{label}={get_model_version(unique[label])}" for label in sorted(unique))
+
+
+def bump_model_version(model: type[models.Model]) -> None:
+    """Invalidate every cache entry keyed on *model* (and its concrete parents)."""
+    for target in (model, *model._meta.get_parent_list()):
+        key = _version_key(target)
+        version = uuid.uuid4().hex
+        try:
+            cache.set(key, version, None)
+        except Exception as exc:
+            logger.debug("Model version bump failed for %s: %s", target, exc)
+            with _local_lock:
+                _local_versions.pop(key, None)
+            continue
+        _remember_version(key, version, time.monotonic())
+
+
+@contextmanager
+def batched_model_version_bumps() -> Iterator[None]:
+    """Defer the version bumps of writes in the block to a single bump per model."""
+    if getattr(_batch_state, "pending", None) is not None:
+        yield
+        return
+    _batch_state.pending = {}
+    try:
+        yield
+    finally:
+        pending, _batch_state.pending = _batch_state.pending, None
+        for (_label, using), model in pending.items():
+            _bump_now_and_on_commit(model, using)
+
+
+def _bump_now_and_on_commit(
+    model: type[models.Model], using: Optional[str] = None
+) -> None:
+    pending = getattr(_batch_state, "pending", None)
+    if pending is not None:
+        pending[(model._meta.label_lower, using)] = model
+        return
+    bump_model_version(model)
+    try:
+        if not transaction.get_connection(using).in_atomic_block:
+            return
+        # Bumped above for reads inside the transaction; bump again on commit
+        # so entries cached by other requests before the commit are dropped.
+        transaction.on_commit(lambda: bump_model_version(model), using=using)
+    except Exception:
+        pass
+
+
+def record_model_write(model: type[models.Model], using: Optional[str] = None) -> None:
+    """Bump *model* for writes that send no signals (``QuerySet.update``, raw SQL)."""
+    _bump_now_and_on_commit(model, using)
+
+
+def _handle_write(sender, using: Optional[str] = None, **kwargs) -> None:
+    if kwargs.get("raw"):
+        return
+    _bump_now_and_on_commit(sender, using)
+
+
+def _handle_m2m_changed(
+    sender, instance, action: str, model=None, using: Optional[str] = None, **kwargs
+) -> None:
+    if not action.startswith("post_"):
+        return
+    _bump_now_and_on_commit(sender, using)
+    _bump_now_and_on_commit(type(instance), using)
+    if model is not None:
+        _bump_now_and_on_commit(model, using)
+
+
+def _settings_sections() -> Iterator[dict]:
+    yield getattr(settings, "RAIL_DJANGO_GRAPHQL", {}) or {}
+    schema_configs = getattr(settings, "RAIL_DJANGO_GRAPHQL_SCHEMAS", {}) or {}
+    if isinstance(schema_configs, dict):
+        for config in schema_configs.values():
+            if isinstance(config, dict):
+                yield config
+
+
+def model_version_signals_required(config: Optional[dict] = None) -> bool:
+    """Return whether the settings (or *config*) enable a feature keyed on model versions."""
+    configs = _settings_sections() if config is None else (config,)
+    for config in configs:
+        query_settings = config.get("query_settings", {}) or {}
+        if str(query_settings.get("default_count_mode") or "").lower() == "cached":
+            return True
+        performance_settings = config.get("performance_settings", {}) or {}
+        if performance_settings.get("enable_query_caching") or performance_settings.get(
+            "http_conditional_caching"
+        ):
+            return True
+    return False
+
+
+def model_version_signals_connected() -> bool:
+    """Return whether writes currently bump model versions."""
+    return _SIGNALS_CONNECTED
+
+
+def ensure_model_version_signals() -> None:
+    """Connect the signal handlers bumping model versions (idempotent)."""
+    global _SIGNALS_CONNECTED
+    if _SIGNALS_CONNECTED:
+        return
+    post_save.connect(_handle_write, dispatch_uid="rail_django_model_version_post_save")
+    post_delete.connect(_handle_write, dispatch_uid="rail_django_model_version_post_delete")
+    m2m_changed.connect(
+        _handle_m2m_changed, dispatch_uid="rail_django_model_version_m2m_changed"
+    )
+    _SIGNALS_CONNECTED = True
@@ -10,9 +10,10 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple, Type
 
 from django.db import models
-from graphql import Visitor, parse, visit
+from graphql import DocumentNode, Visitor, parse, visit
 from graphql.language.ast import FieldNode
 
+from .document_cache import get_document_cache
 from .runtime_settings import RuntimeSettings
 
 logger = logging.getLogger(__name__)
@@ -53,8 +54,9 @@ class QueryOptimizer:
             query_timeout=self.settings.query_timeout,
             enable_performance_monitoring=False,
             log_slow_queries=False,
+            plan_cache_size=self.settings.query_plan_cache_size,
         )
-        return SelectionOptimizer(config)
+        return SelectionOptimizer(config, self.schema_name)
 
     def optimize_queryset(self, queryset: models.QuerySet, info: Any = None) -> models.QuerySet:
         """
@@ -142,9 +144,19 @@ class QueryComplexityAnalyzer:
 
     def _analyze_with_ast(self, query: str) -> Optional[tuple[int, int]]:
         try:
-            document = parse(query)
+            document = get_document_cache().get_document(query).document
         except Exception:
             return None
+        return self.analyze_document(document)
+
+    def analyze_document(self, document: DocumentNode) -> tuple[int, int]:
+        """Analyze depth and complexity of a parsed document, memoized per document."""
+        key = ("complexity", tuple(sorted(self.complexity_weights.items())))
+        return get_document_cache().get_artifact(
+            document, key, lambda: self._visit_document(document)
+        )
+
+    def _visit_document(self, document: DocumentNode) -> tuple[int, int]:
         analyzer = _ComplexityVisitor(self.complexity_weights)
         visit(document, analyzer)
         return analyzer.max_depth, analyzer.total_complexity
@@ -180,13 +192,21 @@ class QueryComplexityAnalyzer:
 
     def validate_query_limits(
         self,
-        query: str,
+        query: Optional[str] = None,
         *,
         schema: Optional[Any] = None,
         document: Optional[Any] = None,
         user: Optional[Any] = None,
+        variables: Optional[dict[str, Any]] = None,
+        document_analysis: Optional[tuple[int, int]] = None,
     ) -> list[str]:
-        """Validate query against performance limits."""
+        """Validate query against performance limits.
+
+        Either the query text or an already parsed *document* must be given;
+        the document is preferred so the request is not parsed again.
+        *document_analysis* is a (depth, complexity) pair already computed
+        for the document.
+        """
         errors: list[str] = []
         enable_depth = bool(self.settings.enable_query_depth_limiting)
         enable_complexity = bool(self.settings.enable_query_cost_analysis)
@@ -196,11 +216,9 @@ class QueryComplexityAnalyzer:
                 GraphQLSecurityAnalyzer,
                 SecurityConfig,
             )
-            from .settings import SchemaSettings
             from .security import get_introspection_roles
 
             doc = document or parse(query)
-            schema_settings = SchemaSettings.from_schema(self.schema_name or "default")
             analyzer = GraphQLSecurityAnalyzer(
                 SecurityConfig(
                     max_query_complexity=self.settings.max_query_complexity,
@@ -216,14 +234,19 @@ class QueryComplexityAnalyzer:
                 )
             )
             if schema is not None and (enable_depth or enable_complexity):
-                result = analyzer.analyze_query(doc, schema, user=user)
+                result = analyzer.analyze_query(doc, schema, user=user, variables=variables)
                 errors.extend(result.blocked_reasons)
                 return errors
         except Exception:
             # Fall back to the simple string-based analysis
             pass
 
-        depth, complexity = self.analyze_query(query)
+        if document_analysis is not None:
+            depth, complexity = document_analysis
+        elif document is not None:
+            depth, complexity = self.analyze_document(document)
+        else:
+            depth, complexity = self.analyze_query(query or "")
         if enable_depth and depth > self.settings.max_query_depth:
             errors.append(
                 f"Query depth {depth} exceeds maximum allowed depth {self.settings.max_query_depth}"
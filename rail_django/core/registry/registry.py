@@ -128,6 +128,13 @@ class SchemaRegistry:
                 from ...config_proxy import configure_schema_settings
                 configure_schema_settings(name, clear_existing=True, **schema_settings)
 
+                from ..model_versions import (
+                    ensure_model_version_signals,
+                    model_version_signals_required,
+                )
+                if model_version_signals_required(schema_settings):
+                    ensure_model_version_signals()
+
             logger.info(f"Registered schema: {name}")
             self._run_post_registration_hooks(schema_info)
             return schema_info
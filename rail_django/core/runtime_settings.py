@@ -87,6 +87,7 @@ class RuntimeSettings:
     max_query_complexity: int = 1000
     enable_query_cost_analysis: bool = False
     query_timeout: int = 30
+    query_plan_cache_size: int = 1000
 
     @classmethod
     def from_schema(cls, schema_name: Optional[str] = None) -> "RuntimeSettings":
@@ -88,6 +88,7 @@ class SchemaBuilderCore:
         # Schema state
         self._schema = None
         self._query_fields: dict[str, Union[graphene.Field, graphene.List]] = {}
+        self._query_operations: dict[str, tuple[type[models.Model], str]] = {}
         self._mutation_fields: dict[str, type[graphene.Mutation]] = {}
         self._subscription_fields: dict[str, graphene.Field] = {}
         self._registered_models: set[type[models.Model]] = set()
@@ -459,6 +460,7 @@ class SchemaBuilderCore:
         with self._lock:
             self._schema = None
             self._query_fields.clear()
+            self._query_operations.clear()
             self._mutation_fields.clear()
             self._subscription_fields.clear()
             self._registered_models.clear()
@@ -482,6 +484,22 @@ class SchemaBuilderCore:
         """
         return self._query_fields.copy()
 
+    def get_query_operation(
+        self, field_name: str
+    ) -> Optional[tuple[type[models.Model], str]]:
+        """
+        Returns the model and operation of a generated root query field.
+
+        Args:
+            field_name: Root query field name (e.g. ``productList``)
+
+        Returns:
+            Optional[Tuple[Type[models.Model], str]]: ``(model, operation)`` with
+            operation one of retrieve, list, group, paginated or history, or
+            None for fields not generated from a model
+        """
+        return self._query_operations.get(field_name)
+
     def get_mutation_fields(self) -> dict[str, type[graphene.Mutation]]:
         """
         Returns the current mutation fields for this schema.
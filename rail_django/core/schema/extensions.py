@@ -15,6 +15,8 @@ from django.conf import settings as django_settings
 from django.db import models
 from graphene_django.debug import DjangoDebug
 
+from ...config_proxy import get_setting
+
 logger = logging.getLogger(__name__)
 
 
@@ -477,10 +479,19 @@ class ExtensionsMixin:
                     )
 
                 # Create the schema
+                directives = None
+                if get_setting(
+                    "performance_settings.incremental_delivery", False, self.schema_name
+                ):
+                    from ..incremental import get_incremental_directives
+
+                    directives = get_incremental_directives()
+
                 self._schema = graphene.Schema(
                     query=query_type,
                     mutation=mutation_type,
                     subscription=subscription_type,
+                    directives=directives,
                     auto_camelcase=self.settings.auto_camelcase,
                 )
 
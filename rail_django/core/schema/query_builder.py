@@ -97,6 +97,7 @@ class QueryBuilderMixin:
                 description="Dummy query field to ensure schema validity"
             )
         }
+        self._query_operations = {}
 
         for model in models_list:
             # Canonical model token: camelCase model class name.
@@ -140,11 +141,19 @@ class QueryBuilderMixin:
                         model, manager_name
                     )
                     self._query_fields[f"{model_name}{manager_suffix}"] = single_query
+                    self._query_operations[f"{model_name}{manager_suffix}"] = (
+                        model,
+                        "retrieve",
+                    )
 
                     list_query = self.query_generator.generate_list_query(
                         model, manager_name
                     )
                     self._query_fields[f"{model_name}List{manager_suffix}"] = list_query
+                    self._query_operations[f"{model_name}List{manager_suffix}"] = (
+                        model,
+                        "list",
+                    )
 
                     grouping_query = self.query_generator.generate_grouping_query(
                         model, manager_name
@@ -152,6 +161,10 @@ class QueryBuilderMixin:
                     self._query_fields[f"{model_name}Group{manager_suffix}"] = (
                         grouping_query
                     )
+                    self._query_operations[f"{model_name}Group{manager_suffix}"] = (
+                        model,
+                        "group",
+                    )
 
                 if self.settings.enable_pagination:
                     paginated_query = self.query_generator.generate_paginated_query(
@@ -163,6 +176,10 @@ class QueryBuilderMixin:
                     self._query_fields[f"{model_name}Page{manager_suffix}"] = (
                         paginated_query
                     )
+                    self._query_operations[f"{model_name}Page{manager_suffix}"] = (
+                        history_result_model or model,
+                        "history" if is_history_manager else "paginated",
+                    )
 
     def _generate_mutation_fields(self, models_list: list[type[models.Model]]) -> None:
         """
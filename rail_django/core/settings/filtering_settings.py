@@ -17,6 +17,9 @@ class FilteringSettings:
     enable_window_filters: bool = True
     enable_subquery_filters: bool = True
     enable_conditional_aggregation: bool = True
+    aggregation_filter_strategy: str = "auto"
+    quick_search_backend: str = "auto"
+    workload_sample_rate: float = 0.0
     enable_array_filters: bool = True
     enable_field_comparison: bool = True
     enable_distinct_count: bool = True
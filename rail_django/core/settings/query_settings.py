@@ -24,6 +24,8 @@ class QueryGeneratorSettings:
     enable_estimated_counts: bool = True
     estimated_count_min_rows: int = 50000
     default_count_mode: str = "auto"
+    count_cache_timeout: int = 300
+    count_cap: int = 10000
     additional_lookup_fields: Dict[str, List[str]] = field(default_factory=dict)
     require_model_permissions: bool = True
     model_permission_codename: str = "view"
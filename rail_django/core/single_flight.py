@@ -0,0 +1,244 @@
+"""
+Single-flight recomputation of cached values.
+
+When a hot cache entry expires, every request that misses it would otherwise
+recompute it at the same time. ``SingleFlight.run`` lets one caller per key
+recompute while the others wait for its result or, when an expired copy is
+still around, return that copy (stale-while-revalidate):
+
+- threads of one process serialize on an in-process lock per key;
+- processes coordinate through a short lease taken with ``cache.add`` in the
+  Django cache. Without a lease holder, or once the lease holder is slower
+  than ``wait_timeout``, callers compute the value themselves.
+
+Stale copies come from envelopes written by ``pack_entry``: the entry is kept
+``stale_ttl`` seconds past its fresh lifetime and ``unpack_entry`` reports
+whether it is still fresh.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional, TypeVar
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SINGLE_FLIGHT_PREFIX = "rail_django:single_flight"
+DEFAULT_STALE_TTL = 300
+
+_ENVELOPE_MARKER = "_rail_swr"
+
+Lookup = Callable[[], Optional[tuple[Any, bool]]]
+
+_UNSET = object()
+
+
+def pack_entry(
+    value: Any, timeout: Optional[int], stale_ttl: int = DEFAULT_STALE_TTL
+) -> tuple[dict[str, Any], Optional[int]]:
+    """
+    Wrap *value* for storage with a fresh lifetime of *timeout* seconds.
+
+    Returns:
+        Tuple of (entry, storage timeout). The storage timeout extends
+        *timeout* by *stale_ttl* so expired copies can still be served.
+    """
+    if not timeout or timeout <= 0:
+        return {_ENVELOPE_MARKER: True, "value": value, "fresh_until": None}, timeout
+    entry = {
+        _ENVELOPE_MARKER: True,
+        "value": value,
+        "fresh_until": time.time() + timeout,
+    }
+    return entry, timeout + max(0, int(stale_ttl))
+
+
+def unpack_entry(entry: Any) -> Optional[tuple[Any, bool]]:
+    """Return ``(value, is_fresh)`` for a stored entry, or None when absent.
+
+    Entries not written by ``pack_entry`` are returned as fresh values.
+    """
+    if entry is None:
+        return None
+    if not isinstance(entry, dict) or not entry.get(_ENVELOPE_MARKER):
+        return entry, True
+    fresh_until = entry.get("fresh_until")
+    return entry.get("value"), fresh_until is None or fresh_until > time.time()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent recomputations of the same cache key.
+
+    Args:
+        cache_alias: Django cache alias holding the cross-process leases.
+        lease_timeout: Seconds a lease is held at most (crashed holders).
+        wait_timeout: Seconds a caller waits for another one's result before
+            computing the value itself.
+        poll_interval: Seconds between lookups while waiting on a lease.
+    """
+
+    def __init__(
+        self,
+        cache_alias: str = "default",
+        *,
+        lease_timeout: float = 30.0,
+        wait_timeout: float = 10.0,
+        poll_interval: float = 0.05,
+    ):
+        self.cache_alias = cache_alias
+        self.lease_timeout = lease_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._locks: dict[str, list[Any]] = {}
+        self._locks_guard = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.computes = 0
+        self.stale_served = 0
+        self.waited = 0
+
+    def run(
+        self,
+        key: str,
+        compute: Callable[[], T],
+        lookup: Lookup,
+        *,
+        found: Any = _UNSET,
+    ) -> T:
+        """
+        Return the cached value of *key*, computing it at most once at a time.
+
+        Args:
+            key: Identifies the cached value across processes.
+            compute: Recomputes the value and stores it where *lookup* reads.
+            lookup: Returns ``(value, is_fresh)`` or None on a miss.
+            found: Result of a lookup the caller already made.
+        """
+        if found is _UNSET:
+            found = lookup()
+        if found is not None and found[1]:
+            return found[0]
+        stale = found[0] if found is not None else _UNSET
+
+        lock = self._acquire_lock_entry(key)
+        acquired = False
+        try:
+            acquired = lock.acquire(blocking=False)
+            if not acquired:
+                if stale is not _UNSET:
+                    self._count("stale_served")
+                    return stale
+                self._count("waited")
+                acquired = lock.acquire(timeout=self.wait_timeout)
+                found = lookup()
+                if found is not None and found[1]:
+                    return found[0]
+            return self._run_with_lease(key, compute, lookup, stale)
+        finally:
+            if acquired:
+                lock.release()
+            self._release_lock_entry(key)
+
+    def get_stats(self) -> dict[str, int]:
+        with self._stats_lock:
+            return {
+                "computes": self.computes,
+                "stale_served": self.stale_served,
+                "waited": self.waited,
+            }
+
+    def _run_with_lease(
+        self, key: str, compute: Callable[[], T], lookup: Lookup, stale: Any
+    ) -> T:
+        lease_key = self._lease_key(key)
+        token = uuid.uuid4().hex
+        if not self._take_lease(lease_key, token):
+            if stale is not _UNSET:
+                self._count("stale_served")
+                return stale
+            self._count("waited")
+            deadline = time.monotonic() + self.wait_timeout
+            while time.monotonic() < deadline:
+                time.sleep(self.poll_interval)
+                found = lookup()
+                if found is not None and found[1]:
+                    return found[0]
+                if self._take_lease(lease_key, token):
+                    break
+            else:
+                logger.debug("Single-flight wait timed out for %s", key)
+                token = None
+        try:
+            self._count("computes")
+            return compute()
+        finally:
+            if token is not None:
+                self._drop_lease(lease_key, token)
+
+    def _lease_key(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return f"{SINGLE_FLIGHT_PREFIX}:{digest}"
+
+    def _take_lease(self, lease_key: str, token: str) -> bool:
+        try:
+            return bool(
+                caches[self.cache_alias].add(
+                    lease_key, token, max(1, int(self.lease_timeout))
+                )
+            )
+        except Exception as exc:
+            logger.debug("Single-flight lease unavailable: %s", exc)
+            return True
+
+    def _drop_lease(self, lease_key: str, token: str) -> None:
+        try:
+            cache = caches[self.cache_alias]
+            if cache.get(lease_key) == token:
+                cache.delete(lease_key)
+        except Exception as exc:
+            logger.debug("Single-flight lease release failed: %s", exc)
+
+    def _acquire_lock_entry(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = [threading.Lock(), 0]
+                self._locks[key] = entry
+            entry[1] += 1
+            return entry[0]
+
+    def _release_lock_entry(self, key: str) -> None:
+        with self._locks_guard:
+            entry = self._locks.get(key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                self._locks.pop(key, None)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide single-flight coordinator."""
+    global _single_flight
+    if _single_flight is not None:
+        return _single_flight
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+        return _single_flight
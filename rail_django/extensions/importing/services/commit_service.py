@@ -8,6 +8,7 @@ from django.apps import apps
 from django.db import transaction
 from django.utils import timezone
 
+from ....core.model_versions import batched_model_version_bumps, record_model_write
 from ..constants import ImportIssueCode
 from ..models import (
     ImportBatch,
@@ -78,6 +79,7 @@ def _normalize_non_null_value_for_commit(
 
 
 @transaction.atomic
+@batched_model_version_bumps()
 def commit_batch(
     *,
     batch: ImportBatch,
@@ -179,6 +181,7 @@ def commit_batch(
         ) from exc
 
     batch.rows.filter(id__in=[row.id for row in valid_rows]).update(status=ImportRowStatus.COMMITTED)
+    record_model_write(batch.rows.model)
     committed_rows = create_count + update_count
     batch.status = ImportBatchStatus.COMMITTED
     batch.committed_rows = committed_rows
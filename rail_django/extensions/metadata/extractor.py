@@ -16,8 +16,9 @@ from ...core.mutation_permissions import (
     get_mutation_access_config,
 )
 from ...core.security import get_authz_manager
+from ...core.single_flight import get_single_flight
 from .utils import (
-    get_cached_schema,
+    get_cached_schema_entry,
     set_cached_schema,
     get_model_version,
 )
@@ -116,14 +117,51 @@ class ModelSchemaExtractor(
         include = set(include_sections or [])
         section_subfields = include_section_subfields or {}
 
+        user_id = str(user.pk) if user and hasattr(user, "pk") else None
+        found = get_cached_schema_entry(app_name, model_name, user_id, object_id)
+        if found is not None and found[1]:
+            return _project_schema_payload(found[0], include, section_subfields)
+
+        def build() -> dict[str, Any]:
+            return self._build_schema(
+                app_name,
+                model_name,
+                user,
+                object_id,
+                user_id,
+                include,
+                section_subfields,
+            )
+
+        if getattr(settings, "DEBUG", False):
+            result = build()
+        else:
+            # Only one caller rebuilds an expired or missing entry.
+            result = get_single_flight().run(
+                f"metadata:{app_name}:{model_name}:{user_id}:{object_id}",
+                build,
+                lambda: get_cached_schema_entry(
+                    app_name, model_name, user_id, object_id
+                ),
+                found=found,
+            )
+        return _project_schema_payload(result, include, section_subfields)
+
+    def _build_schema(
+        self,
+        app_name: str,
+        model_name: str,
+        user: Any,
+        object_id: Optional[str],
+        user_id: Optional[str],
+        include: set[str],
+        section_subfields: dict[str, set[str]],
+    ) -> dict[str, Any]:
+        """Build (and cache) the full schema payload of a model."""
+
         def wants(section: str) -> bool:
             return not include or section in include
 
-        user_id = str(user.pk) if user and hasattr(user, "pk") else None
-        cached = get_cached_schema(app_name, model_name, user_id, object_id)
-        if cached:
-            return _project_schema_payload(cached, include, section_subfields)
-
         try:
             model = apps.get_model(app_name, model_name)
         except LookupError:
@@ -224,7 +262,7 @@ class ModelSchemaExtractor(
         if should_cache_full_payload:
             set_cached_schema(app_name, model_name, result, user_id, object_id)
 
-        return _project_schema_payload(result, include, section_subfields)
+        return result
 
     def _extract_field_groups(self, model: Any, graphql_meta: Any) -> list[dict]:
         """Extract field grouping information."""
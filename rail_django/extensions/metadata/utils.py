@@ -8,6 +8,7 @@ from typing import Any, Optional
 from django.core.cache import cache
 from django.conf import settings
 from django.db import models
+from ...core.single_flight import pack_entry, unpack_entry
 from ...utils.hashing import short_hash
 
 # Cache management
@@ -229,14 +230,22 @@ def get_cached_schema(
     app: str, model: str, user_id: Optional[str] = None, object_id: Optional[str] = None
 ) -> Optional[dict[str, Any]]:
     """Retrieve schema from cache."""
+    entry = get_cached_schema_entry(app, model, user_id, object_id)
+    return entry[0] if entry is not None else None
+
+
+def get_cached_schema_entry(
+    app: str, model: str, user_id: Optional[str] = None, object_id: Optional[str] = None
+) -> Optional[tuple[dict[str, Any], bool]]:
+    """Retrieve ``(schema, is_fresh)`` from cache, including expired copies."""
     # In DEBUG mode, we might want to skip cache for faster iteration
     if getattr(settings, "DEBUG", False):
         return None
 
     version = get_model_version(app, model)
     static_key = _get_static_cache_key(app, model, version=version)
-    static_payload = cache.get(static_key)
-    if not static_payload:
+    static_entry = unpack_entry(cache.get(static_key))
+    if not static_entry or not static_entry[0]:
         return None
 
     overlay_key = _get_overlay_cache_key(
@@ -246,8 +255,10 @@ def get_cached_schema(
         object_id=object_id,
         version=version,
     )
-    overlay_payload = cache.get(overlay_key)
-    return _merge_schema_payload(static_payload, overlay_payload)
+    overlay_entry = unpack_entry(cache.get(overlay_key))
+    overlay_payload = overlay_entry[0] if overlay_entry else None
+    fresh = static_entry[1] and (overlay_entry is None or overlay_entry[1])
+    return _merge_schema_payload(static_entry[0], overlay_payload), fresh
 
 
 def set_cached_schema(
@@ -265,7 +276,7 @@ def set_cached_schema(
     static_payload, overlay_payload = _split_schema_payload(data)
 
     static_key = _get_static_cache_key(app, model, version=version)
-    cache.set(static_key, static_payload, timeout=OVERLAY_CACHE_TIMEOUT_SECONDS)
+    cache.set(static_key, *pack_entry(static_payload, OVERLAY_CACHE_TIMEOUT_SECONDS))
 
     overlay_key = _get_overlay_cache_key(
         app,
@@ -274,7 +285,7 @@ def set_cached_schema(
         object_id=object_id,
         version=version,
     )
-    cache.set(overlay_key, overlay_payload, timeout=OVERLAY_CACHE_TIMEOUT_SECONDS)
+    cache.set(overlay_key, *pack_entry(overlay_payload, OVERLAY_CACHE_TIMEOUT_SECONDS))
 
 
 def invalidate_metadata_cache(app: str = None, model: str = None) -> None:
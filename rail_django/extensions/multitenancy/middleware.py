@@ -3,6 +3,8 @@ Multitenancy GraphQL middleware.
 """
 
 from typing import Optional
+
+from ...core.middleware.base import after_resolve
 from .settings import get_multitenancy_settings
 from .resolver import resolve_tenant_id
 from .applicator import filter_result_for_tenant
@@ -24,4 +26,7 @@ class TenantContextMiddleware:
 
         resolve_tenant_id(getattr(info, "context", None), schema_name=schema_name)
         result = next_resolver(root, info, **kwargs)
-        return filter_result_for_tenant(result, info, schema_name=schema_name)
+        return after_resolve(
+            result,
+            lambda value: filter_result_for_tenant(value, info, schema_name=schema_name),
+        )
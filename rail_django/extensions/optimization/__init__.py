@@ -15,6 +15,7 @@ from .optimizer import (
     get_optimizer,
 )
 from .cache import invalidate_query_cache
+from .plan_cache import QueryPlan, QueryPlanCache
 
 __all__ = [
     # Configuration
@@ -26,6 +27,8 @@ __all__ = [
     "QueryOptimizer",
     "get_optimizer",
     "configure_optimization",
+    "QueryPlan",
+    "QueryPlanCache",
     # Monitor
     "PerformanceMonitor",
     "PerformanceMetrics",
@@ -9,6 +9,7 @@ from typing import Any, Callable, Dict, List, Optional, Set, Type
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 from django.db.models.fields.related import ForeignKey, ManyToManyField, OneToOneField
+from graphene.utils.str_converters import to_snake_case
 from graphql import GraphQLResolveInfo
 from graphql.language.ast import FieldNode, FragmentSpreadNode, InlineFragmentNode
 
@@ -21,6 +22,9 @@ from .config import QueryOptimizationConfig
 
 logger = logging.getLogger(__name__)
 
+# Arguments routing a nested relation list through a per-request list loader.
+RELATION_LIST_ARGUMENTS = frozenset({"filters", "limit", "orderBy", "order_by"})
+
 
 @dataclass
 class QueryAnalysisResult:
@@ -98,6 +102,14 @@ class QueryAnalyzer:
                     field_name = selection.name.value
                     if field_name.startswith("__"):
                         continue
+                    if selection.selection_set and any(
+                        argument.name.value in RELATION_LIST_ARGUMENTS
+                        for argument in selection.arguments or ()
+                    ):
+                        # Filtered, ordered or limited relation lists are
+                        # resolved by per-request list loaders; prefetching
+                        # the unfiltered relation would be wasted work.
+                        continue
                     current_path = (
                         f"{parent_path}__{field_name}" if parent_path else field_name
                     )
@@ -137,7 +149,7 @@ class QueryAnalyzer:
 
         Pagination queries expose model fields under an `items` wrapper:
         e.g. `items__orderItems__id`. For relationship analysis we need
-        `orderItems__id`.
+        `order_items__id`.
         """
         normalized: set[str] = set()
         root_fields = {
@@ -166,7 +178,10 @@ class QueryAnalyzer:
                 candidate = candidate[len("node__") :]
 
             if candidate:
-                normalized.add(candidate)
+                # GraphQL names are camelCased; model lookups are not.
+                normalized.add(
+                    "__".join(to_snake_case(segment) for segment in candidate.split("__"))
+                )
 
         return normalized
 
@@ -422,7 +437,7 @@ class QueryAnalyzer:
             if getattr(field, "is_relation", False) and hasattr(field, "attname"):
                 concrete_names.append(field.attname)
             else:
-                concrete_names.append(field.column if hasattr(field, "column") else field.name)
+                concrete_names.append(field.attname if hasattr(field, "attname") else field.name)
 
         # Deduplicate while preserving order
         seen: set[str] = set()
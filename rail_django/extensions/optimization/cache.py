@@ -45,6 +45,7 @@ def _build_query_cache_key(
     versions: list[str],
     user_id: Optional[str],
     cache_buster: Optional[str],
+    tenant_id: Optional[str] = None,
 ) -> str:
     operation = info.operation
     operation_name = None
@@ -62,6 +63,7 @@ def _build_query_cache_key(
         "query_hash": query_hash,
         "variables": variables,
         "user_id": user_id,
+        "tenant_id": tenant_id,
         "versions": versions,
         "cache_buster": cache_buster,
     }
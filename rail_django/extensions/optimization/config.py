@@ -28,6 +28,7 @@ class QueryOptimizationConfig:
     max_query_complexity: int = 1000
     max_query_depth: int = 10
     query_timeout: int = 30  # seconds
+    plan_cache_size: int = 1000  # memoized select/prefetch/only plans
 
     # Resource Monitoring
     enable_performance_monitoring: bool = True
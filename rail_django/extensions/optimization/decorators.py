@@ -12,6 +12,66 @@ from graphql import DocumentNode, GraphQLResolveInfo
 from .optimizer import get_optimizer
 from .monitor import get_performance_monitor
 from .cache import _resolve_cache_scopes, _build_query_cache_key
+from .result_cache import (
+    DependencyRecorder,
+    collect_selection_models,
+    get_cached_result,
+    store_result,
+)
+from ...core.execution import synchronous_execution
+from ...core.single_flight import get_single_flight
+
+
+def _resolver_cache_key(
+    info: GraphQLResolveInfo,
+    schema_name: Optional[str],
+    cache_backend,
+    cache_config,
+    user_specific_cache: bool,
+    cache_scopes: Optional[list[str]],
+) -> str:
+    cache_user_specific = bool(
+        user_specific_cache or getattr(cache_config, "query_cache_user_specific", False)
+    )
+    user = getattr(info.context, "user", None)
+    user_id = None
+    if cache_user_specific and user and getattr(user, "is_authenticated", False):
+        user_id = str(getattr(user, "id", None) or getattr(user, "pk", None))
+
+    tenant_id = _request_tenant_id(info, schema_name)
+
+    scope_setting = getattr(cache_config, "query_cache_scope", "schema")
+    scopes = _resolve_cache_scopes(scope_setting, schema_name, cache_scopes)
+    versions = [cache_backend.get_version(scope) for scope in scopes]
+    cache_buster = getattr(info.context, "cache_buster", None) or getattr(
+        info.context, "cache_version", None
+    )
+    return _build_query_cache_key(
+        info,
+        schema_name=schema_name,
+        versions=versions,
+        user_id=user_id,
+        cache_buster=cache_buster,
+        tenant_id=None if tenant_id is None else str(tenant_id),
+    )
+
+
+def _request_tenant_id(info: GraphQLResolveInfo, schema_name: Optional[str]):
+    try:
+        from ...extensions.multitenancy import (
+            get_multitenancy_settings,
+            resolve_tenant_id,
+        )
+    except ImportError:
+        return None
+    try:
+        if not get_multitenancy_settings(schema_name).enabled:
+            return None
+        return resolve_tenant_id(
+            getattr(info, "context", None), schema_name=schema_name
+        )
+    except Exception:
+        return None
 
 
 def optimize_query(
@@ -20,12 +80,27 @@ def optimize_query(
     user_specific_cache: bool = False,
     complexity_limit: Optional[int] = None,
     cache_scopes: Optional[list[str]] = None,
+    authorize: Optional[Callable] = None,
 ):
     """
     Decorator for optimizing GraphQL queries.
+
+    ``authorize`` is called with the resolver arguments before a cached
+    result is looked up, so access checks also guard cache hits. Cached
+    results are keyed on the request tenant when multitenancy is enabled.
+
+    When query caching is enabled, results are cached per operation and keyed
+    on the data versions of every model the resolver read (see
+    ``result_cache``), so writes to those models invalidate the entry.
+    QuerySet results (relay connections) are not cached. Concurrent misses
+    of one entry are coalesced by ``core.single_flight``. Resolvers computing
+    a cached entry run synchronously even under async execution.
     """
 
     def decorator(resolver_func: Callable) -> Callable:
+        # Resolvers returning QuerySets (relay connections) are never cached.
+        state = {"returns_queryset": False}
+
         @wraps(resolver_func)
         def wrapper(root, info: GraphQLResolveInfo, **kwargs):
             schema_name = getattr(info.context, "schema_name", None)
@@ -72,88 +147,87 @@ def optimize_query(
                         )
 
                 # ExÇ¸cuter la requÇºte
+                cache_key = None
                 if (
                     cache_enabled
                     and cache_backend is not None
+                    and not state["returns_queryset"]
                     and info.operation
                     and info.operation.operation.value == "query"
                 ):
-                    cache_timeout_value = cache_timeout
-                    if cache_timeout_value is None and cache_config is not None:
-                        cache_timeout_value = getattr(cache_config, "cache_timeout", None)
-
-                    cache_user_specific = bool(
-                        user_specific_cache
-                        or getattr(cache_config, "query_cache_user_specific", False)
-                    )
-                    user = getattr(info.context, "user", None)
-                    user_id = None
-                    if cache_user_specific and user and getattr(user, "is_authenticated", False):
-                        user_id = str(getattr(user, "id", None) or getattr(user, "pk", None))
-
-                    scope_setting = getattr(cache_config, "query_cache_scope", "schema")
-                    scopes = _resolve_cache_scopes(scope_setting, schema_name, cache_scopes)
-                    versions = [cache_backend.get_version(scope) for scope in scopes]
-                    cache_buster = getattr(info.context, "cache_buster", None) or getattr(
-                        info.context, "cache_version", None
-                    )
-
-                    cache_key = _build_query_cache_key(
+                    if authorize is not None:
+                        authorize(root, info, **kwargs)
+                    cache_key = _resolver_cache_key(
                         info,
-                        schema_name=schema_name,
-                        versions=versions,
-                        user_id=user_id,
-                        cache_buster=cache_buster,
-                    )
-                    cached = cache_backend.get(cache_key)
-                    if cached is not None:
-                        return cached
-
-                result = resolver_func(root, info, **kwargs)
-
-                # Optimize queryset if it's a QuerySet
-                if isinstance(result, QuerySet) and hasattr(result, "model"):
-                    result = optimizer.optimize_queryset(result, info, result.model)
-                if (
-                    cache_enabled
-                    and cache_backend is not None
-                    and info.operation
-                    and info.operation.operation.value == "query"
-                    and result is not None
-                    and not isinstance(result, QuerySet)
-                ):
-                    cache_timeout_value = cache_timeout
-                    if cache_timeout_value is None and cache_config is not None:
-                        cache_timeout_value = getattr(cache_config, "cache_timeout", None)
-                    cache_user_specific = bool(
-                        user_specific_cache
-                        or getattr(cache_config, "query_cache_user_specific", False)
+                        schema_name,
+                        cache_backend,
+                        cache_config,
+                        user_specific_cache,
+                        cache_scopes,
                     )
-                    user = getattr(info.context, "user", None)
-                    user_id = None
-                    if cache_user_specific and user and getattr(user, "is_authenticated", False):
-                        user_id = str(getattr(user, "id", None) or getattr(user, "pk", None))
-                    scope_setting = getattr(cache_config, "query_cache_scope", "schema")
-                    scopes = _resolve_cache_scopes(scope_setting, schema_name, cache_scopes)
-                    versions = [cache_backend.get_version(scope) for scope in scopes]
-                    cache_buster = getattr(info.context, "cache_buster", None) or getattr(
-                        info.context, "cache_version", None
+                    found, known_versions = get_cached_result(
+                        cache_backend, cache_key, info
                     )
-                    cache_key = _build_query_cache_key(
-                        info,
-                        schema_name=schema_name,
-                        versions=versions,
-                        user_id=user_id,
-                        cache_buster=cache_buster,
+                    if found is not None and found[1]:
+                        performance_monitor.record_query_performance(
+                            query_name=info.field_name,
+                            execution_time=time.time() - start_time,
+                            cache_hit=True,
+                        )
+                        return found[0]
+
+                computed = []
+
+                def compute():
+                    computed.append(True)
+                    if cache_key is None:
+                        result = resolver_func(root, info, **kwargs)
+                    else:
+                        # Cached results must be complete, so generated
+                        # resolvers do not return awaitables here.
+                        with synchronous_execution(), DependencyRecorder() as dependencies:
+                            result = resolver_func(root, info, **kwargs)
+
+                    # Optimize queryset if it's a QuerySet
+                    if isinstance(result, QuerySet) and hasattr(result, "model"):
+                        state["returns_queryset"] = True
+                        result = optimizer.optimize_queryset(result, info, result.model)
+                    if (
+                        cache_key is not None
+                        and result is not None
+                        and not isinstance(result, QuerySet)
+                    ):
+                        cache_timeout_value = cache_timeout
+                        if cache_timeout_value is None and cache_config is not None:
+                            cache_timeout_value = getattr(cache_config, "cache_timeout", None)
+                        store_result(
+                            cache_backend,
+                            cache_key,
+                            dependencies.models() | collect_selection_models(info),
+                            result,
+                            timeout=cache_timeout_value,
+                            known_versions=known_versions,
+                        )
+                    return result
+
+                if cache_key is None:
+                    result = compute()
+                else:
+                    # One caller per key recomputes; the others wait for it or
+                    # get the expired entry while it runs.
+                    result = get_single_flight().run(
+                        f"query:{cache_key}",
+                        compute,
+                        lambda: get_cached_result(cache_backend, cache_key)[0],
+                        found=found,
                     )
-                    cache_backend.set(cache_key, result, timeout=cache_timeout_value)
 
                 # Enregistrer les mÇ¸triques de performance
                 execution_time = time.time() - start_time
                 performance_monitor.record_query_performance(
                     query_name=info.field_name,
                     execution_time=execution_time,
-                    cache_hit=False,
+                    cache_hit=not computed,
                 )
 
                 return result
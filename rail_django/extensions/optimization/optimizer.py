@@ -3,7 +3,7 @@ Query optimizer for applying optimizations to Django querysets.
 """
 
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from django.db.models import Prefetch, QuerySet
 from django.db.models.fields.related import ManyToManyField
@@ -18,6 +18,13 @@ except ImportError:
 
 from .config import QueryOptimizationConfig
 from .analyzer import QueryAnalyzer
+from .plan_cache import (
+    DEFAULT_PLAN_CACHE_SIZE,
+    PrefetchPlan,
+    QueryPlan,
+    QueryPlanCache,
+    build_plan_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +32,13 @@ logger = logging.getLogger(__name__)
 class QueryOptimizer:
     """Optimizes Django querysets based on GraphQL query analysis."""
 
-    def __init__(self, config: QueryOptimizationConfig):
+    def __init__(
+        self, config: QueryOptimizationConfig, schema_name: Optional[str] = None
+    ):
         self.config = config
+        self.schema_name = schema_name
         self.analyzer = QueryAnalyzer(config)
+        self.plan_cache = QueryPlanCache(config.plan_cache_size)
 
     def optimize_queryset(
         self, queryset: QuerySet, info: GraphQLResolveInfo, model: type[models.Model]
@@ -45,36 +56,20 @@ class QueryOptimizer:
         if not self.config.auto_optimize_queries:
             return queryset
 
-        analysis = self.analyzer.analyze_query(info, model)
+        plan = self.get_plan(info, model)
 
-        # Apply select_related optimization
-        if self.config.enable_select_related and analysis.select_related_fields:
-            queryset = queryset.select_related(*analysis.select_related_fields)
-            logger.debug(f"Applied select_related: {analysis.select_related_fields}")
+        if plan.select_related:
+            queryset = queryset.select_related(*plan.select_related)
 
-        # Apply prefetch_related optimization
-        if self.config.enable_prefetch_related and analysis.prefetch_related_fields:
-            prefetch_fields, skipped_fields = self._filter_valid_prefetch_fields(
-                model, analysis.prefetch_related_fields
+        if plan.prefetch_related:
+            queryset = queryset.prefetch_related(
+                *(self.build_prefetch(entry, info) for entry in plan.prefetch_related)
             )
-            if skipped_fields:
-                logger.debug(
-                    f"Skipped invalid prefetch_related paths: {skipped_fields}"
-                )
-            if prefetch_fields:
-                prefetch_objects = self._build_prefetch_objects(
-                    model, prefetch_fields
-                )
-                queryset = queryset.prefetch_related(*prefetch_objects)
-                logger.debug(
-                    f"Applied prefetch_related: {prefetch_fields}"
-                )
 
         # Apply only() to limit fetched columns to those in the selection set
-        if analysis.only_fields:
+        if plan.only_fields:
             try:
-                queryset = queryset.only(*analysis.only_fields)
-                logger.debug(f"Applied only(): {analysis.only_fields}")
+                queryset = queryset.only(*plan.only_fields)
             except Exception:
                 # only() can fail with complex inheritance or deferred fields
                 # that conflict with select_related.  Fall back to SELECT *.
@@ -91,6 +86,180 @@ class QueryOptimizer:
 
         return queryset
 
+    def get_plan(
+        self, info: GraphQLResolveInfo, model: type[models.Model]
+    ) -> QueryPlan:
+        """Return the optimization plan for *info*, memoized per operation path."""
+        key = build_plan_key(info, model, self.schema_name)
+        if key is not None:
+            plan = self.plan_cache.get(key)
+            if plan is not None:
+                return plan
+
+        plan = self._build_plan(info, model)
+        if key is not None:
+            self.plan_cache.set(key, plan)
+        return plan
+
+    def build_prefetch(
+        self, entry: Union[str, PrefetchPlan], info: GraphQLResolveInfo
+    ) -> Union[str, Prefetch]:
+        """Turn a planned prefetch into a ``Prefetch`` for the current request.
+
+        Every level starts from the related model's default manager, is
+        scoped to the request tenant and carries its own ``select_related``,
+        nested prefetches and ``only()`` columns.
+        """
+        if isinstance(entry, str):
+            return entry
+
+        queryset = entry.model._default_manager.all()
+        queryset = self._apply_tenant_scope(queryset, info, entry.model)
+        if entry.select_related:
+            queryset = queryset.select_related(*entry.select_related)
+        if entry.children:
+            queryset = queryset.prefetch_related(
+                *(self.build_prefetch(child, info) for child in entry.children)
+            )
+        if entry.only_fields:
+            queryset = queryset.only(*entry.only_fields)
+        return Prefetch(entry.lookup, queryset=queryset)
+
+    def _apply_tenant_scope(
+        self, queryset: QuerySet, info: GraphQLResolveInfo, model: type[models.Model]
+    ) -> QuerySet:
+        try:
+            from ..multitenancy import apply_tenant_queryset
+        except ImportError:
+            return queryset
+        return apply_tenant_queryset(
+            queryset, info, model, schema_name=self.schema_name, operation="read"
+        )
+
+    def _build_plan(
+        self, info: GraphQLResolveInfo, model: type[models.Model]
+    ) -> QueryPlan:
+        analysis = self.analyzer.analyze_query(info, model)
+
+        select_related: list[str] = []
+        if self.config.enable_select_related and analysis.select_related_fields:
+            select_related = list(analysis.select_related_fields)
+            logger.debug(f"Planned select_related: {select_related}")
+
+        prefetch_plans: list[Union[str, PrefetchPlan]] = []
+        if self.config.enable_prefetch_related and analysis.prefetch_related_fields:
+            requested = self.analyzer._normalize_model_field_paths(
+                analysis.requested_fields
+            )
+            prefetch_plans = self._build_prefetch_plans(
+                model, requested, analysis.prefetch_related_fields, depth=1
+            )
+            logger.debug(f"Planned prefetch_related: {prefetch_plans}")
+
+        if analysis.only_fields:
+            logger.debug(f"Planned only(): {analysis.only_fields}")
+
+        return QueryPlan(
+            select_related=tuple(select_related),
+            prefetch_related=tuple(prefetch_plans),
+            only_fields=tuple(analysis.only_fields),
+        )
+
+    def _build_prefetch_plans(
+        self,
+        model: type[models.Model],
+        requested_fields: set[str],
+        prefetch_fields: list[str],
+        depth: int,
+    ) -> list[Union[str, PrefetchPlan]]:
+        """Plan one ``Prefetch`` per relation path, recursing into its selection.
+
+        ``requested_fields`` are model-relative paths. Levels deeper than
+        ``max_prefetch_depth`` are left to the field resolvers.
+        """
+        valid_fields, skipped_fields = self._filter_valid_prefetch_fields(
+            model, prefetch_fields
+        )
+        if skipped_fields:
+            logger.debug(f"Skipped invalid prefetch_related paths: {skipped_fields}")
+
+        plans: list[Union[str, PrefetchPlan]] = []
+        for lookup in valid_fields:
+            relation, related_model = self._resolve_prefetch_target(model, lookup)
+            if related_model is None:
+                continue
+            if _GenericRelation is not None and isinstance(relation, _GenericRelation):
+                # Generic relations keep the plain lookup (see
+                # _build_prefetch_objects for the schema check).
+                plans.extend(self._build_prefetch_objects(model, [lookup]))
+                continue
+
+            prefix = f"{lookup}__"
+            nested = {
+                path[len(prefix):] for path in requested_fields if path.startswith(prefix)
+            }
+
+            only_fields = self.analyzer._get_only_fields(related_model, nested)
+            if only_fields:
+                link_field = self._get_prefetch_link_field(relation)
+                if link_field and link_field not in only_fields:
+                    only_fields.append(link_field)
+
+            select_related: list[str] = []
+            if self.config.enable_select_related:
+                select_related = self.analyzer._get_select_related_fields(
+                    related_model, nested
+                )
+
+            children: list[Union[str, PrefetchPlan]] = []
+            if depth < self.config.max_prefetch_depth:
+                child_fields = self.analyzer._get_prefetch_related_fields(
+                    related_model, nested
+                )
+                if child_fields:
+                    children = self._build_prefetch_plans(
+                        related_model, nested, child_fields, depth + 1
+                    )
+
+            plans.append(
+                PrefetchPlan(
+                    lookup=lookup,
+                    model=related_model,
+                    only_fields=tuple(only_fields),
+                    select_related=tuple(select_related),
+                    children=tuple(children),
+                )
+            )
+        return plans
+
+    def _resolve_prefetch_target(
+        self, model: type[models.Model], field_path: str
+    ) -> tuple[Optional[Any], Optional[type[models.Model]]]:
+        """Return the last relation of *field_path* and the model it reaches."""
+        relation = None
+        current_model: Optional[type[models.Model]] = model
+        for segment in field_path.split("__"):
+            relation, current_model = self.analyzer._resolve_relation_segment(
+                current_model, segment
+            )
+            if current_model is None:
+                return None, None
+        return relation, current_model
+
+    @staticmethod
+    def _get_prefetch_link_field(relation: Any) -> Optional[str]:
+        """Column the prefetched rows need to be matched back to their parent.
+
+        Reverse FK rows are matched on their foreign key; many-to-many rows
+        are matched through the join table, so they need nothing extra.
+        """
+        if getattr(relation, "one_to_many", False) and not getattr(
+            relation, "concrete", False
+        ):
+            remote_field = getattr(relation, "field", None)
+            return getattr(remote_field, "attname", None)
+        return None
+
     def _filter_valid_prefetch_fields(
         self, model: type[models.Model], fields: list[str]
     ) -> tuple[list[str], list[str]]:
@@ -295,6 +464,9 @@ def _build_optimizer_config(schema_name: Optional[str]) -> QueryOptimizationConf
         ),
         log_slow_queries=bool(perf_settings.get("log_slow_queries", False)),
         slow_query_threshold=float(perf_settings.get("slow_query_threshold", 1.0)),
+        plan_cache_size=int(
+            perf_settings.get("query_plan_cache_size", DEFAULT_PLAN_CACHE_SIZE)
+        ),
     )
 
 
@@ -305,7 +477,7 @@ def get_optimizer(schema_name: Optional[str] = None) -> QueryOptimizer:
 
     if schema_name not in _optimizer_by_schema:
         config = _build_optimizer_config(schema_name)
-        _optimizer_by_schema[schema_name] = QueryOptimizer(config)
+        _optimizer_by_schema[schema_name] = QueryOptimizer(config, schema_name)
 
     return _optimizer_by_schema[schema_name]
 
@@ -0,0 +1,143 @@
+"""
+Memoized query optimization plans.
+
+The ``select_related`` paths, prefetch trees and ``only()`` columns chosen
+for a resolver depend only on the operation's selection set and the model
+being resolved. This module keeps them in a bounded LRU keyed by
+``(query hash, operation name, response path, model, schema)`` so a repeated
+operation reuses the plan built by the first request.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional, Union
+
+from django.db import models
+from graphql import GraphQLResolveInfo
+
+from ...core.document_cache import REQUEST_DOCUMENT_ATTR, CachedDocument
+
+DEFAULT_PLAN_CACHE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class PrefetchPlan:
+    """One level of a nested ``Prefetch`` tree.
+
+    The queryset itself is built per request (see
+    :meth:`QueryOptimizer.build_prefetch`) so tenant scoping always uses the
+    current request.
+
+    Attributes:
+        lookup: Lookup relative to the parent level, e.g. ``order_items``.
+        model: Model of the prefetched rows.
+        only_fields: Columns passed to ``only()`` for this level.
+        select_related: Forward FK/O2O paths joined into this level.
+        children: Nested prefetches of this level's rows.
+    """
+
+    lookup: str
+    model: type[models.Model]
+    only_fields: tuple[str, ...] = ()
+    select_related: tuple[str, ...] = ()
+    children: tuple[Union[str, "PrefetchPlan"], ...] = ()
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Optimizations to apply to a queryset for one selection set.
+
+    Attributes:
+        select_related: Paths passed to ``select_related()``.
+        prefetch_related: Plain lookups and :class:`PrefetchPlan` trees for
+            ``prefetch_related()``.
+        only_fields: Column names passed to ``only()``.
+    """
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[Union[str, PrefetchPlan], ...] = ()
+    only_fields: tuple[str, ...] = ()
+
+
+class QueryPlanCache:
+    """Thread-safe bounded LRU of :class:`QueryPlan` objects."""
+
+    def __init__(self, max_size: int = DEFAULT_PLAN_CACHE_SIZE):
+        self.max_size = max(0, int(max_size))
+        self._plans: OrderedDict[Hashable, QueryPlan] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[QueryPlan]:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self._plans.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def set(self, key: Hashable, plan: QueryPlan) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._plans),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def build_plan_key(
+    info: GraphQLResolveInfo,
+    model: type[models.Model],
+    schema_name: Optional[str] = None,
+) -> Optional[tuple[Any, ...]]:
+    """Return the plan cache key for a resolver call, or None if it has none.
+
+    Only operations executed from a cached document (as attached to the
+    context by the GraphQL view) have a stable identity; other executions
+    are analyzed on every call.
+    """
+    context = getattr(info, "context", None)
+    entry = getattr(context, REQUEST_DOCUMENT_ATTR, None)
+    operation = getattr(info, "operation", None)
+    if not isinstance(entry, CachedDocument) or operation is None:
+        return None
+    if not any(definition is operation for definition in entry.document.definitions):
+        return None
+
+    operation_name = operation.name.value if operation.name else None
+    path = getattr(info, "path", None)
+    # List indices do not change the selection set of a field.
+    response_path = tuple(
+        key for key in (path.as_list() if path is not None else ()) if isinstance(key, str)
+    )
+    return (
+        entry.query_hash,
+        operation_name,
+        response_path,
+        model._meta.label_lower,
+        schema_name or "",
+    )
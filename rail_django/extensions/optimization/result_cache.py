@@ -0,0 +1,297 @@
+"""
+Dependency-tracked result cache for generated query resolvers.
+
+While a resolver runs on a cache miss, every SQL statement it executes
+(filters, counts, ``select_related`` joins, prefetch queries) is inspected
+for the tables it reads, and the selection set is walked for the models of
+the object types it returns. The result is stored under a key that embeds
+the data versions of those models (``rail_django.core.model_versions``),
+which ``post_save``, ``post_delete`` and ``m2m_changed`` bump on every
+write, so an entry is invalidated exactly when one of the models it was
+built from changes.
+
+Lookups happen before any SQL runs, so a small manifest stored under the
+unversioned key lists the dependencies seen by previous computations.
+Versions are read before the resolver runs: a write racing with the
+computation leaves the new entry unreachable rather than stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from contextlib import ExitStack
+from typing import Any, Iterable, Optional
+
+from django.apps import apps
+from django.db import connections, models
+from graphql import (
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    get_named_type,
+    is_abstract_type,
+)
+from graphql.language import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+)
+
+from ...core.model_versions import get_model_version_map
+from ...core.single_flight import pack_entry, unpack_entry
+
+logger = logging.getLogger(__name__)
+
+_TABLE_RE = re.compile(r"""(?:\bFROM|\bJOIN)\s+[`"\[]?([\w$]+)""", re.IGNORECASE)
+
+
+class DependencyRecorder:
+    """Record the models read by the SQL executed inside the block.
+
+    Cached results served inside the block (``get_cached_result``) add the
+    models they were built from, so nested caches do not hide dependencies.
+    """
+
+    _active = threading.local()
+
+    def __init__(self):
+        self.tables: set[str] = set()
+        self.labels: set[str] = set()
+        self._stack: Optional[ExitStack] = None
+
+    def _wrapper(self, execute, sql, params, many, context):
+        try:
+            self.tables.update(_TABLE_RE.findall(sql or ""))
+        except TypeError:
+            pass
+        return execute(sql, params, many, context)
+
+    def __enter__(self) -> "DependencyRecorder":
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self._wrapper))
+        _active_recorders().append(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        recorders = _active_recorders()
+        if self in recorders:
+            recorders.remove(self)
+        if self._stack is not None:
+            self._stack.close()
+            self._stack = None
+
+    @classmethod
+    def note_labels(cls, labels: Iterable[str]) -> None:
+        """Add model labels to every recorder active on this thread."""
+        labels = set(labels)
+        for recorder in _active_recorders():
+            recorder.labels.update(labels)
+
+    def models(self) -> set[type[models.Model]]:
+        found = models_for_tables(self.tables)
+        for label in self.labels:
+            try:
+                found.add(apps.get_model(label))
+            except (LookupError, ValueError):
+                continue
+        return found
+
+
+def _active_recorders() -> list[DependencyRecorder]:
+    active = DependencyRecorder._active
+    if not hasattr(active, "stack"):
+        active.stack = []
+    return active.stack
+
+
+def models_for_tables(tables: Iterable[str]) -> set[type[models.Model]]:
+    """Return the models (including auto-created through models) owning *tables*."""
+    wanted = set(tables)
+    return {
+        model
+        for model in apps.get_models(include_auto_created=True)
+        if model._meta.db_table in wanted
+    }
+
+
+def models_in_sql(sql: str) -> set[type[models.Model]]:
+    """Return the models whose tables *sql* reads, subqueries included."""
+    return models_for_tables(_TABLE_RE.findall(sql or ""))
+
+
+def _object_type_model(graphql_type: Any) -> Optional[type[models.Model]]:
+    graphene_type = getattr(graphql_type, "graphene_type", None)
+    model = getattr(getattr(graphene_type, "_meta", None), "model", None)
+    if isinstance(model, type) and issubclass(model, models.Model):
+        return model
+    return None
+
+
+def _collect_models(
+    schema: Any, fragments: dict[str, Any], roots: Iterable[tuple[Any, Any]]
+) -> set[type[models.Model]]:
+    found: set[type[models.Model]] = set()
+    seen: set[tuple[str, int]] = set()
+
+    def walk(graphql_type: Any, selection_set: Any, depth: int) -> None:
+        named = get_named_type(graphql_type)
+        if depth > 20 or named is None:
+            return
+        if is_abstract_type(named):
+            for possible in schema.get_possible_types(named):
+                walk(possible, selection_set, depth + 1)
+            return
+        if not isinstance(named, GraphQLObjectType):
+            return
+        model = _object_type_model(named)
+        if model is not None:
+            found.add(model)
+        if selection_set is None:
+            return
+        marker = (named.name, id(selection_set))
+        if marker in seen:
+            return
+        seen.add(marker)
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field = named.fields.get(selection.name.value)
+                if field is not None and selection.selection_set is not None:
+                    walk(field.type, selection.selection_set, depth + 1)
+            elif isinstance(selection, InlineFragmentNode):
+                target = named
+                if selection.type_condition is not None:
+                    target = schema.get_type(selection.type_condition.name.value)
+                walk(target, selection.selection_set, depth + 1)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = fragments.get(selection.name.value)
+                if fragment is not None:
+                    target = schema.get_type(fragment.type_condition.name.value)
+                    walk(target, fragment.selection_set, depth + 1)
+
+    for graphql_type, selection_set in roots:
+        walk(graphql_type, selection_set, 0)
+    return found
+
+
+def collect_selection_models(info: GraphQLResolveInfo) -> set[type[models.Model]]:
+    """Return the models of every object type reachable from the selection."""
+    return _collect_models(
+        info.schema,
+        info.fragments,
+        [(info.return_type, node.selection_set) for node in info.field_nodes],
+    )
+
+
+def collect_operation_models(
+    schema: GraphQLSchema, document: DocumentNode, operation: OperationDefinitionNode
+) -> set[type[models.Model]]:
+    """Return the models of every object type an operation selects."""
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    root_type = schema.get_root_type(operation.operation)
+    return _collect_models(schema, fragments, [(root_type, operation.selection_set)])
+
+
+def _manifest_key(base_key: str) -> str:
+    return f"{base_key}:deps"
+
+
+def _label_versions(backend: Any, labels: Iterable[str]) -> Optional[dict[str, str]]:
+    try:
+        model_list = [apps.get_model(label) for label in labels]
+    except (LookupError, ValueError):
+        return None
+    # Backends trusting their namespace versions for a while (two-tier) also
+    # trust model versions for as long.
+    max_age = float(getattr(backend, "version_ttl", 0) or 0)
+    return get_model_version_map(model_list, max_age=max_age)
+
+
+def _versioned_key(base_key: str, versions: dict[str, str]) -> str:
+    raw = "|".join(f"{label}={versions[label]}" for label in sorted(versions))
+    return f"{base_key}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+
+def get_cached_result(
+    backend: Any, base_key: str, info: Optional[GraphQLResolveInfo] = None
+) -> tuple[Optional[tuple[Any, bool]], dict[str, str]]:
+    """
+    Look up the cached result of *base_key*.
+
+    Returns:
+        Tuple of (``(value, is_fresh)`` or None, versions read before
+        computing). Pass the versions to ``store_result`` so a write racing
+        with the computation leaves the new entry unreachable instead of
+        stale. An entry past its timeout but built from the current model
+        versions is returned as not fresh (see ``core.single_flight``).
+    """
+    try:
+        manifest = list(backend.get(_manifest_key(base_key)) or [])
+        labels = set(manifest)
+        if info is not None:
+            labels.update(model._meta.label_lower for model in collect_selection_models(info))
+        versions = _label_versions(backend, labels) or {}
+        if not manifest or not all(label in versions for label in manifest):
+            return None, versions
+        entry = backend.get(
+            _versioned_key(base_key, {label: versions[label] for label in manifest})
+        )
+    except Exception as exc:
+        logger.debug("Result cache lookup failed: %s", exc)
+        return None, {}
+    if entry is not None:
+        DependencyRecorder.note_labels(manifest)
+    return unpack_entry(entry), versions
+
+
+def store_result(
+    backend: Any,
+    base_key: str,
+    model_list: Iterable[type[models.Model]],
+    value: Any,
+    timeout: Optional[int] = None,
+    known_versions: Optional[dict[str, str]] = None,
+) -> None:
+    """Store *value* keyed on the versions of *model_list* seen before computing it."""
+    labels = {model._meta.label_lower for model in model_list}
+    if not labels:
+        return
+    try:
+        labels.update(backend.get(_manifest_key(base_key)) or [])
+        versions = dict(known_versions or {})
+        missing = _label_versions(
+            backend, (label for label in labels if label not in versions)
+        )
+        if missing is None:
+            return
+        versions.update(missing)
+        manifest = sorted(labels)
+        entry, storage_timeout = pack_entry(value, timeout)
+        backend.set(_manifest_key(base_key), manifest, timeout=storage_timeout)
+        backend.set(
+            _versioned_key(base_key, {label: versions[label] for label in manifest}),
+            entry,
+            timeout=storage_timeout,
+        )
+    except Exception as exc:
+        logger.debug("Result cache store failed: %s", exc)
+
+
+__all__ = [
+    "DependencyRecorder",
+    "collect_operation_models",
+    "collect_selection_models",
+    "get_cached_result",
+    "models_for_tables",
+    "store_result",
+]
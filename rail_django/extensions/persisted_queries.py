@@ -7,22 +7,28 @@ This module is opt-in and only active when enabled in persisted_query_settings.
 from __future__ import annotations
 
 import json
+import logging
 import threading
 import time
 from dataclasses import dataclass
 from hashlib import sha256
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
 
 from django.core.cache import caches
 
 from ..config_proxy import get_setting
 
+logger = logging.getLogger(__name__)
+
 
 PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
 PERSISTED_QUERY_NOT_ALLOWED = "PERSISTED_QUERY_NOT_ALLOWED"
 PERSISTED_QUERY_HASH_MISMATCH = "PERSISTED_QUERY_HASH_MISMATCH"
 PERSISTED_QUERY_DISABLED = "PERSISTED_QUERY_DISABLED"
 
+# Request attribute carrying the compiled operation resolved for a request.
+REQUEST_PERSISTED_QUERY_ATTR = "_rail_persisted_query"
+
 
 @dataclass(frozen=True)
 class PersistedQuerySettings:
@@ -35,6 +41,23 @@ class PersistedQuerySettings:
     allowlist_hashes: set[str]
     hash_algorithm: str
     max_query_length: int
+    compile_allowlist: bool = False
+
+
+@dataclass(frozen=True)
+class CompiledPersistedQuery:
+    """An allowlisted operation parsed, validated and scored ahead of time."""
+
+    sha: str
+    query: str
+    entry: Any
+    operation_type: Optional[str]
+    depth: int
+    complexity: int
+
+    @property
+    def document(self):
+        return self.entry.document
 
 
 @dataclass(frozen=True)
@@ -42,6 +65,7 @@ class PersistedQueryResolution:
     query: Optional[str]
     error_code: Optional[str] = None
     error_message: Optional[str] = None
+    compiled: Optional[CompiledPersistedQuery] = None
 
     def has_error(self) -> bool:
         return bool(self.error_code)
@@ -90,11 +114,173 @@ class PersistedQueryStore:
 
 _STORE_BY_ALIAS: dict[str, PersistedQueryStore] = {}
 
+@dataclass(frozen=True)
+class _CompiledAllowlist:
+    builder: Any
+    version: int
+    queries: dict[str, CompiledPersistedQuery]
+
+    def is_current(self, builder: Any) -> bool:
+        return builder is self.builder and int(builder.get_schema_version()) == self.version
+
+
+# (schema name, validation rules) -> allowlist compiled for that schema build
+_COMPILED_BY_SCHEMA: dict[tuple[str, Optional[tuple[Any, ...]]], _CompiledAllowlist] = {}
+_COMPILE_LOCK = threading.Lock()
+
+
+def compile_persisted_queries(
+    schema_name: str,
+    *,
+    validation_rules: Optional[Sequence[Any]] = None,
+    force: bool = False,
+) -> dict[str, CompiledPersistedQuery]:
+    """
+    Parse, validate and complexity-score every allowlisted operation.
+
+    Compiled documents are kept in process memory per schema and validation
+    rules, and rebuilt when the schema builder or its version changes. Pass
+    the view's ``validation_rules`` so the memoized validation is the one the
+    view reads. Operations that fail to parse or validate are logged and left
+    out, so requests for them take the regular execution path and report
+    their errors there.
+    """
+    from ..core.registry import schema_registry
+
+    rules = tuple(validation_rules) if validation_rules is not None else None
+    key = (schema_name, rules)
+    builder = schema_registry.get_schema_builder(schema_name)
+    cached = _COMPILED_BY_SCHEMA.get(key)
+    if not force and cached is not None and cached.is_current(builder):
+        return cached.queries
+
+    with _COMPILE_LOCK:
+        cached = _COMPILED_BY_SCHEMA.get(key)
+        if not force and cached is not None and cached.is_current(builder):
+            return cached.queries
+        schema_instance = schema_registry.get_schema_instance(schema_name)
+        version = int(builder.get_schema_version())
+        graphql_schema = getattr(schema_instance, "graphql_schema", schema_instance)
+        compiled = _compile_allowlist(schema_name, version, graphql_schema, rules)
+        _COMPILED_BY_SCHEMA[key] = _CompiledAllowlist(builder, version, compiled)
+        logger.info(
+            "Compiled %s persisted quer%s for schema '%s'.",
+            len(compiled),
+            "y" if len(compiled) == 1 else "ies",
+            schema_name,
+        )
+        return compiled
+
+
+def _compile_allowlist(
+    schema_name: str,
+    version: int,
+    graphql_schema: Any,
+    rules: Optional[tuple[Any, ...]],
+) -> dict[str, CompiledPersistedQuery]:
+    from ..core.document_cache import get_document_cache
+    from ..core.performance import get_complexity_analyzer
+
+    settings = _load_settings(schema_name)
+    document_cache = get_document_cache()
+    complexity_analyzer = get_complexity_analyzer(schema_name)
+    compiled: dict[str, CompiledPersistedQuery] = {}
+    for sha, query in settings.allowlist.items():
+        if _hash_query(query, settings.hash_algorithm) != sha:
+            logger.warning(
+                "Persisted query '%s' does not match its hash; skipping compilation.",
+                sha,
+            )
+            continue
+        try:
+            entry = document_cache.get_document(
+                query, schema_name=schema_name, schema_version=version
+            )
+        except Exception as exc:
+            logger.warning("Persisted query '%s' failed to parse: %s", sha, exc)
+            continue
+        errors = document_cache.validate(entry, graphql_schema, rules)
+        if errors:
+            logger.warning(
+                "Persisted query '%s' failed validation: %s",
+                sha,
+                "; ".join(error.message for error in errors),
+            )
+            continue
+        depth, complexity = complexity_analyzer.analyze_document(entry.document)
+        compiled[sha] = CompiledPersistedQuery(
+            sha=sha,
+            query=query,
+            entry=entry,
+            operation_type=_single_operation_type(entry.document),
+            depth=depth,
+            complexity=complexity,
+        )
+    return compiled
+
+
+def get_compiled_persisted_query(
+    sha: str,
+    schema_name: Optional[str],
+    validation_rules: Optional[Sequence[Any]] = None,
+) -> Optional[CompiledPersistedQuery]:
+    """Return the compiled allowlisted operation for *sha*, if any."""
+    if not schema_name:
+        return None
+    try:
+        return compile_persisted_queries(
+            schema_name, validation_rules=validation_rules
+        ).get(sha)
+    except Exception as exc:
+        logger.debug("Persisted query compilation unavailable for '%s': %s", schema_name, exc)
+        return None
+
+
+def get_request_compiled_query(
+    context: Any, document: Any
+) -> Optional[CompiledPersistedQuery]:
+    """Return the compiled operation *context* is executing as *document*."""
+    compiled = getattr(context, REQUEST_PERSISTED_QUERY_ATTR, None)
+    if compiled is not None and compiled.document is document:
+        return compiled
+    return None
+
+
+def warm_persisted_queries(schema_name: str) -> int:
+    """Compile the allowlist for *schema_name* when compilation is enabled."""
+    settings = _load_settings(schema_name)
+    if not (settings.enabled and settings.compile_allowlist):
+        return 0
+    return len(compile_persisted_queries(schema_name))
+
+
+def clear_compiled_persisted_queries(schema_name: Optional[str] = None) -> None:
+    with _COMPILE_LOCK:
+        if schema_name is None:
+            _COMPILED_BY_SCHEMA.clear()
+            return
+        for key in [key for key in _COMPILED_BY_SCHEMA if key[0] == schema_name]:
+            del _COMPILED_BY_SCHEMA[key]
+
+
+def _single_operation_type(document: Any) -> Optional[str]:
+    from graphql import OperationDefinitionNode
+
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    if len(operations) != 1:
+        return None
+    return operations[0].operation.value
+
 
 def resolve_persisted_query(
     payload: dict[str, Any],
     *,
     schema_name: Optional[str] = None,
+    validation_rules: Optional[Sequence[Any]] = None,
 ) -> PersistedQueryResolution:
     settings = _load_settings(schema_name)
     if not settings.enabled:
@@ -116,6 +302,11 @@ def resolve_persisted_query(
 
     query = payload.get("query")
 
+    if settings.compile_allowlist:
+        compiled = get_compiled_persisted_query(sha, schema_name, validation_rules)
+        if compiled is not None and (not query or query == compiled.query):
+            return PersistedQueryResolution(query=compiled.query, compiled=compiled)
+
     if query:
         if settings.max_query_length and len(query) > settings.max_query_length:
             return PersistedQueryResolution(
@@ -216,6 +407,9 @@ def _load_settings(schema_name: Optional[str]) -> PersistedQuerySettings:
         get_setting("persisted_query_settings.max_query_length", 0, schema_name),
         default=0,
     )
+    compile_allowlist = bool(
+        get_setting("persisted_query_settings.compile_allowlist", False, schema_name)
+    )
 
     allowlist_raw = get_setting(
         "persisted_query_settings.allowlist", None, schema_name
@@ -238,6 +432,7 @@ def _load_settings(schema_name: Optional[str]) -> PersistedQuerySettings:
         allowlist_hashes=allowlist_hashes,
         hash_algorithm=hash_algorithm,
         max_query_length=max_query_length,
+        compile_allowlist=compile_allowlist,
     )
 
 
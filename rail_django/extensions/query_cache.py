@@ -3,43 +3,132 @@ Lightweight query cache hooks for GraphQL resolvers.
 
 Caching is opt-in and disabled unless a backend is registered via
 rail_django.core.services.set_query_cache_factory.
+
+Two backends are provided:
+
+- ``InMemoryQueryCacheBackend``: a bounded per-process LRU, for tests, local
+  development or single-worker deployments.
+- ``TwoTierQueryCacheBackend``: the same bounded LRU in front of a shared
+  Django cache. Hot entries are served without a network hop, misses fall
+  through to the shared cache, and version namespaces are re-read from it at
+  most once per ``version_ttl`` seconds.
+
+Entry keys embed the namespace and model versions they were computed under,
+so a key never changes meaning; the local tier only needs a short TTL to
+bound memory, not to stay coherent.
 """
 
 from __future__ import annotations
 
+import logging
+import pickle
+import sys
 import threading
 import time
 import uuid
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+
+_MISS = object()
+
+
+def _estimate_size(value: Any) -> int:
+    try:
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class _BoundedLRU:
+    """LRU of ``key -> (value, expires_at, size)`` bounded by count and bytes."""
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None):
+        self.max_entries = max(0, int(max_entries))
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        self.total_bytes = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[Any, Optional[float], int]] = OrderedDict()
+
+    def get(self, key: str, now: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISS
+        value, expires_at, _size = entry
+        if expires_at is not None and expires_at <= now:
+            self._discard(key)
+            return _MISS
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        if self.max_entries == 0:
+            return
+        size = _estimate_size(value) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            self._discard(key)
+            return
+        self._discard(key)
+        self._entries[key] = (value, expires_at, size)
+        self.total_bytes += size
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes and self.total_bytes > self.max_bytes
+        ):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _expires_at(timeout: Optional[int], now: float) -> Optional[float]:
+    if timeout and timeout > 0:
+        return now + timeout
+    return None
+
 
 class InMemoryQueryCacheBackend:
-    """Simple in-memory cache backend for tests or local development."""
+    """Bounded in-memory cache backend for tests or local development."""
 
-    def __init__(self, default_timeout: int = 300):
+    def __init__(
+        self,
+        default_timeout: int = 300,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = None,
+    ):
         self.default_timeout = default_timeout
         self._lock = threading.RLock()
-        self._store: dict[str, dict[str, Any]] = {}
+        self._store = _BoundedLRU(max_entries, max_bytes)
         self._versions: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
 
     def get(self, key: str) -> Any:
         with self._lock:
-            entry = self._store.get(key)
-            if not entry:
+            value = self._store.get(key, time.time())
+            if value is _MISS:
+                self.misses += 1
                 return None
-            expires_at = entry.get("expires_at")
-            if expires_at is not None and expires_at <= time.time():
-                self._store.pop(key, None)
-                return None
-            return entry.get("value")
+            self.hits += 1
+            return value
 
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
         resolved_timeout = self.default_timeout if timeout is None else timeout
-        expires_at = None
-        if resolved_timeout and resolved_timeout > 0:
-            expires_at = time.time() + resolved_timeout
         with self._lock:
-            self._store[key] = {"value": value, "expires_at": expires_at}
+            self._store.set(key, value, _expires_at(resolved_timeout, time.time()))
 
     def get_version(self, namespace: str) -> str:
         with self._lock:
@@ -56,6 +145,162 @@ class InMemoryQueryCacheBackend:
             self._versions[namespace] = version
         return version
 
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self._versions.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "bytes": self._store.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self._store.evictions,
+            }
+
+
+class TwoTierQueryCacheBackend:
+    """
+    Bounded in-process LRU in front of a shared Django cache.
+
+    Args:
+        cache_alias: Django cache alias used as the shared tier.
+        default_timeout: Shared-tier timeout when ``set`` gets none.
+        local_timeout: Upper bound on how long an entry stays in the local tier.
+        max_entries: Local tier entry limit.
+        max_bytes: Local tier size limit (pickled size of the values).
+        version_ttl: Seconds a namespace version read from the shared tier,
+            or a model version read by the result cache, is trusted locally.
+            Bumps made by this process are visible at once; bumps made by
+            other workers within this window.
+        key_prefix: Prefix of every key written to the shared tier.
+    """
+
+    def __init__(
+        self,
+        cache_alias: str = "default",
+        *,
+        default_timeout: int = 300,
+        local_timeout: int = 30,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = 16 * 1024 * 1024,
+        version_ttl: float = 1.0,
+        key_prefix: str = "rail_django:query_cache",
+    ):
+        self.cache_alias = cache_alias
+        self.default_timeout = default_timeout
+        self.local_timeout = local_timeout
+        self.version_ttl = version_ttl
+        self.key_prefix = key_prefix
+        self._lock = threading.RLock()
+        self._local = _BoundedLRU(max_entries, max_bytes)
+        self._versions: dict[str, tuple[str, float]] = {}
+        self.local_hits = 0
+        self.remote_hits = 0
+        self.misses = 0
+        self.version_refreshes = 0
+
+    @property
+    def shared(self):
+        from django.core.cache import caches
+
+        return caches[self.cache_alias]
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    def _local_expires_at(self, timeout: Optional[int], now: float) -> Optional[float]:
+        local = self.local_timeout
+        if timeout and timeout > 0:
+            local = min(local, timeout) if local and local > 0 else timeout
+        return _expires_at(local, now)
+
+    def get(self, key: str) -> Any:
+        now = time.time()
+        with self._lock:
+            value = self._local.get(key, now)
+            if value is not _MISS:
+                self.local_hits += 1
+                return value
+        try:
+            value = self.shared.get(self._shared_key(key))
+        except Exception as exc:
+            logger.debug("Shared query cache lookup failed for %s: %s", key, exc)
+            value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.remote_hits += 1
+            self._local.set(key, value, self._local_expires_at(None, now))
+        return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        resolved_timeout = self.default_timeout if timeout is None else timeout
+        try:
+            self.shared.set(self._shared_key(key), value, resolved_timeout or None)
+        except Exception as exc:
+            logger.debug("Shared query cache store failed for %s: %s", key, exc)
+        with self._lock:
+            self._local.set(
+                key, value, self._local_expires_at(resolved_timeout, time.time())
+            )
+
+    def get_version(self, namespace: str) -> str:
+        now = time.time()
+        with self._lock:
+            cached = self._versions.get(namespace)
+            if cached is not None and now - cached[1] < self.version_ttl:
+                return cached[0]
+        version_key = self._shared_key(f"version:{namespace}")
+        try:
+            version = self.shared.get(version_key)
+            if version is None:
+                self.shared.add(version_key, _new_version(), None)
+                version = self.shared.get(version_key)
+        except Exception as exc:
+            logger.debug("Shared query cache version lookup failed: %s", exc)
+            version = None
+        with self._lock:
+            if version is None:
+                # Shared tier unavailable: keep serving the last known version.
+                version = cached[0] if cached is not None else _new_version()
+            self.version_refreshes += 1
+            self._versions[namespace] = (str(version), now)
+        return str(version)
+
+    def bump_version(self, namespace: str) -> str:
+        version = _new_version()
+        try:
+            self.shared.set(self._shared_key(f"version:{namespace}"), version, None)
+        except Exception as exc:
+            logger.debug("Shared query cache version bump failed: %s", exc)
+        with self._lock:
+            self._versions[namespace] = (version, time.time())
+        return version
+
+    def clear_local(self) -> None:
+        """Drop the local tier and cached versions (the shared tier is kept)."""
+        with self._lock:
+            self._local.clear()
+            self._versions.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._local),
+                "bytes": self._local.total_bytes,
+                "local_hits": self.local_hits,
+                "remote_hits": self.remote_hits,
+                "misses": self.misses,
+                "evictions": self._local.evictions,
+                "version_refreshes": self.version_refreshes,
+            }
+
 
 def _new_version() -> str:
     return uuid.uuid4().hex
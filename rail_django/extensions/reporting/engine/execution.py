@@ -12,6 +12,7 @@ from typing import Any, Optional
 from django.core.cache import cache
 from django.db.models import IntegerField, Value
 
+from ....core.single_flight import get_single_flight, pack_entry, unpack_entry
 from ..types import ReportingError
 from ..utils import (
     _coerce_int,
@@ -70,12 +71,73 @@ class ExecutionMixin:
                 f"{user_id}:"
                 f"{_hash_query_payload(spec)}"
             )
-            cached = cache.get(cache_key)
-            if cached:
-                payload = dict(cached)
-                payload["cache"] = {"hit": True, "key": cache_key, "ttl_seconds": ttl}
+            found = unpack_entry(cache.get(cache_key))
+            if found is not None and not found[0]:
+                found = None
+            if found is not None and found[1]:
+                return self._cached_payload(found[0], cache_key, ttl)
+
+            # One caller recomputes an expired or missing entry; concurrent
+            # callers get the expired payload or wait for the fresh one.
+            computed = []
+
+            def compute() -> dict[str, Any]:
+                computed.append(True)
+                return self._execute_query(
+                    spec=spec,
+                    mode=mode,
+                    where=where,
+                    having=having,
+                    quick_search=quick_search,
+                    ordering=ordering,
+                    limit=limit,
+                    offset=offset,
+                    cache_key=cache_key,
+                    ttl=ttl,
+                )
+
+            payload = get_single_flight().run(
+                cache_key,
+                compute,
+                lambda: unpack_entry(cache.get(cache_key)),
+                found=found,
+            )
+            if computed:
                 return payload
+            return self._cached_payload(payload, cache_key, ttl)
+
+        return self._execute_query(
+            spec=spec,
+            mode=mode,
+            where=where,
+            having=having,
+            quick_search=quick_search,
+            ordering=ordering,
+            limit=limit,
+            offset=offset,
+            cache_key=cache_key,
+            ttl=ttl,
+        )
 
+    def _cached_payload(self, cached: dict, cache_key: str, ttl: int) -> dict[str, Any]:
+        payload = dict(cached)
+        payload["cache"] = {"hit": True, "key": cache_key, "ttl_seconds": ttl}
+        return payload
+
+    def _execute_query(
+        self,
+        *,
+        spec: dict,
+        mode: str,
+        where: Any,
+        having: Any,
+        quick_search: str,
+        ordering: list[str],
+        limit: int,
+        offset: int,
+        cache_key: Optional[str],
+        ttl: int,
+    ) -> dict[str, Any]:
         warnings: list[str] = []
 
         if not self._source_adapter.supports_orm_operations():
@@ -112,7 +174,7 @@ class ExecutionMixin:
                 },
             }
             if cache_key:
-                cache.set(cache_key, payload, ttl)
+                cache.set(cache_key, *pack_entry(payload, ttl))
                 payload["cache"] = {"hit": False, "key": cache_key, "ttl_seconds": ttl}
             return _json_sanitize(payload)
 
@@ -254,7 +316,7 @@ class ExecutionMixin:
             },
         }
         if cache_key:
-            cache.set(cache_key, payload, ttl)
+            cache.set(cache_key, *pack_entry(payload, ttl))
             payload["cache"] = {"hit": False, "key": cache_key, "ttl_seconds": ttl}
         return _json_sanitize(payload)
 
@@ -435,7 +497,7 @@ class ExecutionMixin:
                 )
 
         if cache_key:
-            cache.set(cache_key, payload, ttl)
+            cache.set(cache_key, *pack_entry(payload, ttl))
             payload["cache"] = {"hit": False, "key": cache_key, "ttl_seconds": ttl}
 
         return _json_sanitize(payload)
@@ -5,9 +5,10 @@ from __future__ import annotations
 import json
 
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import Q
 from graphql import GraphQLError
 
+from ....core.settings import FilteringSettings
+from ....generators.filters.quick_search import build_text_search_q
 from ..cache.keys import table_rows_key
 from ..cache.store import get_cache, set_cache
 from ..cache.strategies import stale_while_revalidate
@@ -177,10 +178,16 @@ def resolve_table_rows(input_data: dict, *, info=None) -> dict:
             and f.get_internal_type() in {"CharField", "TextField"}
         ]
         if text_fields:
-            query = Q()
-            for name in text_fields:
-                query |= Q(**{f"{name}__icontains": quick_search})
-            qs = qs.filter(query)
+            filtering_settings = FilteringSettings.from_schema(schema_name)
+            qs = qs.filter(
+                build_text_search_q(
+                    model_cls,
+                    quick_search,
+                    text_fields,
+                    backend=filtering_settings.quick_search_backend,
+                    config=filtering_settings.fts_config,
+                )
+            )
 
     if normalized_where:
         qs = qs.filter(**normalized_where)
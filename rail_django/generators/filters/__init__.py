@@ -23,6 +23,8 @@ Package Structure:
         - FilterOperation: Single filter operation representation
         - GroupedFieldFilter: Grouped filter for UI builders
         - FilterMetadataGenerator: Metadata generation
+    - quick_search: Indexed quick search backends (pg_trgm, tsvector, FTS5)
+    - workload: Filter workload recorder and index advisor
     - advanced: High-level filter generators
         - ModelFilterGenerator: Full-featured filter generator
         - ModelFilterMetadataGenerator: Metadata-focused generator
@@ -5,16 +5,23 @@ This module provides aggregation-level filter application functionality includin
 - Basic aggregation filters (sum, avg, min, max, count)
 - Conditional aggregation filters
 - Aggregation annotation collection and construction
+- Correlated subquery compilation when several to-many relations are
+  aggregated, so their joins do not multiply each other's rows
 """
 
 import logging
 from typing import Any, Dict, Optional, Type
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
-from django.db.models import Avg, Count, Max, Min, Q, Sum
+from django.db.models import Avg, Count, Max, Min, OuterRef, Q, Subquery, Sum
 
 logger = logging.getLogger(__name__)
 
+AGGREGATION_STRATEGY_AUTO = "auto"
+AGGREGATION_STRATEGY_JOIN = "join"
+AGGREGATION_STRATEGY_SUBQUERY = "subquery"
+
 
 class AggregationFilterApplicatorMixin:
     """
@@ -102,10 +109,133 @@ class AggregationFilterApplicatorMixin:
         annotations = self._collect_aggregation_annotations(where_input)
 
         if annotations:
+            if self._use_aggregation_subqueries(queryset.model, where_input):
+                annotations = self._as_correlated_subqueries(queryset.model, annotations)
             queryset = queryset.annotate(**annotations)
 
         return queryset
 
+    # =========================================================================
+    # Join vs. Correlated Subquery Strategy
+    # =========================================================================
+
+    def _use_aggregation_subqueries(
+        self,
+        model: Type[models.Model],
+        where_input: Dict[str, Any],
+    ) -> bool:
+        """
+        Decide whether aggregation filters compile to correlated subqueries.
+
+        Aggregating through joins is correct for a single to-many relation,
+        but two to-many joins multiply each other's rows: totals come out
+        wrong and the intermediate result grows with the product of both
+        relations. The ``aggregation_filter_strategy`` filtering setting
+        forces ``join`` or ``subquery``; ``auto`` (default) switches to
+        subqueries when more than one to-many path is aggregated.
+        """
+        strategy = str(
+            getattr(
+                getattr(self, "filtering_settings", None),
+                "aggregation_filter_strategy",
+                AGGREGATION_STRATEGY_AUTO,
+            )
+            or AGGREGATION_STRATEGY_AUTO
+        ).lower()
+        if strategy == AGGREGATION_STRATEGY_SUBQUERY:
+            return True
+        if strategy == AGGREGATION_STRATEGY_JOIN:
+            return False
+        paths = self._collect_aggregation_paths(where_input)
+        to_many_paths = {
+            path for path in paths if self._is_to_many_path(model, path)
+        }
+        return len(to_many_paths) > 1
+
+    def _collect_aggregation_paths(
+        self,
+        where_input: Dict[str, Any],
+        paths: Optional[set[str]] = None,
+        prefix: str = "",
+    ) -> set[str]:
+        """Collect the relation paths of every ``_agg`` and ``_cond_agg`` filter."""
+        if paths is None:
+            paths = set()
+
+        for key, value in where_input.items():
+            if value is None:
+                continue
+            if key in ("AND", "OR") and isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        self._collect_aggregation_paths(item, paths, prefix)
+                continue
+            if not isinstance(value, dict):
+                continue
+            if key == "NOT":
+                self._collect_aggregation_paths(value, paths, prefix)
+                continue
+            for suffix in ("_cond_agg", "_agg"):
+                if key.endswith(suffix):
+                    paths.add(f"{prefix}{key[: -len(suffix)]}")
+                    break
+            else:
+                for suffix in ("_rel", "_some", "_every", "_none"):
+                    if key.endswith(suffix):
+                        self._collect_aggregation_paths(
+                            value, paths, f"{prefix}{key[: -len(suffix)]}__"
+                        )
+                        break
+
+        return paths
+
+    def _is_to_many_path(self, model: Type[models.Model], path: str) -> bool:
+        """Return True when *path* crosses a many-to-many or reverse foreign key."""
+        current = model
+        for part in path.split("__"):
+            if current is None:
+                return False
+            try:
+                field = current._meta.get_field(part)
+            except FieldDoesNotExist:
+                field = next(
+                    (
+                        rel
+                        for rel in current._meta.related_objects
+                        if rel.get_accessor_name() == part
+                    ),
+                    None,
+                )
+                if field is None:
+                    return False
+            if getattr(field, "many_to_many", False) or getattr(field, "one_to_many", False):
+                return True
+            current = getattr(field, "related_model", None)
+        return False
+
+    def _as_correlated_subqueries(
+        self,
+        model: Type[models.Model],
+        annotations: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Wrap aggregate expressions into independent correlated subqueries.
+
+        Each aggregate is computed by a subquery over the model restricted to
+        the outer row's primary key, so it joins only its own relation.
+        """
+        compiled: Dict[str, Any] = {}
+        for name, aggregate in annotations.items():
+            inner = (
+                model._base_manager.filter(pk=OuterRef("pk"))
+                .order_by()
+                .values("pk")
+                .annotate(_rail_aggregate=aggregate)
+                .values("_rail_aggregate")
+            )
+            compiled[name] = Subquery(inner)
+        return compiled
+
     def _collect_aggregation_annotations(
         self,
         where_input: Dict[str, Any],
@@ -274,6 +404,8 @@ class AggregationFilterApplicatorMixin:
         """
         annotations = self._collect_conditional_aggregation_annotations(where_input)
         if annotations:
+            if self._use_aggregation_subqueries(queryset.model, where_input):
+                annotations = self._as_correlated_subqueries(queryset.model, annotations)
             queryset = queryset.annotate(**annotations)
         return queryset
 
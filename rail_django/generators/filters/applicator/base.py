@@ -10,6 +10,8 @@ from django.db.models import Q
 from django.core.exceptions import FieldDoesNotExist
 from django.utils import timezone
 
+from ..workload import get_filter_workload_recorder
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_FILTER_DEPTH = 10
@@ -36,6 +38,11 @@ class BaseFilterApplicatorMixin:
         if self._quick_mixin is None:
             from ..mixins import QuickFilterMixin
             self._quick_mixin = QuickFilterMixin()
+            if self.filtering_settings is not None:
+                self._quick_mixin.quick_search_backend = (
+                    self.filtering_settings.quick_search_backend
+                )
+                self._quick_mixin.quick_search_config = self.filtering_settings.fts_config
         return self._quick_mixin
 
     def _get_include_mixin(self):
@@ -347,6 +354,7 @@ class BaseFilterApplicatorMixin:
 
         if q_object:
             queryset = queryset.filter(q_object)
+            get_filter_workload_recorder().record_filters(queryset, self.schema_name)
 
         if tenant_filter:
             try:
@@ -15,6 +15,8 @@ from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 from django.db.models import Q
 
+from ..quick_search import build_text_search_q
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,8 +26,14 @@ class QuickFilterMixin:
 
     Provides the ability to search across multiple text fields with a single
     search term, similar to a search box in a UI.
+
+    Text fields are matched through the quick search backend
+    (see ``rail_django.generators.filters.quick_search``).
     """
 
+    quick_search_backend: Optional[str] = None
+    quick_search_config: Optional[str] = None
+
     def _is_sensitive_field_name(self, field_name: str) -> bool:
         """Return True when a field name looks sensitive and should be excluded."""
         lowered = field_name.lower()
@@ -132,6 +140,8 @@ class QuickFilterMixin:
         model: Type[models.Model],
         search_value: str,
         quick_filter_fields: Optional[List[str]] = None,
+        search_backend: Optional[str] = None,
+        search_config: Optional[str] = None,
     ) -> Q:
         """
         Build a Q object for quick filter search.
@@ -140,6 +150,8 @@ class QuickFilterMixin:
             model: Django model to search
             search_value: Search term
             quick_filter_fields: Optional list of fields to search
+            search_backend: Quick search backend for text fields (default: auto)
+            search_config: PostgreSQL text search configuration for ``fts``
 
         Returns:
             Django Q object for the search
@@ -151,6 +163,7 @@ class QuickFilterMixin:
             quick_filter_fields = self.get_default_quick_filter_fields(model)
 
         q_objects = Q()
+        text_field_paths: List[str] = []
         for field_path in quick_filter_fields:
             try:
                 field = self._get_field_from_path(model, field_path)
@@ -158,7 +171,7 @@ class QuickFilterMixin:
                     if isinstance(
                         field, (models.CharField, models.TextField, models.EmailField)
                     ):
-                        q_objects |= Q(**{f"{field_path}__icontains": search_value})
+                        text_field_paths.append(field_path)
                     elif isinstance(
                         field, models.IntegerField
                     ):
@@ -188,6 +201,14 @@ class QuickFilterMixin:
                 logger.debug(f"Error processing quick filter field {field_path}: {e}")
                 continue
 
+        if text_field_paths:
+            q_objects |= build_text_search_q(
+                model,
+                search_value,
+                text_field_paths,
+                backend=search_backend or self.quick_search_backend,
+                config=search_config or self.quick_search_config,
+            )
         return q_objects
 
 
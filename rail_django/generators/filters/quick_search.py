@@ -0,0 +1,463 @@
+"""
+Indexed backends for quick search.
+
+Quick search used to OR ``icontains`` across text fields, which no B-tree
+index can serve. The backend is selected with
+``filtering_settings.quick_search_backend``:
+
+``icontains``
+    Substring match, no index.
+``trigram``
+    PostgreSQL. Same ``UPPER(col::text) LIKE`` predicate as ``icontains``,
+    served by one ``pg_trgm`` GIN index per column.
+``fts``
+    PostgreSQL full-text search. Word-prefix matching of every search term
+    against ``to_tsvector`` of the indexed columns, served by a GIN index.
+``fts5``
+    SQLite FTS5. Word-prefix matching against an external-content FTS5 table
+    kept in sync with the model table by triggers.
+``auto`` (default)
+    ``trigram`` on PostgreSQL, ``fts5`` on SQLite when its table exists,
+    ``icontains`` otherwise.
+
+Indexes are created for the direct text fields listed in
+``GraphQLMeta.filtering.quick`` by the ``manage_quick_search_indexes``
+management command; PostgreSQL indexes are built ``CONCURRENTLY`` so
+writes to the table are not blocked. Related paths and fields that are not
+indexed are still searched with ``icontains``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections, models, router
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger(__name__)
+
+QUICK_SEARCH_AUTO = "auto"
+QUICK_SEARCH_ICONTAINS = "icontains"
+QUICK_SEARCH_TRIGRAM = "trigram"
+QUICK_SEARCH_FTS = "fts"
+QUICK_SEARCH_FTS5 = "fts5"
+
+QUICK_SEARCH_BACKENDS = (
+    QUICK_SEARCH_AUTO,
+    QUICK_SEARCH_ICONTAINS,
+    QUICK_SEARCH_TRIGRAM,
+    QUICK_SEARCH_FTS,
+    QUICK_SEARCH_FTS5,
+)
+
+TEXT_FIELD_TYPES = (models.CharField, models.TextField, models.EmailField)
+
+_INTEGER_PK_TYPES = {
+    "AutoField",
+    "BigAutoField",
+    "SmallAutoField",
+    "IntegerField",
+    "BigIntegerField",
+}
+
+_SEARCH_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+# Seconds an FTS5 table lookup is trusted; other processes may create or
+# drop the table meanwhile.
+FTS5_COLUMNS_TTL = 60.0
+
+# (database alias, db_table) -> (expiry, columns of the FTS5 table or None).
+_fts5_columns_cache: Dict[
+    Tuple[str, str], Tuple[float, Optional[Tuple[str, ...]]]
+] = {}
+
+
+def _search_terms(search_value: str) -> List[str]:
+    return _SEARCH_TERM_RE.findall(search_value or "")
+
+
+def _index_suffix(*parts: str) -> str:
+    return hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()[:8]
+
+
+def _index_prefix(model: Type[models.Model]) -> str:
+    return f"{model._meta.db_table[:40]}_qs"
+
+
+def fts5_table_name(model: Type[models.Model]) -> str:
+    """Return the name of the FTS5 table indexing *model*."""
+    return f"{model._meta.db_table}_quick_fts"
+
+
+def get_indexable_fields(
+    model: Type[models.Model], field_paths: Sequence[str]
+) -> List[models.Field]:
+    """Return the direct, concrete text fields of *model* among *field_paths*."""
+    fields: List[models.Field] = []
+    for field_path in field_paths:
+        if not isinstance(field_path, str) or "__" in field_path:
+            continue
+        try:
+            field = model._meta.get_field(field_path)
+        except Exception:
+            continue
+        if getattr(field, "concrete", False) and isinstance(field, TEXT_FIELD_TYPES):
+            if field not in fields:
+                fields.append(field)
+    return fields
+
+
+def get_quick_search_fields(model: Type[models.Model]) -> List[models.Field]:
+    """Return the indexable fields declared in ``GraphQLMeta.filtering.quick``."""
+    try:
+        from ...core.meta import get_model_graphql_meta
+
+        quick = list(get_model_graphql_meta(model).filtering.quick or [])
+    except Exception as exc:
+        logger.debug("Could not read quick fields of %s: %s", model.__name__, exc)
+        return []
+    return get_indexable_fields(model, quick)
+
+
+def get_quick_search_models() -> List[Tuple[Type[models.Model], List[models.Field]]]:
+    """Return ``(model, fields)`` for every model declaring indexable quick fields."""
+    found = []
+    for model in apps.get_models():
+        if model._meta.proxy or not model._meta.managed:
+            continue
+        fields = get_quick_search_fields(model)
+        if fields:
+            found.append((model, fields))
+    return found
+
+
+def _fts5_columns(model: Type[models.Model], using: str) -> Optional[Tuple[str, ...]]:
+    cache_key = (using, model._meta.db_table)
+    cached = _fts5_columns_cache.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    columns: Optional[Tuple[str, ...]] = None
+    connection = connections[using]
+    if connection.vendor == "sqlite":
+        table = fts5_table_name(model)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                    [table],
+                )
+                if cursor.fetchone():
+                    cursor.execute(f"PRAGMA table_info({connection.ops.quote_name(table)})")
+                    columns = tuple(row[1] for row in cursor.fetchall())
+        except Exception as exc:
+            logger.debug("Could not inspect FTS5 table %s: %s", table, exc)
+            return None
+    _fts5_columns_cache[cache_key] = (time.monotonic() + FTS5_COLUMNS_TTL, columns)
+    return columns
+
+
+def resolve_quick_search_backend(
+    model: Type[models.Model], backend: Optional[str] = None, using: Optional[str] = None
+) -> str:
+    """Return the concrete backend used to search *model*."""
+    using = using or router.db_for_read(model) or DEFAULT_DB_ALIAS
+    vendor = connections[using].vendor
+    backend = (backend or QUICK_SEARCH_AUTO).lower()
+    if backend not in QUICK_SEARCH_BACKENDS:
+        logger.warning("Unknown quick search backend %r, using icontains", backend)
+        return QUICK_SEARCH_ICONTAINS
+    if backend == QUICK_SEARCH_AUTO:
+        if vendor == "postgresql":
+            return QUICK_SEARCH_TRIGRAM
+        if vendor == "sqlite" and _fts5_columns(model, using):
+            return QUICK_SEARCH_FTS5
+        return QUICK_SEARCH_ICONTAINS
+    if backend in (QUICK_SEARCH_TRIGRAM, QUICK_SEARCH_FTS) and vendor != "postgresql":
+        return QUICK_SEARCH_ICONTAINS
+    if backend == QUICK_SEARCH_FTS5 and vendor != "sqlite":
+        return QUICK_SEARCH_ICONTAINS
+    return backend
+
+
+def _icontains_q(field_paths: Sequence[str], search_value: str) -> Q:
+    q = Q()
+    for field_path in field_paths:
+        q |= Q(**{f"{field_path}__icontains": search_value})
+    return q
+
+
+def _fts_q(fields: Sequence[models.Field], terms: Sequence[str], config: str) -> Q:
+    from django.contrib.postgres.search import SearchQuery, SearchVector, SearchVectorExact
+
+    vector = SearchVector(*(field.name for field in fields), config=config)
+    query = SearchQuery(
+        " & ".join(f"{term}:*" for term in terms), config=config, search_type="raw"
+    )
+    return Q(SearchVectorExact(vector, query))
+
+
+def _fts5_q(
+    model: Type[models.Model], fields: Sequence[models.Field], terms: Sequence[str], using: str
+) -> Q:
+    table = connections[using].ops.quote_name(fts5_table_name(model))
+    columns = " ".join(field.column for field in fields)
+    phrases = " AND ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+    return Q(
+        pk__in=RawSQL(
+            f"SELECT rowid FROM {table} WHERE {table} MATCH %s",
+            [f"{{{columns}}} : ({phrases})"],
+        )
+    )
+
+
+def build_text_search_q(
+    model: Type[models.Model],
+    search_value: str,
+    field_paths: Sequence[str],
+    *,
+    backend: Optional[str] = None,
+    config: Optional[str] = None,
+    using: Optional[str] = None,
+) -> Q:
+    """
+    Build the quick search predicate of *search_value* over text *field_paths*.
+
+    Args:
+        model: Searched model
+        search_value: Raw search input
+        field_paths: Text field paths (related paths allowed)
+        backend: Backend name, see the module docstring (default: auto)
+        config: PostgreSQL text search configuration for ``fts``
+        using: Database alias (default: the read database of *model*)
+
+    Returns:
+        Django Q object ORing the per-field matches
+    """
+    field_paths = [path for path in field_paths if isinstance(path, str) and path]
+    if not search_value or not field_paths:
+        return Q()
+
+    using = using or router.db_for_read(model) or DEFAULT_DB_ALIAS
+    resolved = resolve_quick_search_backend(model, backend, using)
+    terms = _search_terms(search_value)
+    if resolved in (QUICK_SEARCH_ICONTAINS, QUICK_SEARCH_TRIGRAM) or not terms:
+        return _icontains_q(field_paths, search_value)
+
+    indexed = get_indexable_fields(model, field_paths)
+    if resolved == QUICK_SEARCH_FTS5:
+        columns = _fts5_columns(model, using) or ()
+        indexed = [field for field in indexed if field.column in columns]
+    if not indexed:
+        return _icontains_q(field_paths, search_value)
+
+    indexed_names = {field.name for field in indexed}
+    remaining = [path for path in field_paths if path not in indexed_names]
+    if resolved == QUICK_SEARCH_FTS:
+        q = _fts_q(indexed, terms, config or "english")
+    else:
+        q = _fts5_q(model, indexed, terms, using)
+    return q | _icontains_q(remaining, search_value)
+
+
+def _postgres_indexes(
+    model: Type[models.Model],
+    fields: Sequence[models.Field],
+    backend: str,
+    config: str,
+) -> List[models.Index]:
+    from django.contrib.postgres.indexes import GinIndex, OpClass
+    from django.contrib.postgres.search import SearchVector
+    from django.db.models.functions import Cast, Upper
+
+    prefix = _index_prefix(model)
+    if backend == QUICK_SEARCH_FTS:
+        names = [field.name for field in fields]
+        return [
+            GinIndex(
+                SearchVector(*names, config=config),
+                name=f"{prefix}_fts_{_index_suffix(config, *names)}",
+            )
+        ]
+    return [
+        GinIndex(
+            OpClass(Upper(Cast(field.name, models.TextField())), name="gin_trgm_ops"),
+            name=f"{prefix}_trgm_{_index_suffix(field.column)}",
+        )
+        for field in fields
+    ]
+
+
+def _fts5_statements(model: Type[models.Model], fields: Sequence[models.Field], qn) -> List[str]:
+    table = qn(model._meta.db_table)
+    fts = qn(fts5_table_name(model))
+    pk = qn(model._meta.pk.column)
+    columns = ", ".join(qn(field.column) for field in fields)
+    new_values = ", ".join(f"new.{qn(field.column)}" for field in fields)
+    old_values = ", ".join(f"old.{qn(field.column)}" for field in fields)
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.{pk}, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{pk}, {new_values});"
+    trigger = fts5_table_name(model)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content={table}, "
+        f"content_rowid={pk}, tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER {qn(trigger + '_ai')} AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {qn(trigger + '_ad')} AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER {qn(trigger + '_au')} AFTER UPDATE ON {table} "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def _invalid_postgres_indexes(cursor, model: Type[models.Model]) -> List[str]:
+    cursor.execute(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid AND i.indrelid = %s::regclass",
+        [model._meta.db_table],
+    )
+    prefix = _index_prefix(model)
+    return [row[0] for row in cursor.fetchall() if row[0].startswith(f"{prefix}_")]
+
+
+def drop_quick_search_indexes(
+    model: Type[models.Model], using: str = DEFAULT_DB_ALIAS
+) -> List[str]:
+    """Drop every quick search index of *model*; return the dropped names."""
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    dropped: List[str] = []
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            prefix = _index_prefix(model)
+            constraints = connection.introspection.get_constraints(
+                cursor, model._meta.db_table
+            )
+            concurrently = "" if connection.in_atomic_block else " CONCURRENTLY"
+            for name in sorted(constraints):
+                if name.startswith(f"{prefix}_"):
+                    cursor.execute(f"DROP INDEX{concurrently} IF EXISTS {qn(name)}")
+                    dropped.append(name)
+        elif connection.vendor == "sqlite":
+            trigger = fts5_table_name(model)
+            for suffix in ("_ai", "_ad", "_au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {qn(trigger + suffix)}")
+            if _fts5_columns(model, using):
+                cursor.execute(f"DROP TABLE IF EXISTS {qn(fts5_table_name(model))}")
+                dropped.append(fts5_table_name(model))
+    _fts5_columns_cache.pop((using, model._meta.db_table), None)
+    return dropped
+
+
+def ensure_quick_search_indexes(
+    model: Type[models.Model],
+    fields: Sequence[models.Field],
+    *,
+    backend: Optional[str] = None,
+    config: str = "english",
+    using: str = DEFAULT_DB_ALIAS,
+) -> List[str]:
+    """
+    Create the quick search indexes of *fields*, replacing outdated ones.
+
+    Returns:
+        Names of the indexes created; empty when they were already current
+    """
+    connection = connections[using]
+    vendor = connection.vendor
+    backend = (backend or QUICK_SEARCH_AUTO).lower()
+    if backend == QUICK_SEARCH_AUTO:
+        backend = QUICK_SEARCH_TRIGRAM if vendor == "postgresql" else QUICK_SEARCH_FTS5
+    if not fields:
+        return []
+
+    if backend in (QUICK_SEARCH_TRIGRAM, QUICK_SEARCH_FTS) and vendor == "postgresql":
+        indexes = _postgres_indexes(model, fields, backend, config)
+        qn = connection.ops.quote_name
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        concurrently = "" if connection.in_atomic_block else " CONCURRENTLY"
+        with connection.cursor() as cursor:
+            existing = set(
+                connection.introspection.get_constraints(cursor, model._meta.db_table)
+            )
+            if backend == QUICK_SEARCH_TRIGRAM:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            # An interrupted concurrent build leaves an invalid index behind.
+            for name in _invalid_postgres_indexes(cursor, model):
+                cursor.execute(f"DROP INDEX{concurrently} IF EXISTS {qn(name)}")
+                existing.discard(name)
+        wanted = {index.name for index in indexes}
+        prefix = _index_prefix(model)
+        if any(name.startswith(f"{prefix}_") and name not in wanted for name in existing):
+            drop_quick_search_indexes(model, using)
+            existing = set()
+        created = []
+        with connection.schema_editor(atomic=False) as schema_editor:
+            for index in indexes:
+                if index.name not in existing:
+                    schema_editor.add_index(model, index, concurrently=bool(concurrently))
+                    created.append(index.name)
+        return created
+
+    if backend == QUICK_SEARCH_FTS5 and vendor == "sqlite":
+        if model._meta.pk.get_internal_type() not in _INTEGER_PK_TYPES:
+            raise ValueError(
+                f"FTS5 quick search needs an integer primary key on {model._meta.label}."
+            )
+        columns = _fts5_columns(model, using)
+        if columns == tuple(field.column for field in fields):
+            return []
+        drop_quick_search_indexes(model, using)
+        with connection.cursor() as cursor:
+            for statement in _fts5_statements(model, fields, connection.ops.quote_name):
+                cursor.execute(statement)
+        _fts5_columns_cache.pop((using, model._meta.db_table), None)
+        return [fts5_table_name(model)]
+
+    raise ValueError(f"Quick search backend {backend!r} is not supported on {vendor}.")
+
+
+def rebuild_quick_search_indexes(
+    model: Type[models.Model], using: str = DEFAULT_DB_ALIAS
+) -> List[str]:
+    """Rebuild and compact the existing quick search indexes of *model*."""
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    rebuilt: List[str] = []
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            prefix = _index_prefix(model)
+            constraints = connection.introspection.get_constraints(
+                cursor, model._meta.db_table
+            )
+            concurrently = "" if connection.in_atomic_block else " CONCURRENTLY"
+            for name in sorted(constraints):
+                if name.startswith(f"{prefix}_"):
+                    cursor.execute(f"REINDEX INDEX{concurrently} {qn(name)}")
+                    rebuilt.append(name)
+        elif connection.vendor == "sqlite" and _fts5_columns(model, using):
+            fts = qn(fts5_table_name(model))
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('optimize')")
+            rebuilt.append(fts5_table_name(model))
+    return rebuilt
+
+
+__all__ = [
+    "QUICK_SEARCH_BACKENDS",
+    "build_text_search_q",
+    "drop_quick_search_indexes",
+    "ensure_quick_search_indexes",
+    "fts5_table_name",
+    "get_indexable_fields",
+    "get_quick_search_fields",
+    "get_quick_search_models",
+    "rebuild_quick_search_indexes",
+    "resolve_quick_search_backend",
+]
@@ -0,0 +1,587 @@
+"""
+Filter workload recording and index advice.
+
+``FilterWorkloadRecorder`` samples the querysets produced by
+``NestedFilterApplicator`` (``filtering_settings.workload_sample_rate``) and
+the orderings applied by list and paginated queries. Each sample is reduced
+to its *shape* per table: the columns compared for equality, the columns
+compared by range and the constant predicates (``isnull``, boolean equality)
+of the AND-connected conditions, plus one representative SQL statement
+kept without its parameter values. Shapes are counted per model in process;
+each process writes its counts under its own cache key for
+``WORKLOAD_CACHE_TTL`` seconds, so flushes of different workers never
+overwrite each other, and ``load()`` merges the counts of every worker.
+
+``IndexAdvisor`` turns the workload into ranked ``IndexRecommendation``
+objects: composite indexes (equality columns first, then one range column),
+partial indexes when a shape always carries constant predicates, and
+ordering indexes. Candidates already served by the leading columns of an
+existing index are dropped, and ``EXPLAIN`` of the recorded sample boosts
+shapes that currently scan the whole table.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import random
+import re
+import threading
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, models
+from django.db.models import Q
+from django.db.models.expressions import Col
+from django.db.models.lookups import Lookup
+from django.db.models.sql.where import OR, WhereNode
+
+logger = logging.getLogger(__name__)
+
+WORKLOAD_CACHE_PREFIX = "rail_django:filter_workload"
+WORKLOAD_WORKERS_KEY = f"{WORKLOAD_CACHE_PREFIX}:workers"
+
+EQUALITY_LOOKUPS = frozenset({"exact", "in"})
+RANGE_LOOKUPS = frozenset({"gt", "gte", "lt", "lte", "range", "startswith"})
+
+DEFAULT_FLUSH_EVERY = 50
+
+# Recorded workload expires unless samples keep refreshing it.
+WORKLOAD_CACHE_TTL = 7 * 24 * 3600
+
+_PLACEHOLDER_RE = re.compile(r"%%|%s")
+
+
+def _shape_key(eq: Sequence[str], rng: Sequence[str], const: Sequence[Sequence[Any]]) -> str:
+    return json.dumps([list(eq), list(rng), [list(item) for item in const]])
+
+
+def _merge_workload(
+    target: Dict[str, Dict[str, Any]], source: Dict[str, Dict[str, Any]]
+) -> None:
+    for label, entry in source.items():
+        merged = target.setdefault(label, {"shapes": {}, "orderings": {}})
+        for shape_key, stats in entry["shapes"].items():
+            current = merged["shapes"].setdefault(
+                shape_key, {"count": 0, "sample": stats["sample"]}
+            )
+            current["count"] += stats["count"]
+        for ordering, count in entry["orderings"].items():
+            merged["orderings"][ordering] = merged["orderings"].get(ordering, 0) + count
+
+
+def _lookup_access(lookup: Lookup) -> Optional[Tuple[str, models.Field, str, Any]]:
+    lhs = lookup.lhs
+    if not isinstance(lhs, Col) or not getattr(lhs.target, "concrete", False):
+        return None
+    return lhs.alias, lhs.target, lookup.lookup_name, lookup.rhs
+
+
+def _collect_where(
+    node: Any,
+    accesses: Dict[str, Dict[str, Any]],
+    subqueries: List[Any],
+) -> None:
+    """Collect AND-connected column predicates of *node*, grouped by table alias."""
+    if isinstance(node, WhereNode):
+        if node.negated or node.connector == OR:
+            return
+        for child in node.children:
+            _collect_where(child, accesses, subqueries)
+        return
+    nested = getattr(node, "query", None)
+    if nested is not None and hasattr(nested, "where"):
+        subqueries.append(nested)
+        return
+    if not isinstance(node, Lookup):
+        return
+    rhs_query = getattr(node.rhs, "query", node.rhs)
+    if hasattr(rhs_query, "where") and hasattr(rhs_query, "alias_map"):
+        subqueries.append(rhs_query)
+    access = _lookup_access(node)
+    if access is None:
+        return
+    alias, target, lookup_name, value = access
+    entry = accesses.setdefault(
+        alias, {"model": target.model, "eq": set(), "range": set(), "const": set()}
+    )
+    if target.model is not entry["model"]:
+        return
+    column = target.column
+    if lookup_name == "isnull":
+        entry["const"].add((column, "isnull", bool(value)))
+    elif lookup_name == "exact" and isinstance(target, models.BooleanField) and isinstance(
+        value, bool
+    ):
+        entry["const"].add((column, "exact", value))
+    elif lookup_name in EQUALITY_LOOKUPS:
+        entry["eq"].add(column)
+    elif lookup_name in RANGE_LOOKUPS:
+        entry["range"].add(column)
+
+
+def extract_filter_shapes(queryset: models.QuerySet) -> List[Dict[str, Any]]:
+    """
+    Return the per-table predicate shapes of *queryset*.
+
+    Returns:
+        List of dicts with ``model``, ``eq``, ``range`` and ``const`` keys
+    """
+    shapes: List[Dict[str, Any]] = []
+    pending = [queryset.query]
+    seen = 0
+    while pending and seen < 20:
+        query = pending.pop()
+        seen += 1
+        accesses: Dict[str, Dict[str, Any]] = {}
+        _collect_where(query.where, accesses, pending)
+        for entry in accesses.values():
+            if not (entry["eq"] or entry["range"] or entry["const"]):
+                continue
+            shapes.append(
+                {
+                    "model": entry["model"],
+                    "eq": sorted(entry["eq"]),
+                    "range": sorted(entry["range"] - entry["eq"]),
+                    "const": sorted(entry["const"]),
+                }
+            )
+    return shapes
+
+
+class FilterWorkloadRecorder:
+    """
+    Sampling recorder of applied filter shapes and orderings, per model.
+
+    Example:
+        recorder = get_filter_workload_recorder()
+        recorder.record_filters(queryset, schema_name="default")
+        workload = recorder.load()
+    """
+
+    def __init__(self, flush_every: int = DEFAULT_FLUSH_EVERY):
+        self.flush_every = max(1, int(flush_every))
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_samples = 0
+        self._sample_rates: Dict[str, float] = {}
+        # Counts flushed by this process, written whole to its own key.
+        self._totals: Dict[str, Dict[str, Any]] = {}
+        self._worker_key = f"{WORKLOAD_CACHE_PREFIX}:worker:{uuid.uuid4().hex}"
+
+    def get_sample_rate(self, schema_name: str = "default") -> float:
+        rate = self._sample_rates.get(schema_name)
+        if rate is None:
+            try:
+                from ...core.settings import FilteringSettings
+
+                rate = float(FilteringSettings.from_schema(schema_name).workload_sample_rate or 0)
+            except Exception:
+                rate = 0.0
+            self._sample_rates[schema_name] = rate
+        return rate
+
+    def should_sample(self, schema_name: str = "default") -> bool:
+        rate = self.get_sample_rate(schema_name)
+        return rate > 0 and (rate >= 1 or random.random() < rate)
+
+    def _entry(self, label: str) -> Dict[str, Any]:
+        return self._pending.setdefault(label, {"shapes": {}, "orderings": {}})
+
+    def record_filters(
+        self, queryset: models.QuerySet, schema_name: str = "default", force: bool = False
+    ) -> None:
+        """Record the predicate shapes of a filtered *queryset* (sampled)."""
+        if not force and not self.should_sample(schema_name):
+            return
+        try:
+            shapes = extract_filter_shapes(queryset)
+            sample = None
+            if shapes:
+                # Parameter values may hold user data; only the SQL is kept.
+                sql, _params = queryset.query.sql_with_params()
+                sample = [sql, queryset.db]
+        except Exception as exc:
+            logger.debug("Could not record filter workload: %s", exc)
+            return
+        if not shapes:
+            return
+        with self._lock:
+            for shape in shapes:
+                entry = self._entry(shape["model"]._meta.label_lower)
+                key = _shape_key(shape["eq"], shape["range"], shape["const"])
+                stats = entry["shapes"].setdefault(key, {"count": 0, "sample": sample})
+                stats["count"] += 1
+            flush_due = self._note_sample()
+        if flush_due:
+            self.flush(wait=False)
+
+    def record_ordering(
+        self,
+        model: Type[models.Model],
+        order_by: Sequence[str],
+        schema_name: str = "default",
+        force: bool = False,
+    ) -> None:
+        """Record the database ordering applied to *model* (sampled)."""
+        if not force and not self.should_sample(schema_name):
+            return
+        columns = _ordering_columns(model, order_by)
+        if not columns:
+            return
+        with self._lock:
+            orderings = self._entry(model._meta.concrete_model._meta.label_lower)["orderings"]
+            key = ",".join(columns)
+            orderings[key] = orderings.get(key, 0) + 1
+            flush_due = self._note_sample()
+        if flush_due:
+            self.flush(wait=False)
+
+    def _note_sample(self) -> bool:
+        self._pending_samples += 1
+        return self._pending_samples >= self.flush_every
+
+    def flush(self, wait: bool = True) -> None:
+        """
+        Write the counts of this process to the shared cache.
+
+        Cache I/O runs outside the lock taken by recording threads. With
+        ``wait=False`` the call returns at once while another thread flushes.
+        """
+        if not self._flush_lock.acquire(blocking=wait):
+            return
+        try:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._pending_samples = 0
+            if not pending:
+                return
+            _merge_workload(self._totals, pending)
+            try:
+                cache.set(self._worker_key, self._totals, WORKLOAD_CACHE_TTL)
+                # A registration lost to a concurrent one is retried on the next flush.
+                workers = cache.get(WORKLOAD_WORKERS_KEY) or []
+                if self._worker_key not in workers:
+                    cache.set(
+                        WORKLOAD_WORKERS_KEY, [*workers, self._worker_key], WORKLOAD_CACHE_TTL
+                    )
+            except Exception as exc:
+                logger.debug("Could not flush filter workload: %s", exc)
+        finally:
+            self._flush_lock.release()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Return the recorded workload per model label, merged across workers."""
+        self.flush()
+        workload: Dict[str, Dict[str, Any]] = {}
+        workers = cache.get(WORKLOAD_WORKERS_KEY) or []
+        for totals in cache.get_many(workers).values():
+            _merge_workload(workload, totals)
+        return workload
+
+    def reset(self) -> None:
+        """Discard the recorded workload and cached sample rates."""
+        with self._flush_lock, self._lock:
+            self._pending = {}
+            self._pending_samples = 0
+            self._sample_rates = {}
+            self._totals = {}
+            workers = cache.get(WORKLOAD_WORKERS_KEY) or []
+            cache.delete_many([*workers, WORKLOAD_WORKERS_KEY])
+
+
+_recorder: Optional[FilterWorkloadRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_filter_workload_recorder() -> FilterWorkloadRecorder:
+    """Return the process-wide workload recorder."""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = FilterWorkloadRecorder()
+    return _recorder
+
+
+def _placeholder_count(sql: str) -> int:
+    return sum(1 for match in _PLACEHOLDER_RE.finditer(sql) if match.group() == "%s")
+
+
+def _numbered_placeholders(sql: str) -> str:
+    """Rewrite ``%s`` as ``$1, $2, ...`` for a statement run without parameters."""
+    counter = itertools.count(1)
+    return _PLACEHOLDER_RE.sub(
+        lambda match: f"${next(counter)}" if match.group() == "%s" else "%", sql
+    )
+
+
+def _ordering_columns(model: Type[models.Model], order_by: Sequence[str]) -> List[str]:
+    columns = []
+    for spec in order_by or []:
+        if not isinstance(spec, str):
+            return []
+        name = spec.lstrip("-+")
+        if "__" in name:
+            return []
+        try:
+            target = model._meta.pk if name == "pk" else model._meta.get_field(name)
+        except Exception:
+            return []
+        if not getattr(target, "concrete", False):
+            return []
+        if target.model is not model._meta.concrete_model:
+            return []
+        columns.append(f"-{target.column}" if spec.startswith("-") else target.column)
+    return columns
+
+
+@dataclass
+class IndexRecommendation:
+    """A ranked index candidate derived from the recorded workload."""
+
+    model: Type[models.Model]
+    fields: List[str]
+    condition: Dict[str, Any] = field(default_factory=dict)
+    occurrences: int = 0
+    score: float = 0.0
+    kind: str = "composite"
+    full_scan: Optional[bool] = None
+    plan: str = ""
+
+    @property
+    def name(self) -> str:
+        table = self.model._meta.db_table
+        digest = hashlib.sha256(
+            json.dumps([table, self.fields, sorted(self.condition.items())], default=str).encode()
+        ).hexdigest()[:6]
+        return f"{table[:11]}_{self.fields[0].lstrip('-')[:7]}_{digest}_idx"
+
+    def as_index(self) -> models.Index:
+        condition = Q(**self.condition) if self.condition else None
+        return models.Index(fields=self.fields, name=self.name, condition=condition)
+
+    def describe(self) -> str:
+        text = f"{self.model._meta.label}({', '.join(self.fields)})"
+        if self.condition:
+            text += " WHERE " + " AND ".join(
+                f"{key}={value!r}" for key, value in sorted(self.condition.items())
+            )
+        return text
+
+
+class IndexAdvisor:
+    """
+    Rank index recommendations from a recorded filter workload.
+
+    Example:
+        advisor = IndexAdvisor(min_occurrences=5)
+        for rec in advisor.recommend(get_filter_workload_recorder().load()):
+            print(rec.describe(), rec.score)
+    """
+
+    def __init__(
+        self,
+        min_occurrences: int = 5,
+        explain: bool = True,
+        using: str = DEFAULT_DB_ALIAS,
+    ):
+        self.min_occurrences = max(1, int(min_occurrences))
+        self.explain = explain
+        self.using = using
+
+    def recommend(
+        self,
+        workload: Dict[str, Dict[str, Any]],
+        models_filter: Optional[Iterable[Type[models.Model]]] = None,
+    ) -> List[IndexRecommendation]:
+        """Return index recommendations ordered by decreasing score."""
+        allowed = (
+            {model._meta.label_lower for model in models_filter} if models_filter else None
+        )
+        recommendations: Dict[Tuple[str, str, str], IndexRecommendation] = {}
+        for label, entry in workload.items():
+            if allowed is not None and label not in allowed:
+                continue
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError):
+                continue
+            existing = self._existing_index_columns(model)
+            for candidate in self._candidates(model, entry):
+                columns = [self._column(model, name) for name in candidate.fields]
+                if self._is_covered(columns, candidate.condition, existing):
+                    continue
+                key = (
+                    label,
+                    ",".join(candidate.fields),
+                    json.dumps(sorted(candidate.condition.items()), default=str),
+                )
+                current = recommendations.get(key)
+                if current is not None:
+                    current.occurrences += candidate.occurrences
+                    current.score += candidate.score
+                    continue
+                recommendations[key] = candidate
+        return sorted(
+            recommendations.values(),
+            key=lambda rec: (-rec.score, rec.model._meta.label, rec.fields),
+        )
+
+    def _candidates(
+        self, model: Type[models.Model], entry: Dict[str, Any]
+    ) -> Iterable[IndexRecommendation]:
+        concrete_model = model._meta.concrete_model
+        columns_to_fields = {
+            f.column: f.name for f in model._meta.concrete_fields if f.model is concrete_model
+        }
+        shapes = entry.get("shapes") or {}
+        popularity: Counter = Counter()
+        for shape_key, stats in shapes.items():
+            eq, _, _ = json.loads(shape_key)
+            for column in eq:
+                popularity[column] += stats["count"]
+
+        for shape_key, stats in shapes.items():
+            count = int(stats.get("count") or 0)
+            if count < self.min_occurrences:
+                continue
+            eq, rng, const = json.loads(shape_key)
+            used = [*eq, *rng, *(column for column, _, _ in const)]
+            if not all(column in columns_to_fields for column in used):
+                continue
+            ordered_eq = sorted(eq, key=lambda column: (-popularity[column], column))
+            columns = ordered_eq + rng[:1]
+            condition = {}
+            for column, lookup, value in const:
+                name = columns_to_fields[column]
+                condition[name if lookup == "exact" else f"{name}__isnull"] = value
+            if not columns:
+                if not any(lookup == "isnull" for _, lookup, _ in const):
+                    continue
+                columns = [column for column, _, _ in const]
+                condition = {}
+            full_scan, plan = self._explain(model, stats.get("sample"))
+            weight = 2.0 if full_scan else (0.5 if full_scan is False else 1.0)
+            yield IndexRecommendation(
+                model=model,
+                fields=[columns_to_fields[column] for column in columns],
+                condition=condition,
+                occurrences=count,
+                score=count * weight,
+                kind="partial" if condition else "composite",
+                full_scan=full_scan,
+                plan=plan,
+            )
+
+        for ordering, count in (entry.get("orderings") or {}).items():
+            if count < self.min_occurrences:
+                continue
+            columns = ordering.split(",")
+            if not all(column.lstrip("-") in columns_to_fields for column in columns):
+                continue
+            fields = [
+                f"-{columns_to_fields[c[1:]]}" if c.startswith("-") else columns_to_fields[c]
+                for c in columns
+            ]
+            if fields == [model._meta.pk.name] or fields == [f"-{model._meta.pk.name}"]:
+                continue
+            yield IndexRecommendation(
+                model=model, fields=fields, occurrences=count, score=float(count), kind="ordering"
+            )
+
+    def _column(self, model: Type[models.Model], name: str) -> str:
+        return model._meta.get_field(name.lstrip("-")).column
+
+    def _existing_index_columns(self, model: Type[models.Model]) -> List[List[str]]:
+        connection = connections[self.using]
+        try:
+            with connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(
+                    cursor, model._meta.db_table
+                )
+        except DatabaseError as exc:
+            logger.debug("Could not introspect indexes of %s: %s", model._meta.db_table, exc)
+            return []
+        return [
+            list(info.get("columns") or [])
+            for info in constraints.values()
+            if info.get("index") or info.get("unique") or info.get("primary_key")
+        ]
+
+    def _is_covered(
+        self, columns: List[str], condition: Dict[str, Any], existing: List[List[str]]
+    ) -> bool:
+        if condition:
+            return False
+        return any(index[: len(columns)] == columns for index in existing)
+
+    def _explain(self, model: Type[models.Model], sample: Any) -> Tuple[Optional[bool], str]:
+        if not self.explain or not sample:
+            return None, ""
+        sql = sample[0]
+        connection = connections[self.using]
+        table = model._meta.db_table
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == "sqlite":
+                    # The plan is chosen before values are bound.
+                    params = [None] * _placeholder_count(sql)
+                    cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                    plan = "\n".join(str(row[-1]) for row in cursor.fetchall())
+                    full_scan = any(
+                        re.match(rf"SCAN {re.escape(table)}\b(?!.*INDEX)", line)
+                        for line in plan.splitlines()
+                    )
+                elif connection.vendor == "postgresql":
+                    if connection.pg_version < 160000:
+                        return None, ""
+                    cursor.execute(f"EXPLAIN (GENERIC_PLAN) {_numbered_placeholders(sql)}")
+                    plan = "\n".join(str(row[0]) for row in cursor.fetchall())
+                    full_scan = bool(re.search(rf'Seq Scan on "?{re.escape(table)}"?\b', plan))
+                else:
+                    return None, ""
+        except Exception as exc:
+            logger.debug("EXPLAIN failed for %s: %s", table, exc)
+            return None, ""
+        return full_scan, plan
+
+
+def build_index_migration(
+    app_label: str, recommendations: Sequence[IndexRecommendation]
+) -> Any:
+    """Return a ``Migration`` adding the recommended indexes of *app_label*."""
+    from django.db import migrations
+    from django.db.migrations.autodetector import MigrationAutodetector
+    from django.db.migrations.loader import MigrationLoader
+
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    leaves = loader.graph.leaf_nodes(app_label)
+    number = 1
+    if leaves:
+        number = (MigrationAutodetector.parse_number(leaves[-1][1]) or 0) + 1
+    migration = migrations.Migration(f"{number:04d}_filter_workload_indexes", app_label)
+    migration.dependencies = list(leaves)
+    migration.operations = [
+        migrations.AddIndex(model_name=rec.model._meta.model_name, index=rec.as_index())
+        for rec in recommendations
+        if rec.model._meta.app_label == app_label
+    ]
+    return migration
+
+
+__all__ = [
+    "FilterWorkloadRecorder",
+    "IndexAdvisor",
+    "IndexRecommendation",
+    "build_index_migration",
+    "extract_filter_shapes",
+    "get_filter_workload_recorder",
+]
@@ -10,6 +10,7 @@ from django.db import IntegrityError, models, transaction
 
 from ...core.exceptions import GraphQLAutoError
 from ...core.meta import get_model_graphql_meta
+from ...core.model_versions import batched_model_version_bumps
 from ..pipeline.utils import decode_global_id
 from .errors import (
     MutationError,
@@ -71,17 +72,18 @@ def generate_bulk_create_mutation(
 
                 audited_create = _wrap_with_audit(model, "create", _perform_create)
                 instances = []
-                for input_data in inputs:
-                    # Normalize enum inputs (GraphQL Enum -> underlying Django values)
-                    input_data = cls._normalize_enum_inputs(input_data, model)
-                    input_data = self._apply_tenant_input(
-                        input_data, info, model, operation="create"
-                    )
-                    input_data = self.input_validator.validate_and_sanitize(
-                        model.__name__, input_data
-                    )
-                    instance = audited_create(info, input_data)
-                    instances.append(instance)
+                with batched_model_version_bumps():
+                    for input_data in inputs:
+                        # Normalize enum inputs (GraphQL Enum -> underlying Django values)
+                        input_data = cls._normalize_enum_inputs(input_data, model)
+                        input_data = self._apply_tenant_input(
+                            input_data, info, model, operation="create"
+                        )
+                        input_data = self.input_validator.validate_and_sanitize(
+                            model.__name__, input_data
+                        )
+                        instance = audited_create(info, input_data)
+                        instances.append(instance)
 
                 return cls(ok=True, objects=instances, errors=[])
 
@@ -216,32 +218,33 @@ def generate_bulk_update_mutation(
 
                 audited_update = _wrap_with_audit(model, "update", _perform_update)
                 instances = []
-                for input_data in inputs:
-                    scoped = self._apply_tenant_scope(
-                        model.objects.all(), info, model, operation="update"
-                    )
-                    instance = scoped.get(pk=_resolve_lookup_id(input_data["id"]))
-                    graphql_meta.ensure_operation_access(
-                        "bulk_update", info=info, instance=instance
-                    )
-                    graphql_meta.ensure_operation_access(
-                        "update", info=info, instance=instance
-                    )
-                    # Normalize enum inputs for update payload
-                    update_data = cls._normalize_enum_inputs(input_data["data"], model)
-                    update_data = {
-                        field_name: field_value
-                        for field_name, field_value in update_data.items()
-                        if field_name != "id"
-                    }
-                    update_data = self._apply_tenant_input(
-                        update_data, info, model, operation="update"
-                    )
-                    update_data = self.input_validator.validate_and_sanitize(
-                        model.__name__, update_data
-                    )
-                    instance = audited_update(info, instance, update_data)
-                    instances.append(instance)
+                with batched_model_version_bumps():
+                    for input_data in inputs:
+                        scoped = self._apply_tenant_scope(
+                            model.objects.all(), info, model, operation="update"
+                        )
+                        instance = scoped.get(pk=_resolve_lookup_id(input_data["id"]))
+                        graphql_meta.ensure_operation_access(
+                            "bulk_update", info=info, instance=instance
+                        )
+                        graphql_meta.ensure_operation_access(
+                            "update", info=info, instance=instance
+                        )
+                        # Normalize enum inputs for update payload
+                        update_data = cls._normalize_enum_inputs(input_data["data"], model)
+                        update_data = {
+                            field_name: field_value
+                            for field_name, field_value in update_data.items()
+                            if field_name != "id"
+                        }
+                        update_data = self._apply_tenant_input(
+                            update_data, info, model, operation="update"
+                        )
+                        update_data = self.input_validator.validate_and_sanitize(
+                            model.__name__, update_data
+                        )
+                        instance = audited_update(info, instance, update_data)
+                        instances.append(instance)
 
                 return cls(ok=True, objects=instances, errors=[])
 
@@ -394,8 +397,9 @@ def generate_bulk_delete_mutation(
                     return target
 
                 audited_delete = _wrap_with_audit(model, "delete", _perform_delete)
-                for inst in deleted_instances:
-                    audited_delete(info, inst)
+                with batched_model_version_bumps():
+                    for inst in deleted_instances:
+                        audited_delete(info, inst)
                 return cls(ok=True, objects=deleted_instances, errors=[])
 
             except model.DoesNotExist as exc:
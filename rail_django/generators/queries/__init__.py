@@ -9,14 +9,21 @@ from .grouping import (
     GroupingBucketType,
     generate_grouping_query,
 )
+from .keyset import (
+    CursorPage,
+    paginate_by_cursor,
+    uses_cursor_pagination,
+)
 from .list import (
     generate_list_query,
     generate_single_query,
 )
 from .ordering import (
     apply_count_annotations_for_ordering,
+    apply_ordering_expressions,
     apply_property_ordering,
     get_default_ordering,
+    get_ordering_expression,
     normalize_ordering_specs,
     safe_prop_value,
     split_order_specs,
@@ -31,11 +38,16 @@ __all__ = [
     "QueryGenerator",
     "GroupingBucketType",
     "generate_grouping_query",
+    "CursorPage",
+    "paginate_by_cursor",
+    "uses_cursor_pagination",
     "generate_list_query",
     "generate_single_query",
     "apply_count_annotations_for_ordering",
+    "apply_ordering_expressions",
     "apply_property_ordering",
     "get_default_ordering",
+    "get_ordering_expression",
     "normalize_ordering_specs",
     "safe_prop_value",
     "split_order_specs",
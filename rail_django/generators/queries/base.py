@@ -12,11 +12,13 @@ from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.db import models
 
+from ..filters.workload import get_filter_workload_recorder
 from .exceptions import (
     FilterApplicationError,
     PresetFilterError,
     SavedFilterError,
 )
+from .ordering import apply_ordering_expressions
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,10 @@ RESERVED_QUERY_ARGS: FrozenSet[str] = frozenset([
     "limit",
     "page",
     "per_page",
+    "first",
+    "last",
+    "after",
+    "before",
     "skip_count",
     "count_mode",
     "include",
@@ -340,7 +346,8 @@ class QueryOrderingHelper:
     Helper for applying ordering to querysets.
 
     Handles database ordering, count annotations, distinct on,
-    and property-based ordering.
+    property expressions pushed down to SQL, and Python sorting for the
+    remaining property-based ordering.
     """
 
     def __init__(
@@ -397,6 +404,11 @@ class QueryOrderingHelper:
                 queryset, self.model, normalized
             )
 
+            # Push properties with a registered ORM expression down to SQL
+            queryset, normalized = apply_ordering_expressions(
+                queryset, self.model, normalized, self.ordering_config
+            )
+
             # Split into DB and property specs
             db_specs, prop_specs = self.qg._split_order_specs(self.model, normalized)
 
@@ -405,6 +417,9 @@ class QueryOrderingHelper:
                 queryset = self.qg._apply_distinct_on(queryset, distinct_on, db_specs)
             elif db_specs:
                 queryset = queryset.order_by(*db_specs)
+                get_filter_workload_recorder().record_ordering(
+                    self.model, db_specs, getattr(self.qg, "schema_name", "default")
+                )
 
             # Handle property ordering
             if prop_specs:
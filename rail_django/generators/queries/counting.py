@@ -0,0 +1,119 @@
+"""
+Count strategies for paginated queries.
+
+``cached``
+    Exact counts cached in the Django cache. The key hashes the model, the
+    compiled SQL and parameters of the filtered queryset (which include the
+    tenant predicate) and the data versions of every table the query reads,
+    so a write to any of them invalidates the entry.
+``capped``
+    ``SELECT COUNT(*) FROM (SELECT ... LIMIT cap + 1)``: stops scanning after
+    ``cap`` rows so clients can display "10,000+".
+``estimated``
+    Planner row estimate from ``EXPLAIN`` (PostgreSQL), valid for filtered
+    queries as well.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Optional
+
+from django.core.cache import cache
+from django.db import connections, models
+
+from ...core.model_versions import get_model_versions
+from ...extensions.optimization.result_cache import models_in_sql
+
+logger = logging.getLogger(__name__)
+
+COUNT_CACHE_PREFIX = "rail_django:count"
+
+
+def _models_in_query(queryset: models.QuerySet, sql: str) -> list[type[models.Model]]:
+    """Return the models whose tables the queryset's compiled *sql* reads.
+
+    Tables read by ``Exists`` / ``Subquery`` filters (relation ``_some`` /
+    ``_none`` filters, aggregates) are included.
+    """
+    return [queryset.model, *models_in_sql(sql)]
+
+
+def count_cache_key(queryset: models.QuerySet) -> Optional[str]:
+    """Return the cache key of the exact count of *queryset*."""
+    try:
+        count_queryset = queryset.order_by()
+        sql, params = count_queryset.query.sql_with_params()
+        versions = get_model_versions(_models_in_query(count_queryset, sql))
+    except Exception as exc:
+        logger.debug("Could not build count cache key: %s", exc)
+        return None
+    digest = hashlib.sha256(
+        json.dumps([sql, [str(param) for param in params], versions]).encode("utf-8")
+    ).hexdigest()
+    return f"{COUNT_CACHE_PREFIX}:{queryset.db}:{queryset.model._meta.label_lower}:{digest}"
+
+
+def cached_count(queryset: models.QuerySet, timeout: Optional[int] = 300) -> int:
+    """Return the exact count of *queryset*, reusing a cached value when fresh."""
+    key = count_cache_key(queryset)
+    if key is not None:
+        try:
+            value = cache.get(key)
+        except Exception:
+            value = None
+        if value is not None:
+            return int(value)
+    total = queryset.count()
+    if key is not None:
+        try:
+            cache.set(key, total, timeout)
+        except Exception as exc:
+            logger.debug("Could not cache count for %s: %s", queryset.model.__name__, exc)
+    return total
+
+
+def capped_count(queryset: models.QuerySet, cap: int) -> tuple[int, bool]:
+    """
+    Count at most *cap* rows.
+
+    Returns:
+        Tuple of (count, is_capped); ``is_capped`` means "at least *cap*".
+    """
+    cap = max(1, int(cap))
+    total = queryset.order_by()[: cap + 1].count()
+    if total > cap:
+        return cap, True
+    return total, False
+
+
+def explain_row_estimate(queryset: models.QuerySet) -> Optional[int]:
+    """
+    Return the planner's row estimate for *queryset* (PostgreSQL only).
+
+    Returns None when the backend is unsupported or EXPLAIN fails.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            row = cursor.fetchone()
+    except Exception as exc:
+        logger.debug("EXPLAIN row estimate failed for %s: %s", queryset.model.__name__, exc)
+        return None
+    if not row:
+        return None
+    plan: Any = row[0]
+    if isinstance(plan, str):
+        try:
+            plan = json.loads(plan)
+        except ValueError:
+            return None
+    try:
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+    return estimate if estimate >= 0 else None
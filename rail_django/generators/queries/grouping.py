@@ -110,7 +110,11 @@ def generate_grouping_query(
 
     max_buckets = getattr(self.settings, "max_grouping_buckets", 200) or 200
 
-    @optimize_query()
+    def authorize(root, info, **kwargs):
+        self._enforce_model_permission(info, model, "list", graphql_meta)
+        graphql_meta.ensure_operation_access("list", info=info)
+
+    @optimize_query(user_specific_cache=True, authorize=authorize)
     def resolver(root: Any, info: graphene.ResolveInfo, **kwargs):
         self._enforce_model_permission(info, model, "list", graphql_meta)
         graphql_meta.ensure_operation_access("list", info=info)
@@ -0,0 +1,272 @@
+"""
+Cursor (keyset) pagination helpers for paginated queries.
+
+Cursors are opaque base64 tokens. When the applied ordering resolves to
+non-null columns of the model itself, a cursor encodes the ordering values of
+its row and pages are fetched with a seek predicate
+(``WHERE (a, b, pk) > (...)`` expanded into ORed comparisons), so deep pages
+cost the same as the first one and do not drift when rows are inserted.
+Otherwise (property ordering, annotations, nullable or related columns) the
+cursor encodes the row position and pages fall back to OFFSET.
+"""
+
+import base64
+import datetime
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+from graphql import GraphQLError
+
+logger = logging.getLogger(__name__)
+
+CURSOR_ARGS = ("first", "last", "after", "before")
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    """JSON encoder keeping full microsecond precision for seek values."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+@dataclass
+class CursorPage:
+    """Rows of a cursor page and the values of its ``pageInfo``."""
+
+    items: List[Any]
+    page_size: int
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: Optional[str]
+    end_cursor: Optional[str]
+
+
+def uses_cursor_pagination(kwargs: dict[str, Any]) -> bool:
+    """Return True when any cursor argument was supplied."""
+    return any(kwargs.get(name) is not None for name in CURSOR_ARGS)
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, cls=_CursorEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError, UnicodeError):
+        raise GraphQLError("Invalid pagination cursor.")
+    if not isinstance(payload, dict):
+        raise GraphQLError("Invalid pagination cursor.")
+    return payload
+
+
+def get_keyset_ordering(
+    model: Type[models.Model], queryset: models.QuerySet
+) -> Optional[List[Tuple[models.Field, bool]]]:
+    """
+    Return the ordering of *queryset* as ``(field, descending)`` pairs.
+
+    The primary key is appended unless a unique column already makes the
+    ordering total. Returns None when the ordering cannot be seeked: random
+    or expression ordering, annotations, related or nullable columns.
+    """
+    query = queryset.query
+    specs = list(query.order_by) or (
+        list(model._meta.ordering) if query.default_ordering else []
+    )
+    ordering: List[Tuple[models.Field, bool]] = []
+    for spec in specs:
+        if not isinstance(spec, str) or spec == "?":
+            return None
+        descending = spec.startswith("-")
+        name = spec.lstrip("-+")
+        if name == "pk":
+            field = model._meta.pk
+        else:
+            if "__" in name or name in query.annotations:
+                return None
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+        if not getattr(field, "concrete", False) or field.null:
+            return None
+        if field.is_relation and name != field.attname:
+            # Ordering by a relation name follows the related model's ordering.
+            return None
+        ordering.append((field, descending))
+        if field.primary_key or field.unique:
+            return ordering
+    ordering.append((model._meta.pk, ordering[-1][1] if ordering else False))
+    return ordering
+
+
+def _ordering_signature(ordering: Sequence[Tuple[models.Field, bool]]) -> List[str]:
+    return [f"-{field.attname}" if desc else field.attname for field, desc in ordering]
+
+
+def _seek_filter(
+    ordering: Sequence[Tuple[models.Field, bool]], values: Sequence[Any], forward: bool
+) -> Q:
+    """Build ``(a, b, c) > (x, y, z)`` as ORed equality prefixes for mixed directions."""
+    condition = Q()
+    equal_prefix: dict[str, Any] = {}
+    for (field, descending), value in zip(ordering, values):
+        lookup = "lt" if descending == forward else "gt"
+        condition |= Q(**equal_prefix, **{f"{field.attname}__{lookup}": value})
+        equal_prefix[field.attname] = value
+    return condition
+
+
+def _decode_keyset_values(
+    cursor: str, ordering: Sequence[Tuple[models.Field, bool]]
+) -> List[Any]:
+    payload = decode_cursor(cursor)
+    values = payload.get("k")
+    if payload.get("s") != _ordering_signature(ordering) or not isinstance(values, list):
+        raise GraphQLError("Pagination cursor does not match the requested ordering.")
+    try:
+        return [field.to_python(value) for (field, _), value in zip(ordering, values)]
+    except ValidationError:
+        raise GraphQLError("Invalid pagination cursor.")
+
+
+def _keyset_cursor(instance: Any, ordering: Sequence[Tuple[models.Field, bool]]) -> str:
+    return encode_cursor(
+        {
+            "s": _ordering_signature(ordering),
+            "k": [field.value_from_object(instance) for field, _ in ordering],
+        }
+    )
+
+
+def _decode_offset(cursor: str) -> int:
+    value = decode_cursor(cursor).get("o")
+    if not isinstance(value, int) or value < 0:
+        raise GraphQLError("Pagination cursor does not match the requested ordering.")
+    return value
+
+
+def _page_size(value: Any, name: str, max_page_size: int) -> Optional[int]:
+    if value is None:
+        return None
+    if value < 0:
+        raise GraphQLError(f"{name} must be a non-negative integer.")
+    return min(int(value), max_page_size)
+
+
+def paginate_by_cursor(
+    model: Type[models.Model],
+    queryset: models.QuerySet,
+    items: Optional[List[Any]],
+    kwargs: dict[str, Any],
+    *,
+    default_page_size: int,
+    max_page_size: int,
+) -> CursorPage:
+    """
+    Fetch one page of *queryset* from ``first``/``last``/``after``/``before``.
+
+    ``items`` is the already materialized result of property ordering, in
+    which case positions are used as cursors.
+    """
+    first = _page_size(kwargs.get("first"), "first", max_page_size)
+    last = _page_size(kwargs.get("last"), "last", max_page_size)
+    after = kwargs.get("after")
+    before = kwargs.get("before")
+    if first is None and last is None:
+        if before is not None and after is None:
+            last = min(default_page_size, max_page_size)
+        else:
+            first = min(default_page_size, max_page_size)
+
+    ordering = get_keyset_ordering(model, queryset) if items is None else None
+    if ordering is None:
+        return _paginate_by_offset(queryset, items, first, last, after, before)
+
+    queryset = queryset.order_by(
+        *(f"-{field.attname}" if desc else field.attname for field, desc in ordering)
+    )
+    if after is not None:
+        queryset = queryset.filter(
+            _seek_filter(ordering, _decode_keyset_values(after, ordering), forward=True)
+        )
+    if before is not None:
+        queryset = queryset.filter(
+            _seek_filter(ordering, _decode_keyset_values(before, ordering), forward=False)
+        )
+
+    if first is not None:
+        rows = list(queryset[: first + 1])
+        has_more = len(rows) > first
+        rows = rows[:first]
+        if last is not None and len(rows) > last:
+            rows = rows[len(rows) - last :]
+        has_next_page = has_more or before is not None
+        has_previous_page = after is not None
+    else:
+        rows = list(queryset.reverse()[: last + 1])
+        has_more = len(rows) > last
+        rows = list(reversed(rows[:last]))
+        has_next_page = before is not None
+        has_previous_page = has_more or after is not None
+
+    return CursorPage(
+        items=rows,
+        page_size=first if first is not None else last,
+        has_next_page=has_next_page,
+        has_previous_page=has_previous_page,
+        start_cursor=_keyset_cursor(rows[0], ordering) if rows else None,
+        end_cursor=_keyset_cursor(rows[-1], ordering) if rows else None,
+    )
+
+
+def _paginate_by_offset(
+    queryset: models.QuerySet,
+    items: Optional[List[Any]],
+    first: Optional[int],
+    last: Optional[int],
+    after: Optional[str],
+    before: Optional[str],
+) -> CursorPage:
+    start = _decode_offset(after) + 1 if after is not None else 0
+    end = _decode_offset(before) if before is not None else None
+    if end is None and first is None:
+        end = len(items) if items is not None else queryset.count()
+    if end is not None:
+        end = max(start, end)
+
+    if first is not None:
+        stop = start + first
+        if end is not None:
+            stop = min(stop, end)
+        window_start = stop - last if last is not None else start
+        window_start = max(start, window_start)
+    else:
+        stop = end
+        window_start = max(start, end - last)
+
+    source = items if items is not None else queryset
+    rows = list(source[window_start : stop + 1])
+    has_next_page = len(rows) > stop - window_start
+    rows = rows[: stop - window_start]
+    if end is not None and stop >= end:
+        has_next_page = before is not None
+    return CursorPage(
+        items=rows,
+        page_size=first if first is not None else last,
+        has_next_page=has_next_page,
+        has_previous_page=window_start > 0,
+        start_cursor=encode_cursor({"o": window_start}) if rows else None,
+        end_cursor=encode_cursor({"o": window_start + len(rows) - 1}) if rows else None,
+    )
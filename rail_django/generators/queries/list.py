@@ -18,6 +18,7 @@ try:
 except ImportError:
     DjangoFilterConnectionField = None
 
+from ...core.execution import is_async_execution, run_in_worker
 from ...core.meta import get_model_graphql_meta
 from ...extensions.optimization import optimize_query
 from .base import (
@@ -48,6 +49,32 @@ def _is_schema_error(exc: Exception) -> bool:
         return True
     return False
 
+async def _retrieve_async(
+    queryset: models.QuerySet, pk: Any, finish: Any
+) -> Optional[models.Model]:
+    """Async single object lookup: ``aget`` then *finish* in a worker thread."""
+    try:
+        instance = await queryset.aget(pk=pk)
+    except queryset.model.DoesNotExist:
+        return None
+    return await run_in_worker(finish, instance)
+
+
+async def _list_async(queryset: models.QuerySet, finish: Any, fetch: Any) -> Any:
+    """Async list evaluation with ``async for``, then *finish* in a worker thread.
+
+    On a schema error the rows are read with *fetch*, the synchronous
+    evaluation that retries without prefetching.
+    """
+    try:
+        rows = [row async for row in queryset]
+    except Exception as exc:
+        if not _is_schema_error(exc):
+            raise
+        rows = await run_in_worker(fetch, queryset)
+    return await run_in_worker(finish, rows)
+
+
 def _get_nested_filter_generator(schema_name: str):
     """Lazy import to avoid circular dependencies. Returns singleton instance."""
     from ..filters import get_nested_filter_generator
@@ -81,6 +108,10 @@ def generate_single_query(
     model_type = self.type_generator.generate_object_type(model)
     graphql_meta = get_model_graphql_meta(model)
 
+    def authorize_single(root, info, **kwargs):
+        self._enforce_model_permission(info, model, "retrieve", graphql_meta)
+
+    @optimize_query(user_specific_cache=True, authorize=authorize_single)
     def resolve_single(root, info, id):
         """Resolver for single object queries."""
         try:
@@ -96,14 +127,19 @@ def generate_single_query(
                     info,
                     id=id,
                 )
-            instance = queryset.get(pk=id)
-            self._enforce_tenant_access(
-                instance, info, model, operation="retrieve"
-            )
-            graphql_meta.ensure_operation_access(
-                "retrieve", info=info, instance=instance
-            )
-            return self._apply_field_masks(instance, info, model)
+
+            def finish(instance):
+                self._enforce_tenant_access(
+                    instance, info, model, operation="retrieve"
+                )
+                graphql_meta.ensure_operation_access(
+                    "retrieve", info=info, instance=instance
+                )
+                return self._apply_field_masks(instance, info, model)
+
+            if is_async_execution(info):
+                return _retrieve_async(queryset, id, finish)
+            return finish(queryset.get(pk=id))
         except model.DoesNotExist:
             return None
 
@@ -191,8 +227,12 @@ def generate_list_query(
             description=f"Retrieve a list of {model_name} instances with pagination using {manager_name} manager",
         )
 
+    def authorize_list(root, info, **kwargs):
+        self._enforce_model_permission(info, model, "list", graphql_meta)
+        graphql_meta.ensure_operation_access("list", info=info)
+
     # Standard list query with offset/limit pagination
-    @optimize_query()
+    @optimize_query(user_specific_cache=True, authorize=authorize_list)
     def resolver(
         root: Any, info: graphene.ResolveInfo, **kwargs
     ) -> List[models.Model]:
@@ -259,84 +299,75 @@ def generate_list_query(
                 items = items[offset:offset + limit]
             else:
                 queryset = queryset[offset:offset + limit]
-                try:
-                    items = list(queryset)
-                except Exception as eval_exc:
-                    # Guard against prefetch_related failures caused by
-                    # missing DB columns (e.g. unapplied GenericRelation
-                    # migrations).  Strip prefetch and retry.
-                    if (
-                        queryset.query.select_related
-                        or getattr(queryset, "_prefetch_related_lookups", None)
-                    ) and _is_schema_error(eval_exc):
-                        logger.warning(
-                            "Prefetch/select_related failed for %s "
-                            "(possible unapplied migration): %s.  "
-                            "Retrying without prefetch.  "
-                            "Run 'manage.py migrate' to fix.",
-                            model.__name__,
-                            eval_exc,
-                        )
-                        plain_qs = manager.all()
-                        plain_qs = self._apply_tenant_scope(
-                            plain_qs, info, model, operation="list"
-                        )
-                        if graphql_meta.has_custom_resolver("list"):
-                            plain_qs = graphql_meta.apply_custom_resolver(
-                                "list", plain_qs, info, **kwargs,
-                            )
-                        context_retry = QueryContext(
-                            model=model,
-                            queryset=plain_qs,
-                            info=info,
-                            kwargs=kwargs,
-                            graphql_meta=graphql_meta,
-                            filter_applicator=nested_filter_applicator,
-                            filter_class=filter_class,
-                            ordering_config=ordering_config,
-                            settings=self.settings,
-                            schema_name=self.schema_name,
-                        )
-                        pipeline_retry = QueryFilterPipeline(context_retry)
-                        plain_qs = pipeline_retry.apply_all()
-                        ordering_helper_retry = QueryOrderingHelper(
-                            self, model, ordering_config, self.settings
-                        )
-                        plain_qs, items, _, _ = ordering_helper_retry.apply(
-                            plain_qs,
-                            kwargs.get("order_by"),
-                            kwargs.get("distinct_on"),
-                            skip_count=False,
-                        )
-                        if items is None:
-                            plain_qs = plain_qs[offset:offset + limit]
-                            items = list(plain_qs)
-                        else:
-                            items = items[offset:offset + limit]
-                    else:
-                        raise
-        elif items is None:
+
+        def fetch_items(queryset):
             try:
-                items = list(queryset)
+                return list(queryset)
             except Exception as eval_exc:
-                if (
-                    queryset.query.select_related
-                    or getattr(queryset, "_prefetch_related_lookups", None)
-                ) and _is_schema_error(eval_exc):
-                    logger.warning(
-                        "Prefetch/select_related failed for %s "
-                        "(possible unapplied migration): %s.  "
-                        "Retrying without prefetch.",
-                        model.__name__,
-                        eval_exc,
-                    )
-                    plain_qs = manager.all()
-                    plain_qs = self._apply_tenant_scope(
-                        plain_qs, info, model, operation="list"
+                # Guard against prefetch_related failures caused by
+                # missing DB columns (e.g. unapplied GenericRelation
+                # migrations).  Strip prefetch and retry.
+                if not (
+                    (
+                        queryset.query.select_related
+                        or getattr(queryset, "_prefetch_related_lookups", None)
                     )
-                    items = list(plain_qs)
-                else:
+                    and _is_schema_error(eval_exc)
+                ):
                     raise
+                logger.warning(
+                    "Prefetch/select_related failed for %s "
+                    "(possible unapplied migration): %s.  "
+                    "Retrying without prefetch.  "
+                    "Run 'manage.py migrate' to fix.",
+                    model.__name__,
+                    eval_exc,
+                )
+                plain_qs = manager.all()
+                plain_qs = self._apply_tenant_scope(
+                    plain_qs, info, model, operation="list"
+                )
+                if not self.settings.enable_pagination:
+                    return list(plain_qs)
+                if graphql_meta.has_custom_resolver("list"):
+                    plain_qs = graphql_meta.apply_custom_resolver(
+                        "list", plain_qs, info, **kwargs,
+                    )
+                context_retry = QueryContext(
+                    model=model,
+                    queryset=plain_qs,
+                    info=info,
+                    kwargs=kwargs,
+                    graphql_meta=graphql_meta,
+                    filter_applicator=nested_filter_applicator,
+                    filter_class=filter_class,
+                    ordering_config=ordering_config,
+                    settings=self.settings,
+                    schema_name=self.schema_name,
+                )
+                pipeline_retry = QueryFilterPipeline(context_retry)
+                plain_qs = pipeline_retry.apply_all()
+                ordering_helper_retry = QueryOrderingHelper(
+                    self, model, ordering_config, self.settings
+                )
+                plain_qs, retry_items, _, _ = ordering_helper_retry.apply(
+                    plain_qs,
+                    kwargs.get("order_by"),
+                    kwargs.get("distinct_on"),
+                    skip_count=False,
+                )
+                if retry_items is None:
+                    return list(plain_qs[offset:offset + limit])
+                return retry_items[offset:offset + limit]
+
+        if items is None:
+            if is_async_execution(info):
+                return _list_async(
+                    queryset,
+                    lambda rows: self._apply_field_masks(rows, info, model),
+                    fetch_items,
+                )
+            items = fetch_items(queryset)
 
         return self._apply_field_masks(items, info, model)
 
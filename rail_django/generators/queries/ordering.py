@@ -114,6 +114,70 @@ def apply_count_annotations_for_ordering(
     return queryset, new_order_by
 
 
+def get_ordering_expression(
+    model: type[models.Model], name: str, ordering_config=None
+) -> Optional[Any]:
+    """
+    Return the ORM expression registered for ordering by property *name*.
+
+    Expressions come from ``GraphQLMeta.Ordering(expressions=...)`` or from
+    the ``@ordering_expression`` decorator on the property getter.
+    """
+    expressions = getattr(ordering_config, "expressions", None) or {}
+    expression = expressions.get(name)
+    if expression is None:
+        attr = getattr(model, name, None)
+        getter = getattr(attr, "fget", None)
+        expression = getattr(getter, "_graphql_ordering_expression", None)
+    if expression is None:
+        return None
+    if callable(expression) and not hasattr(expression, "resolve_expression"):
+        expression = expression()
+    return expression
+
+
+def apply_ordering_expressions(
+    queryset: models.QuerySet,
+    model: type[models.Model],
+    order_by: list[str],
+    ordering_config=None,
+) -> tuple[models.QuerySet, list[str]]:
+    """
+    Replace property specs that declare an ORM expression with SQL aliases.
+
+    Returns the aliased queryset and the rewritten order_by list; properties
+    without an expression are left for Python sorting.
+    """
+    if not order_by:
+        return queryset, order_by
+    try:
+        prop_names = set(ModelIntrospector.for_model(model).properties.keys())
+    except (AttributeError, TypeError) as e:
+        logger.debug(f"Could not introspect model {model.__name__} for properties: {e}")
+        return queryset, order_by
+
+    new_order_by: list[str] = []
+    aliases: dict[str, Any] = {}
+    for spec in order_by:
+        desc = spec.startswith("-")
+        name = spec[1:] if desc else spec
+        expression = (
+            get_ordering_expression(model, name, ordering_config)
+            if name in prop_names
+            else None
+        )
+        if expression is None:
+            new_order_by.append(spec)
+            continue
+        alias = f"_order_{name}"
+        aliases[alias] = expression
+        new_order_by.append(f"-{alias}" if desc else alias)
+
+    if aliases:
+        queryset = queryset.alias(**aliases)
+    return queryset, new_order_by
+
+
 def normalize_ordering_specs(
     order_by: Optional[list[str]],
     ordering_config,
@@ -2,17 +2,22 @@
 Paginated query builder helpers.
 
 This module provides query generation for paginated queries with
-page-based pagination, filtering, ordering, and pagination metadata.
+page-based or cursor-based pagination, filtering, ordering, and pagination
+metadata.
 """
 
 import logging
-from typing import Any, List, Optional, Type
+from typing import Any, Callable, List, Optional, Type
 
 import graphene
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.db import connections, models
+from graphql.language import ast
 
+from ...core.execution import is_async_execution, run_in_worker
+from ...core.incremental import is_deferred_selection
 from ...core.meta import get_model_graphql_meta
+from ...core.model_versions import model_version_signals_connected
 from ...extensions.optimization import optimize_query
 from .base import (
     RESERVED_QUERY_ARGS,
@@ -22,21 +27,44 @@ from .base import (
     build_query_arguments,
     create_default_ordering_config,
 )
+from .counting import cached_count, capped_count, explain_row_estimate
+from .keyset import paginate_by_cursor, uses_cursor_pagination
 from .ordering import get_default_ordering
 
 logger = logging.getLogger(__name__)
 
 COUNT_MODE_EXACT = "exact"
 COUNT_MODE_AUTO = "auto"
-SUPPORTED_COUNT_MODES = frozenset({COUNT_MODE_EXACT, COUNT_MODE_AUTO})
+COUNT_MODE_CACHED = "cached"
+COUNT_MODE_CAPPED = "capped"
+COUNT_MODE_ESTIMATED = "estimated"
+SUPPORTED_COUNT_MODES = frozenset(
+    {
+        COUNT_MODE_EXACT,
+        COUNT_MODE_AUTO,
+        COUNT_MODE_CACHED,
+        COUNT_MODE_CAPPED,
+        COUNT_MODE_ESTIMATED,
+    }
+)
+COUNT_SELECTIONS = frozenset(
+    {"totalCount", "total_count", "countIsEstimated", "count_is_estimated"}
+)
 
 
 def _normalize_count_mode(raw_value: Any) -> str:
-    """Normalize count mode values to supported internal tokens."""
+    """
+    Normalize count mode values to supported internal tokens.
+
+    ``cached`` is only honoured while writes bump model versions; cached
+    counts would otherwise outlive the rows they count.
+    """
     value = raw_value
     if hasattr(raw_value, "value"):
         value = getattr(raw_value, "value")
     normalized = str(value or "").strip().lower()
+    if normalized == COUNT_MODE_CACHED and not model_version_signals_connected():
+        return COUNT_MODE_EXACT
     if normalized in SUPPORTED_COUNT_MODES:
         return normalized
     return COUNT_MODE_EXACT
@@ -167,9 +195,32 @@ def _resolve_total_count(
     """
     Resolve total count with optional smart estimator fast path.
 
+    ``cached`` reuses a version-invalidated exact count, ``capped`` stops
+    counting at ``count_cap`` rows (reported as estimated) and ``estimated``
+    uses planner statistics for filtered queries too.
+
     Returns:
         Tuple of (total_count, count_is_estimated)
     """
+    if count_mode == COUNT_MODE_CACHED:
+        timeout = getattr(settings, "count_cache_timeout", 300)
+        return cached_count(queryset, timeout=timeout), False
+
+    if count_mode == COUNT_MODE_CAPPED:
+        return capped_count(queryset, getattr(settings, "count_cap", 10000))
+
+    if count_mode == COUNT_MODE_ESTIMATED and not has_property_ordering:
+        estimate = None
+        if _can_use_estimated_count(
+            queryset, kwargs, has_property_ordering=has_property_ordering
+        ):
+            estimate = _estimate_queryset_count(queryset)
+        if estimate is None:
+            estimate = explain_row_estimate(queryset)
+        if estimate is not None:
+            return estimate, True
+        return queryset.count(), False
+
     if count_mode != COUNT_MODE_AUTO:
         return queryset.count(), False
 
@@ -195,6 +246,35 @@ def _resolve_total_count(
     return estimate, True
 
 
+def _selects_total_count(info: Any) -> bool:
+    """Return whether ``pageInfo.totalCount`` or ``countIsEstimated`` is selected."""
+    fragments = getattr(info, "fragments", None) or {}
+    visited: set[str] = set()
+
+    def selections(selection_set: Any):
+        for selection in getattr(selection_set, "selections", None) or ():
+            if isinstance(selection, ast.FieldNode):
+                yield selection
+                continue
+            if isinstance(selection, ast.FragmentSpreadNode):
+                name = selection.name.value
+                if name in visited or name not in fragments:
+                    continue
+                visited.add(name)
+                yield from selections(fragments[name].selection_set)
+            elif isinstance(selection, ast.InlineFragmentNode):
+                yield from selections(selection.selection_set)
+
+    for field_node in getattr(info, "field_nodes", None) or ():
+        for page_info in selections(field_node.selection_set):
+            if page_info.name.value not in ("pageInfo", "page_info"):
+                continue
+            for field in selections(page_info.selection_set):
+                if field.name.value in COUNT_SELECTIONS:
+                    return True
+    return False
+
+
 def _get_nested_filter_generator(schema_name: str):
     """Lazy import to avoid circular dependencies. Returns singleton instance."""
     from ..filters import get_nested_filter_generator
@@ -221,6 +301,12 @@ class PaginationInfo(graphene.ObjectType):
     count_is_estimated = graphene.Boolean(
         description="Whether pagination count values are estimated."
     )
+    start_cursor = graphene.String(
+        description="Cursor of the first item (cursor pagination only)"
+    )
+    end_cursor = graphene.String(
+        description="Cursor of the last item (cursor pagination only)"
+    )
 
 
 class PaginatedResult:
@@ -238,6 +324,50 @@ class PaginatedResult:
         self.page_info = page_info
 
 
+class DeferredCountPaginationInfo:
+    """
+    Pagination metadata whose count values are computed on first access.
+
+    Used when ``pageInfo`` is only selected inside ``@defer`` fragments, so
+    the page rows are delivered before the count query runs. The requested
+    page is not clamped to the page count in that case.
+    """
+
+    def __init__(
+        self,
+        count_resolver: Callable[[], tuple[int, bool]],
+        *,
+        current_page: int,
+        per_page: int,
+        has_next_page: bool,
+        has_previous_page: bool,
+    ):
+        self._count_resolver = count_resolver
+        self._count: Optional[tuple[int, bool]] = None
+        self.current_page = current_page
+        self.per_page = per_page
+        self.has_next_page = has_next_page
+        self.has_previous_page = has_previous_page
+
+    def _resolve_count(self) -> tuple[int, bool]:
+        if self._count is None:
+            self._count = self._count_resolver()
+        return self._count
+
+    @property
+    def total_count(self) -> int:
+        return self._resolve_count()[0]
+
+    @property
+    def page_count(self) -> int:
+        total_count = self.total_count
+        return (total_count + self.per_page - 1) // self.per_page if total_count > 0 else 0
+
+    @property
+    def count_is_estimated(self) -> bool:
+        return self._resolve_count()[1]
+
+
 class EmptyPaginatedResult:
     """Empty paginated result for invalid filter scenarios."""
 
@@ -263,6 +393,118 @@ class EmptyPaginatedResult:
         )()
 
 
+def _page_window(
+    page: int, per_page: int, total_count: int, count_is_estimated: bool
+) -> tuple[int, int, slice]:
+    """
+    Return the page, page count and row slice of an offset page.
+
+    Capped and estimated counts are lower bounds or guesses: the page is not
+    clamped to them and the slice includes one extra row probing for a next
+    page. Exact counts clamp the page to the last one.
+    """
+    if total_count > 0:
+        page_count = (total_count + per_page - 1) // per_page
+    else:
+        page_count = 0
+    if not count_is_estimated:
+        page = 1 if page_count == 0 else max(1, min(page, page_count))
+    start = (page - 1) * per_page
+    end = start + per_page + (1 if count_is_estimated else 0)
+    return page, page_count, slice(start, end)
+
+
+def _offset_page_info(
+    rows: List[Any],
+    *,
+    page: int,
+    page_count: int,
+    per_page: int,
+    total_count: int,
+    count_is_estimated: bool,
+) -> tuple[List[Any], PaginationInfo]:
+    """Build the page items and metadata from the rows of ``_page_window``."""
+    if count_is_estimated:
+        has_next_page = len(rows) > per_page
+        rows = rows[:per_page]
+        if rows:
+            page_count = max(page_count, page + 1 if has_next_page else page)
+    else:
+        has_next_page = page < page_count
+    page_info = PaginationInfo(
+        total_count=total_count,
+        page_count=page_count,
+        current_page=page,
+        per_page=per_page,
+        has_next_page=has_next_page,
+        has_previous_page=page > 1,
+        count_is_estimated=count_is_estimated,
+    )
+    return rows, page_info
+
+
+async def _resolve_offset_page_async(
+    queryset: models.QuerySet,
+    kwargs: dict[str, Any],
+    *,
+    page: int,
+    per_page: int,
+    skip_count: bool,
+    count_mode: str,
+    has_property_ordering: bool,
+    uncapped_total: Optional[int],
+    settings: Any,
+    finish: Callable[[List[Any]], List[Any]],
+) -> "PaginatedResult":
+    """
+    Async counterpart of the offset branch of the paginated resolver.
+
+    Rows and exact counts are read with Django's async ORM API. Other count
+    strategies and *finish* (field masks) run in a worker thread.
+    """
+    if skip_count:
+        start = (page - 1) * per_page
+        rows = [row async for row in queryset[start : start + per_page + 1]]
+        page_info = PaginationInfo(
+            total_count=None,
+            page_count=None,
+            current_page=page,
+            per_page=per_page,
+            has_next_page=len(rows) > per_page,
+            has_previous_page=page > 1,
+            count_is_estimated=None,
+        )
+        rows = rows[:per_page]
+    else:
+        if uncapped_total is not None:
+            total_count, count_is_estimated = uncapped_total, False
+        elif count_mode == COUNT_MODE_EXACT:
+            total_count, count_is_estimated = await queryset.acount(), False
+        else:
+            total_count, count_is_estimated = await run_in_worker(
+                _resolve_total_count,
+                queryset,
+                kwargs,
+                count_mode=count_mode,
+                has_property_ordering=has_property_ordering,
+                settings=settings,
+            )
+        page, page_count, window = _page_window(
+            page, per_page, total_count, count_is_estimated
+        )
+        rows = [row async for row in queryset[window]]
+        rows, page_info = _offset_page_info(
+            rows,
+            page=page,
+            page_count=page_count,
+            per_page=per_page,
+            total_count=total_count,
+            count_is_estimated=count_is_estimated,
+        )
+    items = await run_in_worker(finish, rows)
+    return PaginatedResult(items=items, page_info=page_info)
+
+
 def generate_paginated_query(
     self,
     model: Type[models.Model],
@@ -338,7 +580,11 @@ def generate_paginated_query(
             extra={"model": filter_model.__name__, "schema": self.schema_name},
         )
 
-    @optimize_query()
+    def authorize(root, info, **kwargs):
+        self._enforce_model_permission(info, model, operation_name, graphql_meta)
+        graphql_meta.ensure_operation_access(operation_name, info=info)
+
+    @optimize_query(user_specific_cache=True, authorize=authorize)
     def resolver(
         root: Any, info: graphene.ResolveInfo, **kwargs
     ) -> PaginatedConnection:
@@ -412,6 +658,11 @@ def generate_paginated_query(
         if hasattr(queryset, '_result_cache') and queryset._result_cache == []:
             return EmptyPaginatedResult(per_page)
 
+        cursor_mode = uses_cursor_pagination(kwargs)
+        if cursor_mode and not _selects_total_count(info):
+            # Cursor pages are located without the count.
+            skip_count = True
+
         # Apply ordering using helper
         ordering_helper = QueryOrderingHelper(
             self, model, ordering_config, self.settings
@@ -423,6 +674,62 @@ def generate_paginated_query(
             skip_count=skip_count,
         )
 
+        if cursor_mode:
+            cursor_page = paginate_by_cursor(
+                model,
+                queryset,
+                items,
+                kwargs,
+                default_page_size=per_page,
+                max_page_size=self.settings.max_page_size,
+            )
+            total_count = None
+            count_is_estimated = None
+            if not skip_count:
+                if uncapped_total is not None:
+                    total_count, count_is_estimated = uncapped_total, False
+                elif items is not None:
+                    total_count, count_is_estimated = len(items), False
+                else:
+                    total_count, count_is_estimated = _resolve_total_count(
+                        queryset,
+                        kwargs,
+                        count_mode=count_mode,
+                        has_property_ordering=has_prop_ordering,
+                        settings=self.settings,
+                    )
+            page_info = PaginationInfo(
+                total_count=total_count,
+                page_count=None,
+                current_page=None,
+                per_page=cursor_page.page_size,
+                has_next_page=cursor_page.has_next_page,
+                has_previous_page=cursor_page.has_previous_page,
+                count_is_estimated=count_is_estimated,
+                start_cursor=cursor_page.start_cursor,
+                end_cursor=cursor_page.end_cursor,
+            )
+            items = self._apply_field_masks(cursor_page.items, info, model)
+            return PaginatedResult(items=items, page_info=page_info)
+
+        if (
+            items is None
+            and is_async_execution(info)
+            and not is_deferred_selection(info, "pageInfo", "page_info")
+        ):
+            return _resolve_offset_page_async(
+                queryset,
+                kwargs,
+                page=page,
+                per_page=per_page,
+                skip_count=skip_count,
+                count_mode=count_mode,
+                has_property_ordering=has_prop_ordering,
+                uncapped_total=uncapped_total,
+                settings=self.settings,
+                finish=lambda rows: self._apply_field_masks(rows, info, model),
+            )
+
         if skip_count:
             # Apply pagination without total count
             start = (page - 1) * per_page
@@ -449,6 +756,31 @@ def generate_paginated_query(
             items = self._apply_field_masks(items, info, model)
             return PaginatedResult(items=items, page_info=page_info)
 
+        if (
+            items is None
+            and uncapped_total is None
+            and is_deferred_selection(info, "pageInfo", "page_info")
+        ):
+            # Only deferred fields need the count: fetch the page first.
+            start = (page - 1) * per_page
+            items = list(queryset[start : start + per_page + 1])
+            has_next_page = len(items) > per_page
+            page_info = DeferredCountPaginationInfo(
+                lambda: _resolve_total_count(
+                    queryset,
+                    kwargs,
+                    count_mode=count_mode,
+                    has_property_ordering=has_prop_ordering,
+                    settings=self.settings,
+                ),
+                current_page=page,
+                per_page=per_page,
+                has_next_page=has_next_page,
+                has_previous_page=page > 1,
+            )
+            items = self._apply_field_masks(items[:per_page], info, model)
+            return PaginatedResult(items=items, page_info=page_info)
+
         # Calculate pagination values (with total count)
         count_is_estimated = False
         if uncapped_total is not None:
@@ -466,35 +798,16 @@ def generate_paginated_query(
                 settings=self.settings,
             )
 
-        # Calculate page count, handling empty results
-        if total_count > 0:
-            page_count = (total_count + per_page - 1) // per_page
-        else:
-            page_count = 0
-
-        # Ensure page is within valid range
-        if page_count == 0:
-            page = 1
-        else:
-            page = max(1, min(page, page_count))
-
-        # Apply pagination (with total count)
-        start = (page - 1) * per_page
-        end = start + per_page
-
-        if items is not None:
-            items = items[start:end]
-        else:
-            items = list(queryset[start:end])
-
-        # Create pagination info
-        page_info = PaginationInfo(
-            total_count=total_count,
+        page, page_count, window = _page_window(
+            page, per_page, total_count, count_is_estimated
+        )
+        items = items[window] if items is not None else list(queryset[window])
+        items, page_info = _offset_page_info(
+            items,
+            page=page,
             page_count=page_count,
-            current_page=page,
             per_page=per_page,
-            has_next_page=page < page_count,
-            has_previous_page=page > 1,
+            total_count=total_count,
             count_is_estimated=count_is_estimated,
         )
 
@@ -510,6 +823,18 @@ def generate_paginated_query(
         include_pagination=True,
         use_page_based=True,
     )
+    arguments["first"] = graphene.Int(
+        description="Cursor pagination: number of records after `after`"
+    )
+    arguments["last"] = graphene.Int(
+        description="Cursor pagination: number of records before `before`"
+    )
+    arguments["after"] = graphene.String(
+        description="Cursor pagination: return records after this cursor"
+    )
+    arguments["before"] = graphene.String(
+        description="Cursor pagination: return records before this cursor"
+    )
     arguments["skip_count"] = graphene.Argument(
         graphene.Boolean,
         description="Skip total count calculation for faster pagination.",
@@ -517,8 +842,10 @@ def generate_paginated_query(
     arguments["count_mode"] = graphene.Argument(
         graphene.String,
         description=(
-            "Count strategy: 'exact' (default) or 'auto' "
-            "(estimated counts on large simple PostgreSQL queries)."
+            "Count strategy: 'exact', 'auto' (estimated counts on large simple "
+            "PostgreSQL queries), 'cached' (exact count cached until the data "
+            "changes, when a setting enables it), 'capped' (count up to a cap; countIsEstimated means "
+            "'at least') or 'estimated' (planner estimate, filtered queries too)."
         ),
     )
 
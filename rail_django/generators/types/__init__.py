@@ -7,7 +7,18 @@ Django model fields and relationships into GraphQL types.
 
 from .constants import FIELD_TYPE_MAP, PYTHON_TYPE_MAP
 from .generator import TypeGenerator
-from .dataloaders import RelatedObjectsLoader
+from .dataloaders import (
+    BatchLoader,
+    ForwardObjectLoader,
+    GenericRelationLoader,
+    ManyToManyLoader,
+    RelatedObjectsLoader,
+    RelationAggregateLoader,
+    RelationListLoader,
+    RelationLoaderRegistry,
+    ReverseOneToOneLoader,
+    get_loader_registry,
+)
 from .enums import get_or_create_enum_for_field
 from .inputs import generate_input_type
 from .objects import generate_object_type
@@ -17,7 +28,16 @@ __all__ = [
     "TypeGenerator",
     "FIELD_TYPE_MAP",
     "PYTHON_TYPE_MAP",
+    "BatchLoader",
+    "ForwardObjectLoader",
+    "GenericRelationLoader",
+    "ManyToManyLoader",
     "RelatedObjectsLoader",
+    "RelationAggregateLoader",
+    "RelationListLoader",
+    "RelationLoaderRegistry",
+    "ReverseOneToOneLoader",
+    "get_loader_registry",
     "get_or_create_enum_for_field",
     "generate_input_type",
     "generate_object_type",
@@ -1,64 +1,413 @@
 """
-DataLoader helpers for reverse relations.
+Batch loaders for relation fields.
+
+The query optimizer prefetches the relations it can see in the selection set.
+Relation resolvers reached without a prefetch (custom root fields, levels
+past ``max_prefetch_depth``) fall back to these loaders: the first lookup for
+an instance loads the relation for every peer of that instance (see
+:mod:`rail_django.core.execution`) and caches the result per key.
+
+Loaders are created per request by :class:`RelationLoaderRegistry` and are
+scoped to one database alias and tenant.
 """
 
-from typing import Any, Optional, Type
+from collections import defaultdict
+from typing import Any, Callable, Hashable, Iterable, Optional
 
 from django.db import models
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from ...core.execution import add_peers, get_peers
+
+REQUEST_LOADERS_ATTR = "_rail_dataloaders"
+
+
+class BatchLoader:
+    """Request-scoped loader caching one value per key.
+
+    Subclasses define :meth:`key_for` (the key of a parent instance) and
+    :meth:`batch_load` (the values of a list of keys). ``many`` loaders
+    return lists, the others a single object or ``None``.
+
+    Loaders standing in for Django's single-object descriptors (forward
+    foreign keys, one-to-one fields) set ``use_base_manager``: like attribute
+    access, they read through ``_base_manager`` with no tenant filter, so a
+    filtering default manager does not hide the related object.
+    """
+
+    many = False
+    use_base_manager = False
+
+    def __init__(
+        self,
+        related_model: type[models.Model],
+        db_alias: Optional[str] = None,
+        tenant_field: Optional[str] = None,
+        tenant_id: Optional[Any] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        self.related_model = related_model
+        self.db_alias = db_alias
+        self.tenant_field = tenant_field
+        self.tenant_id = tenant_id
+        self.max_batch_size = max_batch_size
+        self._cache: dict[Hashable, Any] = {}
+
+    def get_queryset(self) -> models.QuerySet:
+        if self.use_base_manager:
+            return self.related_model._base_manager.using(self.db_alias).all()
+        queryset = self.related_model._default_manager.using(self.db_alias).all()
+        if self.tenant_field and self.tenant_id is not None:
+            queryset = queryset.filter(**{self.tenant_field: self.tenant_id})
+        return queryset
+
+    def key_for(self, instance: models.Model) -> Optional[Hashable]:
+        raise NotImplementedError
+
+    def batch_load(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        raise NotImplementedError
+
+    def load(self, key: Hashable, peer_keys: Iterable[Hashable] = ()) -> Any:
+        """Return the value of *key*, loading *peer_keys* in the same batch."""
+        if key in self._cache:
+            return self._cache[key]
+        self._fill(key, peer_keys)
+        return self._cache[key]
+
+    def load_for(self, context: Any, instance: models.Model) -> Any:
+        """Return the value of *instance*, batching the lookup over its peers."""
+        key = self.key_for(instance)
+        if key is None:
+            return [] if self.many else None
+        if key in self._cache:
+            return self._cache[key]
+
+        instance_type = type(instance)
+        peer_keys = (
+            self.key_for(peer)
+            for peer in get_peers(context, instance)
+            if type(peer) is instance_type
+        )
+        loaded = self._fill(key, (peer_key for peer_key in peer_keys if peer_key is not None))
+        add_peers(context, loaded)
+        return self._cache[key]
+
+    def _fill(self, key: Hashable, peer_keys: Iterable[Hashable]) -> list[models.Model]:
+        pending = [key]
+        seen = {key}
+        for peer_key in peer_keys:
+            if peer_key not in seen and peer_key not in self._cache:
+                seen.add(peer_key)
+                pending.append(peer_key)
+
+        loaded: list[models.Model] = []
+        size = self.max_batch_size or len(pending)
+        for start in range(0, len(pending), size):
+            chunk = pending[start : start + size]
+            results = self.batch_load(chunk)
+            for chunk_key in chunk:
+                value = results.get(chunk_key)
+                if self.many:
+                    value = value or []
+                    loaded.extend(value)
+                elif value is not None:
+                    loaded.append(value)
+                self._cache[chunk_key] = value
+        return loaded
+
+
+class ForwardObjectLoader(BatchLoader):
+    """Loader for forward foreign keys and one-to-one fields, keyed by id."""
+
+    use_base_manager = True
+
+    def __init__(self, related_model: type[models.Model], field: models.ForeignKey, **kwargs: Any):
+        super().__init__(related_model, **kwargs)
+        self.field = field
+
+    def key_for(self, instance: models.Model) -> Optional[Hashable]:
+        return getattr(instance, self.field.attname, None)
+
+    def batch_load(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        target_field = self.field.target_field
+        queryset = self.get_queryset().filter(**{f"{target_field.name}__in": keys})
+        return {getattr(obj, target_field.attname): obj for obj in queryset}
+
+
+class RelatedObjectsLoader(BatchLoader):
+    """Loader for reverse foreign key relations."""
+
+    many = True
+
+    def __init__(
+        self,
+        related_model: type[models.Model],
+        relation_field: str,
+        db_alias: Optional[str] = None,
+        tenant_field: Optional[str] = None,
+        tenant_id: Optional[Any] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        super().__init__(
+            related_model,
+            db_alias=db_alias,
+            tenant_field=tenant_field,
+            tenant_id=tenant_id,
+            max_batch_size=max_batch_size,
+        )
+        self.relation_field = relation_field
+        self.field = related_model._meta.get_field(relation_field)
+
+    def key_for(self, instance: models.Model) -> Optional[Hashable]:
+        return getattr(instance, self.field.target_field.attname, None)
+
+    def batch_load(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        queryset = self.get_queryset().filter(**{f"{self.relation_field}__in": keys})
+        results: dict[Hashable, Any] = defaultdict(list)
+        for obj in queryset:
+            results[getattr(obj, self.field.attname)].append(obj)
+        return results
+
+
+class ReverseOneToOneLoader(RelatedObjectsLoader):
+    """Loader for the reverse side of one-to-one fields."""
+
+    many = False
+    use_base_manager = True
+
+    def batch_load(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        queryset = self.get_queryset().filter(**{f"{self.relation_field}__in": keys})
+        return {getattr(obj, self.field.attname): obj for obj in queryset}
+
+
+class ManyToManyLoader(BatchLoader):
+    """Loader for many-to-many relations, read through the join table.
+
+    ``source_field`` and ``target_field`` name the foreign keys of the
+    ``through`` model pointing at the parent and the related model.
+    """
+
+    many = True
+
+    def __init__(
+        self,
+        related_model: type[models.Model],
+        through: type[models.Model],
+        source_field: str,
+        target_field: str,
+        **kwargs: Any,
+    ):
+        super().__init__(related_model, **kwargs)
+        self.through = through
+        self.source_field = through._meta.get_field(source_field)
+        self.target_field = through._meta.get_field(target_field)
+
+    def key_for(self, instance: models.Model) -> Optional[Hashable]:
+        return getattr(instance, self.source_field.target_field.attname, None)
+
+    def batch_load(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        links = (
+            self.through._default_manager.using(self.db_alias)
+            .filter(**{f"{self.source_field.attname}__in": keys})
+            .values_list(self.source_field.attname, self.target_field.attname)
+        )
+        owners: dict[Hashable, list[Hashable]] = defaultdict(list)
+        for source_id, target_id in links:
+            owners[target_id].append(source_id)
+        if not owners:
+            return {}
+
+        target = self.target_field.target_field
+        queryset = self.get_queryset().filter(**{f"{target.name}__in": list(owners)})
+        results: dict[Hashable, Any] = defaultdict(list)
+        for obj in queryset:
+            for source_id in owners.get(getattr(obj, target.attname), ()):
+                results[source_id].append(obj)
+        return results
+
+
+class GenericRelationLoader(BatchLoader):
+    """Loader for ``GenericRelation`` fields, scoped to the parent content type."""
+
+    many = True
+
+    def __init__(self, related_model: type[models.Model], field: Any, **kwargs: Any):
+        super().__init__(related_model, **kwargs)
+        self.field = field
+        self.object_id_field = related_model._meta.get_field(field.object_id_field_name)
+
+    def key_for(self, instance: models.Model) -> Optional[Hashable]:
+        if instance.pk is None:
+            return None
+        return self.object_id_field.to_python(instance.pk)
+
+    def batch_load(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        from django.contrib.contenttypes.models import ContentType
+
+        content_type = ContentType.objects.db_manager(self.db_alias).get_for_model(
+            self.field.model, for_concrete_model=self.field.for_concrete_model
+        )
+        queryset = self.get_queryset().filter(
+            **{
+                self.field.content_type_field_name: content_type,
+                f"{self.field.object_id_field_name}__in": keys,
+            }
+        )
+        results: dict[Hashable, Any] = defaultdict(list)
+        for obj in queryset:
+            results[getattr(obj, self.object_id_field.attname)].append(obj)
+        return results
+
+
+class RelationAggregateLoader(BatchLoader):
+    """Loader for relation counts and stats: one ``GROUP BY`` per batch.
+
+    ``group_path`` is the lookup from the related model to the parent key
+    (``post_id``, ``posts``, ``object_id``), ``extra_filters`` narrows the
+    related rows (e.g. the generic content type) and ``prepare_queryset``
+    applies the field's ``filters`` argument. Values are dicts of the
+    ``aggregates``; parents without related rows get ``None`` values.
+    """
+
+    def __init__(
+        self,
+        related_model: type[models.Model],
+        group_path: str,
+        aggregates: dict[str, Any],
+        parent_key: Callable[[models.Model], Optional[Hashable]],
+        extra_filters: Optional[dict[str, Any]] = None,
+        prepare_queryset: Optional[Callable[[models.QuerySet], models.QuerySet]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(related_model, **kwargs)
+        self.group_path = group_path
+        self.aggregates = aggregates
+        self.parent_key = parent_key
+        self.extra_filters = extra_filters or {}
+        self.prepare_queryset = prepare_queryset
+
+    def key_for(self, instance: models.Model) -> Optional[Hashable]:
+        return self.parent_key(instance)
+
+    def load_for(self, context: Any, instance: models.Model) -> Any:
+        value = super().load_for(context, instance)
+        return value if value is not None else dict.fromkeys(self.aggregates)
+
+    def batch_load(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        queryset = self.get_queryset().filter(
+            **self.extra_filters, **{f"{self.group_path}__in": keys}
+        )
+        if self.prepare_queryset is not None:
+            queryset = self.prepare_queryset(queryset)
+        rows = queryset.order_by().values(self.group_path).annotate(**self.aggregates)
+        return {row.pop(self.group_path): row for row in rows}
+
+    def _fill(self, key: Hashable, peer_keys: Iterable[Hashable]) -> list[models.Model]:
+        super()._fill(key, peer_keys)
+        # Aggregates are plain dicts, not instances to batch over.
+        return []
+
+
+class RelationListLoader(BatchLoader):
+    """Loader for nested relation lists with ``filters``, ``order_by`` and ``limit``.
+
+    Rows of every parent are read in one query. With a ``limit`` the rows
+    are numbered per parent with ``ROW_NUMBER() OVER (PARTITION BY <parent
+    key> ORDER BY ...)`` and only the first ``limit`` rows of each parent
+    are returned. ``group_path``, ``extra_filters`` and ``prepare_queryset``
+    are as for :class:`RelationAggregateLoader`.
+    """
+
+    many = True
+    parent_key_alias = "_rail_parent_key"
+    row_number_alias = "_rail_row_number"
+
+    def __init__(
+        self,
+        related_model: type[models.Model],
+        group_path: str,
+        parent_key: Callable[[models.Model], Optional[Hashable]],
+        order_by: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        extra_filters: Optional[dict[str, Any]] = None,
+        prepare_queryset: Optional[Callable[[models.QuerySet], models.QuerySet]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(related_model, **kwargs)
+        self.group_path = group_path
+        self.parent_key = parent_key
+        self.order_by = list(order_by or [])
+        self.limit = limit
+        self.extra_filters = extra_filters or {}
+        self.prepare_queryset = prepare_queryset
+
+    def key_for(self, instance: models.Model) -> Optional[Hashable]:
+        return self.parent_key(instance)
+
+    def get_ordering(self) -> list[Any]:
+        specs = self.order_by or list(self.related_model._meta.ordering or [])
+        ordering: list[Any] = []
+        for spec in specs:
+            if isinstance(spec, str):
+                name = spec.lstrip("-")
+                ordering.append(F(name).desc() if spec.startswith("-") else F(name).asc())
+            else:
+                ordering.append(spec)
+        # A unique tiebreaker keeps the per-parent row numbers deterministic.
+        ordering.append(F("pk").asc())
+        return ordering
+
+    def batch_load(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        queryset = self.get_queryset().filter(
+            **self.extra_filters, **{f"{self.group_path}__in": keys}
+        )
+        if self.prepare_queryset is not None:
+            queryset = self.prepare_queryset(queryset)
+        ordering = self.get_ordering()
+        queryset = queryset.annotate(**{self.parent_key_alias: F(self.group_path)})
+        if self.limit is not None:
+            queryset = queryset.annotate(
+                **{
+                    self.row_number_alias: Window(
+                        RowNumber(),
+                        partition_by=[F(self.group_path)],
+                        order_by=ordering,
+                    )
+                }
+            ).filter(**{f"{self.row_number_alias}__lte": self.limit})
+        results: dict[Hashable, Any] = defaultdict(list)
+        for obj in queryset.order_by(*ordering):
+            results[getattr(obj, self.parent_key_alias)].append(obj)
+        return results
+
+
+class RelationLoaderRegistry:
+    """Loaders of one request, keyed by relation, database alias and tenant."""
+
+    def __init__(self):
+        self._loaders: dict[Hashable, BatchLoader] = {}
+
+    def get(self, key: Hashable, factory: Callable[[], BatchLoader]) -> BatchLoader:
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = self._loaders[key] = factory()
+        return loader
+
+    def clear(self) -> None:
+        self._loaders.clear()
+
 
-try:
-    from promise import Promise
-    from promise.dataloader import DataLoader
-except Exception:
-    Promise = None
-    DataLoader = None
-
-
-if DataLoader:
-
-    class RelatedObjectsLoader(DataLoader):
-        """Batch loader for reverse foreign key relations."""
-
-        def __init__(
-            self,
-            related_model: type[models.Model],
-            relation_field: str,
-            db_alias: Optional[str] = None,
-            tenant_field: Optional[str] = None,
-            tenant_id: Optional[Any] = None,
-        ):
-            super().__init__()
-            self.related_model = related_model
-            self.relation_field = relation_field
-            self.db_alias = db_alias
-            self.tenant_field = tenant_field
-            self.tenant_id = tenant_id
-
-        def batch_load_fn(self, keys):
-            if Promise is None:
-                return keys
-
-            results_map = {key: [] for key in keys}
-            if not keys:
-                return Promise.resolve([[] for _ in keys])
-
-            filter_kwargs = {f"{self.relation_field}__in": keys}
-            queryset = self.related_model._default_manager.using(self.db_alias).filter(
-                **filter_kwargs
-            )
-            if self.tenant_field and self.tenant_id is not None:
-                queryset = queryset.filter(**{self.tenant_field: self.tenant_id})
-
-            for obj in queryset:
-                key = getattr(obj, f"{self.relation_field}_id", None)
-                if key is None:
-                    try:
-                        key = getattr(obj, self.relation_field).pk
-                    except Exception:
-                        key = None
-                results_map.setdefault(key, []).append(obj)
-
-            return Promise.resolve([results_map.get(key, []) for key in keys])
-
-else:
-    RelatedObjectsLoader = None
+def get_loader_registry(context: Any) -> Optional[RelationLoaderRegistry]:
+    """Return the loader registry of the request *context*, creating it."""
+    if context is None:
+        return None
+    registry = getattr(context, REQUEST_LOADERS_ATTR, None)
+    if isinstance(registry, RelationLoaderRegistry):
+        return registry
+    registry = RelationLoaderRegistry()
+    try:
+        setattr(context, REQUEST_LOADERS_ATTR, registry)
+    except Exception:
+        return None
+    return registry
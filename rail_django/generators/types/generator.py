@@ -2,9 +2,12 @@
 TypeGenerator implementation.
 """
 
+import json
 import logging
-from types import UnionType
-from typing import Any, Dict, List, Optional, Type, Union, get_args, get_origin
+from functools import partial
+from operator import attrgetter
+from types import SimpleNamespace, UnionType
+from typing import Any, Callable, Dict, List, Optional, Type, Union, get_args, get_origin
 
 import graphene
 from django.db import models
@@ -35,7 +38,17 @@ from ...core.services import get_query_optimizer
 from ...core.scalars import get_custom_scalar, get_enabled_scalars
 from ...core.settings import MutationGeneratorSettings, TypeGeneratorSettings
 from ..introspector import ModelIntrospector
-from .dataloaders import RelatedObjectsLoader
+from .dataloaders import (
+    BatchLoader,
+    ForwardObjectLoader,
+    GenericRelationLoader,
+    ManyToManyLoader,
+    RelatedObjectsLoader,
+    RelationAggregateLoader,
+    RelationListLoader,
+    ReverseOneToOneLoader,
+    get_loader_registry,
+)
 from .enums import (
     build_enum_name as _build_enum_name,
     get_or_create_enum_for_field as _get_or_create_enum_for_field,
@@ -618,29 +631,226 @@ class TypeGenerator:
             }
         return generic_relations
 
-    def _get_relation_dataloader(self, context: Any, related_model: type[models.Model], relation: Any, state: Any):
-        if not RelatedObjectsLoader or not context or relation is None:
+    def _get_relation_dataloader(self, context: Any, related_model: type[models.Model], relation: Any, state: Any) -> Optional[BatchLoader]:
+        """Return the request's batch loader for *relation*, or ``None``.
+
+        *relation* is a forward FK/O2O or M2M field, a reverse relation
+        object or a ``GenericRelation``. No loader is returned when the
+        tenant is required but unknown, so the caller's scoped queryset
+        path applies.
+        """
+        if not context or relation is None:
             return None
-        try:
-            from django.db.models.fields.reverse_related import ManyToOneRel
-            if not isinstance(relation, ManyToOneRel):
+        factory = self._get_relation_loader_factory(related_model, relation)
+        if factory is None:
+            return None
+        return self._get_request_loader(context, related_model, state, relation, factory)
+
+    def _get_relation_aggregate_loader(
+        self,
+        context: Any,
+        related_model: type[models.Model],
+        relation: Any,
+        state: Any,
+        aggregates: dict[str, Any],
+        filters: Optional[dict[str, Any]] = None,
+    ) -> Optional[RelationAggregateLoader]:
+        """Return the request's loader computing *aggregates* per parent, or ``None``.
+
+        Backs the ``<relation>_count`` and ``<relation>_stats`` fields with one
+        ``GROUP BY`` query per field, filters and tenant.
+        """
+        if not context or relation is None:
+            return None
+        grouping = self._get_relation_grouping(related_model, relation)
+        if grouping is None:
+            return None
+        group_path, parent_key, extra_filters = grouping
+        filters_key = None
+        prepare_queryset = None
+        if filters:
+            try:
+                filters_key = json.dumps(filters, sort_keys=True, default=str)
+            except (TypeError, ValueError):
                 return None
-        except Exception:
+            prepare_queryset = partial(self._filter_related_queryset, related_model, filters)
+        factory = partial(
+            RelationAggregateLoader,
+            related_model,
+            group_path,
+            aggregates,
+            parent_key,
+            extra_filters=extra_filters,
+            prepare_queryset=prepare_queryset,
+        )
+        key = ("aggregate", relation, tuple(aggregates), filters_key)
+        return self._get_request_loader(context, related_model, state, key, factory)
+
+    def _get_relation_list_loader(
+        self,
+        context: Any,
+        related_model: type[models.Model],
+        relation: Any,
+        state: Any,
+        filters: Optional[dict[str, Any]] = None,
+        order_by: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[RelationListLoader]:
+        """Return the request's loader for a filtered, ordered or limited relation list.
+
+        Returns ``None`` when the relation cannot be grouped by parent, so
+        the caller falls back to a per-parent queryset.
+        """
+        if not context or relation is None:
             return None
-        relation_field = getattr(relation.field, "name", None)
-        if not relation_field:
+        grouping = self._get_relation_grouping(related_model, relation)
+        if grouping is None:
+            return None
+        group_path, parent_key, extra_filters = grouping
+        filters_key = None
+        prepare_queryset = None
+        if filters:
+            try:
+                filters_key = json.dumps(filters, sort_keys=True, default=str)
+            except (TypeError, ValueError):
+                return None
+            prepare_queryset = partial(self._filter_related_queryset, related_model, filters)
+        ordering = self._get_relation_ordering(related_model, order_by)
+        factory = partial(
+            RelationListLoader,
+            related_model,
+            group_path,
+            parent_key,
+            order_by=ordering,
+            limit=limit,
+            extra_filters=extra_filters,
+            prepare_queryset=prepare_queryset,
+        )
+        key = ("list", relation, filters_key, tuple(ordering), limit)
+        return self._get_request_loader(context, related_model, state, key, factory)
+
+    def _get_relation_ordering(self, related_model: type[models.Model], order_by: Optional[list[str]]) -> list[str]:
+        """Validate the ``order_by`` argument of a nested relation list.
+
+        Each spec is a field path of *related_model*, optionally prefixed
+        with ``-``; its first segment must be exposed by the schema.
+        """
+        ordering: list[str] = []
+        for spec in order_by or []:
+            name = str(spec).strip()
+            path = name.lstrip("-")
+            if not path:
+                continue
+            first_segment = path.split("__", 1)[0]
+            try:
+                related_model._meta.get_field(first_segment)
+            except Exception:
+                if first_segment != "pk":
+                    raise GraphQLError(f"Invalid order_by field '{path}' for {related_model.__name__}.")
+            if first_segment != "pk" and not self._should_include_field(related_model, first_segment):
+                raise GraphQLError(f"Invalid order_by field '{path}' for {related_model.__name__}.")
+            ordering.append(name)
+        return ordering
+
+    def _get_request_loader(self, context: Any, related_model: type[models.Model], state: Any, key: Any, factory: Callable[..., BatchLoader]) -> Optional[BatchLoader]:
+        registry = get_loader_registry(context)
+        if registry is None:
             return None
         db_alias = getattr(state, "db", None)
-        tenant_field, tenant_id, tenant_settings = self._get_tenant_filter_for_model(context, related_model)
+        try:
+            tenant_field, tenant_id, tenant_settings = self._get_tenant_filter_for_model(context, related_model)
+        except Exception as exc:
+            # The caller's ``_apply_tenant_scope`` path decides whether to fail open.
+            logger.debug(f"Tenant lookup failed for {related_model.__name__} loader: {exc}")
+            return None
         if tenant_settings and tenant_settings.require_tenant and tenant_field and tenant_id is None:
             return None
-        tenant_key = "none" if tenant_id is None else str(tenant_id)
-        loader_key = f"reverse:{related_model._meta.label_lower}:{relation_field}:{db_alias or 'default'}:{tenant_key}"
-        if not hasattr(context, "_rail_dataloaders"):
-            context._rail_dataloaders = {}
-        if loader_key not in context._rail_dataloaders:
-            context._rail_dataloaders[loader_key] = RelatedObjectsLoader(related_model, relation_field, db_alias, tenant_field=tenant_field, tenant_id=tenant_id)
-        return context._rail_dataloaders[loader_key]
+        options = {
+            "db_alias": db_alias,
+            "tenant_field": tenant_field,
+            "tenant_id": tenant_id,
+            "max_batch_size": getattr(self.query_optimizer.settings, "dataloader_batch_size", None),
+        }
+        loader_key = (key, db_alias or "default", tenant_id)
+        return registry.get(loader_key, lambda: factory(**options))
+
+    def _get_relation_grouping(self, related_model: type[models.Model], relation: Any) -> Optional[tuple[str, Callable[[models.Model], Any], dict[str, Any]]]:
+        """Return ``(group path, parent key, extra filters)`` for grouping *relation* rows by parent."""
+        from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel, OneToOneRel
+
+        try:
+            from django.contrib.contenttypes.fields import GenericRelation
+            from django.contrib.contenttypes.models import ContentType
+        except ImportError:
+            GenericRelation = None
+
+        if GenericRelation is not None and isinstance(relation, GenericRelation):
+            object_id_field = related_model._meta.get_field(relation.object_id_field_name)
+            content_type = ContentType.objects.get_for_model(
+                relation.model, for_concrete_model=relation.for_concrete_model
+            )
+
+            def generic_key(instance: models.Model) -> Any:
+                return None if instance.pk is None else object_id_field.to_python(instance.pk)
+
+            return (
+                relation.object_id_field_name,
+                generic_key,
+                {relation.content_type_field_name: content_type},
+            )
+        if isinstance(relation, models.ManyToManyField):
+            if relation.remote_field.hidden:
+                return None
+            return relation.related_query_name(), attrgetter("pk"), {}
+        if isinstance(relation, ManyToManyRel):
+            return relation.field.name, attrgetter("pk"), {}
+        if isinstance(relation, ManyToOneRel) and not isinstance(relation, OneToOneRel):
+            return (
+                relation.field.attname,
+                attrgetter(relation.field.target_field.attname),
+                {},
+            )
+        return None
+
+    def _filter_related_queryset(self, related_model: type[models.Model], filters: dict[str, Any], queryset: models.QuerySet) -> models.QuerySet:
+        from ..filters import ModelFilterGenerator
+
+        filter_set_class = ModelFilterGenerator().generate_filter_set(related_model)
+        return filter_set_class(filters, queryset=queryset).qs
+
+    def _get_relation_loader_factory(self, related_model: type[models.Model], relation: Any) -> Optional[Callable[..., BatchLoader]]:
+        from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel, OneToOneRel
+
+        try:
+            from django.contrib.contenttypes.fields import GenericRelation
+        except ImportError:
+            GenericRelation = None
+
+        if GenericRelation is not None and isinstance(relation, GenericRelation):
+            return partial(GenericRelationLoader, related_model, relation)
+        if isinstance(relation, models.ManyToManyField):
+            return partial(
+                ManyToManyLoader,
+                related_model,
+                relation.remote_field.through,
+                relation.m2m_field_name(),
+                relation.m2m_reverse_field_name(),
+            )
+        if isinstance(relation, ManyToManyRel):
+            return partial(
+                ManyToManyLoader,
+                related_model,
+                relation.through,
+                relation.field.m2m_reverse_field_name(),
+                relation.field.m2m_field_name(),
+            )
+        if isinstance(relation, OneToOneRel):
+            return partial(ReverseOneToOneLoader, related_model, relation.field.name)
+        if isinstance(relation, ManyToOneRel):
+            return partial(RelatedObjectsLoader, related_model, relation.field.name)
+        if isinstance(relation, models.ForeignKey):
+            return partial(ForwardObjectLoader, related_model, relation)
+        return None
 
     def _apply_tenant_scope(self, queryset: models.QuerySet, info: Any, model: type[models.Model], *, operation: str = "read") -> models.QuerySet:
         try:
@@ -661,20 +871,21 @@ class TypeGenerator:
     def _get_tenant_filter_for_model(self, context: Any, model: type[models.Model]) -> tuple[Optional[str], Optional[Any], Optional[Any]]:
         try:
             from ...extensions.multitenancy import get_multitenancy_settings, get_tenant_field_config, resolve_tenant_id
-            settings_mt = get_multitenancy_settings(self.schema_name)
-            if not settings_mt.enabled or settings_mt.isolation_mode != "row":
-                return None, None, settings_mt
-            tenant_field = get_tenant_field_config(model, schema_name=self.schema_name)
-            if tenant_field is None:
-                return None, None, settings_mt
-            user = getattr(context, "user", None)
-            if settings_mt.allow_cross_tenant_superuser and user and user.is_superuser:
-                return None, None, settings_mt
-            tenant_id = resolve_tenant_id(context, schema_name=self.schema_name)
-            return tenant_field.path, tenant_id, settings_mt
-        except Exception:
+            from ...extensions.multitenancy.applicator import _is_cross_tenant_allowed
+        except ImportError:
             return None, None, None
 
+        settings_mt = get_multitenancy_settings(self.schema_name)
+        if not settings_mt.enabled or settings_mt.isolation_mode != "row":
+            return None, None, settings_mt
+        tenant_field = get_tenant_field_config(model, schema_name=self.schema_name)
+        if tenant_field is None:
+            return None, None, settings_mt
+        if _is_cross_tenant_allowed(SimpleNamespace(context=context), settings_mt):
+            return None, None, settings_mt
+        tenant_id = resolve_tenant_id(context, schema_name=self.schema_name)
+        return tenant_field.path, tenant_id, settings_mt
+
     def _should_include_nested_relations(self, model: type[models.Model]) -> bool:
         model_name = model.__name__
         if not self.mutation_settings.enable_nested_relations:
@@ -9,7 +9,9 @@ import graphene
 from django.db import models
 from django.db.models import Avg, Count, Max, Min, Sum
 from graphene_django import DjangoObjectType
+from graphql import GraphQLError
 
+from ...core.execution import mark_attribute_resolver
 from ...utils.history import serialize_history_changes
 from .inheritance import inheritance_handler
 from ..introspector import ModelIntrospector
@@ -25,36 +27,6 @@ class RowMutationPermissionsType(graphene.ObjectType):
     update_reason = graphene.String()
     delete_reason = graphene.String()
 
-try:
-    import graphql
-except Exception:
-    graphql = None
-
-try:
-    from promise import Promise
-except Exception:
-    Promise = None
-
-_GRAPHQL_MAJOR = 0
-if graphql is not None:
-    try:
-        _GRAPHQL_MAJOR = int(str(graphql.__version__).split(".")[0])
-    except Exception:
-        _GRAPHQL_MAJOR = 0
-
-
-def _resolve_promise(value):
-    if _GRAPHQL_MAJOR < 3:
-        return value
-    if Promise is None:
-        return value
-    if isinstance(value, Promise):
-        try:
-            return value.get()
-        except Exception:
-            return value
-    return value
-
 
 def _is_numeric_model_field(field: models.Field) -> bool:
     """Return True for concrete, non-relational numeric fields useful for stats."""
@@ -69,6 +41,62 @@ def _is_numeric_model_field(field: models.Field) -> bool:
     return isinstance(field, (models.IntegerField, models.FloatField, models.DecimalField))
 
 
+RELATION_COUNT_AGGREGATES = {"total_count": Count("pk")}
+
+
+def _relation_stats_annotations(numeric_field_names: list[str]) -> dict[str, Any]:
+    """Aggregates backing a ``<relation>_stats`` field."""
+    annotations = {"total_count": Count("pk")}
+    for numeric_field_name in numeric_field_names:
+        annotations[f"{numeric_field_name}_sum"] = Sum(numeric_field_name)
+        annotations[f"{numeric_field_name}_avg"] = Avg(numeric_field_name)
+        annotations[f"{numeric_field_name}_min"] = Min(numeric_field_name)
+        annotations[f"{numeric_field_name}_max"] = Max(numeric_field_name)
+        annotations[f"{numeric_field_name}_count"] = Count(numeric_field_name)
+        annotations[f"{numeric_field_name}_distinct_count"] = Count(
+            numeric_field_name, distinct=True
+        )
+    return annotations
+
+
+def _finalize_relation_stats(
+    aggregate_values: dict[str, Any], numeric_field_names: list[str]
+) -> dict[str, Any]:
+    """Replace empty sums and counts with 0, as ``aggregate()`` on no rows gives None."""
+    aggregate_values = dict(aggregate_values)
+    aggregate_values["total_count"] = aggregate_values.get("total_count") or 0
+    for numeric_field_name in numeric_field_names:
+        for suffix in ("_sum", "_count", "_distinct_count"):
+            key = f"{numeric_field_name}{suffix}"
+            aggregate_values[key] = aggregate_values.get(key) or 0
+    return aggregate_values
+
+
+def _relation_list_arguments() -> dict[str, Any]:
+    """``limit`` and ``order_by`` arguments of nested relation lists."""
+    return {
+        "limit": graphene.Int(description="Maximum number of related objects per parent"),
+        "order_by": graphene.List(
+            graphene.String, description="Ordering of the related objects, e.g. ['-created_at']"
+        ),
+    }
+
+
+def _order_and_limit(
+    queryset: models.QuerySet, ordering: list[str], limit: Optional[int]
+) -> models.QuerySet:
+    if ordering:
+        queryset = queryset.order_by(*ordering)
+    if limit is not None:
+        queryset = queryset[:limit]
+    return queryset
+
+
+def _check_relation_limit(limit: Optional[int]) -> None:
+    if limit is not None and limit < 0:
+        raise GraphQLError("limit must be a non-negative integer.")
+
+
 def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectType]:
     """
     Generates a GraphQL object type for a Django model.
@@ -272,6 +300,51 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
         except Exception:
             pass
 
+    query_optimizer = self.query_optimizer
+    get_relation_dataloader = self._get_relation_dataloader
+    get_relation_aggregate_loader = self._get_relation_aggregate_loader
+    get_relation_list_loader = self._get_relation_list_loader
+    get_relation_ordering = self._get_relation_ordering
+
+    # Resolve forward FK / OneToOne fields through a batch loader when the
+    # optimizer did not join them with select_related.
+    for field_name, rel_info in relationships.items():
+        if not self._should_include_field(model, field_name):
+            continue
+        if f"resolve_{field_name}" in type_attrs:
+            continue
+        try:
+            forward_field = model._meta.get_field(field_name)
+        except Exception:
+            continue
+        if not isinstance(forward_field, models.ForeignKey):
+            continue
+        if not isinstance(forward_field.related_model, type):
+            continue
+
+        def make_forward_resolver(field_name, forward_field):
+            def resolver(self, info):
+                if getattr(self, forward_field.attname, None) is None:
+                    return None
+                if not forward_field.is_cached(self) and query_optimizer.settings.enable_dataloader:
+                    loader = get_relation_dataloader(
+                        info.context,
+                        forward_field.related_model,
+                        forward_field,
+                        getattr(self, "_state", None),
+                    )
+                    if loader:
+                        return loader.load_for(info.context, self)
+                return getattr(self, field_name)
+
+            # Read on the event loop under async execution once select_related
+            # has cached the object; otherwise run in a worker like other fields.
+            return mark_attribute_resolver(resolver)
+
+        type_attrs[f"resolve_{field_name}"] = make_forward_resolver(
+            field_name, forward_field
+        )
+
     # Override ManyToMany fields to use direct lists instead of connections
     for field_name, rel_info in relationships.items():
         if not self._should_include_field(model, field_name):
@@ -297,6 +370,7 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
             type_attrs[field_name] = graphene.List(
                 make_lazy_type(related_model),
                 filters=graphene.Argument(graphene.JSONString),
+                **_relation_list_arguments(),
                 description=f"Related {model_name} objects",
             )
 
@@ -306,15 +380,32 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
                 description=f"Count of related {model_name} objects"
             )            # Add resolver that handles different relationship types with filtering
             def make_resolver(field_name, rel_info, related_model):
-                def resolver(self, info, filters=None):
+                def resolver(self, info, filters=None, limit=None, order_by=None):
+                    _check_relation_limit(limit)
+                    windowed = bool(filters) or limit is not None or bool(order_by)
                     # Optimization: Use prefetch cache if available and no filters
                     if (
-                        not filters
+                        not windowed
                         and hasattr(self, "_prefetched_objects_cache")
                         and field_name in self._prefetched_objects_cache
                     ):
                         return self._prefetched_objects_cache[field_name]
 
+                    if query_optimizer.settings.enable_dataloader:
+                        relation = self._meta.get_field(field_name)
+                        state = getattr(self, "_state", None)
+                        if windowed:
+                            loader = get_relation_list_loader(
+                                info.context, related_model, relation, state,
+                                filters=filters, order_by=order_by, limit=limit,
+                            )
+                        else:
+                            loader = get_relation_dataloader(
+                                info.context, related_model, relation, state
+                            )
+                        if loader:
+                            return loader.load_for(info.context, self)
+
                     related_obj = getattr(self, field_name)
                     # For OneToOne fields, return the single object or None
                     if rel_info.relationship_type == "OneToOneField":
@@ -336,13 +427,32 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
                         filter_set = filter_set_class(filters, queryset=queryset)
                         queryset = filter_set.qs
 
-                    return queryset
+                    return _order_and_limit(
+                        queryset, get_relation_ordering(related_model, order_by), limit
+                    )
 
                 return resolver
 
             # Add count resolver for ManyToMany relation
             def make_count_resolver(field_name, related_model):
                 def count_resolver(self, info):
+                    if (
+                        hasattr(self, "_prefetched_objects_cache")
+                        and field_name in self._prefetched_objects_cache
+                    ):
+                        return len(self._prefetched_objects_cache[field_name])
+
+                    if query_optimizer.settings.enable_dataloader:
+                        loader = get_relation_aggregate_loader(
+                            info.context,
+                            related_model,
+                            self._meta.get_field(field_name),
+                            getattr(self, "_state", None),
+                            RELATION_COUNT_AGGREGATES,
+                        )
+                        if loader:
+                            return loader.load_for(info.context, self)["total_count"] or 0
+
                     related_obj = getattr(self, field_name)
                     queryset = related_obj.all()
                     queryset = apply_tenant_scope(
@@ -370,9 +480,6 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
             continue
         if not self._should_include_field(model, accessor_name):
             continue
-        query_optimizer = self.query_optimizer
-        get_relation_dataloader = self._get_relation_dataloader
-
         # Use proper lazy type resolution to avoid recursion
         # Create a closure that captures the related_model
         def make_lazy_type(model_ref):
@@ -404,6 +511,7 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
             type_attrs[accessor_name] = graphene.List(
                 make_lazy_type(related_model),
                 filters=graphene.Argument(graphene.JSONString),
+                **_relation_list_arguments(),
                 description=f"Related {related_model.__name__} objects",
             )
 
@@ -423,16 +531,36 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
             get_relation_dataloader,
             apply_tenant_scope,
         ):
-            def resolver(self, info, filters=None):
+            def resolver(self, info, filters=None, limit=None, order_by=None):
+                _check_relation_limit(limit)
+                windowed = bool(filters) or limit is not None or bool(order_by)
                 # Optimization: Use prefetch cache if available and no filters (for lists)
                 if (
                     not is_one_to_one
-                    and not filters
+                    and not windowed
                     and hasattr(self, "_prefetched_objects_cache")
                     and accessor_name in self._prefetched_objects_cache
                 ):
                     return self._prefetched_objects_cache[accessor_name]
 
+                if (
+                    relation is not None
+                    and not (is_one_to_one and (windowed or relation.is_cached(self)))
+                    and query_optimizer.settings.enable_dataloader
+                ):
+                    state = getattr(self, "_state", None)
+                    if windowed:
+                        loader = get_relation_list_loader(
+                            info.context, related_model, relation, state,
+                            filters=filters, order_by=order_by, limit=limit,
+                        )
+                    else:
+                        loader = get_relation_dataloader(
+                            info.context, related_model, relation, state
+                        )
+                    if loader:
+                        return loader.load_for(info.context, self)
+
                 # For OneToOne reverse relationships, handle DoesNotExist exceptions
                 if is_one_to_one:
                     try:
@@ -447,19 +575,6 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
                     queryset, info, related_model, operation="read"
                 )
 
-                if relation is not None and query_optimizer.settings.enable_dataloader:
-                    loader = get_relation_dataloader(
-                        info.context,
-                        related_model,
-                        relation,
-                        getattr(self, "_state", None),
-                    )
-                    if loader:
-                        parent_id = getattr(self, "pk", None)
-                        if parent_id is None:
-                            return []
-                        return _resolve_promise(loader.load(parent_id))
-
                 # Apply filters if provided
                 if filters:
                     from ..filters import ModelFilterGenerator
@@ -471,17 +586,36 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
                     filter_set = filter_set_class(filters, queryset=queryset)
                     queryset = filter_set.qs
 
-                return queryset
+                return _order_and_limit(
+                    queryset, get_relation_ordering(related_model, order_by), limit
+                )
 
             return resolver
 
         # Add count resolver for reverse ManyToOne relations
-        def make_count_resolver(accessor_name, is_one_to_one, related_model):
+        def make_count_resolver(accessor_name, is_one_to_one, related_model, relation):
             def count_resolver(self, info):
                 if is_one_to_one:
                     # For OneToOne, return 1 if exists, 0 if not
                     related_obj = getattr(self, accessor_name, None)
                     return 1 if related_obj else 0
+                if (
+                    hasattr(self, "_prefetched_objects_cache")
+                    and accessor_name in self._prefetched_objects_cache
+                ):
+                    return len(self._prefetched_objects_cache[accessor_name])
+
+                if relation is not None and query_optimizer.settings.enable_dataloader:
+                    loader = get_relation_aggregate_loader(
+                        info.context,
+                        related_model,
+                        relation,
+                        getattr(self, "_state", None),
+                        RELATION_COUNT_AGGREGATES,
+                    )
+                    if loader:
+                        return loader.load_for(info.context, self)["total_count"] or 0
+
                 # For ManyToOne reverse relations, count the related objects
                 related_obj = getattr(self, accessor_name)
                 queryset = related_obj.all()
@@ -506,7 +640,7 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
         if not is_one_to_one_reverse:
             count_field_name = f"{accessor_name}_count"
             type_attrs[f"resolve_{count_field_name}"] = make_count_resolver(
-                accessor_name, is_one_to_one_reverse, related_model
+                accessor_name, is_one_to_one_reverse, related_model, relation
             )
 
             numeric_fields = [
@@ -574,10 +708,27 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
             def make_stats_resolver(
                 accessor_name,
                 related_model,
+                relation,
                 numeric_field_names,
                 apply_tenant_scope,
             ):
+                stats_annotations = _relation_stats_annotations(numeric_field_names)
+
                 def stats_resolver(self, info, filters=None):
+                    if relation is not None and query_optimizer.settings.enable_dataloader:
+                        loader = get_relation_aggregate_loader(
+                            info.context,
+                            related_model,
+                            relation,
+                            getattr(self, "_state", None),
+                            stats_annotations,
+                            filters=filters,
+                        )
+                        if loader:
+                            return _finalize_relation_stats(
+                                loader.load_for(info.context, self), numeric_field_names
+                            )
+
                     related_obj = getattr(self, accessor_name)
                     queryset = related_obj.all()
                     queryset = apply_tenant_scope(
@@ -594,39 +745,16 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
                         filter_set = filter_set_class(filters, queryset=queryset)
                         queryset = filter_set.qs
 
-                    annotations = {"total_count": Count("pk")}
-                    for numeric_field_name in numeric_field_names:
-                        annotations[f"{numeric_field_name}_sum"] = Sum(numeric_field_name)
-                        annotations[f"{numeric_field_name}_avg"] = Avg(numeric_field_name)
-                        annotations[f"{numeric_field_name}_min"] = Min(numeric_field_name)
-                        annotations[f"{numeric_field_name}_max"] = Max(numeric_field_name)
-                        annotations[f"{numeric_field_name}_count"] = Count(
-                            numeric_field_name
-                        )
-                        annotations[f"{numeric_field_name}_distinct_count"] = Count(
-                            numeric_field_name, distinct=True
-                        )
-
-                    aggregate_values = queryset.aggregate(**annotations)
-                    aggregate_values["total_count"] = aggregate_values.get("total_count") or 0
-
-                    for numeric_field_name in numeric_field_names:
-                        sum_key = f"{numeric_field_name}_sum"
-                        count_key = f"{numeric_field_name}_count"
-                        distinct_count_key = f"{numeric_field_name}_distinct_count"
-                        aggregate_values[sum_key] = aggregate_values.get(sum_key) or 0
-                        aggregate_values[count_key] = aggregate_values.get(count_key) or 0
-                        aggregate_values[distinct_count_key] = (
-                            aggregate_values.get(distinct_count_key) or 0
-                        )
-
-                    return aggregate_values
+                    return _finalize_relation_stats(
+                        queryset.aggregate(**stats_annotations), numeric_field_names
+                    )
 
                 return stats_resolver
 
             type_attrs[f"resolve_{stats_field_name}"] = make_stats_resolver(
                 accessor_name,
                 related_model,
+                relation,
                 numeric_field_names,
                 apply_tenant_scope,
             )
@@ -653,6 +781,7 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
         type_attrs[field_name] = graphene.List(
             make_lazy_type_gr(related_model),
             filters=graphene.Argument(graphene.JSONString),
+            **_relation_list_arguments(),
             description=f"Related {related_model.__name__} objects (generic relation)",
         )
 
@@ -674,18 +803,35 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
 
             The resolver first checks the prefetch cache (populated by the
             query optimizer when ``prefetch_related`` includes this field),
-            then falls back to the GenericRelatedObjectManager which issues
-            a properly scoped query through content_type + object_id.
+            then the request's batch loader, and finally falls back to the
+            GenericRelatedObjectManager which issues a properly scoped query
+            through content_type + object_id.
             """
-            def resolver(self, info, filters=None):
+            def resolver(self, info, filters=None, limit=None, order_by=None):
+                _check_relation_limit(limit)
+                windowed = bool(filters) or limit is not None or bool(order_by)
                 # Use prefetch cache when available and no extra filters
                 if (
-                    not filters
+                    not windowed
                     and hasattr(self, "_prefetched_objects_cache")
                     and field_name in self._prefetched_objects_cache
                 ):
                     return self._prefetched_objects_cache[field_name]
 
+                if query_optimizer.settings.enable_dataloader:
+                    state = getattr(self, "_state", None)
+                    if windowed:
+                        loader = get_relation_list_loader(
+                            info.context, related_model, gr_field, state,
+                            filters=filters, order_by=order_by, limit=limit,
+                        )
+                    else:
+                        loader = get_relation_dataloader(
+                            info.context, related_model, gr_field, state
+                        )
+                    if loader:
+                        return loader.load_for(info.context, self)
+
                 # GenericRelatedObjectManager handles content_type scoping
                 related_manager = getattr(self, field_name)
                 queryset = related_manager.all()
@@ -703,10 +849,12 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
                     filter_set = filter_set_class(filters, queryset=queryset)
                     queryset = filter_set.qs
 
-                return queryset
+                return _order_and_limit(
+                    queryset, get_relation_ordering(related_model, order_by), limit
+                )
             return resolver
 
-        def make_gr_count_resolver(field_name, related_model, apply_tenant_scope):
+        def make_gr_count_resolver(field_name, related_model, gr_field, apply_tenant_scope):
             """Build count resolver for a GenericRelation field."""
             def count_resolver(self, info):
                 # Use prefetch cache when available
@@ -716,6 +864,17 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
                 ):
                     return len(self._prefetched_objects_cache[field_name])
 
+                if query_optimizer.settings.enable_dataloader:
+                    loader = get_relation_aggregate_loader(
+                        info.context,
+                        related_model,
+                        gr_field,
+                        getattr(self, "_state", None),
+                        RELATION_COUNT_AGGREGATES,
+                    )
+                    if loader:
+                        return loader.load_for(info.context, self)["total_count"] or 0
+
                 related_manager = getattr(self, field_name)
                 queryset = related_manager.all()
                 queryset = apply_tenant_scope(
@@ -731,7 +890,7 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
             apply_tenant_scope,
         )
         type_attrs[f"resolve_{count_field_name}"] = make_gr_count_resolver(
-            field_name, related_model, apply_tenant_scope
+            field_name, related_model, gr_field, apply_tenant_scope
         )
 
         # Stats aggregation type (same pattern as regular reverse relations)
@@ -800,11 +959,28 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
         def make_gr_stats_resolver(
             field_name,
             related_model,
+            gr_field,
             numeric_field_names,
             apply_tenant_scope,
         ):
             """Build stats resolver for a GenericRelation field."""
+            stats_annotations = _relation_stats_annotations(numeric_field_names)
+
             def stats_resolver(self, info, filters=None):
+                if query_optimizer.settings.enable_dataloader:
+                    loader = get_relation_aggregate_loader(
+                        info.context,
+                        related_model,
+                        gr_field,
+                        getattr(self, "_state", None),
+                        stats_annotations,
+                        filters=filters,
+                    )
+                    if loader:
+                        return _finalize_relation_stats(
+                            loader.load_for(info.context, self), numeric_field_names
+                        )
+
                 related_manager = getattr(self, field_name)
                 queryset = related_manager.all()
                 queryset = apply_tenant_scope(
@@ -821,31 +997,15 @@ def generate_object_type(self, model: type[models.Model]) -> type[DjangoObjectTy
                     filter_set = filter_set_class(filters, queryset=queryset)
                     queryset = filter_set.qs
 
-                annotations = {"total_count": Count("pk")}
-                for nf_name in numeric_field_names:
-                    annotations[f"{nf_name}_sum"] = Sum(nf_name)
-                    annotations[f"{nf_name}_avg"] = Avg(nf_name)
-                    annotations[f"{nf_name}_min"] = Min(nf_name)
-                    annotations[f"{nf_name}_max"] = Max(nf_name)
-                    annotations[f"{nf_name}_count"] = Count(nf_name)
-                    annotations[f"{nf_name}_distinct_count"] = Count(
-                        nf_name, distinct=True
-                    )
-
-                aggregate_values = queryset.aggregate(**annotations)
-                aggregate_values["total_count"] = aggregate_values.get("total_count") or 0
-
-                for nf_name in numeric_field_names:
-                    for suffix in ("_sum", "_count", "_distinct_count"):
-                        key = f"{nf_name}{suffix}"
-                        aggregate_values[key] = aggregate_values.get(key) or 0
-
-                return aggregate_values
+                return _finalize_relation_stats(
+                    queryset.aggregate(**stats_annotations), numeric_field_names
+                )
             return stats_resolver
 
         type_attrs[f"resolve_{stats_field_name}"] = make_gr_stats_resolver(
             field_name,
             related_model,
+            gr_field,
             numeric_field_names,
             apply_tenant_scope,
         )
@@ -10,6 +10,7 @@ This package provides multi-schema GraphQL views with support for:
 
 Classes:
     MultiSchemaGraphQLView: Main GraphQL view supporting multiple schemas.
+    AsyncMultiSchemaGraphQLView: ASGI variant executing queries asynchronously.
     SchemaListView: View for listing available schemas.
 
 Usage:
@@ -25,10 +26,11 @@ Usage:
     ]
 """
 
-from .multi_schema import MultiSchemaGraphQLView
+from .multi_schema import AsyncMultiSchemaGraphQLView, MultiSchemaGraphQLView
 from .schema_list import SchemaListView
 
 __all__ = [
+    "AsyncMultiSchemaGraphQLView",
     "MultiSchemaGraphQLView",
     "SchemaListView",
 ]
@@ -291,12 +291,11 @@ class SchemaMixin:
     def _configure_middleware(self, schema_name: str) -> None:
         """Configure the GraphQL middleware stack for this schema."""
         try:
-            from ...core.middleware import get_middleware_stack
+            from ...core.middleware import get_compiled_middleware
             from ...core.registry import schema_registry
             builder = schema_registry.get_schema_builder(schema_name)
             builder_middleware = list(getattr(builder, "get_middleware", lambda: [])())
-            core_middleware = get_middleware_stack(schema_name)
-            self.middleware = builder_middleware + core_middleware
+            self.middleware = [get_compiled_middleware(schema_name, builder_middleware)]
         except Exception as e:
             logger.exception("Failed to configure middleware for '%s': %s", schema_name, e)
             raise RuntimeError(
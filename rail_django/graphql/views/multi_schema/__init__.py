@@ -3,8 +3,10 @@ Multi-schema GraphQL view package.
 """
 
 from .view import MultiSchemaGraphQLView, SchemaRegistryUnavailable
+from .async_view import AsyncMultiSchemaGraphQLView
 
 __all__ = [
+    "AsyncMultiSchemaGraphQLView",
     "MultiSchemaGraphQLView",
     "SchemaRegistryUnavailable",
 ]
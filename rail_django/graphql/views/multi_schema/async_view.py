@@ -0,0 +1,178 @@
+"""
+ASGI-native variant of MultiSchemaGraphQLView.
+"""
+
+from inspect import isawaitable
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from graphql import ExecutionResult, OperationType, execute, get_operation_ast, validate_schema
+
+try:
+    from graphene_django.settings import graphene_settings
+    from graphene_django.views import HttpError
+except ImportError:
+    raise ImportError(
+        "graphene-django is required for GraphQL views. Install it with: pip install graphene-django"
+    )
+
+from .view import MultiSchemaGraphQLView
+from ....core.document_cache import REQUEST_DOCUMENT_ATTR, CachedDocument, get_document_cache
+from ....core.execution import run_in_worker
+from ....core.middleware import AsyncExecutionMiddleware
+from ....extensions.persisted_queries import REQUEST_PERSISTED_QUERY_ATTR
+
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncMultiSchemaGraphQLView(MultiSchemaGraphQLView):
+    """
+    MultiSchemaGraphQLView executing query operations on the event loop.
+
+    Request checks and schema setup run in Django's sync executor, then
+    query operations are executed with graphql-core's async executor and
+    :class:`AsyncExecutionMiddleware`, so a slow query does not hold a
+    worker thread while it waits on the database. Mutations, batches,
+    introspection, streamed or incremental responses, conditional GETs and
+    GraphiQL use the synchronous path of the parent view.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs):
+        schema_name = await sync_to_async(self._resolve_schema_name)(kwargs.get("schema_name"))
+        self._schema_name = schema_name
+
+        try:
+            prepared = await sync_to_async(self._prepare_dispatch)(request, schema_name)
+            if isinstance(prepared, HttpResponseBase):
+                return prepared
+            request_is_batch, parsed_body = prepared
+
+            response = None
+            original_batch = self.batch
+            if request_is_batch is False and self.batch: self.batch = False
+            try:
+                if (
+                    not self.batch
+                    and not self._streaming_responses_enabled(schema_name)
+                    and not self._incremental_delivery_requested(request)
+                    and not (
+                        request.method == "GET"
+                        and self._http_conditional_caching_enabled(schema_name)
+                    )
+                ):
+                    response = await self._dispatch_async(request)
+            finally: self.batch = original_batch
+
+            if response is None:
+                response = await sync_to_async(self._dispatch_prepared)(
+                    request, request_is_batch, parsed_body, *args, **kwargs
+                )
+            return response
+        except Exception as e:
+            return self._dispatch_error_response(e, schema_name)
+
+    async def _dispatch_async(self, request: HttpRequest) -> Optional[HttpResponseBase]:
+        """Execute a query operation asynchronously, or return None to use the sync path."""
+        if request.method not in ("GET", "POST"):
+            return None
+        try:
+            data = self.parse_body(request)
+            if not isinstance(data, dict) or self.can_display_graphiql(request, data):
+                return None
+            query, variables, operation_name, _id = self.get_graphql_params(request, data)
+            if not query or self._is_introspection_query(query):
+                return None
+            entry = self._get_async_document(request, query)
+            if entry is None:
+                return None
+            operation_ast = get_operation_ast(entry.document, operation_name)
+            if operation_ast is None or operation_ast.operation != OperationType.QUERY:
+                return None
+
+            execution_result = await self._execute_document_async(
+                request, entry, variables, operation_name
+            )
+        except HttpError as e:
+            response = e.response
+            response["Content-Type"] = "application/json"
+            response.content = self.json_encode(request, {"errors": [self.format_error(e)]})
+            return response
+
+        status_code = 200
+        response_data = {}
+        if execution_result.errors:
+            response_data["errors"] = [self.format_error(e) for e in execution_result.errors]
+        if execution_result.errors and any(
+            not getattr(e, "path", None) for e in execution_result.errors
+        ):
+            status_code = 400
+        else:
+            response_data["data"] = execution_result.data
+        return HttpResponse(
+            status=status_code,
+            content=self.json_encode(request, response_data),
+            content_type="application/json",
+        )
+
+    def _get_async_document(self, request: HttpRequest, query: str) -> Optional[CachedDocument]:
+        compiled = getattr(request, REQUEST_PERSISTED_QUERY_ATTR, None)
+        if compiled is not None and compiled.query == query:
+            return compiled.entry
+        try:
+            return self._get_cached_document(query)
+        except Exception:
+            # Let the sync path report the syntax error.
+            return None
+
+    async def _execute_document_async(
+        self, request: HttpRequest, entry: CachedDocument, variables, operation_name
+    ) -> ExecutionResult:
+        """Async counterpart of ``_execute_cached_document`` for query operations."""
+        schema = self.schema.graphql_schema
+
+        schema_validation_errors = validate_schema(schema)
+        if schema_validation_errors:
+            return ExecutionResult(data=None, errors=schema_validation_errors)
+
+        validation_errors = get_document_cache().validate(
+            entry, schema, self.validation_rules, graphene_settings.MAX_VALIDATION_ERRORS
+        )
+        if validation_errors:
+            return ExecutionResult(data=None, errors=validation_errors)
+
+        try:
+            context = await sync_to_async(self.get_context)(request)
+            try: setattr(context, REQUEST_DOCUMENT_ATTR, entry)
+            except Exception: pass
+            middleware = list(self.get_middleware(request) or [])
+            middleware.append(AsyncExecutionMiddleware(self._schema_name))
+            execute_options = {
+                "root_value": self.get_root_value(request),
+                "context_value": context,
+                "variable_values": variables,
+                "operation_name": operation_name,
+                "middleware": middleware,
+            }
+            if self.execution_context_class:
+                execute_options["execution_context_class"] = self.execution_context_class
+
+            result = await run_in_worker(
+                self._run_operation,
+                lambda: execute(schema, entry.document, **execute_options),
+                schema,
+                entry.document,
+                operation_name,
+                context,
+                variables,
+            )
+            if isawaitable(result):
+                result = await result
+            return result
+        except Exception as e:
+            return ExecutionResult(errors=[e])
@@ -0,0 +1,103 @@
+"""
+Concurrent execution of batched GraphQL requests for MultiSchemaGraphQLView.
+"""
+
+import contextvars
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from graphql import OperationType, get_operation_ast
+
+try:
+    from graphene_django.views import HttpError
+except ImportError:
+    raise ImportError(
+        "graphene-django is required for GraphQL views. Install it with: pip install graphene-django"
+    )
+
+
+class BatchExecutionMixin:
+    """Mixin running independent query operations of a batch concurrently.
+
+    Concurrency is opt-in per schema with the ``batch_max_concurrency``
+    setting. Each worker thread executes its share of the batch in order with
+    its own copy of the request as GraphQL context and its own database
+    connection, which it closes once done. Batches containing a mutation, a
+    subscription or an operation that cannot be parsed run in order on the
+    request thread, exactly like a regular batch.
+
+    Worker threads do not share the request's transaction, so concurrent
+    batches should not be enabled together with ``ATOMIC_REQUESTS``.
+    """
+
+    batch_max_concurrency = 1
+
+    def _configure_batch_concurrency(self, schema_settings: dict[str, Any]) -> None:
+        try:
+            value = int(schema_settings.get("batch_max_concurrency", 1) or 1)
+        except (TypeError, ValueError):
+            value = 1
+        self.batch_max_concurrency = max(1, value)
+
+    def _should_execute_batch_concurrently(self, request: HttpRequest, data: Any) -> bool:
+        if self.batch_max_concurrency <= 1:
+            return False
+        if not isinstance(data, list) or len(data) < 2:
+            return False
+        for entry in data:
+            if not isinstance(entry, dict):
+                return False
+            try:
+                query, _variables, operation_name, _id = self.get_graphql_params(request, entry)
+                if not query:
+                    return False
+                document = self._get_cached_document(query).document
+            except Exception:
+                return False
+            operation = get_operation_ast(document, operation_name)
+            if operation is None or operation.operation != OperationType.QUERY:
+                return False
+        return True
+
+    def _dispatch_concurrent_batch(self, request: HttpRequest, data: Any) -> Optional[HttpResponse]:
+        """Execute *data* concurrently, or return None to use the in-order path."""
+        if self.can_display_graphiql(request, data):
+            return None
+        if not self._should_execute_batch_concurrently(request, data):
+            return None
+        try:
+            responses = self._execute_batch_concurrently(request, data)
+        except HttpError as e:
+            response = e.response
+            response["Content-Type"] = "application/json"
+            response.content = self.json_encode(request, {"errors": [self.format_error(e)]})
+            return response
+
+        result = "[{}]".format(",".join(response[0] for response in responses))
+        status_code = max((response[1] for response in responses), default=200)
+        return HttpResponse(status=status_code, content=result, content_type="application/json")
+
+    def _execute_batch_concurrently(self, request: HttpRequest, data: list[Any]) -> list[tuple[str, int]]:
+        worker_count = min(self.batch_max_concurrency, len(data))
+        # Round-robin so every worker gets one DB connection for its whole share.
+        assignments = [list(range(index, len(data), worker_count)) for index in range(worker_count)]
+        results: list[Any] = [None] * len(data)
+
+        def run_share(indexes: list[int]) -> None:
+            try:
+                for index in indexes:
+                    results[index] = self.get_response(copy.copy(request), data[index])
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="rail-graphql-batch") as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, run_share, indexes)
+                for indexes in assignments
+            ]
+            for future in futures:
+                future.result()
+        return results
@@ -0,0 +1,261 @@
+"""
+HTTP conditional caching (ETag / 304) for GET queries of MultiSchemaGraphQLView.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from django.apps import apps
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponseNotModified
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from graphql import FieldNode, OperationType, get_operation_ast
+
+from ....config_proxy import get_setting
+from ....core.meta import get_model_graphql_meta
+from ....core.model_versions import get_model_version_map
+from ....extensions.optimization.result_cache import (
+    DependencyRecorder,
+    collect_operation_models,
+)
+
+logger = logging.getLogger(__name__)
+
+ETAG_MANIFEST_PREFIX = "rail_django:http_etag"
+ETAG_MANIFEST_TIMEOUT = 86400
+
+# Set on the request by execute_graphql_request: whether the result had errors.
+REQUEST_RESULT_ERRORS_ATTR = "_rail_graphql_result_errors"
+
+
+@dataclass
+class ConditionalGetPlan:
+    """What a GET query's ETag is computed from, read before execution."""
+
+    base_key: str
+    manifest: Optional[list[str]]
+    labels: set[str]
+    versions: dict[str, str]
+    cache_control: str
+    vary: tuple[str, ...] = ("Authorization", "Cookie")
+
+    def etag(self) -> str:
+        raw = "|".join(f"{label}={self.versions[label]}" for label in sorted(self.versions))
+        digest = hashlib.sha256(f"{self.base_key}|{raw}".encode("utf-8")).hexdigest()
+        return f'"{digest[:40]}"'
+
+
+class ConditionalGetMixin:
+    """Mixin answering GET queries with ETags and ``If-None-Match`` with 304.
+
+    Enabled with ``performance_settings.http_conditional_caching``. Applies to
+    GET query operations whose root fields are all generated model queries.
+    The ETag covers the document hash, operation name, variables, user and
+    tenant scope and the data versions of the models the query read, so it
+    changes with any write to them. For authenticated users it also covers
+    the user, group and permission models, so permission changes made
+    through the ORM invalidate it. The models read are learned from the SQL
+    run by the first execution (as for the query result cache). A matching
+    ``If-None-Match`` gets a 304 without executing resolvers. Cache-Control
+    comes from the ``http_cache`` GraphQLMeta of those models.
+    """
+
+    def _http_conditional_caching_enabled(self, schema_name: Optional[str]) -> bool:
+        return bool(
+            get_setting(
+                "performance_settings.http_conditional_caching", False, schema_name
+            )
+        )
+
+    def _conditional_get_plan(self, request: HttpRequest) -> Optional[ConditionalGetPlan]:
+        """Return the ETag plan of a GET query, or None when it does not apply."""
+        schema_name = getattr(self, "_schema_name", None)
+        query = request.GET.get("query") if request.method == "GET" else None
+        if not query or not self._http_conditional_caching_enabled(schema_name):
+            return None
+        if self.batch or self.request_wants_html(request):
+            return None
+        if self._incremental_delivery_requested(request):
+            return None
+        try:
+            entry = self._get_cached_document(str(query))
+            operation_name = request.GET.get("operationName") or None
+            operation = get_operation_ast(entry.document, operation_name)
+            if operation is None or operation.operation != OperationType.QUERY:
+                return None
+            configs = self._root_field_http_cache_configs(schema_name, operation)
+            if not configs:
+                return None
+
+            user = self._get_request_user(request)
+            user_scope = f"user:{user.pk}" if user is not None else "anonymous"
+            tenant_id, tenant_header = _request_tenant(request, schema_name)
+            base_key = hashlib.sha256(
+                json.dumps(
+                    [
+                        schema_name,
+                        self._get_schema_version(schema_name),
+                        entry.query_hash,
+                        operation_name,
+                        _normalize_variables(request.GET.get("variables")),
+                        user_scope,
+                        None if tenant_id is None else str(tenant_id),
+                    ],
+                    sort_keys=True,
+                ).encode("utf-8")
+            ).hexdigest()
+
+            manifest = cache.get(f"{ETAG_MANIFEST_PREFIX}:{base_key}")
+            labels = set(manifest or [])
+            labels.update(
+                model._meta.label_lower
+                for model in collect_operation_models(
+                    self.schema.graphql_schema, entry.document, operation
+                )
+            )
+            access_labels = _access_model_labels() if user is not None else set()
+            versions = get_model_version_map(
+                apps.get_model(label) for label in labels | access_labels
+            )
+        except Exception as exc:
+            logger.debug("Conditional GET not applicable: %s", exc)
+            return None
+
+        return ConditionalGetPlan(
+            base_key=base_key,
+            manifest=list(manifest) if manifest is not None else None,
+            labels=labels,
+            versions=versions,
+            cache_control=_cache_control(configs, anonymous=user is None),
+            vary=("Authorization", "Cookie", *((tenant_header,) if tenant_header else ())),
+        )
+
+    def _root_field_http_cache_configs(self, schema_name: Optional[str], operation) -> list:
+        from ....core.registry import schema_registry
+
+        builder = schema_registry.get_schema_builder(schema_name)
+        configs = []
+        for selection in operation.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                return []
+            if selection.name.value == "__typename":
+                continue
+            mapped = builder.get_query_operation(selection.name.value)
+            if mapped is None:
+                return []
+            model, operation_kind = mapped
+            config = get_model_graphql_meta(model).http_cache.for_operation(operation_kind)
+            if not config.enabled:
+                return []
+            configs.append(config)
+        return configs
+
+    def _dispatch_conditional_get(
+        self,
+        request: HttpRequest,
+        plan: ConditionalGetPlan,
+        execute: Callable[[], HttpResponseBase],
+    ) -> HttpResponseBase:
+        """Answer with 304 when the client's ETag is current, else execute and tag."""
+        if plan.manifest is not None and _etag_matches(
+            request.META.get("HTTP_IF_NONE_MATCH"), plan.etag()
+        ):
+            return self._apply_http_cache_headers(HttpResponseNotModified(), plan)
+
+        with DependencyRecorder() as dependencies:
+            response = execute()
+        if response.status_code != 200 or getattr(
+            request, REQUEST_RESULT_ERRORS_ATTR, True
+        ):
+            return response
+
+        read = {model._meta.label_lower for model in dependencies.models()}
+        manifest_key = f"{ETAG_MANIFEST_PREFIX}:{plan.base_key}"
+        if not read <= plan.labels:
+            # Versions of the newly seen models were not read before executing;
+            # record them so the next request can be tagged.
+            cache.set(manifest_key, sorted(plan.labels | read), ETAG_MANIFEST_TIMEOUT)
+            return response
+        if plan.manifest is None or set(plan.manifest) != plan.labels:
+            cache.set(manifest_key, sorted(plan.labels), ETAG_MANIFEST_TIMEOUT)
+        return self._apply_http_cache_headers(response, plan)
+
+    def _apply_http_cache_headers(
+        self, response: HttpResponseBase, plan: ConditionalGetPlan
+    ) -> HttpResponseBase:
+        response["ETag"] = plan.etag()
+        response["Cache-Control"] = plan.cache_control
+        patch_vary_headers(response, plan.vary)
+        return response
+
+
+def _request_tenant(
+    request: HttpRequest, schema_name: Optional[str]
+) -> tuple[Any, Optional[str]]:
+    """Return ``(tenant id, tenant header)`` when multitenancy is enabled."""
+    try:
+        from ....extensions.multitenancy import (
+            get_multitenancy_settings,
+            resolve_tenant_id,
+        )
+    except ImportError:
+        return None, None
+    settings = get_multitenancy_settings(schema_name)
+    if not settings.enabled:
+        return None, None
+    return (
+        resolve_tenant_id(request, schema_name=schema_name),
+        settings.tenant_header or None,
+    )
+
+
+def _access_model_labels() -> set[str]:
+    """Labels of the models holding users' permissions (auth user, group, permission)."""
+    from django.contrib.auth import get_user_model
+
+    labels = {get_user_model()._meta.label_lower}
+    for label in ("auth.group", "auth.permission"):
+        app_label, model_name = label.split(".")
+        try:
+            apps.get_model(app_label, model_name)
+        except LookupError:
+            continue
+        labels.add(label)
+    return labels
+
+
+def _normalize_variables(raw: Any) -> Any:
+    if not raw:
+        return None
+    try:
+        return json.dumps(json.loads(raw), sort_keys=True)
+    except (TypeError, ValueError):
+        return str(raw)
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = parse_etags(header)
+    if "*" in candidates:
+        return True
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def _cache_control(configs: list, *, anonymous: bool) -> str:
+    max_age = min(config.max_age for config in configs)
+    stale = min(config.stale_while_revalidate for config in configs)
+    public = anonymous and all(config.public for config in configs)
+    parts = ["public" if public else "private"]
+    if max_age > 0:
+        parts.append(f"max-age={max_age}")
+        if stale > 0:
+            parts.append(f"stale-while-revalidate={stale}")
+    else:
+        parts.append("no-cache")
+    return ", ".join(parts)
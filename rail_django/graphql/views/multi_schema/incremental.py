@@ -0,0 +1,138 @@
+"""
+Incremental delivery (@defer / @stream) responses for MultiSchemaGraphQLView.
+"""
+
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from graphql import OperationType, get_operation_ast
+
+from ....core.incremental import (
+    IncrementalExecution,
+    document_uses_incremental_delivery,
+    schema_supports_incremental_delivery,
+)
+
+try:
+    from graphene_django.views import HttpError
+except ImportError:
+    raise ImportError(
+        "graphene-django is required for GraphQL views. Install it with: pip install graphene-django"
+    )
+
+MULTIPART_CONTENT_TYPE = 'multipart/mixed; boundary="-"; deferSpec=20220824'
+_PART_HEADER = b"\r\n---\r\nContent-Type: application/json; charset=utf-8\r\n\r\n"
+_CLOSING_BOUNDARY = b"\r\n-----\r\n"
+
+
+class IncrementalDeliveryMixin:
+    """Mixin answering ``@defer``/``@stream`` queries with a multipart/mixed stream.
+
+    Requires ``performance_settings.incremental_delivery`` (which adds the
+    directives to the schema) and a client sending
+    ``Accept: multipart/mixed``. The initial result is sent first and each
+    deferred fragment or streamed batch follows in its own part. Other
+    clients get the directives applied inline in a single JSON response.
+
+    Subsequent payloads are computed while the response is sent, after the
+    view returned: Django middleware wrapping the view has finished by then,
+    while GraphQL middleware, permission checks and tenant scoping (resolved
+    from the request) still apply. When the view runs inside a transaction
+    (``ATOMIC_REQUESTS``), all payloads are computed before the view returns
+    so they read the same transaction.
+    """
+
+    _incremental_delivery = False
+    _incremental_payloads: Optional[IncrementalExecution] = None
+
+    def _incremental_delivery_requested(self, request: HttpRequest) -> bool:
+        accept = request.META.get("HTTP_ACCEPT", "")
+        if "multipart/mixed" not in accept.lower():
+            return False
+        schema = getattr(self, "schema", None)
+        graphql_schema = getattr(schema, "graphql_schema", None)
+        return graphql_schema is not None and schema_supports_incremental_delivery(
+            graphql_schema
+        )
+
+    def _dispatch_incremental_response(self, request: HttpRequest) -> Optional[HttpResponse]:
+        """Execute a @defer/@stream query as a multipart stream, or return None."""
+        try:
+            data = self.parse_body(request)
+            if not isinstance(data, dict) or self.can_display_graphiql(request, data):
+                return None
+            query, _variables, operation_name, _id = self.get_graphql_params(request, data)
+            if not query:
+                return None
+            try:
+                document = self._get_cached_document(query).document
+            except Exception:
+                return None
+            if not document_uses_incremental_delivery(document):
+                return None
+            operation = get_operation_ast(document, operation_name)
+            if operation is None or operation.operation != OperationType.QUERY:
+                return None
+            self._incremental_delivery = True
+            result, status_code = self.get_response(request, data)
+        except HttpError as e:
+            response = e.response
+            response["Content-Type"] = "application/json"
+            response.content = self.json_encode(request, {"errors": [self.format_error(e)]})
+            return response
+        finally:
+            self._incremental_delivery = False
+
+        payloads = self._incremental_payloads
+        self._incremental_payloads = None
+        if payloads is None or result is None or status_code != 200:
+            return HttpResponse(status=status_code, content=result, content_type="application/json")
+        if _in_transaction():
+            payloads = list(payloads)
+        return StreamingHttpResponse(
+            self._iter_multipart(request, result, payloads),
+            content_type=MULTIPART_CONTENT_TYPE,
+        )
+
+    def _iter_multipart(
+        self, request: HttpRequest, initial: Any, payloads: Iterable[Tuple[Any, bool]]
+    ) -> Iterator[bytes]:
+        yield _PART_HEADER + _as_bytes(initial)
+        for payload, has_next in payloads:
+            entry: dict[str, Any] = {}
+            if payload.is_stream:
+                entry["items"] = payload.items
+            else:
+                entry["data"] = payload.data
+            entry["path"] = payload.path
+            if payload.label is not None:
+                entry["label"] = payload.label
+            if payload.errors:
+                entry["errors"] = [self.format_error(error) for error in payload.errors]
+            body = self.json_encode(request, {"incremental": [entry], "hasNext": has_next})
+            yield _PART_HEADER + _as_bytes(body)
+        yield _CLOSING_BOUNDARY
+
+    def json_encode(self, request: HttpRequest, d: Any, pretty: bool = False):
+        if (
+            self._incremental_delivery
+            and self._incremental_payloads is not None
+            and isinstance(d, dict)
+            and "incremental" not in d
+        ):
+            d = {**d, "hasNext": self._incremental_payloads.has_next}
+        return super().json_encode(request, d, pretty=pretty)
+
+
+def _in_transaction() -> bool:
+    """Return whether a database connection is inside an atomic block."""
+    return any(
+        connection.in_atomic_block for connection in connections.all(initialized_only=True)
+    )
+
+
+def _as_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
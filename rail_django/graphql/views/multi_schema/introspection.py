@@ -8,7 +8,6 @@ from typing import Any, Dict
 from django.conf import settings
 from django.http import HttpRequest
 from django.utils import timezone as django_timezone
-from graphql import parse
 from graphql.language.ast import FieldNode, OperationDefinitionNode
 
 from ..utils import _get_effective_schema_settings
@@ -23,7 +22,7 @@ class IntrospectionMixin:
 
     def _is_introspection_query(self, query: str) -> bool:
         try:
-            document = parse(query)
+            document = self._get_cached_document(query).document
         except Exception:
             return False
 
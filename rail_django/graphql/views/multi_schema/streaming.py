@@ -0,0 +1,75 @@
+"""
+Streaming JSON responses for MultiSchemaGraphQLView.
+"""
+
+from typing import Any, Optional
+
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+
+from ....config_proxy import get_setting
+from ....utils.json_stream import DEFAULT_CHUNK_SIZE, get_json_encoder, iter_json
+
+try:
+    from graphene_django.views import HttpError
+except ImportError:
+    raise ImportError(
+        "graphene-django is required for GraphQL views. Install it with: pip install graphene-django"
+    )
+
+
+class StreamingResponseMixin:
+    """Mixin serializing single-operation results into a StreamingHttpResponse.
+
+    Enabled with ``performance_settings.streaming_responses``. The result is
+    encoded incrementally while it is sent, so a large list query never
+    materializes its full JSON string in memory. Batches, GraphiQL and
+    ``pretty`` responses keep the regular encoding.
+    """
+
+    _stream_json_responses = False
+
+    def _streaming_responses_enabled(self, schema_name: Optional[str]) -> bool:
+        return bool(
+            get_setting("performance_settings.streaming_responses", False, schema_name)
+        )
+
+    def _streaming_chunk_size(self, schema_name: Optional[str]) -> int:
+        value = get_setting(
+            "performance_settings.streaming_chunk_size", DEFAULT_CHUNK_SIZE, schema_name
+        )
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            return DEFAULT_CHUNK_SIZE
+
+    def _dispatch_streaming_response(self, request: HttpRequest) -> Optional[HttpResponse]:
+        """Execute the request and stream its result, or return None to use the regular path."""
+        if self.pretty or request.GET.get("pretty"):
+            return None
+        try:
+            data = self.parse_body(request)
+            if not isinstance(data, dict) or self.can_display_graphiql(request, data):
+                return None
+            self._stream_json_responses = True
+            result, status_code = self.get_response(request, data)
+        except HttpError as e:
+            self._stream_json_responses = False
+            response = e.response
+            response["Content-Type"] = "application/json"
+            response.content = self.json_encode(request, {"errors": [self.format_error(e)]})
+            return response
+        finally:
+            self._stream_json_responses = False
+
+        if result is None or isinstance(result, (str, bytes)):
+            return HttpResponse(status=status_code, content=result, content_type="application/json")
+        return StreamingHttpResponse(result, status=status_code, content_type="application/json")
+
+    def json_encode(self, request: HttpRequest, d: Any, pretty: bool = False):
+        if self._stream_json_responses and not pretty:
+            return iter_json(
+                d,
+                chunk_size=self._streaming_chunk_size(getattr(self, "_schema_name", None)),
+                encoder=get_json_encoder(),
+            )
+        return super().json_encode(request, d, pretty=pretty)
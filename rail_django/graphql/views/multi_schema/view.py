@@ -11,15 +11,26 @@ import graphene
 from django.conf import settings
 from django.core.exceptions import RequestDataTooBig
 from django.core.cache import cache
+from django.db import connection, transaction
 from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.http.response import HttpResponseBase
 from django.http.multipartparser import MultiPartParserError
 from django.http.request import RawPostDataException
 from django.utils.datastructures import MultiValueDict
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
-from graphql import ExecutionResult, OperationDefinitionNode, OperationType, parse
+from graphql import (
+    ExecutionResult,
+    OperationDefinitionNode,
+    OperationType,
+    execute,
+    get_operation_ast,
+    validate_schema,
+)
 
 try:
+    from graphene_django.constants import MUTATION_ERRORS_FLAG
+    from graphene_django.settings import graphene_settings
     from graphene_django.views import GraphQLView, HttpError, HttpResponseBadRequest
 except ImportError:
     raise ImportError(
@@ -33,9 +44,22 @@ from ..utils import (
     _is_test_graphql_endpoint_request,
 )
 from .authentication import AuthenticationMixin
+from .batch import BatchExecutionMixin
+from .conditional import REQUEST_RESULT_ERRORS_ATTR, ConditionalGetMixin
+from .incremental import IncrementalDeliveryMixin
 from .introspection import IntrospectionMixin
 from .responses import ResponseMixin
+from .streaming import StreamingResponseMixin
+from ....core.document_cache import (
+    REQUEST_DOCUMENT_ATTR,
+    CachedDocument,
+    get_document_cache,
+)
+from ....core.execution import PeerTrackingExecutionContext
+from ....core.incremental import execute_incremental
+from ....extensions.persisted_queries import REQUEST_PERSISTED_QUERY_ATTR
 from ....utils.csrf import enforce_csrf_for_session_auth
+from ....utils.request import get_request_json
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +69,22 @@ class SchemaRegistryUnavailable(Exception):
 
 
 @method_decorator(csrf_exempt, name="dispatch")
-class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMixin, GraphQLView):
+class MultiSchemaGraphQLView(
+    AuthenticationMixin,
+    IntrospectionMixin,
+    ResponseMixin,
+    ConditionalGetMixin,
+    BatchExecutionMixin,
+    StreamingResponseMixin,
+    IncrementalDeliveryMixin,
+    GraphQLView,
+):
     """
     GraphQL view that supports multiple schemas with per-schema configuration.
     """
 
     _placeholder_schema = None
+    execution_context_class = PeerTrackingExecutionContext
 
     def __init__(self, **kwargs):
         if self._placeholder_schema is None:
@@ -114,110 +148,153 @@ class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMi
         self._schema_name = schema_name
 
         try:
-            if not hasattr(request, "META") or not isinstance(request.META, dict): request.META = {}
-            if getattr(request, "content_type", None) and "CONTENT_TYPE" not in request.META:
-                request.META["CONTENT_TYPE"] = request.content_type
-
-            if not hasattr(request, "GET") or not isinstance(request.GET, (dict, MultiValueDict)): request.GET = {}
-            # Do not access request.POST/request.FILES eagerly; for multipart requests this can
-            # consume the data stream and make request.body unavailable (RawPostDataException).
-            request_post = request.__dict__.get("POST")
-            request_files = request.__dict__.get("FILES")
-            if request_post is not None and not isinstance(request_post, (dict, MultiValueDict)):
-                request.__dict__["POST"] = MultiValueDict()
-            if request_files is not None and not isinstance(request_files, (dict, MultiValueDict)):
-                request.__dict__["FILES"] = MultiValueDict()
-            if not hasattr(request, "COOKIES") or not isinstance(request.COOKIES, dict): request.COOKIES = {}
-            if _is_test_graphql_endpoint_request(request) and not _is_test_graphql_endpoint_enabled():
-                return self._test_endpoint_blocked_response(schema_name)
-            csrf_response = enforce_csrf_for_session_auth(
+            prepared = self._prepare_dispatch(request, schema_name)
+            if isinstance(prepared, HttpResponseBase):
+                return prepared
+            request_is_batch, parsed_body = prepared
+            return self._dispatch_prepared(request, request_is_batch, parsed_body, *args, **kwargs)
+        except Exception as e:
+            return self._dispatch_error_response(e, schema_name)
+
+    def _dispatch_prepared(self, request: HttpRequest, request_is_batch, parsed_body, *args, **kwargs):
+        """Execute a request accepted by ``_prepare_dispatch`` and build its response."""
+        plan = self._conditional_get_plan(request)
+        if plan is not None:
+            return self._dispatch_conditional_get(
                 request,
-                failure_message="CSRF validation failed for session-authenticated GraphQL request.",
+                plan,
+                lambda: self._dispatch_execute(request, request_is_batch, parsed_body, *args, **kwargs),
             )
-            if csrf_response is not None:
-                return csrf_response
-
-            request_is_batch = None
-            if request.method == "POST":
-                content_type = request.META.get("CONTENT_TYPE", "").lower()
-                if not content_type or content_type.startswith("application/json"):
-                    raw_body = self._safe_request_body(request)
-                    if raw_body is None:
-                        return JsonResponse({"errors": [{"message": "Request body is unavailable."}]}, status=400)
-                    if not raw_body:
-                        return JsonResponse({"errors": [{"message": "Request body is empty."}]}, status=400)
-                    try:
-                        parsed_body = json.loads(raw_body.decode("utf-8"))
-                        request_is_batch = isinstance(parsed_body, list)
-                    except Exception:
-                        return JsonResponse({"errors": [{"message": "Invalid JSON in request body"}]}, status=400)
-                    persisted_response = self._apply_persisted_query(
-                        request,
-                        schema_name,
-                        payload=parsed_body,
-                    )
-                    if persisted_response is not None: return persisted_response
-                elif content_type == "application/graphql":
-                    request_is_batch = False
-            elif request.method == "GET":
-                get_query = request.GET.get("query")
-                if get_query and not self._document_allows_get(str(get_query)):
-                    return JsonResponse(
-                        {
-                            "errors": [
-                                {
-                                    "message": "Only query operations may be executed with GET.",
-                                    "extensions": {"code": "GET_QUERY_ONLY"},
-                                }
-                            ]
-                        },
-                        status=405,
-                    )
-
-            schema_info = self._get_schema_info(schema_name)
-            if not schema_info: return self._schema_not_found_response(schema_name)
-            if not getattr(schema_info, "enabled", True): return self._schema_disabled_response(schema_name)
-
-            graphiql_access = self._check_graphiql_access(request, schema_name, schema_info)
-            if graphiql_access is not None: return graphiql_access
-
-            self._configure_for_schema(schema_info)
-            self._configure_middleware(schema_name)
-
-            if (request.method == "GET" and self.graphiql and not request.GET.get("query")
-                and not self._check_authentication(request, schema_info)):
-                return self._authentication_required_response()
-
-            self.schema = self._get_schema_instance(schema_name, schema_info)
-            if request.method == "GET" and not self.graphiql and not request.GET.get("query"):
-                return HttpResponseNotAllowed(["POST"])
-
-            original_batch = self.batch
-            if request_is_batch is False and self.batch: self.batch = False
-            try: return super().dispatch(request, *args, **kwargs)
-            finally: self.batch = original_batch
+        return self._dispatch_execute(request, request_is_batch, parsed_body, *args, **kwargs)
 
-        except SchemaRegistryUnavailable:
+    def _dispatch_execute(self, request: HttpRequest, request_is_batch, parsed_body, *args, **kwargs):
+        original_batch = self.batch
+        if request_is_batch is False and self.batch: self.batch = False
+        try:
+            if self.batch and request_is_batch:
+                batch_response = self._dispatch_concurrent_batch(request, parsed_body)
+                if batch_response is not None: return batch_response
+            elif not self.batch and request.method in ("GET", "POST"):
+                # Other methods are rejected with a 405 by graphene.
+                # Documents without @defer/@stream fall through to streaming.
+                if self._incremental_delivery_requested(request):
+                    incremental_response = self._dispatch_incremental_response(request)
+                    if incremental_response is not None: return incremental_response
+                if self._streaming_responses_enabled(self._schema_name):
+                    streaming_response = self._dispatch_streaming_response(request)
+                    if streaming_response is not None: return streaming_response
+            return super().dispatch(request, *args, **kwargs)
+        finally: self.batch = original_batch
+
+    def _prepare_dispatch(self, request: HttpRequest, schema_name: str):
+        """
+        Run the checks and schema setup preceding GraphQL execution.
+
+        Returns an HttpResponse that ends the request early, or a
+        ``(request_is_batch, parsed_body)`` tuple for the request body.
+        """
+        if not hasattr(request, "META") or not isinstance(request.META, dict): request.META = {}
+        if getattr(request, "content_type", None) and "CONTENT_TYPE" not in request.META:
+            request.META["CONTENT_TYPE"] = request.content_type
+
+        if not hasattr(request, "GET") or not isinstance(request.GET, (dict, MultiValueDict)): request.GET = {}
+        # Do not access request.POST/request.FILES eagerly; for multipart requests this can
+        # consume the data stream and make request.body unavailable (RawPostDataException).
+        request_post = request.__dict__.get("POST")
+        request_files = request.__dict__.get("FILES")
+        if request_post is not None and not isinstance(request_post, (dict, MultiValueDict)):
+            request.__dict__["POST"] = MultiValueDict()
+        if request_files is not None and not isinstance(request_files, (dict, MultiValueDict)):
+            request.__dict__["FILES"] = MultiValueDict()
+        if not hasattr(request, "COOKIES") or not isinstance(request.COOKIES, dict): request.COOKIES = {}
+        if _is_test_graphql_endpoint_request(request) and not _is_test_graphql_endpoint_enabled():
+            return self._test_endpoint_blocked_response(schema_name)
+        csrf_response = enforce_csrf_for_session_auth(
+            request,
+            failure_message="CSRF validation failed for session-authenticated GraphQL request.",
+        )
+        if csrf_response is not None:
+            return csrf_response
+
+        request_is_batch = None
+        parsed_body = None
+        if request.method == "POST":
+            content_type = request.META.get("CONTENT_TYPE", "").lower()
+            if not content_type or content_type.startswith("application/json"):
+                raw_body = self._safe_request_body(request)
+                if raw_body is None:
+                    return JsonResponse({"errors": [{"message": "Request body is unavailable."}]}, status=400)
+                if not raw_body:
+                    return JsonResponse({"errors": [{"message": "Request body is empty."}]}, status=400)
+                try:
+                    parsed_body = get_request_json(request, raw_body)
+                    request_is_batch = isinstance(parsed_body, list)
+                except Exception:
+                    return JsonResponse({"errors": [{"message": "Invalid JSON in request body"}]}, status=400)
+                persisted_response = self._apply_persisted_query(
+                    request,
+                    schema_name,
+                    payload=parsed_body,
+                )
+                if persisted_response is not None: return persisted_response
+            elif content_type == "application/graphql":
+                request_is_batch = False
+        elif request.method == "GET":
+            get_query = request.GET.get("query")
+            if get_query and not self._document_allows_get(str(get_query)):
+                return JsonResponse(
+                    {
+                        "errors": [
+                            {
+                                "message": "Only query operations may be executed with GET.",
+                                "extensions": {"code": "GET_QUERY_ONLY"},
+                            }
+                        ]
+                    },
+                    status=405,
+                )
+
+        schema_info = self._get_schema_info(schema_name)
+        if not schema_info: return self._schema_not_found_response(schema_name)
+        if not getattr(schema_info, "enabled", True): return self._schema_disabled_response(schema_name)
+
+        graphiql_access = self._check_graphiql_access(request, schema_name, schema_info)
+        if graphiql_access is not None: return graphiql_access
+
+        self._configure_for_schema(schema_info)
+        self._configure_middleware(schema_name)
+
+        if (request.method == "GET" and self.graphiql and not request.GET.get("query")
+            and not self._check_authentication(request, schema_info)):
+            return self._authentication_required_response()
+
+        self.schema = self._get_schema_instance(schema_name, schema_info)
+        if request.method == "GET" and not self.graphiql and not request.GET.get("query"):
+            return HttpResponseNotAllowed(["POST"])
+        return request_is_batch, parsed_body
+
+    def _dispatch_error_response(self, exc: Exception, schema_name: str) -> HttpResponseBase:
+        """Map an exception raised while dispatching to an error response."""
+        if isinstance(exc, SchemaRegistryUnavailable):
             return JsonResponse({"error": "Schema registry not available"}, status=503)
-        except RequestDataTooBig as e:
+        if isinstance(exc, RequestDataTooBig):
             return JsonResponse(
                 {
                     "errors": [
                         {
-                            "message": str(e),
+                            "message": str(exc),
                             "extensions": {"code": "payload_too_large"},
                         }
                     ]
                 },
                 status=413,
             )
-        except MultiPartParserError as e:
-            return JsonResponse({"errors": [{"message": str(e)}]}, status=400)
-        except Exception as e:
-            if "Invalid boundary" in str(e):
-                return JsonResponse({"errors": [{"message": "Invalid multipart boundary"}]}, status=400)
-            logger.exception(f"Error handling request for schema '{schema_name}': {e}")
-            return self._error_response(str(e))
+        if isinstance(exc, MultiPartParserError):
+            return JsonResponse({"errors": [{"message": str(exc)}]}, status=400)
+        if "Invalid boundary" in str(exc):
+            return JsonResponse({"errors": [{"message": "Invalid multipart boundary"}]}, status=400)
+        logger.error(f"Error handling request for schema '{schema_name}': {exc}", exc_info=exc)
+        return self._error_response(str(exc))
 
     def _safe_request_body(self, request: HttpRequest) -> bytes | None:
         """Read request.body safely when it may already be consumed by multipart parsing."""
@@ -228,7 +305,7 @@ class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMi
 
     def _document_allows_get(self, query: str) -> bool:
         try:
-            document = parse(query)
+            document = self._get_cached_document(query).document
         except Exception:
             return False
         for definition in getattr(document, "definitions", []) or []:
@@ -249,29 +326,155 @@ class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMi
                 except Exception as exc: logger.debug("Failed to read introspection cache: %s", exc); cached = None
                 if cached is not None: return ExecutionResult(data=cached, errors=None)
 
-        result = super().execute_graphql_request(request, data, query, variables, operation_name, show_graphiql)
+        result = self._execute_cached_document(request, query, variables, operation_name, show_graphiql)
+        try: setattr(request, REQUEST_RESULT_ERRORS_ATTR, bool(result is None or result.errors))
+        except Exception: pass
         if cache_key and result and not result.errors and result.data is not None:
             try: cache.set(cache_key, result.data)
             except Exception as exc: logger.debug("Failed to store introspection cache: %s", exc)
         return result
 
+    def _get_cached_document(self, query: str, schema_name: Optional[str] = None) -> CachedDocument:
+        """Return the parsed document for *query* from the shared document cache."""
+        schema_name = schema_name or getattr(self, "_schema_name", None)
+        return get_document_cache().get_document(
+            query,
+            schema_name=schema_name,
+            schema_version=self._get_schema_version(schema_name),
+        )
+
+    def _get_schema_version(self, schema_name: Optional[str]) -> int:
+        if not schema_name:
+            return 0
+        try:
+            from ....core.registry import schema_registry
+            builder = schema_registry.get_schema_builder(schema_name)
+            return int(builder.get_schema_version())
+        except Exception:
+            return 0
+
+    def _execute_cached_document(self, request, query, variables, operation_name, show_graphiql=False):
+        """Mirror GraphQLView.execute_graphql_request using the shared document cache."""
+        schema = self.schema.graphql_schema
+
+        schema_validation_errors = validate_schema(schema)
+        if schema_validation_errors:
+            return ExecutionResult(data=None, errors=schema_validation_errors)
+
+        compiled = getattr(request, REQUEST_PERSISTED_QUERY_ATTR, None)
+        if compiled is not None and compiled.query == query:
+            entry = compiled.entry
+        else:
+            try:
+                entry = self._get_cached_document(query)
+            except Exception as e:
+                return ExecutionResult(errors=[e])
+        document = entry.document
+
+        operation_ast = get_operation_ast(document, operation_name)
+        if request.method.lower() == "get" and operation_ast is not None and operation_ast.operation != OperationType.QUERY:
+            if show_graphiql:
+                return None
+            raise HttpError(
+                HttpResponseNotAllowed(
+                    ["POST"],
+                    f"Can only perform a {operation_ast.operation.value} operation from a POST request.",
+                )
+            )
+
+        validation_errors = get_document_cache().validate(
+            entry, schema, self.validation_rules, graphene_settings.MAX_VALIDATION_ERRORS
+        )
+        if validation_errors:
+            return ExecutionResult(data=None, errors=validation_errors)
+
+        try:
+            context = self.get_context(request)
+            try: setattr(context, REQUEST_DOCUMENT_ATTR, entry)
+            except Exception: pass
+            execute_options = {
+                "root_value": self.get_root_value(request),
+                "context_value": context,
+                "variable_values": variables,
+                "operation_name": operation_name,
+                "middleware": self.get_middleware(request),
+            }
+            if self.execution_context_class:
+                execute_options["execution_context_class"] = self.execution_context_class
+
+            def execute_operation():
+                if (
+                    operation_ast is not None
+                    and operation_ast.operation == OperationType.MUTATION
+                    and (
+                        graphene_settings.ATOMIC_MUTATIONS is True
+                        or connection.settings_dict.get("ATOMIC_MUTATIONS", False) is True
+                    )
+                ):
+                    with transaction.atomic():
+                        result = execute(schema, document, **execute_options)
+                        if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                            transaction.set_rollback(True)
+                    return result
+
+                if self._incremental_delivery:
+                    result, self._incremental_payloads = execute_incremental(
+                        schema, document, **execute_options
+                    )
+                    return result
+                return execute(schema, document, **execute_options)
+
+            return self._run_operation(
+                execute_operation, schema, document, operation_name, context, variables
+            )
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+
+    def _run_operation(self, execute_operation, schema, document, operation_name, context, variables):
+        """Run the schema's per-operation middleware once around *execute_operation*."""
+        compiled = getattr(self, "_compiled_middleware", None)
+        if compiled is None:
+            return execute_operation()
+        return compiled.run_operation(
+            execute_operation,
+            schema=schema,
+            document=document,
+            operation_name=operation_name,
+            context=context,
+            variable_values=variables,
+        )
+
+    def get_graphql_params(self, request, data):
+        query, variables, operation_name, id = super().get_graphql_params(request, data)
+        if not query:
+            compiled = getattr(request, REQUEST_PERSISTED_QUERY_ATTR, None)
+            if compiled is not None:
+                query = compiled.query
+        return query, variables, operation_name, id
+
     def get(self, request: HttpRequest, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
-    def get_context(self, request):
-        context = super().get_context(request)
+    def _get_request_user(self, request):
+        """Return the authenticated user of the request (session or token), or None."""
         user = self._resolve_request_user(request)
         if user and getattr(user, "is_authenticated", False):
+            return user
+        raw_auth = request.META.get("HTTP_AUTHORIZATION", "")
+        auth_header = raw_auth.strip()
+        header_lower = auth_header.lower()
+        if header_lower.startswith("bearer ") or header_lower.startswith("token "):
+            if self._validate_token(auth_header, {}, request=request):
+                user = self._resolve_request_user(request)
+                if user and getattr(user, "is_authenticated", False):
+                    return user
+        return None
+
+    def get_context(self, request):
+        context = super().get_context(request)
+        user = self._get_request_user(request)
+        if user is not None:
             context.user = user
-        else:
-            raw_auth = request.META.get("HTTP_AUTHORIZATION", "")
-            auth_header = raw_auth.strip()
-            header_lower = auth_header.lower()
-            if header_lower.startswith("bearer ") or header_lower.startswith("token "):
-                if self._validate_token(auth_header, {}, request=request):
-                    user = self._resolve_request_user(request)
-                    if user and getattr(user, "is_authenticated", False):
-                        context.user = user
         schema_match = getattr(request, "resolver_match", None)
         schema_name = self._resolve_schema_name(
             getattr(schema_match, "kwargs", {}).get("schema_name")
@@ -290,10 +493,8 @@ class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMi
             raw_body = self._safe_request_body(request)
             if raw_body is None:
                 raise HttpError(HttpResponseBadRequest("Request body is unavailable."))
-            try: body = raw_body.decode("utf-8")
-            except Exception as exc: raise HttpError(HttpResponseBadRequest(str(exc)))
             try:
-                request_json = json.loads(body)
+                request_json = get_request_json(request, raw_body)
                 if self.batch:
                     if isinstance(request_json, list):
                         if not request_json: raise HttpError(HttpResponseBadRequest("Received an empty list in the batch request."))
@@ -440,12 +641,12 @@ class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMi
 
     def _configure_middleware(self, schema_name: str) -> None:
         try:
-            from ....core.middleware import get_middleware_stack
+            from ....core.middleware import get_compiled_middleware
             from ....core.registry import schema_registry
             builder = schema_registry.get_schema_builder(schema_name)
             builder_middleware = list(getattr(builder, "get_middleware", lambda: [])())
-            core_middleware = get_middleware_stack(schema_name)
-            self.middleware = builder_middleware + core_middleware
+            self._compiled_middleware = get_compiled_middleware(schema_name, builder_middleware)
+            self.middleware = [self._compiled_middleware]
         except Exception as e:
             logger.exception("Failed to configure middleware for '%s': %s", schema_name, e)
             raise RuntimeError(
@@ -457,6 +658,7 @@ class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMi
         self.graphiql = schema_settings.get("enable_graphiql", True)
         if "pretty" in schema_settings: self.pretty = schema_settings["pretty"]
         if "batch" in schema_settings: self.batch = schema_settings["batch"]
+        self._configure_batch_concurrency(schema_settings)
 
     def check_schema_permissions(self, request: HttpRequest, schema_info: dict[str, Any]) -> bool:
         return self._check_authentication(request, schema_info)
@@ -468,8 +670,8 @@ class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMi
         raw_body = self._safe_request_body(request)
         if not raw_body:
             return ""
-        try: body = json.loads(raw_body.decode("utf-8"))
-        except Exception: return ""
+        try: body = get_request_json(request, raw_body)
+        except ValueError: return ""
         if isinstance(body, dict):
             query = body.get("query", "")
             return str(query) if query is not None else ""
@@ -491,18 +693,25 @@ class MultiSchemaGraphQLView(AuthenticationMixin, IntrospectionMixin, ResponseMi
             if not raw_body:
                 return None
             try:
-                payload = json.loads(raw_body.decode("utf-8"))
-            except Exception:
+                payload = get_request_json(request, raw_body)
+            except ValueError:
                 return None
         if not isinstance(payload, dict):
             return None
         try:
             from ....extensions.persisted_queries import resolve_persisted_query
-            resolution = resolve_persisted_query(payload, schema_name=schema_name)
+            resolution = resolve_persisted_query(
+                payload,
+                schema_name=schema_name,
+                validation_rules=self.validation_rules,
+            )
             if resolution.has_error():
                 return JsonResponse({"errors": [{"message": resolution.error_message, "extensions": {"code": resolution.error_code}}]}, status=200)
+            if resolution.compiled is not None:
+                setattr(request, REQUEST_PERSISTED_QUERY_ATTR, resolution.compiled)
+                return None
             if resolution.query and payload.get("query") != resolution.query:
+                # The payload is the request's decoded body, shared with parse_body.
                 payload["query"] = resolution.query
-                request._body = json.dumps(payload).encode("utf-8")
         except Exception: pass
         return None
@@ -0,0 +1,107 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+
+from rail_django.core.settings import FilteringSettings
+from rail_django.generators.filters.quick_search import (
+    QUICK_SEARCH_BACKENDS,
+    drop_quick_search_indexes,
+    ensure_quick_search_indexes,
+    get_quick_search_fields,
+    get_quick_search_models,
+    rebuild_quick_search_indexes,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create and maintain the search indexes of the quick fields declared "
+        "in GraphQLMeta (pg_trgm or tsvector GIN indexes on PostgreSQL, "
+        "FTS5 tables on SQLite)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            default=[],
+            help="Limit to app_label.ModelName (repeatable).",
+        )
+        parser.add_argument(
+            "--backend",
+            choices=[name for name in QUICK_SEARCH_BACKENDS if name != "icontains"],
+            default=None,
+            help="Index type (default: filtering_settings.quick_search_backend).",
+        )
+        parser.add_argument(
+            "--config",
+            default=None,
+            help="PostgreSQL text search configuration for the fts backend.",
+        )
+        parser.add_argument(
+            "--schema",
+            default="default",
+            help="Schema whose filtering settings provide the defaults.",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        action = parser.add_mutually_exclusive_group()
+        action.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Rebuild and compact the existing indexes.",
+        )
+        action.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the quick search indexes.",
+        )
+
+    def _targets(self, labels):
+        if not labels:
+            return get_quick_search_models()
+        targets = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as exc:
+                raise CommandError(f"Unknown model '{label}': {exc}")
+            targets.append((model, get_quick_search_fields(model)))
+        return targets
+
+    def handle(self, *args, **options):
+        settings = FilteringSettings.from_schema(options["schema"])
+        backend = options["backend"] or settings.quick_search_backend
+        if backend == "icontains":
+            self.stdout.write(
+                self.style.WARNING("quick_search_backend is 'icontains'; nothing to index.")
+            )
+            return
+        config = options["config"] or settings.fts_config
+        using = options["database"]
+
+        for model, fields in self._targets(options["model"]):
+            label = model._meta.label
+            try:
+                if options["drop"]:
+                    names = drop_quick_search_indexes(model, using=using)
+                    verb = "Dropped"
+                elif options["rebuild"]:
+                    names = rebuild_quick_search_indexes(model, using=using)
+                    verb = "Rebuilt"
+                elif not fields:
+                    self.stdout.write(
+                        self.style.WARNING(f"{label}: no indexable quick fields declared.")
+                    )
+                    continue
+                else:
+                    names = ensure_quick_search_indexes(
+                        model, fields, backend=backend, config=config, using=using
+                    )
+                    verb = "Created"
+            except (DatabaseError, ValueError) as exc:
+                self.stderr.write(self.style.WARNING(f"{label}: {exc}"))
+                continue
+            if names:
+                self.stdout.write(self.style.SUCCESS(f"{label}: {verb} {', '.join(names)}"))
+            else:
+                self.stdout.write(f"{label}: up to date")
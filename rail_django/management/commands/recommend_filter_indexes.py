@@ -0,0 +1,118 @@
+import os
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from rail_django.generators.filters.workload import (
+    IndexAdvisor,
+    build_index_migration,
+    get_filter_workload_recorder,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rank composite, partial and ordering index recommendations from the "
+        "recorded filter workload (filtering_settings.workload_sample_rate)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            default=[],
+            help="Limit to app_label.ModelName (repeatable).",
+        )
+        parser.add_argument(
+            "--min-count",
+            type=int,
+            default=5,
+            help="Minimum recorded occurrences of a filter shape (default: 5).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Maximum number of recommendations (default: 20).",
+        )
+        parser.add_argument(
+            "--no-explain",
+            action="store_true",
+            help="Do not run EXPLAIN on the recorded sample queries.",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument(
+            "--emit-migration",
+            metavar="APP_LABEL",
+            action="append",
+            default=[],
+            help="Write a migration adding the recommended indexes of this app.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print emitted migrations instead of writing them.",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Discard the recorded workload and exit.",
+        )
+
+    def handle(self, *args, **options):
+        recorder = get_filter_workload_recorder()
+        if options["reset"]:
+            recorder.reset()
+            self.stdout.write(self.style.SUCCESS("Filter workload cleared."))
+            return
+
+        model_filter = []
+        for label in options["model"]:
+            try:
+                model_filter.append(apps.get_model(label))
+            except (LookupError, ValueError) as exc:
+                raise CommandError(f"Unknown model '{label}': {exc}")
+
+        advisor = IndexAdvisor(
+            min_occurrences=options["min_count"],
+            explain=not options["no_explain"],
+            using=options["database"],
+        )
+        recommendations = advisor.recommend(recorder.load(), model_filter or None)
+        recommendations = recommendations[: max(0, options["limit"])]
+        if not recommendations:
+            self.stdout.write("No index recommendations for the recorded workload.")
+            return
+
+        for position, rec in enumerate(recommendations, start=1):
+            scan = {True: "full scan", False: "index scan", None: "plan unknown"}[rec.full_scan]
+            self.stdout.write(
+                f"{position}. [{rec.kind}] {rec.describe()} "
+                f"score={rec.score:g} seen={rec.occurrences} ({scan})"
+            )
+
+        for app_label in options["emit_migration"]:
+            self._emit_migration(app_label, recommendations, options["dry_run"])
+
+    def _emit_migration(self, app_label, recommendations, dry_run):
+        from django.db.migrations.writer import MigrationWriter
+
+        try:
+            apps.get_app_config(app_label)
+        except LookupError as exc:
+            raise CommandError(str(exc))
+        migration = build_index_migration(app_label, recommendations)
+        if not migration.operations:
+            self.stdout.write(f"{app_label}: no recommended indexes.")
+            return
+        writer = MigrationWriter(migration)
+        if dry_run:
+            self.stdout.write(writer.as_string())
+            return
+        path = writer.path
+        if os.path.exists(path):
+            raise CommandError(f"Migration file already exists: {path}")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(writer.as_string())
+        self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
@@ -12,6 +12,7 @@ from django.http import HttpRequest, HttpResponse
 from django.utils.deprecation import MiddlewareMixin
 
 from ...core.services import get_rate_limiter
+from ...utils.request import get_request_json
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +54,7 @@ class GraphQLRateLimitMiddleware(MiddlewareMixin):
     def _is_login_request(self, request: HttpRequest) -> bool:
         try:
             if hasattr(request, "body") and request.body:
-                body = json.loads(request.body.decode("utf-8"))
+                body = get_request_json(request)
                 query = body.get("query", "").lower()
                 return "login" in query or ("mutation" in query and "login" in query)
         except Exception: pass
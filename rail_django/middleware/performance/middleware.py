@@ -2,7 +2,6 @@
 Middleware for GraphQL performance monitoring.
 """
 
-import json
 import logging
 import time
 from typing import Optional
@@ -15,6 +14,7 @@ from .aggregator import get_performance_aggregator
 from .collectors import QueryMetricsCollector
 from .metrics import RequestMetrics
 from ...extensions.optimization import get_performance_monitor
+from ...utils.request import get_request_json
 
 logger = logging.getLogger(__name__)
 
@@ -142,8 +142,8 @@ class GraphQLPerformanceMiddleware(MiddlewareMixin):
             return "unknown"
         if request.method == "POST" and request.body:
             try:
-                payload = json.loads(request.body.decode("utf-8"))
-            except Exception:
+                payload = get_request_json(request)
+            except ValueError:
                 payload = {}
             if isinstance(payload, dict):
                 op_name = payload.get("operationName") or payload.get("operation_name")
@@ -172,8 +172,8 @@ class GraphQLPerformanceMiddleware(MiddlewareMixin):
         if not request.body:
             return ""
         try:
-            payload = json.loads(request.body.decode("utf-8"))
-        except Exception:
+            payload = get_request_json(request)
+        except ValueError:
             return ""
         if isinstance(payload, dict):
             query = payload.get("query", "")
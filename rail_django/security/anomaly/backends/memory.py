@@ -0,0 +1,81 @@
+import threading
+import time
+from typing import Optional, Tuple
+
+
+class InMemoryAnomalyBackend:
+    """
+    Process-local anomaly backend with the same interface as the Redis one.
+
+    Counters and blocks live in this process only, which makes it suited to
+    tests and single-process deployments.
+    """
+
+    def __init__(self):
+        self._counters: dict[str, list[float]] = {}
+        self._blocked: dict[str, float] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def increment_counter(
+        self,
+        key: str,
+        window_seconds: int = 300,
+        max_entries: int = 1000
+    ) -> Tuple[int, bool]:
+        """
+        Increment a sliding window counter.
+
+        Returns:
+            Tuple of (current_count, is_new_window)
+        """
+        now = time.time()
+        window_start = now - window_seconds
+        with self._lock:
+            entries = self._counters.setdefault(key, [])
+            kept = [stamp for stamp in entries if stamp > window_start]
+            removed = len(kept) != len(entries)
+            kept.append(now)
+            self._counters[key] = kept[-max_entries:]
+            return len(kept), removed
+
+    def get_counter(self, key: str, window_seconds: int = 300) -> int:
+        """Get current count in sliding window."""
+        window_start = time.time() - window_seconds
+        with self._lock:
+            return sum(1 for stamp in self._counters.get(key, []) if stamp > window_start)
+
+    def is_blocked(self, key: str) -> bool:
+        """Check if a key is in the blocklist."""
+        with self._lock:
+            expires_at = self._blocked.get(key)
+        return expires_at is not None and expires_at > time.time()
+
+    def block(self, key: str, duration_seconds: int = 3600) -> None:
+        """Add key to blocklist."""
+        with self._lock:
+            self._blocked[key] = time.time() + duration_seconds
+            self._version += 1
+
+    def unblock(self, key: str) -> None:
+        """Remove key from blocklist."""
+        with self._lock:
+            if self._blocked.pop(key, None) is not None:
+                self._version += 1
+
+    def get_blocklist_version(self) -> Optional[str]:
+        """Return a token that changes whenever the blocklist changes."""
+        return str(self._version)
+
+    def get_blocked_keys(self) -> dict[str, float]:
+        """Return active blocked keys mapped to their expiry timestamp."""
+        now = time.time()
+        with self._lock:
+            return {key: expires for key, expires in self._blocked.items() if expires > now}
+
+    def clear(self) -> None:
+        """Drop all counters and blocks."""
+        with self._lock:
+            self._counters.clear()
+            self._blocked.clear()
+            self._version += 1
@@ -16,6 +16,7 @@ class RedisAnomalyBackend:
     def __init__(self, redis_client=None):
         self.redis = redis_client or self._get_default_client()
         self.prefix = getattr(settings, "SECURITY_REDIS_PREFIX", "rail:security:")
+        self._blocklist_index_seeded = False
 
     def _get_default_client(self):
         try:
@@ -87,10 +88,76 @@ class RedisAnomalyBackend:
         """Add key to blocklist."""
         if not self.redis:
             return
-        self.redis.setex(f"{self.prefix}blocked:{key}", duration_seconds, "1")
+        pipe = self.redis.pipeline()
+        pipe.setex(f"{self.prefix}blocked:{key}", duration_seconds, "1")
+        # Index and version let processes keep a local snapshot of the blocklist
+        pipe.zadd(self._blocklist_index_key, {key: time.time() + duration_seconds})
+        pipe.incr(self._blocklist_version_key)
+        pipe.execute()
 
     def unblock(self, key: str) -> None:
         """Remove key from blocklist."""
         if not self.redis:
             return
-        self.redis.delete(f"{self.prefix}blocked:{key}")
+        pipe = self.redis.pipeline()
+        pipe.delete(f"{self.prefix}blocked:{key}")
+        pipe.zrem(self._blocklist_index_key, key)
+        pipe.incr(self._blocklist_version_key)
+        pipe.execute()
+
+    @property
+    def _blocklist_index_key(self) -> str:
+        return f"{self.prefix}blocked-index"
+
+    @property
+    def _blocklist_version_key(self) -> str:
+        return f"{self.prefix}blocked-version"
+
+    def get_blocklist_version(self) -> Optional[str]:
+        """Return a token that changes whenever the blocklist changes."""
+        if not self.redis:
+            return None
+        version = self.redis.get(self._blocklist_version_key)
+        if isinstance(version, bytes):
+            version = version.decode("utf-8")
+        return version
+
+    def get_blocked_keys(self) -> dict[str, float]:
+        """Return active blocked keys mapped to their expiry timestamp."""
+        if not self.redis:
+            return {}
+        if not self._blocklist_index_seeded:
+            self._seed_blocklist_index()
+        now = time.time()
+        pipe = self.redis.pipeline()
+        pipe.zremrangebyscore(self._blocklist_index_key, 0, now)
+        pipe.zrangebyscore(self._blocklist_index_key, now, "+inf", withscores=True)
+        _, entries = pipe.execute()
+        blocked: dict[str, float] = {}
+        for member, expires_at in entries:
+            if isinstance(member, bytes):
+                member = member.decode("utf-8")
+            blocked[member] = float(expires_at)
+        return blocked
+
+    def _seed_blocklist_index(self) -> None:
+        """Index blocked keys created before the index existed.
+
+        Runs once per backend, on the first snapshot load. Keys already in the
+        index keep their entry.
+        """
+        marker = f"{self.prefix}blocked:"
+        now = time.time()
+        entries: dict[str, float] = {}
+        for full_key in self.redis.scan_iter(match=f"{marker}*"):
+            if isinstance(full_key, bytes):
+                full_key = full_key.decode("utf-8")
+            ttl_ms = self.redis.pttl(full_key)
+            if ttl_ms == -2:
+                # Expired since the scan.
+                continue
+            expires_at = float("inf") if ttl_ms < 0 else now + ttl_ms / 1000
+            entries[full_key[len(marker):]] = expires_at
+        if entries:
+            self.redis.zadd(self._blocklist_index_key, entries, nx=True)
+        self._blocklist_index_seeded = True
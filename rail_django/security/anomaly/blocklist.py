@@ -0,0 +1,70 @@
+import logging
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_UNLOADED = object()
+
+
+class BlocklistSnapshot:
+    """
+    Process-local copy of the anomaly blocklist.
+
+    Lookups are answered from memory. At most once per ``refresh_interval``
+    seconds the backend's blocklist version is polled, and the blocked keys
+    are reloaded only when it changed. Backends without
+    ``get_blocklist_version``/``get_blocked_keys``, or a ``refresh_interval``
+    of 0, fall back to asking the backend on every lookup.
+    """
+
+    def __init__(self, backend: Any, refresh_interval: float = 1.0):
+        self.backend = backend
+        self.refresh_interval = max(0.0, float(refresh_interval or 0))
+        self._blocked: dict[str, float] = {}
+        self._version: Any = _UNLOADED
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.refresh_interval > 0
+            and hasattr(self.backend, "get_blocklist_version")
+            and hasattr(self.backend, "get_blocked_keys")
+        )
+
+    def is_blocked(self, key: str) -> bool:
+        """Check if a key is blocked, using the local snapshot when possible."""
+        if not self.enabled:
+            return self.backend.is_blocked(key)
+        if not self._refresh_if_due():
+            return self.backend.is_blocked(key)
+        expires_at = self._blocked.get(key)
+        return expires_at is not None and expires_at > time.time()
+
+    def invalidate(self) -> None:
+        """Force the next lookup to poll the backend."""
+        with self._lock:
+            self._checked_at = 0.0
+
+    def _refresh_if_due(self) -> bool:
+        """Refresh the snapshot when due; return False if it is unusable."""
+        now = time.monotonic()
+        if self._version is not _UNLOADED and now - self._checked_at < self.refresh_interval:
+            return True
+        with self._lock:
+            if self._version is not _UNLOADED and now - self._checked_at < self.refresh_interval:
+                return True
+            try:
+                version = self.backend.get_blocklist_version()
+                if version != self._version:
+                    self._blocked = dict(self.backend.get_blocked_keys())
+                    self._version = version
+            except Exception as exc:
+                logger.warning("Failed to refresh blocklist snapshot: %s", exc)
+                if self._version is _UNLOADED:
+                    return False
+            self._checked_at = now
+        return True
@@ -2,7 +2,9 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 from django.conf import settings
+from django.utils.module_loading import import_string
 from .backends.redis import RedisAnomalyBackend
+from .blocklist import BlocklistSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +25,17 @@ class AnomalyDetector:
     Detects anomalous patterns like brute force attacks.
 
     Uses Redis for distributed counting across multiple processes/servers.
+    Blocklist lookups are served from a process-local snapshot refreshed
+    every ``SECURITY_BLOCKLIST_REFRESH_INTERVAL`` seconds.
     """
 
     def __init__(self, backend: Optional[RedisAnomalyBackend] = None):
         self.backend = backend or RedisAnomalyBackend()
         self._load_config()
+        self.blocklist = BlocklistSnapshot(
+            self.backend,
+            refresh_interval=getattr(settings, "SECURITY_BLOCKLIST_REFRESH_INTERVAL", 1.0),
+        )
 
     def _load_config(self):
         thresholds = getattr(settings, "SECURITY_ANOMALY_THRESHOLDS", {})
@@ -56,7 +64,7 @@ class AnomalyDetector:
         Call this after each failed login attempt.
         """
         # Check if already blocked
-        if self.backend.is_blocked(f"ip:{client_ip}"):
+        if self.blocklist.is_blocked(f"ip:{client_ip}"):
             return DetectionResult(
                 detected=True,
                 reason="ip_blocked",
@@ -73,6 +81,7 @@ class AnomalyDetector:
         if ip_count >= self.login_failure_ip_threshold:
             if self.auto_block_enabled:
                 self.backend.block(f"ip:{client_ip}", self.block_duration)
+                self.blocklist.invalidate()
             return DetectionResult(
                 detected=True,
                 reason="ip_threshold_exceeded",
@@ -113,7 +122,7 @@ class AnomalyDetector:
 
         Call this on each request.
         """
-        if self.backend.is_blocked(f"ip:{client_ip}"):
+        if self.blocklist.is_blocked(f"ip:{client_ip}"):
             return DetectionResult(detected=True, reason="ip_blocked")
 
         key = f"rate:{endpoint}:{client_ip}"
@@ -134,24 +143,39 @@ class AnomalyDetector:
 
     def is_ip_blocked(self, client_ip: str) -> bool:
         """Check if an IP is blocked."""
-        return self.backend.is_blocked(f"ip:{client_ip}")
+        return self.blocklist.is_blocked(f"ip:{client_ip}")
 
     def block_ip(self, client_ip: str, duration: Optional[int] = None) -> None:
         """Manually block an IP."""
         self.backend.block(f"ip:{client_ip}", duration or self.block_duration)
+        self.blocklist.invalidate()
 
     def unblock_ip(self, client_ip: str) -> None:
         """Unblock an IP."""
         self.backend.unblock(f"ip:{client_ip}")
+        self.blocklist.invalidate()
 
 
 # Global detector instance
 _detector: Optional[AnomalyDetector] = None
 
 
+def _build_backend():
+    backend_path = getattr(settings, "SECURITY_ANOMALY_BACKEND", None)
+    if not backend_path:
+        return RedisAnomalyBackend()
+    return import_string(backend_path)()
+
+
 def get_anomaly_detector() -> AnomalyDetector:
     """Get the global anomaly detector."""
     global _detector
     if _detector is None:
-        _detector = AnomalyDetector()
+        _detector = AnomalyDetector(backend=_build_backend())
     return _detector
+
+
+def reset_anomaly_detector() -> None:
+    """Drop the global detector so it is rebuilt from current settings."""
+    global _detector
+    _detector = None
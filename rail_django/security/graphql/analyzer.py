@@ -4,7 +4,7 @@ GraphQL query security analyzer.
 
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from graphql import (
@@ -15,6 +15,7 @@ from graphql import (
     GraphQLSchema,
     InlineFragmentNode,
     OperationDefinitionNode,
+    VariableNode,
 )
 
 from .config import SecurityConfig, SecurityThreatLevel
@@ -36,6 +37,30 @@ class QueryAnalysisResult:
     threat_level: SecurityThreatLevel
     warnings: list[str]
     blocked_reasons: list[str]
+    fields: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class DocumentAnalysis:
+    """
+    Analyse d'un document indépendante des variables et de l'utilisateur.
+
+    Calculée une seule fois par document puis partagée entre les requêtes ;
+    seuls les champs dont la taille de liste dépend d'une variable
+    (``variable_fields``) sont réévalués à chaque requête.
+    """
+    complexity: int
+    depth: int
+    field_count: int
+    operation_count: int
+    has_introspection: bool
+    introspection_only: bool
+    has_mutations: bool
+    fields: tuple[str, ...]
+    variable_fields: tuple[tuple[FieldNode, Any, int], ...]
+
+
+_LIST_SIZE_ARGUMENTS = ("first", "last", "limit")
 
 
 class GraphQLSecurityAnalyzer:
@@ -83,7 +108,63 @@ class GraphQLSecurityAnalyzer:
         """
         start_time = time.time()
 
-        # Initialiser le résultat
+        analysis = self.analyze_document(document, schema)
+
+        # Seule la complexité des champs paramétrés par variable est recalculée
+        complexity = analysis.complexity
+        for field_node, parent_type, depth in analysis.variable_fields:
+            complexity += self._calculate_field_complexity(
+                field_node, parent_type, depth, variables
+            )
+
+        result = QueryAnalysisResult(
+            complexity=complexity,
+            depth=analysis.depth,
+            field_count=analysis.field_count,
+            operation_count=analysis.operation_count,
+            has_introspection=analysis.has_introspection,
+            introspection_only=analysis.introspection_only,
+            has_mutations=analysis.has_mutations,
+            execution_time_estimate=0.0,
+            threat_level=SecurityThreatLevel.LOW,
+            warnings=[],
+            blocked_reasons=[],
+            fields=list(analysis.fields),
+        )
+
+        # Calculer le temps d'exécution estimé
+        result.execution_time_estimate = time.time() - start_time
+
+        # Déterminer le niveau de menace
+        result.threat_level = self._calculate_threat_level(result)
+
+        # Vérifier les limites de sécurité
+        self._check_security_limits(result, user)
+
+        return result
+
+    def analyze_document(self, document: DocumentNode,
+                         schema: GraphQLSchema) -> DocumentAnalysis:
+        """
+        Retourne l'analyse statique du document, mémorisée par document.
+
+        Args:
+            document: Document GraphQL à analyser
+            schema: Schéma GraphQL
+
+        Returns:
+            Analyse indépendante des variables et de l'utilisateur
+        """
+        from ...core.document_cache import get_document_cache
+
+        multipliers = tuple(sorted((self.config.complexity_multipliers or {}).items()))
+        key = ("security_analysis", type(self), multipliers, schema)
+        return get_document_cache().get_artifact(
+            document, key, lambda: self._build_document_analysis(document, schema)
+        )
+
+    def _build_document_analysis(self, document: DocumentNode,
+                                 schema: GraphQLSchema) -> DocumentAnalysis:
         result = QueryAnalysisResult(
             complexity=0,
             depth=0,
@@ -97,6 +178,7 @@ class GraphQLSecurityAnalyzer:
             warnings=[],
             blocked_reasons=[]
         )
+        variable_fields: list[tuple[FieldNode, Any, int]] = []
 
         # Analyser chaque opération
         fragments = {
@@ -121,25 +203,29 @@ class GraphQLSecurityAnalyzer:
                     depth=1,
                     parent_type=schema.query_type if definition.operation.value == 'query' else schema.mutation_type,
                     fragments=fragments,
+                    variable_fields=variable_fields,
                 )
 
         if not result.has_introspection:
             result.introspection_only = False
 
-        # Calculer le temps d'exécution estimé
-        result.execution_time_estimate = time.time() - start_time
-
-        # Déterminer le niveau de menace
-        result.threat_level = self._calculate_threat_level(result)
-
-        # Vérifier les limites de sécurité
-        self._check_security_limits(result, user)
-
-        return result
+        return DocumentAnalysis(
+            complexity=result.complexity,
+            depth=result.depth,
+            field_count=result.field_count,
+            operation_count=result.operation_count,
+            has_introspection=result.has_introspection,
+            introspection_only=result.introspection_only,
+            has_mutations=result.has_mutations,
+            fields=tuple(dict.fromkeys(result.fields)),
+            variable_fields=tuple(variable_fields),
+        )
 
     def _analyze_selection_set(self, selection_set, schema: GraphQLSchema,
                                result: QueryAnalysisResult, depth: int,
-                               parent_type=None, fragments: Optional[dict[str, Any]] = None):
+                               parent_type=None, fragments: Optional[dict[str, Any]] = None,
+                               variable_fields: Optional[list] = None,
+                               path: tuple[str, ...] = ()):
         """
         Analyse un ensemble de sélections GraphQL.
 
@@ -149,6 +235,8 @@ class GraphQLSecurityAnalyzer:
             result: Résultat de l'analyse à mettre à jour
             depth: Profondeur actuelle
             parent_type: Type parent
+            variable_fields: Champs dont la complexité dépend des variables
+            path: Chemin des champs parents
         """
         if not selection_set or not selection_set.selections:
             return
@@ -159,6 +247,8 @@ class GraphQLSecurityAnalyzer:
         for selection in selection_set.selections:
             if isinstance(selection, FieldNode):
                 result.field_count += 1
+                field_path = path + (selection.name.value,)
+                result.fields.append(".".join(field_path))
 
                 # Vérifier l'introspection
                 if selection.name.value in ['__schema', '__type']:
@@ -167,10 +257,13 @@ class GraphQLSecurityAnalyzer:
                     result.introspection_only = False
 
                 # Calculer la complexité du champ
-                field_complexity = self._calculate_field_complexity(
-                    selection, parent_type, depth
-                )
-                result.complexity += field_complexity
+                if variable_fields is not None and self._has_variable_list_size(selection):
+                    variable_fields.append((selection, parent_type, depth))
+                else:
+                    field_complexity = self._calculate_field_complexity(
+                        selection, parent_type, depth
+                    )
+                    result.complexity += field_complexity
 
                 # Analyser les sous-sélections
                 if selection.selection_set:
@@ -182,6 +275,8 @@ class GraphQLSecurityAnalyzer:
                         depth + 1,
                         field_type,
                         fragments,
+                        variable_fields,
+                        field_path,
                     )
 
             elif isinstance(selection, InlineFragmentNode):
@@ -192,6 +287,8 @@ class GraphQLSecurityAnalyzer:
                     depth,
                     parent_type,
                     fragments,
+                    variable_fields,
+                    path,
                 )
 
             elif isinstance(selection, FragmentSpreadNode):
@@ -205,9 +302,19 @@ class GraphQLSecurityAnalyzer:
                             depth,
                             parent_type,
                             fragments,
+                            variable_fields,
+                            path,
                         )
 
-    def _calculate_field_complexity(self, field: FieldNode, parent_type, depth: int) -> int:
+    @staticmethod
+    def _has_variable_list_size(field: FieldNode) -> bool:
+        return any(
+            arg.name.value in _LIST_SIZE_ARGUMENTS and isinstance(arg.value, VariableNode)
+            for arg in field.arguments or ()
+        )
+
+    def _calculate_field_complexity(self, field: FieldNode, parent_type, depth: int,
+                                    variables: Optional[dict] = None) -> int:
         """
         Calcule la complexité d'un champ.
 
@@ -215,6 +322,7 @@ class GraphQLSecurityAnalyzer:
             field: Nœud de champ GraphQL
             parent_type: Type parent
             depth: Profondeur du champ
+            variables: Variables de la requête, pour les tailles de liste
 
         Returns:
             Complexité calculée du champ
@@ -236,12 +344,15 @@ class GraphQLSecurityAnalyzer:
         # Champs de liste
         if field.arguments:
             for arg in field.arguments:
-                if arg.name.value in ['first', 'last', 'limit']:
+                if arg.name.value in _LIST_SIZE_ARGUMENTS:
                     # Augmenter la complexité basée sur la taille de la liste
                     try:
-                        limit_value = int(arg.value.value)
+                        if isinstance(arg.value, VariableNode):
+                            limit_value = int((variables or {})[arg.value.name.value])
+                        else:
+                            limit_value = int(arg.value.value)
                         multiplier *= min(limit_value / 10, 10)  # Cap à 10x
-                    except (ValueError, AttributeError):
+                    except (ValueError, TypeError, KeyError, AttributeError):
                         multiplier *= 2.0
 
         # Pénalité de profondeur
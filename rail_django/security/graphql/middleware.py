@@ -3,8 +3,9 @@ GraphQL security middleware.
 """
 
 import logging
-from graphql import DocumentNode, GraphQLError, GraphQLResolveInfo
+from graphql import GraphQLError, GraphQLResolveInfo
 
+from ...core.document_cache import get_request_document
 from ...core.services import get_rate_limiter
 from ..api import security, EventType, Outcome
 from .analyzer import GraphQLSecurityAnalyzer
@@ -53,8 +54,7 @@ def create_security_middleware(config: SecurityConfig = None):
         # Analyser la requete si c'est le champ racine
         if is_root_field:
             try:
-                fragments = list(getattr(info, "fragments", {}).values())
-                document = DocumentNode(definitions=[info.operation] + fragments)
+                document = get_request_document(info)
                 analysis = analyzer.analyze_query(
                     document,
                     info.schema,
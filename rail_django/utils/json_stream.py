@@ -0,0 +1,191 @@
+"""
+Incremental JSON encoding for large GraphQL responses.
+
+``iter_json`` walks a decoded GraphQL result and yields UTF-8 chunks of
+roughly ``chunk_size`` bytes instead of building the whole document as one
+string. The output is identical to ``json.dumps(value, separators=(",", ":"))``
+for JSON-native values. Decimal, datetime, date, time and UUID values, which
+may appear inside generic scalars, are written as strings like the rail
+scalars serialize them; any other object falls back to ``str()`` so a
+response is never aborted halfway through.
+"""
+
+import datetime
+import json
+import logging
+import threading
+import uuid
+from decimal import Decimal
+from typing import Any, Callable, Iterator, Optional, Union
+
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_encode_string = json.encoder.encode_basestring_ascii
+_float_repr = float.__repr__
+_int_repr = int.__repr__
+
+_INFINITY = float("inf")
+
+_encoder_cache: dict[str, Optional[Callable[[Any], Union[bytes, str]]]] = {}
+_encoder_lock = threading.Lock()
+
+
+def get_json_encoder() -> Optional[Callable[[Any], Union[bytes, str]]]:
+    """
+    Return the optional fast encoder used for list items of streamed results.
+
+    ``performance_settings.json_encoder`` may hold the dotted path of a
+    callable returning the compact JSON encoding of an object as ``bytes``
+    or ``str`` (for example ``"orjson.dumps"``). Returns None when unset or
+    when the callable cannot be imported.
+    """
+    from ..config_proxy import get_setting
+
+    path = get_setting("performance_settings.json_encoder", None)
+    if not path:
+        return None
+    if callable(path):
+        return path
+    path = str(path)
+    if path in _encoder_cache:
+        return _encoder_cache[path]
+    with _encoder_lock:
+        try:
+            encoder = import_string(path)
+        except ImportError:
+            logger.warning(
+                "JSON encoder '%s' could not be imported; using the built-in encoder",
+                path,
+            )
+            encoder = None
+        _encoder_cache[path] = encoder
+    return encoder
+
+
+def _encode_float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+    return _float_repr(value)
+
+
+def _encode_key(key: Any) -> str:
+    if isinstance(key, str):
+        return _encode_string(key)
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, float):
+        return _encode_string(_encode_float(key))
+    if isinstance(key, int):
+        return _encode_string(_int_repr(key))
+    return _encode_string(str(key))
+
+
+def _encode_scalar(value: Any) -> str:
+    """Encode a non-container value, using fast paths for common types."""
+    if isinstance(value, str):
+        return _encode_string(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return _int_repr(value)
+    if isinstance(value, float):
+        return _encode_float(value)
+    if isinstance(value, Decimal):
+        return _encode_string(str(value))
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return _encode_string(value.isoformat())
+    if isinstance(value, uuid.UUID):
+        return _encode_string(str(value))
+    return _encode_string(str(value))
+
+
+def _iter_pieces(
+    value: Any, encoder: Optional[Callable[[Any], Union[bytes, str]]]
+) -> Iterator[Union[bytes, str]]:
+    if isinstance(value, dict):
+        if not value:
+            yield "{}"
+            return
+        first = True
+        for key, item in value.items():
+            yield ("{" if first else ",") + _encode_key(key) + ":"
+            first = False
+            if isinstance(item, (dict, list, tuple)):
+                yield from _iter_pieces(item, encoder)
+            else:
+                yield _encode_scalar(item)
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            yield "[]"
+            return
+        first = True
+        for item in value:
+            yield "[" if first else ","
+            first = False
+            if isinstance(item, (dict, list, tuple)):
+                encoded = None
+                if encoder is not None:
+                    try:
+                        encoded = encoder(item)
+                    except (TypeError, ValueError):
+                        encoded = None
+                if encoded is not None:
+                    yield encoded
+                else:
+                    yield from _iter_pieces(item, encoder)
+            else:
+                yield _encode_scalar(item)
+        yield "]"
+    else:
+        yield _encode_scalar(value)
+
+
+def iter_json(
+    value: Any,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoder: Optional[Callable[[Any], Union[bytes, str]]] = None,
+) -> Iterator[bytes]:
+    """
+    Yield the compact JSON encoding of ``value`` as UTF-8 chunks.
+
+    Args:
+        value: The value to encode.
+        chunk_size: Approximate size in bytes of each yielded chunk.
+        encoder: Optional fast encoder applied to each container inside a
+            list. Items it rejects with TypeError/ValueError are encoded by
+            the built-in walker.
+    """
+    buffer: list[bytes] = []
+    size = 0
+    for piece in _iter_pieces(value, encoder):
+        if isinstance(piece, str):
+            piece = piece.encode("utf-8")
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "get_json_encoder", "iter_json"]
@@ -1,12 +1,25 @@
 """
 Request utilities for Rail Django.
 
-This module provides helpers for resolving authenticated users from requests.
+This module provides helpers for resolving authenticated users from requests
+and for decoding JSON request bodies once per request.
 """
 
+import json
+import logging
+import threading
 from typing import Any, Callable, Optional
 
 from django.http import HttpRequest
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Attribute holding ``(raw_body, payload, error)`` for the decoded JSON body.
+REQUEST_JSON_ATTR = "_rail_json_body"
+
+_decoder_cache: dict[str, Callable[[bytes], Any]] = {}
+_decoder_lock = threading.Lock()
 
 
 def resolve_request_user(
@@ -50,4 +63,80 @@ def resolve_request_user(
     return user
 
 
-__all__ = ["resolve_request_user"]
+def _default_json_loads(raw_body: bytes) -> Any:
+    return json.loads(raw_body.decode("utf-8"))
+
+
+def get_json_decoder() -> Callable[[bytes], Any]:
+    """
+    Return the callable used to decode JSON request bodies.
+
+    ``performance_settings.json_decoder`` may hold the dotted path of a
+    callable accepting the raw body bytes (for example ``"orjson.loads"``).
+    When it is unset or cannot be imported, the standard library decoder
+    is used.
+    """
+    from ..config_proxy import get_setting
+
+    path = get_setting("performance_settings.json_decoder", None)
+    if not path:
+        return _default_json_loads
+    if callable(path):
+        return path
+    path = str(path)
+    decoder = _decoder_cache.get(path)
+    if decoder is not None:
+        return decoder
+    with _decoder_lock:
+        try:
+            decoder = import_string(path)
+        except ImportError:
+            logger.warning(
+                "JSON decoder '%s' could not be imported; using json.loads", path
+            )
+            decoder = _default_json_loads
+        _decoder_cache[path] = decoder
+    return decoder
+
+
+def get_request_json(request: HttpRequest, raw_body: Optional[bytes] = None) -> Any:
+    """
+    Decode the JSON body of a request, at most once per request.
+
+    The payload is stored on the request together with the body it was
+    decoded from, so middlewares and the GraphQL view share a single decode.
+    Callers may mutate the returned payload (for example to substitute a
+    persisted query) and later calls will see the change.
+
+    Args:
+        request: The Django request.
+        raw_body: The request body when already read by the caller.
+
+    Returns:
+        The decoded payload, or None when the body is empty.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    if raw_body is None:
+        raw_body = request.body
+    cached = request.__dict__.get(REQUEST_JSON_ATTR)
+    if cached is not None and cached[0] is raw_body:
+        if cached[2] is not None:
+            raise ValueError(cached[2])
+        return cached[1]
+
+    payload: Any = None
+    error: Optional[str] = None
+    if raw_body:
+        try:
+            payload = get_json_decoder()(raw_body)
+        except Exception as exc:
+            error = str(exc) or "Invalid JSON"
+    setattr(request, REQUEST_JSON_ATTR, (raw_body, payload, error))
+    if error is not None:
+        raise ValueError(error)
+    return payload
+
+
+__all__ = ["resolve_request_user", "get_json_decoder", "get_request_json"]
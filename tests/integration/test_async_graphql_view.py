@@ -0,0 +1,115 @@
+"""
+Integration tests for the ASGI GraphQL view.
+"""
+
+import asyncio
+import datetime
+import json
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TransactionTestCase
+
+from rail_django.core.registry import schema_registry
+from rail_django.core.schema import clear_all_schemas
+from rail_django.generators.queries import list as list_queries
+from rail_django.generators.queries import pagination
+from rail_django.graphql.views import AsyncMultiSchemaGraphQLView, MultiSchemaGraphQLView
+from tests.models import TestCompany, TestEmployee
+
+pytestmark = pytest.mark.integration
+
+
+class TestAsyncGraphQLView(TransactionTestCase):
+    schema_name = "async_view_test"
+
+    def setUp(self):
+        schema_registry.clear()
+        clear_all_schemas()
+        schema_registry.register_schema(
+            name=self.schema_name,
+            apps=["tests"],
+            auto_discover=False,
+            settings={"schema_settings": {"authentication_required": False}},
+        )
+        schema_registry.get_schema_builder(self.schema_name).get_schema()
+        self.user = get_user_model().objects.create_superuser(
+            username="async_view_admin",
+            email="async_view_admin@example.com",
+            password="async_view_admin_password",
+        )
+        self.company = TestCompany.objects.create(
+            nom_entreprise="Acme",
+            secteur_activite="Rail",
+            adresse_entreprise="1 Main St",
+            email_entreprise="acme@example.com",
+        )
+        TestEmployee.objects.create(
+            utilisateur_employe=self.user,
+            entreprise_employe=self.company,
+            poste_employe="Engineer",
+            salaire_employe=1000,
+            date_embauche=datetime.date(2024, 1, 1),
+        )
+
+    def _post(self, view_class, query):
+        request = RequestFactory().post(
+            f"/graphql/{self.schema_name}/",
+            data=json.dumps({"query": query}),
+            content_type="application/json",
+        )
+        request.user = self.user
+        request._dont_enforce_csrf_checks = True
+        response = view_class.as_view()(request, schema_name=self.schema_name)
+        if asyncio.iscoroutine(response):
+            response = asyncio.run(response)
+        return response.status_code, json.loads(response.content)
+
+    def test_async_view_matches_sync_view(self):
+        queries = [
+            "{ testEmployeeList { id entrepriseEmploye { nomEntreprise "
+            "employes { id utilisateurEmploye { username } } } } }",
+            "{ testCompanyPage { items { id } pageInfo { totalCount } } }",
+            "{ testCompanyPage(skipCount: true) { items { id } pageInfo { hasNextPage } } }",
+            '{ testCompanyPage(countMode: "capped") { items { id } pageInfo { totalCount } } }',
+            f"{{ testCompany(id: {self.company.pk}) {{ nomEntreprise }} }}",
+            "{ unknownField }",
+        ]
+        for query in queries:
+            expected = self._post(MultiSchemaGraphQLView, query)
+            assert self._post(AsyncMultiSchemaGraphQLView, query) == expected
+
+        status, payload = self._post(
+            AsyncMultiSchemaGraphQLView, "{ testEmployeeList { entrepriseEmploye { nomEntreprise } } }"
+        )
+        assert status == 200
+        assert payload == {
+            "data": {"testEmployeeList": [{"entrepriseEmploye": {"nomEntreprise": "Acme"}}]}
+        }
+
+    def test_generated_resolvers_read_through_the_async_orm(self):
+        patches = {
+            "retrieve": mock.patch.object(
+                list_queries, "_retrieve_async", wraps=list_queries._retrieve_async
+            ),
+            "list": mock.patch.object(
+                list_queries, "_list_async", wraps=list_queries._list_async
+            ),
+            "page": mock.patch.object(
+                pagination,
+                "_resolve_offset_page_async",
+                wraps=pagination._resolve_offset_page_async,
+            ),
+        }
+        queries = {
+            "retrieve": f"{{ testCompany(id: {self.company.pk}) {{ nomEntreprise }} }}",
+            "list": "{ testCompanyList { nomEntreprise } }",
+            "page": "{ testCompanyPage { items { nomEntreprise } } }",
+        }
+        for name, patcher in patches.items():
+            with patcher as wrapped:
+                status, payload = self._post(AsyncMultiSchemaGraphQLView, queries[name])
+            assert status == 200
+            assert "errors" not in payload
+            assert wrapped.call_count == 1, name
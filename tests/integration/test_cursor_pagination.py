@@ -0,0 +1,149 @@
+"""
+Integration tests for cursor (keyset) pagination on paginated queries.
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rail_django.testing import RailGraphQLTestClient, build_schema
+from test_app.models import Category, Product
+
+pytestmark = [pytest.mark.integration, pytest.mark.django_db]
+
+PAGE_QUERY = """
+query($first: Int, $last: Int, $after: String, $before: String, $orderBy: [String]) {
+    productPage(
+        first: $first
+        last: $last
+        after: $after
+        before: $before
+        orderBy: $orderBy
+        skipCount: true
+    ) {
+        items { name }
+        pageInfo { hasNextPage hasPreviousPage startCursor endCursor perPage }
+    }
+}
+"""
+
+
+@pytest.fixture
+def gql_client():
+    harness = build_schema(schema_name="test_cursor_pagination", apps=["test_app", "rail_django"])
+    user = get_user_model().objects.create_superuser(
+        username="cursor_admin",
+        email="cursor@example.com",
+        password="pass12345",
+    )
+    yield RailGraphQLTestClient(harness.schema, schema_name="test_cursor_pagination", user=user)
+
+
+@pytest.fixture
+def products():
+    category = Category.objects.create(name="Cursor")
+    # Duplicate prices make the primary key tiebreaker matter.
+    prices = [10, 20, 20, 30, 40, 40, 50]
+    return [
+        Product.objects.create(name=f"P{index}", price=Decimal(price), category=category)
+        for index, price in enumerate(prices)
+    ]
+
+
+def _page(gql_client, **variables):
+    result = gql_client.execute(PAGE_QUERY, variables=variables)
+    assert result.get("errors") is None, result.get("errors")
+    return result["data"]["productPage"]
+
+
+def test_forward_pages_use_seek_predicates(gql_client, products):
+    first_page = _page(gql_client, first=3, orderBy=["price"])
+    assert [item["name"] for item in first_page["items"]] == ["P0", "P1", "P2"]
+    assert first_page["pageInfo"]["hasNextPage"] is True
+    assert first_page["pageInfo"]["hasPreviousPage"] is False
+    assert first_page["pageInfo"]["perPage"] == 3
+
+    with CaptureQueriesContext(connection) as queries:
+        second_page = _page(
+            gql_client, first=3, after=first_page["pageInfo"]["endCursor"], orderBy=["price"]
+        )
+    assert [item["name"] for item in second_page["items"]] == ["P3", "P4", "P5"]
+    assert second_page["pageInfo"]["hasPreviousPage"] is True
+    page_sql = [q["sql"] for q in queries.captured_queries if "test_app_product" in q["sql"]]
+    assert page_sql and all("OFFSET" not in sql.upper() for sql in page_sql)
+
+    third_page = _page(
+        gql_client, first=3, after=second_page["pageInfo"]["endCursor"], orderBy=["price"]
+    )
+    assert [item["name"] for item in third_page["items"]] == ["P6"]
+    assert third_page["pageInfo"]["hasNextPage"] is False
+
+
+def test_backward_pages_and_descending_ordering(gql_client, products):
+    page = _page(gql_client, first=2, orderBy=["-price"])
+    assert [item["name"] for item in page["items"]] == ["P6", "P5"]
+
+    next_page = _page(gql_client, first=2, after=page["pageInfo"]["endCursor"], orderBy=["-price"])
+    assert [item["name"] for item in next_page["items"]] == ["P4", "P3"]
+
+    previous = _page(
+        gql_client, last=2, before=next_page["pageInfo"]["startCursor"], orderBy=["-price"]
+    )
+    assert [item["name"] for item in previous["items"]] == ["P6", "P5"]
+    assert previous["pageInfo"]["hasNextPage"] is True
+    assert previous["pageInfo"]["hasPreviousPage"] is False
+
+
+def test_pages_do_not_drift_when_rows_are_inserted(gql_client, products):
+    page = _page(gql_client, first=3, orderBy=["price"])
+    Product.objects.create(name="Early", price=Decimal("5"))
+
+    next_page = _page(gql_client, first=3, after=page["pageInfo"]["endCursor"], orderBy=["price"])
+    assert [item["name"] for item in next_page["items"]] == ["P3", "P4", "P5"]
+
+
+def test_non_seekable_ordering_falls_back_to_offset_cursors(gql_client, products):
+    page = _page(gql_client, first=4, orderBy=["category__name", "name"])
+    assert [item["name"] for item in page["items"]] == ["P0", "P1", "P2", "P3"]
+
+    next_page = _page(
+        gql_client, first=4, after=page["pageInfo"]["endCursor"], orderBy=["category__name", "name"]
+    )
+    assert [item["name"] for item in next_page["items"]] == ["P4", "P5", "P6"]
+    assert next_page["pageInfo"]["hasNextPage"] is False
+
+
+def test_cursor_from_another_ordering_is_rejected(gql_client, products):
+    page = _page(gql_client, first=2, orderBy=["price"])
+    result = gql_client.execute(
+        PAGE_QUERY,
+        variables={"first": 2, "after": page["pageInfo"]["endCursor"], "orderBy": ["name"]},
+    )
+    assert result.get("errors")
+
+
+def test_cursor_pages_count_only_when_total_count_is_selected(gql_client, products):
+    query = """
+    query($first: Int, $after: String) {
+        productPage(first: $first, after: $after, orderBy: ["price"]) {
+            items { name }
+            pageInfo { endCursor %s }
+        }
+    }
+    """
+    with CaptureQueriesContext(connection) as queries:
+        result = gql_client.execute(query % "", variables={"first": 3})
+    assert result.get("errors") is None, result.get("errors")
+    assert not any("COUNT(" in q["sql"].upper() for q in queries.captured_queries)
+
+    result = gql_client.execute(
+        query % "totalCount countIsEstimated",
+        variables={"first": 3, "after": result["data"]["productPage"]["pageInfo"]["endCursor"]},
+    )
+    assert result.get("errors") is None, result.get("errors")
+    page_info = result["data"]["productPage"]["pageInfo"]
+    assert page_info["totalCount"] == len(products)
+    assert page_info["countIsEstimated"] is False
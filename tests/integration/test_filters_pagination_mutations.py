@@ -166,6 +166,43 @@ def test_paginated_query_accepts_count_mode_and_count_estimate_flag(gql_client):
     assert len(page["items"]) == 2
 
 
+def test_capped_count_does_not_clamp_the_page():
+    harness = build_schema(
+        schema_name="capped_count",
+        apps=["test_app"],
+        settings={"query_settings": {"count_cap": 5}},
+    )
+    user = get_user_model().objects.create_superuser(
+        username="capped_admin",
+        email="capped_admin@example.com",
+        password="pass12345",
+    )
+    client = RailGraphQLTestClient(harness.schema, schema_name="capped_count", user=user)
+    category = _create_category()
+    for i in range(25):
+        Post.objects.create(title=f"Post {i:02d}", category=category)
+
+    query = """
+    query($page: Int) {
+        postPage(page: $page, perPage: 2, orderBy: ["title"], countMode: "capped") {
+            pageInfo { currentPage hasNextPage countIsEstimated }
+            items { title }
+        }
+    }
+    """
+    page = client.execute(query, variables={"page": 10})["data"]["postPage"]
+    assert page["pageInfo"] == {
+        "currentPage": 10,
+        "hasNextPage": True,
+        "countIsEstimated": True,
+    }
+    assert [item["title"] for item in page["items"]] == ["Post 18", "Post 19"]
+
+    last = client.execute(query, variables={"page": 13})["data"]["postPage"]
+    assert last["pageInfo"]["hasNextPage"] is False
+    assert [item["title"] for item in last["items"]] == ["Post 24"]
+
+
 def test_offset_limit_pagination(gql_client):
     category = _create_category()
     Post.objects.create(title="A", category=category)
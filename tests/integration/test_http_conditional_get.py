@@ -0,0 +1,123 @@
+"""
+Integration tests for ETag / 304 answers to GET queries.
+"""
+
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from rail_django.core.registry import schema_registry
+from rail_django.core.schema import clear_all_schemas
+from rail_django.graphql.views import MultiSchemaGraphQLView
+from tests.models import TestCompany
+
+pytestmark = pytest.mark.integration
+
+QUERY = "{ testCompanyList { nomEntreprise } }"
+
+
+class TestHttpConditionalGet(TestCase):
+    schema_name = "conditional_get_test"
+    extra_settings = {}
+
+    def setUp(self):
+        cache.clear()
+        schema_registry.clear()
+        clear_all_schemas()
+        schema_registry.register_schema(
+            name=self.schema_name,
+            apps=["tests"],
+            auto_discover=False,
+            settings={
+                "schema_settings": {"authentication_required": False},
+                "performance_settings": {"http_conditional_caching": True},
+                **self.extra_settings,
+            },
+        )
+        schema_registry.get_schema_builder(self.schema_name).get_schema()
+        self.user = get_user_model().objects.create_superuser(
+            username="conditional_admin",
+            email="conditional_admin@example.com",
+            password="conditional_admin_password",
+        )
+        self.company = TestCompany.objects.create(
+            nom_entreprise="Company",
+            secteur_activite="Rail",
+            adresse_entreprise="1 Main St",
+            email_entreprise="company@example.com",
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _get(self, query=QUERY, **headers):
+        request = RequestFactory().get(
+            f"/graphql/{self.schema_name}/",
+            data={"query": query},
+            HTTP_ACCEPT="application/json",
+            **headers,
+        )
+        request.user = self.user
+        return MultiSchemaGraphQLView.as_view()(request, schema_name=self.schema_name)
+
+    def _etag(self):
+        self._get()
+        response = self._get()
+        assert response.status_code == 200
+        return response["ETag"]
+
+    def test_matching_if_none_match_gets_304(self):
+        etag = self._etag()
+
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert response["Cache-Control"] == "private, no-cache"
+        assert "Cookie" in response["Vary"]
+
+    def test_write_to_a_read_model_changes_the_etag(self):
+        etag = self._etag()
+
+        self.company.nom_entreprise = "Renamed"
+        self.company.save()
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        payload = json.loads(response.content)
+        assert payload["data"]["testCompanyList"][0]["nomEntreprise"] == "Renamed"
+
+    def test_permission_changes_change_the_etag(self):
+        etag = self._etag()
+
+        self.user.groups.add(Group.objects.create(name="auditors"))
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_queries_without_model_fields_are_not_tagged(self):
+        self._get("{ __typename }")
+        response = self._get("{ __typename }")
+
+        assert response.status_code == 200
+        assert not response.has_header("ETag")
+
+
+class TestHttpConditionalGetWithTenants(TestHttpConditionalGet):
+    schema_name = "conditional_get_tenant_test"
+    extra_settings = {"multitenancy_settings": {"enabled": True}}
+
+    def test_etag_is_scoped_to_the_tenant(self):
+        self._get(HTTP_X_TENANT_ID="a")
+        etag = self._get(HTTP_X_TENANT_ID="a")["ETag"]
+
+        response = self._get(HTTP_X_TENANT_ID="b", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert "X-Tenant-ID" in response["Vary"]
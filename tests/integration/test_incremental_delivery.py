@@ -0,0 +1,145 @@
+"""
+Integration tests for @defer / @stream incremental delivery.
+"""
+
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+
+from rail_django.core.registry import schema_registry
+from rail_django.core.schema import clear_all_schemas
+from rail_django.graphql.views import MultiSchemaGraphQLView
+from tests.models import TestCompany
+
+pytestmark = pytest.mark.integration
+
+
+def _parts(content: bytes) -> list[dict]:
+    assert content.endswith(b"\r\n-----\r\n")
+    parts = []
+    for chunk in content.split(b"\r\n---\r\n")[1:]:
+        body = chunk.split(b"\r\n\r\n", 1)[1].split(b"\r\n-----\r\n")[0]
+        parts.append(json.loads(body))
+    return parts
+
+
+def _body(response) -> bytes:
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+class TestIncrementalDelivery(TestCase):
+    schema_name = "incremental_test"
+    performance_settings = {"incremental_delivery": True}
+
+    def setUp(self):
+        schema_registry.clear()
+        clear_all_schemas()
+        schema_registry.register_schema(
+            name=self.schema_name,
+            apps=["tests"],
+            auto_discover=False,
+            settings={
+                "schema_settings": {"authentication_required": False},
+                "performance_settings": self.performance_settings,
+            },
+        )
+        schema_registry.get_schema_builder(self.schema_name).get_schema()
+        self.user = get_user_model().objects.create_superuser(
+            username="incremental_admin",
+            email="incremental_admin@example.com",
+            password="incremental_admin_password",
+        )
+        for index in range(3):
+            TestCompany.objects.create(
+                nom_entreprise=f"Company {index}",
+                secteur_activite="Rail",
+                adresse_entreprise="1 Main St",
+                email_entreprise=f"company{index}@example.com",
+            )
+
+    def _post(self, query, accept="multipart/mixed", method="post"):
+        request = getattr(RequestFactory(), method)(
+            f"/graphql/{self.schema_name}/",
+            data=json.dumps({"query": query}),
+            content_type="application/json",
+            HTTP_ACCEPT=accept,
+        )
+        request.user = self.user
+        request._dont_enforce_csrf_checks = True
+        return MultiSchemaGraphQLView.as_view()(request, schema_name=self.schema_name)
+
+    def test_deferred_page_info_is_sent_after_the_rows(self):
+        response = self._post(
+            "{ testCompanyPage(perPage: 2) { items { nomEntreprise } "
+            '... @defer(label: "count") { pageInfo { totalCount pageCount } } } }'
+        )
+
+        assert response["Content-Type"].startswith("multipart/mixed")
+        initial, deferred = _parts(b"".join(response.streaming_content))
+        assert initial["hasNext"] is True
+        assert len(initial["data"]["testCompanyPage"]["items"]) == 2
+        assert "pageInfo" not in initial["data"]["testCompanyPage"]
+        assert deferred == {
+            "incremental": [
+                {
+                    "data": {"pageInfo": {"totalCount": 3, "pageCount": 2}},
+                    "path": ["testCompanyPage"],
+                    "label": "count",
+                }
+            ],
+            "hasNext": False,
+        }
+
+    def test_payloads_are_computed_inside_the_request_transaction(self):
+        response = self._post(
+            "{ testCompanyPage(perPage: 2) { items { nomEntreprise } "
+            "... @defer { pageInfo { totalCount } } } }"
+        )
+        # Writes made after the view returned are not seen by the payloads.
+        TestCompany.objects.all().delete()
+
+        _initial, deferred = _parts(b"".join(response.streaming_content))
+        assert deferred["incremental"][0]["data"] == {"pageInfo": {"totalCount": 3}}
+
+    def test_streamed_list_sends_remaining_items_later(self):
+        response = self._post(
+            "{ testCompanyList @stream(initialCount: 1) { nomEntreprise } }"
+        )
+
+        initial, streamed = _parts(b"".join(response.streaming_content))
+        assert len(initial["data"]["testCompanyList"]) == 1
+        assert streamed["incremental"][0]["path"] == ["testCompanyList", 1]
+        assert len(streamed["incremental"][0]["items"]) == 2
+        assert streamed["hasNext"] is False
+
+    def test_clients_without_multipart_get_a_single_response(self):
+        response = self._post(
+            "{ testCompanyPage(perPage: 2) { items { nomEntreprise } "
+            "... @defer { pageInfo { totalCount } } } }",
+            accept="application/json",
+        )
+
+        payload = json.loads(_body(response))
+        assert payload["data"]["testCompanyPage"]["pageInfo"] == {"totalCount": 3}
+
+    def test_other_methods_are_not_allowed(self):
+        query = "{ testCompanyList @stream(initialCount: 1) { nomEntreprise } }"
+        for method in ("put", "delete"):
+            response = self._post(query, method=method)
+            assert response.status_code == 405, method
+
+
+class TestIncrementalDeliveryWithStreaming(TestIncrementalDelivery):
+    schema_name = "incremental_streaming_test"
+    performance_settings = {"incremental_delivery": True, "streaming_responses": True}
+
+    def test_documents_without_directives_are_streamed(self):
+        response = self._post("{ testCompanyList { nomEntreprise } }")
+
+        assert response.streaming
+        payload = json.loads(_body(response))
+        assert len(payload["data"]["testCompanyList"]) == 3
@@ -0,0 +1,114 @@
+"""
+Integration tests for nested Prefetch planning of list queries.
+"""
+
+import datetime
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from rail_django.core.registry import schema_registry
+from rail_django.core.schema import clear_all_schemas
+from rail_django.graphql.views import MultiSchemaGraphQLView
+from tests.models import TestCompany, TestEmployee
+
+pytestmark = pytest.mark.integration
+
+QUERY = (
+    "{ testCompanyList { nomEntreprise "
+    "employes { posteEmploye utilisateurEmploye { username } } } }"
+)
+
+
+class TestNestedPrefetchPlans(TransactionTestCase):
+    schema_name = "nested_prefetch_test"
+
+    def setUp(self):
+        schema_registry.clear()
+        clear_all_schemas()
+        schema_registry.register_schema(
+            name=self.schema_name,
+            apps=["tests"],
+            auto_discover=False,
+            settings={"schema_settings": {"authentication_required": False}},
+        )
+        schema_registry.get_schema_builder(self.schema_name).get_schema()
+        self.user = get_user_model().objects.create_superuser(
+            username="prefetch_admin",
+            email="prefetch_admin@example.com",
+            password="prefetch_admin_password",
+        )
+
+    def _add_company(self, index):
+        company = TestCompany.objects.create(
+            nom_entreprise=f"Company {index}",
+            secteur_activite="Rail",
+            adresse_entreprise=f"{index} Main St",
+            email_entreprise=f"company{index}@example.com",
+        )
+        for position in ("Engineer", "Driver"):
+            user = get_user_model().objects.create_user(
+                username=f"{position.lower()}_{index}", password="employee_password"
+            )
+            TestEmployee.objects.create(
+                utilisateur_employe=user,
+                entreprise_employe=company,
+                poste_employe=position,
+                salaire_employe=1000,
+                date_embauche=datetime.date(2024, 1, 1),
+            )
+
+    def _post(self):
+        request = RequestFactory().post(
+            f"/graphql/{self.schema_name}/",
+            data=json.dumps({"query": QUERY}),
+            content_type="application/json",
+        )
+        request.user = self.user
+        request._dont_enforce_csrf_checks = True
+        with CaptureQueriesContext(connection) as queries:
+            response = MultiSchemaGraphQLView.as_view()(
+                request, schema_name=self.schema_name
+            )
+        payload = json.loads(response.content)
+        assert response.status_code == 200, payload
+        return payload, [query["sql"] for query in queries.captured_queries]
+
+    def _data_sql(self, sql):
+        return [
+            statement
+            for statement in sql
+            if "tests_testcompany" in statement or "tests_testemployee" in statement
+        ]
+
+    def test_nested_lists_use_a_fixed_number_of_narrow_queries(self):
+        self._add_company(1)
+        self._post()
+        payload, small_sql = self._post()
+        assert payload["data"]["testCompanyList"][0]["employes"][0]["utilisateurEmploye"]
+
+        for index in range(2, 6):
+            self._add_company(index)
+        payload, large_sql = self._post()
+
+        companies = payload["data"]["testCompanyList"]
+        assert len(companies) == 5
+        assert all(len(company["employes"]) == 2 for company in companies)
+        usernames = {
+            company["nomEntreprise"]: {
+                employee["utilisateurEmploye"]["username"]
+                for employee in company["employes"]
+            }
+            for company in companies
+        }
+        assert usernames["Company 5"] == {"engineer_5", "driver_5"}
+
+        assert len(self._data_sql(large_sql)) == len(self._data_sql(small_sql)) == 2
+        employee_sql = [s for s in large_sql if 'FROM "tests_testemployee"' in s]
+        assert len(employee_sql) == 1
+        assert "salaire_employe" not in employee_sql[0]
+        assert "auth_user" in employee_sql[0]
@@ -0,0 +1,105 @@
+"""
+Integration tests: cached query results never bypass access checks.
+"""
+
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from rail_django.core import services
+from rail_django.core.registry import schema_registry
+from rail_django.core.schema import clear_all_schemas
+from rail_django.extensions.optimization.optimizer import _optimizer_by_schema
+from rail_django.extensions.query_cache import InMemoryQueryCacheBackend
+from rail_django.graphql.views import MultiSchemaGraphQLView
+from tests.models import TestCompany
+
+pytestmark = pytest.mark.integration
+
+
+class TestQueryCacheAccess(TestCase):
+    schema_name = "query_cache_access_test"
+
+    def setUp(self):
+        cache.clear()
+        _optimizer_by_schema.clear()
+        self.backend = InMemoryQueryCacheBackend()
+        self._factory = services._query_cache_factory
+        services._query_cache_factory = lambda schema_name=None: self.backend
+        schema_registry.clear()
+        clear_all_schemas()
+        schema_registry.register_schema(
+            name=self.schema_name,
+            apps=["tests"],
+            auto_discover=False,
+            settings={
+                "schema_settings": {"authentication_required": False},
+                "performance_settings": {"enable_query_caching": True},
+            },
+        )
+        schema_registry.get_schema_builder(self.schema_name).get_schema()
+        User = get_user_model()
+        self.admin = User.objects.create_superuser(
+            username="cache_admin",
+            email="cache_admin@example.com",
+            password="cache_admin_password",
+        )
+        self.viewer = User.objects.create_user(
+            username="cache_viewer", password="cache_viewer_password"
+        )
+        self.outsider = User.objects.create_user(
+            username="cache_outsider", password="cache_outsider_password"
+        )
+        self.viewer.user_permissions.add(
+            Permission.objects.get(codename="view_testcompany")
+        )
+        self.company = TestCompany.objects.create(
+            nom_entreprise="Company",
+            secteur_activite="Rail",
+            adresse_entreprise="1 Main St",
+            email_entreprise="company@example.com",
+        )
+
+    def tearDown(self):
+        services._query_cache_factory = self._factory
+        _optimizer_by_schema.clear()
+        cache.clear()
+
+    def _query(self, user, query):
+        request = RequestFactory().post(
+            f"/graphql/{self.schema_name}/",
+            data=json.dumps({"query": query}),
+            content_type="application/json",
+        )
+        request.user = user
+        request._dont_enforce_csrf_checks = True
+        response = MultiSchemaGraphQLView.as_view()(
+            request, schema_name=self.schema_name
+        )
+        return json.loads(response.content)
+
+    def test_cached_object_is_not_served_to_a_user_without_permission(self):
+        query = f'{{ testCompany(id: "{self.company.pk}") {{ nomEntreprise }} }}'
+        admin_payload = self._query(self.admin, query)
+        assert admin_payload["data"]["testCompany"]["nomEntreprise"] == "Company"
+
+        payload = self._query(self.outsider, query)
+
+        assert payload["data"]["testCompany"] is None
+        assert "Permission required" in payload["errors"][0]["message"]
+
+    def test_cached_list_is_keyed_per_user(self):
+        query = "{ testCompanyList { nomEntreprise } }"
+        self._query(self.admin, query)
+        admin_entries = self.backend.get_stats()["entries"]
+        assert admin_entries > 0
+
+        payload = self._query(self.viewer, query)
+
+        assert payload["data"]["testCompanyList"] == [{"nomEntreprise": "Company"}]
+        assert self.backend.get_stats()["entries"] > admin_entries
+        assert self._query(self.outsider, query).get("errors")
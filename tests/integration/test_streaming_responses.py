@@ -0,0 +1,67 @@
+"""
+Integration tests for streamed JSON responses.
+"""
+
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+
+from rail_django.core.registry import schema_registry
+from rail_django.core.schema import clear_all_schemas
+from rail_django.graphql.views import MultiSchemaGraphQLView
+from tests.models import TestCompany
+
+pytestmark = pytest.mark.integration
+
+
+class TestStreamingResponses(TestCase):
+    schema_name = "streaming_test"
+
+    def setUp(self):
+        schema_registry.clear()
+        clear_all_schemas()
+        schema_registry.register_schema(
+            name=self.schema_name,
+            apps=["tests"],
+            auto_discover=False,
+            settings={
+                "schema_settings": {"authentication_required": False},
+                "performance_settings": {"streaming_responses": True},
+            },
+        )
+        schema_registry.get_schema_builder(self.schema_name).get_schema()
+        self.user = get_user_model().objects.create_superuser(
+            username="streaming_admin",
+            email="streaming_admin@example.com",
+            password="streaming_admin_password",
+        )
+        TestCompany.objects.create(
+            nom_entreprise="Company",
+            secteur_activite="Rail",
+            adresse_entreprise="1 Main St",
+            email_entreprise="company@example.com",
+        )
+
+    def _request(self, method, query):
+        request = getattr(RequestFactory(), method)(
+            f"/graphql/{self.schema_name}/",
+            data=json.dumps({"query": query}),
+            content_type="application/json",
+        )
+        request.user = self.user
+        request._dont_enforce_csrf_checks = True
+        return MultiSchemaGraphQLView.as_view()(request, schema_name=self.schema_name)
+
+    def test_post_results_are_streamed(self):
+        response = self._request("post", "{ testCompanyList { nomEntreprise } }")
+
+        assert response.streaming
+        payload = json.loads(b"".join(response.streaming_content))
+        assert payload["data"]["testCompanyList"] == [{"nomEntreprise": "Company"}]
+
+    def test_other_methods_are_not_allowed(self):
+        for method in ("put", "delete"):
+            response = self._request(method, "{ testCompanyList { nomEntreprise } }")
+            assert response.status_code == 405, method
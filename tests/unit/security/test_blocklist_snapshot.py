@@ -0,0 +1,146 @@
+import fnmatch
+import time
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from rail_django.core.middleware.auth import AuthenticationMiddleware
+from rail_django.security.anomaly.backends.memory import InMemoryAnomalyBackend
+from rail_django.security.anomaly.backends.redis import RedisAnomalyBackend
+from rail_django.security.anomaly.blocklist import BlocklistSnapshot
+from rail_django.security.anomaly.detector import AnomalyDetector
+
+
+class FakeRedis:
+    """Subset of the redis client used by the blocklist."""
+
+    def __init__(self):
+        self.values = {}
+        self.expires = {}
+        self.sorted_sets = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def setex(self, key, seconds, value):
+        self.values[key] = value
+        self.expires[key] = time.time() + seconds
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+    def pttl(self, key):
+        if key not in self.values:
+            return -2
+        if key not in self.expires:
+            return -1
+        return int((self.expires[key] - time.time()) * 1000)
+
+    def scan_iter(self, match):
+        return [key.encode() for key in list(self.values) if fnmatch.fnmatch(key, match)]
+
+    def zadd(self, key, mapping, nx=False):
+        entries = self.sorted_sets.setdefault(key, {})
+        for member, score in mapping.items():
+            if not (nx and member in entries):
+                entries[member] = score
+
+    def zrem(self, key, member):
+        self.sorted_sets.get(key, {}).pop(member, None)
+
+    def zremrangebyscore(self, key, low, high):
+        entries = self.sorted_sets.get(key, {})
+        for member in [m for m, score in entries.items() if low <= score <= high]:
+            del entries[member]
+
+    def zrangebyscore(self, key, low, high, withscores=False):
+        return [
+            (member.encode(), score)
+            for member, score in self.sorted_sets.get(key, {}).items()
+            if score >= low
+        ]
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return call
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+@pytest.mark.unit
+class TestBlocklistSnapshot:
+    def test_lookups_are_served_locally_between_polls(self):
+        backend = InMemoryAnomalyBackend()
+        backend.block("ip:1.2.3.4", 60)
+        snapshot = BlocklistSnapshot(backend, refresh_interval=60)
+
+        with patch.object(backend, "is_blocked") as is_blocked_mock:
+            assert snapshot.is_blocked("ip:1.2.3.4") is True
+            assert snapshot.is_blocked("ip:5.6.7.8") is False
+
+        is_blocked_mock.assert_not_called()
+
+    def test_detector_changes_are_visible_immediately(self):
+        detector = AnomalyDetector(backend=InMemoryAnomalyBackend())
+        detector.blocklist.refresh_interval = 60
+
+        assert detector.is_ip_blocked("1.2.3.4") is False
+        detector.block_ip("1.2.3.4")
+        assert detector.is_ip_blocked("1.2.3.4") is True
+        detector.unblock_ip("1.2.3.4")
+        assert detector.is_ip_blocked("1.2.3.4") is False
+
+    def test_redis_keys_blocked_before_the_index_are_seen(self):
+        client = FakeRedis()
+        backend = RedisAnomalyBackend(redis_client=client)
+        # Blocked by a release that did not maintain the index.
+        client.setex(f"{backend.prefix}blocked:ip:1.2.3.4", 60, "1")
+        client.values[f"{backend.prefix}blocked:ip:5.6.7.8"] = "1"
+        backend.block("ip:9.9.9.9", 60)
+        snapshot = BlocklistSnapshot(backend, refresh_interval=60)
+
+        assert snapshot.is_blocked("ip:1.2.3.4") is True
+        assert snapshot.is_blocked("ip:5.6.7.8") is True
+        assert snapshot.is_blocked("ip:9.9.9.9") is True
+        assert snapshot.is_blocked("ip:8.8.8.8") is False
+
+    def test_backend_without_snapshot_support_is_queried_directly(self):
+        backend = Mock(spec=["is_blocked"])
+        backend.is_blocked.return_value = True
+        snapshot = BlocklistSnapshot(backend, refresh_interval=60)
+
+        assert snapshot.is_blocked("ip:1.2.3.4") is True
+        backend.is_blocked.assert_called_once_with("ip:1.2.3.4")
+
+
+@pytest.mark.unit
+def test_authentication_middleware_checks_blocklist_once_per_request():
+    middleware = AuthenticationMiddleware()
+    request = SimpleNamespace(META={"REMOTE_ADDR": "1.2.3.4"}, user=None)
+    info = SimpleNamespace(context=request)
+    detector = Mock()
+    detector.is_ip_blocked.return_value = False
+
+    with patch(
+        "rail_django.core.middleware.auth.get_anomaly_detector", return_value=detector
+    ):
+        for _ in range(3):
+            middleware.resolve(lambda root, info: "ok", None, info)
+
+    detector.is_ip_blocked.assert_called_once_with("1.2.3.4")
@@ -321,3 +321,59 @@ class TestGeneratorWithAdvancedFilters(TestCase):
         # Should have order_items_cond_agg for reverse relation
         self.assertIn("order_items_cond_agg", fields)
 
+
+@pytest.mark.django_db
+class TestAggregationSubqueryStrategy(TestCase):
+    """Aggregations over several to-many relations must not fan out."""
+
+    def setUp(self):
+        from decimal import Decimal
+
+        from test_app.models import Category, Post, Product
+
+        self.applicator = NestedFilterApplicator(schema_name="test")
+        self.busy = Category.objects.create(name="Busy")
+        self.quiet = Category.objects.create(name="Quiet")
+        for index in range(2):
+            Post.objects.create(title=f"Post {index}", category=self.busy)
+        for index in range(3):
+            Product.objects.create(name=f"Product {index}", price=Decimal("10.00"), category=self.busy)
+        Post.objects.create(title="Lonely", category=self.quiet)
+
+    def test_two_to_many_aggregations_use_correlated_subqueries(self):
+        from test_app.models import Category
+
+        where = {
+            "posts_agg": {"field": "id", "count": {"eq": 2}},
+            "products_agg": {"field": "price", "sum": {"eq": 30}},
+        }
+        queryset = self.applicator.apply_where_filter(Category.objects.all(), where)
+
+        self.assertEqual(list(queryset.values_list("name", flat=True)), ["Busy"])
+        self.assertNotIn("GROUP BY", str(queryset.query).split("WHERE")[0].upper())
+
+    def test_single_to_many_aggregation_keeps_the_join(self):
+        from test_app.models import Category
+
+        where = {"posts_agg": {"field": "id", "count": {"gte": 1}}}
+        self.assertFalse(self.applicator._use_aggregation_subqueries(Category, where))
+        queryset = self.applicator.apply_where_filter(Category.objects.all(), where)
+
+        self.assertEqual(queryset.count(), 2)
+        self.assertIn("GROUP BY", str(queryset.query).upper())
+
+    def test_conditional_aggregations_count_towards_the_strategy(self):
+        from test_app.models import Category
+
+        where = {
+            "posts_agg": {"field": "id", "count": {"eq": 2}},
+            "products_cond_agg": {
+                "field": "price",
+                "filter": '{"name": {"startsWith": "Product"}}',
+                "count": {"eq": 3},
+            },
+        }
+        self.assertTrue(self.applicator._use_aggregation_subqueries(Category, where))
+        queryset = self.applicator.apply_where_filter(Category.objects.all(), where)
+
+        self.assertEqual(list(queryset.values_list("name", flat=True)), ["Busy"])
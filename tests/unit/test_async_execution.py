@@ -0,0 +1,154 @@
+import asyncio
+import threading
+
+import graphene
+import pytest
+from django.core.exceptions import SynchronousOnlyOperation
+from graphql import graphql
+
+from rail_django.core.execution import mark_attribute_resolver
+from rail_django.core.middleware import AsyncExecutionMiddleware, after_resolve
+from rail_django.graphql.views import AsyncMultiSchemaGraphQLView
+
+pytestmark = pytest.mark.unit
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+_owner_calls = []
+
+
+class _Item(graphene.ObjectType):
+    name = graphene.String()
+    owner = graphene.String()
+
+    def resolve_owner(root, info):
+        _owner_calls.append(root["name"])
+        if _on_event_loop():
+            raise SynchronousOnlyOperation("database access from the event loop")
+        return f"owner-of-{root['name']}"
+
+
+def _build_schema(calls):
+    class Query(graphene.ObjectType):
+        items = graphene.List(_Item)
+        total = graphene.Int()
+
+        def resolve_items(root, info):
+            calls.append(("items", _on_event_loop()))
+            return [{"name": "a"}, {"name": "b"}]
+
+        def resolve_total(root, info):
+            calls.append(("total", _on_event_loop()))
+            return 2
+
+    return graphene.Schema(query=Query).graphql_schema
+
+
+def _execute(schema, query):
+    return asyncio.run(
+        graphql(schema, query, middleware=[AsyncExecutionMiddleware()])
+    )
+
+
+def test_root_fields_run_in_sync_executor():
+    calls = []
+    result = _execute(_build_schema(calls), "{ items { name } total }")
+
+    assert result.errors is None
+    assert result.data == {"items": [{"name": "a"}, {"name": "b"}], "total": 2}
+    assert sorted(calls) == [("items", False), ("total", False)]
+
+
+def test_custom_nested_resolver_runs_once_in_a_worker():
+    _owner_calls.clear()
+    result = _execute(_build_schema([]), "{ items { name owner } }")
+
+    assert result.errors is None
+    assert result.data["items"][1] == {"name": "b", "owner": "owner-of-b"}
+    assert sorted(_owner_calls) == ["a", "b"]
+
+
+def test_marked_attribute_resolver_runs_on_the_event_loop():
+    calls = []
+
+    def _resolve_label(root, info):
+        calls.append(_on_event_loop())
+        return root["name"].upper()
+
+    class Labelled(graphene.ObjectType):
+        name = graphene.String()
+        label = graphene.String()
+
+        resolve_label = mark_attribute_resolver(_resolve_label)
+
+    class Query(graphene.ObjectType):
+        items = graphene.List(Labelled)
+
+        def resolve_items(root, info):
+            return [{"name": "a"}, {"name": "b"}]
+
+    schema = graphene.Schema(query=Query).graphql_schema
+    result = _execute(schema, "{ items { label } }")
+
+    assert result.errors is None
+    assert result.data == {"items": [{"label": "A"}, {"label": "B"}]}
+    assert calls == [True, True]
+
+
+def test_root_fields_of_a_request_share_one_worker_thread():
+    threads = []
+
+    class Query(graphene.ObjectType):
+        first = graphene.Int()
+        second = graphene.Int()
+
+        def resolve_first(root, info):
+            threads.append(threading.get_ident())
+            return 1
+
+        def resolve_second(root, info):
+            threads.append(threading.get_ident())
+            return 2
+
+    schema = graphene.Schema(query=Query).graphql_schema
+    result = _execute(schema, "{ first second }")
+
+    assert result.errors is None
+    assert result.data == {"first": 1, "second": 2}
+    assert len(threads) == 2
+    assert len(set(threads)) == 1
+    assert threading.get_ident() not in threads
+
+
+def test_after_resolve_processes_awaitable_results():
+    errors = []
+
+    async def value():
+        return 2
+
+    async def failure():
+        raise ValueError("boom")
+
+    async def run():
+        doubled = await after_resolve(value(), lambda result: result * 2)
+        with pytest.raises(ValueError):
+            await after_resolve(failure(), on_error=errors.append, in_worker=False)
+        return doubled
+
+    assert after_resolve(3, lambda result: result + 1) == 4
+    assert asyncio.run(run()) == 4
+    assert [str(error) for error in errors] == ["boom"]
+
+
+def test_async_view_is_marked_as_coroutine():
+    view = AsyncMultiSchemaGraphQLView.as_view()
+
+    assert asyncio.iscoroutinefunction(view)
+    assert getattr(view, "csrf_exempt", False) is True
@@ -0,0 +1,175 @@
+from types import SimpleNamespace
+
+import graphene
+import pytest
+from graphql import execute, parse
+
+from rail_django.core.middleware import (
+    BaseMiddleware,
+    CORSMiddleware,
+    CompiledMiddlewareChain,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _Recording(BaseMiddleware):
+    def __init__(self, name, calls, *, root_only=False, enabled=True, fields=None):
+        super().__init__(None)
+        self.name = name
+        self.calls = calls
+        self.root_only = root_only
+        self.enabled = enabled
+        self.fields = fields
+
+    def is_enabled(self):
+        return self.enabled
+
+    def applies_to(self, parent_type, field_name):
+        return self.fields is None or field_name in self.fields
+
+    def resolve(self, next_resolver, root, info, **kwargs):
+        self.calls.append(self.name)
+        return next_resolver(root, info, **kwargs)
+
+
+def _info(field_name, *, nested):
+    path = SimpleNamespace(prev=SimpleNamespace(prev=None) if nested else None)
+    return SimpleNamespace(
+        path=path, parent_type=SimpleNamespace(name="Item"), field_name=field_name
+    )
+
+
+def _resolver(root, info, **kwargs):
+    return f"{info.field_name}:{kwargs.get('value')}"
+
+
+def test_compiled_chain_matches_graphql_core_ordering_at_root():
+    calls = []
+    chain = CompiledMiddlewareChain(
+        [_Recording("inner", calls), _Recording("outer", calls, root_only=True)]
+    )
+
+    result = chain.resolve(_resolver, None, _info("items", nested=False), value=1)
+
+    assert result == "items:1"
+    assert calls == ["outer", "inner"]
+
+
+def test_compiled_chain_skips_root_only_and_untargeted_middleware():
+    calls = []
+    chain = CompiledMiddlewareChain(
+        [
+            _Recording("root", calls, root_only=True),
+            _Recording("disabled", calls, enabled=False),
+            _Recording("targeted", calls, fields={"name"}),
+        ]
+    )
+
+    assert chain.resolve(_resolver, None, _info("id", nested=True)) == "id:None"
+    assert calls == []
+
+    chain.resolve(_resolver, None, _info("name", nested=True))
+    assert calls == ["targeted"]
+
+
+def test_compiled_chain_drops_pass_through_cors_middleware():
+    chain = CompiledMiddlewareChain([CORSMiddleware(None)])
+
+    assert chain.middleware == []
+
+
+def test_compiled_chain_composes_each_field_resolver_once():
+    calls = []
+    chain = CompiledMiddlewareChain([_Recording("mw", calls)])
+    info = _info("name", nested=True)
+
+    def first(root, info, **kwargs):
+        return "first"
+
+    def second(root, info, **kwargs):
+        return "second"
+
+    assert chain.resolve(first, None, info) == "first"
+    assert chain.resolve(first, None, info) == "first"
+    assert chain.resolve(second, None, info) == "second"
+    assert calls == ["mw", "mw", "mw"]
+    assert list(chain._chains) == [("field", "Item", "name")]
+    assert len(chain._composed) == 2
+
+
+class _OperationRecording(_Recording):
+    def __init__(self, name, calls, *, error=None):
+        super().__init__(name, calls, root_only=True)
+        self.error = error
+
+    def resolve_operation(self, next_operation, operation):
+        self.calls.append(f"{self.name}:{','.join(operation.root_fields)}")
+        if self.error is not None:
+            raise self.error
+        return next_operation()
+
+
+class _Query(graphene.ObjectType):
+    first = graphene.String()
+    second = graphene.String()
+
+    def resolve_first(root, info):
+        return "1"
+
+    def resolve_second(root, info):
+        return "2"
+
+
+_schema = graphene.Schema(query=_Query).graphql_schema
+
+
+def _run(chain, query, *, with_operation=True):
+    document = parse(query)
+    context = SimpleNamespace()
+
+    def run():
+        return execute(_schema, document, context_value=context, middleware=[chain])
+
+    if not with_operation:
+        return run()
+    return chain.run_operation(
+        run, schema=_schema, document=document, operation_name=None, context=context
+    )
+
+
+def test_operation_middleware_runs_once_around_execution():
+    calls = []
+    chain = CompiledMiddlewareChain(
+        [_Recording("field", calls), _OperationRecording("operation", calls)]
+    )
+
+    result = _run(chain, "{ first alias: second }")
+
+    assert result.errors is None
+    assert result.data == {"first": "1", "alias": "2"}
+    assert calls == ["operation:first,alias", "field", "field"]
+
+
+def test_root_fields_run_operation_middleware_without_the_view():
+    calls = []
+    chain = CompiledMiddlewareChain([_OperationRecording("operation", calls)])
+
+    result = _run(chain, "{ first second }", with_operation=False)
+
+    assert result.errors is None
+    assert calls == ["operation", "operation"]
+
+
+def test_operation_middleware_errors_are_reported_per_root_field():
+    chain = CompiledMiddlewareChain(
+        [_OperationRecording("guard", [], error=PermissionError("Rate limit exceeded"))]
+    )
+
+    result = _run(chain, "{ first second }")
+
+    assert result.data == {"first": None, "second": None}
+    assert [(error.message, error.path) for error in result.errors] == [
+        ("Rate limit exceeded", ["first"]),
+        ("Rate limit exceeded", ["second"]),
+    ]
@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import graphene
+import pytest
+from graphql import GraphQLError, parse, validate
+
+from rail_django.core.document_cache import (
+    REQUEST_DOCUMENT_ATTR,
+    DocumentCache,
+    get_request_document,
+)
+
+
+class _Query(graphene.ObjectType):
+    hello = graphene.String()
+
+
+_SCHEMA = graphene.Schema(query=_Query).graphql_schema
+
+
+@pytest.mark.unit
+def test_document_cache_reuses_parsed_document():
+    cache = DocumentCache(max_size=10)
+
+    first = cache.get_document("{ hello }", schema_name="gql", schema_version=1)
+    second = cache.get_document("{ hello }", schema_name="gql", schema_version=1)
+
+    assert first is second
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+@pytest.mark.unit
+def test_document_cache_keys_on_schema_and_version():
+    cache = DocumentCache(max_size=10)
+
+    base = cache.get_document("{ hello }", schema_name="gql", schema_version=1)
+    other_schema = cache.get_document("{ hello }", schema_name="auth", schema_version=1)
+    bumped = cache.get_document("{ hello }", schema_name="gql", schema_version=2)
+
+    assert base is not other_schema
+    assert base is not bumped
+    assert len(cache) == 3
+
+
+@pytest.mark.unit
+def test_document_cache_evicts_least_recently_used():
+    cache = DocumentCache(max_size=2)
+
+    first = cache.get_document("{ a }")
+    cache.get_document("{ b }")
+    cache.get_document("{ a }")
+    cache.get_document("{ c }")
+
+    assert len(cache) == 2
+    assert cache.get_document("{ a }") is first
+    assert cache.get_stats()["misses"] == 3
+
+
+@pytest.mark.unit
+def test_document_cache_does_not_store_syntax_errors():
+    cache = DocumentCache(max_size=10)
+
+    with pytest.raises(GraphQLError):
+        cache.get_document("{ hello")
+
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_document_cache_memoizes_validation_per_schema():
+    cache = DocumentCache(max_size=10)
+    entry = cache.get_document("{ missing }")
+
+    with patch(
+        "rail_django.core.document_cache.validate", wraps=validate
+    ) as validate_mock:
+        first = cache.validate(entry, _SCHEMA)
+        second = cache.validate(entry, _SCHEMA)
+
+    assert first and first is second
+    assert validate_mock.call_count == 1
+
+
+@pytest.mark.unit
+def test_get_request_document_prefers_cached_document():
+    cache = DocumentCache(max_size=10)
+    entry = cache.get_document("query Q { hello ...F } fragment F on Query { hello }")
+    operation = entry.document.definitions[0]
+    context = SimpleNamespace(**{REQUEST_DOCUMENT_ATTR: entry})
+    info = SimpleNamespace(context=context, operation=operation, fragments={})
+
+    assert get_request_document(info) is entry.document
+
+
+@pytest.mark.unit
+def test_get_request_document_rebuilds_for_multi_operation_documents():
+    cache = DocumentCache(max_size=10)
+    entry = cache.get_document("query A { hello } query B { hello }")
+    operation = entry.document.definitions[1]
+    context = SimpleNamespace(**{REQUEST_DOCUMENT_ATTR: entry})
+    info = SimpleNamespace(context=context, operation=operation, fragments={})
+
+    document = get_request_document(info)
+
+    assert document is not entry.document
+    assert list(document.definitions) == [operation]
+
+
+@pytest.mark.unit
+def test_artifacts_hit_for_operation_documents_across_requests():
+    cache = DocumentCache(max_size=10)
+    entry = cache.get_document("query A { hello } query B { hello }")
+    operation = entry.document.definitions[1]
+    calls = []
+
+    with patch(
+        "rail_django.core.document_cache.get_document_cache", return_value=cache
+    ):
+        for _ in range(2):
+            context = SimpleNamespace(**{REQUEST_DOCUMENT_ATTR: entry})
+            info = SimpleNamespace(context=context, operation=operation, fragments={})
+            document = get_request_document(info)
+            cache.get_artifact(document, "depth", lambda: calls.append(1) or 1)
+
+    assert len(calls) == 1
+    assert cache.get_stats()["artifacts"] == 1
+
+
+@pytest.mark.unit
+def test_artifacts_of_unknown_documents_are_not_stored():
+    cache = DocumentCache(max_size=10)
+    document = parse("{ hello }")
+
+    first = cache.get_artifact(document, "depth", lambda: object())
+    second = cache.get_artifact(document, "depth", lambda: object())
+
+    assert first is not second
+    assert cache.get_stats()["artifacts"] == 0
+
+
+@pytest.mark.unit
+def test_artifacts_are_evicted_with_their_document():
+    cache = DocumentCache(max_size=1)
+    entry = cache.get_document("{ hello }")
+    cache.get_artifact(entry.document, "depth", lambda: 1)
+
+    cache.get_document("{ other }")
+
+    assert cache.get_stats()["artifacts"] == 0
+    assert cache.get_artifact(entry.document, "depth", lambda: 2) == 2
@@ -0,0 +1,167 @@
+"""
+Unit tests for the filter workload recorder and index advisor.
+"""
+
+import json
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from rail_django.generators.filters import workload
+from rail_django.generators.filters.applicator import NestedFilterApplicator
+from rail_django.generators.filters.workload import (
+    FilterWorkloadRecorder,
+    IndexAdvisor,
+    extract_filter_shapes,
+    get_filter_workload_recorder,
+)
+from test_app.models import Category, Product
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    recorder = get_filter_workload_recorder()
+    recorder.reset()
+    monkeypatch.setattr(FilterWorkloadRecorder, "get_sample_rate", lambda self, schema: 1.0)
+    yield recorder
+    recorder.reset()
+
+
+@pytest.fixture
+def products():
+    category = Category.objects.create(name="Tools")
+    for index in range(5):
+        Product.objects.create(
+            name=f"P{index}", price=Decimal(10 * index), inventory_count=index, category=category
+        )
+
+
+def test_shapes_split_equality_range_and_constant_predicates():
+    queryset = Product.objects.filter(
+        inventory_count__in=[1, 2],
+        price__gte=10,
+        name__icontains="ignored",
+        category__name="Tools",
+        cost_price__isnull=True,
+    )
+
+    shapes = {shape["model"]: shape for shape in extract_filter_shapes(queryset)}
+
+    assert shapes[Product]["eq"] == ["inventory_count"]
+    assert shapes[Product]["range"] == ["price"]
+    assert shapes[Product]["const"] == [("cost_price", "isnull", True)]
+    assert shapes[Category]["eq"] == ["name"]
+
+
+def test_applied_filters_become_ranked_composite_recommendations(recorder, products):
+    applicator = NestedFilterApplicator()
+    for value in range(4):
+        list(
+            applicator.apply_where_filter(
+                Product.objects.all(),
+                {"inventory_count": {"eq": value}, "price": {"gte": 5}},
+                Product,
+            )
+        )
+    list(applicator.apply_where_filter(Product.objects.all(), {"name": {"eq": "P1"}}, Product))
+
+    recommendations = IndexAdvisor(min_occurrences=3).recommend(recorder.load())
+
+    assert len(recommendations) == 1
+    top = recommendations[0]
+    assert top.model is Product
+    assert top.fields == ["inventory_count", "price"]
+    assert top.occurrences == 4
+    assert top.full_scan is True
+    assert top.kind == "composite"
+
+
+def test_existing_indexes_are_not_recommended_and_constants_become_partial(recorder):
+    for _ in range(3):
+        recorder.record_filters(Product.objects.filter(category_id=1))
+        recorder.record_filters(Product.objects.filter(cost_price__isnull=True, price__gt=5))
+
+    recommendations = IndexAdvisor(min_occurrences=3, explain=False).recommend(recorder.load())
+
+    assert [(rec.fields, rec.condition) for rec in recommendations] == [
+        (["price"], {"cost_price__isnull": True})
+    ]
+    index = recommendations[0].as_index()
+    assert index.condition is not None and len(index.name) <= 30
+
+
+def test_command_lists_recommendations_and_emits_migration(recorder, products):
+    for _ in range(5):
+        recorder.record_filters(Product.objects.filter(inventory_count=3))
+        recorder.record_ordering(Product, ["-price"])
+
+    out = StringIO()
+    call_command(
+        "recommend_filter_indexes",
+        "--min-count",
+        "5",
+        "--emit-migration",
+        "test_app",
+        "--dry-run",
+        stdout=out,
+    )
+    output = out.getvalue()
+
+    assert "[composite] test_app.Product(inventory_count)" in output
+    assert "[ordering] test_app.Product(-price)" in output
+    assert "migrations.AddIndex(" in output
+
+    call_command("recommend_filter_indexes", "--reset", stdout=StringIO())
+    assert recorder.load() == {}
+
+
+def test_samples_keep_sql_without_parameter_values(recorder, products):
+    for _ in range(3):
+        recorder.record_filters(Product.objects.filter(name="customer@example.com"))
+
+    workload = recorder.load()
+
+    assert "customer@example.com" not in json.dumps(workload)
+    recommendations = IndexAdvisor(min_occurrences=3).recommend(workload)
+    assert recommendations[0].full_scan is True
+
+
+def test_workers_flush_to_their_own_keys_without_holding_the_lock(recorder, monkeypatch):
+    other_worker = FilterWorkloadRecorder(flush_every=2)
+    set_value = workload.cache.set
+
+    def checked_set(*args, **kwargs):
+        assert not other_worker._lock.locked()
+        return set_value(*args, **kwargs)
+
+    monkeypatch.setattr(workload.cache, "set", checked_set)
+    for _ in range(2):
+        recorder.record_ordering(Product, ["-price"])
+        other_worker.record_ordering(Product, ["-price"])
+
+    assert recorder.load()["test_app.product"]["orderings"] == {"-price": 4}
+
+
+def test_unsampled_orderings_are_not_inspected(monkeypatch):
+    recorder = FilterWorkloadRecorder()
+    monkeypatch.setattr(FilterWorkloadRecorder, "get_sample_rate", lambda self, schema: 0.0)
+
+    def fail(model, order_by):
+        raise AssertionError("ordering inspected")
+
+    monkeypatch.setattr(workload, "_ordering_columns", fail)
+
+    recorder.record_ordering(Product, ["-price"])
+
+
+def test_numbered_placeholders_keep_literal_percent_signs():
+    sql = "SELECT 1 WHERE a = %s AND b LIKE '10%%' AND c = %s"
+
+    assert workload._numbered_placeholders(sql) == (
+        "SELECT 1 WHERE a = $1 AND b LIKE '10%' AND c = $2"
+    )
+    assert workload._placeholder_count(sql) == 2
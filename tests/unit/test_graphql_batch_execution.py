@@ -0,0 +1,59 @@
+import json
+import threading
+
+import pytest
+from django.test import RequestFactory
+
+from rail_django.graphql.views.multi_schema import MultiSchemaGraphQLView
+
+pytestmark = pytest.mark.unit
+
+
+def _make_view(concurrency: int) -> MultiSchemaGraphQLView:
+    view = MultiSchemaGraphQLView()
+    view.batch = True
+    view._configure_batch_concurrency({"batch_max_concurrency": concurrency})
+    return view
+
+
+def _request():
+    return RequestFactory().post("/graphql/gql/", content_type="application/json")
+
+
+def _recording_get_response(view, threads):
+    def get_response(request, data, show_graphiql=False):
+        threads.append(threading.current_thread().name)
+        return json.dumps({"id": data["id"], "payload": {}}), 200
+
+    view.get_response = get_response
+
+
+def test_concurrent_batch_preserves_operation_order():
+    view = _make_view(3)
+    threads = []
+    _recording_get_response(view, threads)
+    data = [{"id": index, "query": "{ hello }"} for index in range(5)]
+
+    response = view._dispatch_concurrent_batch(_request(), data)
+
+    assert response is not None
+    assert [item["id"] for item in json.loads(response.content)] == list(range(5))
+    assert all(name.startswith("rail-graphql-batch") for name in threads)
+
+
+def test_batch_with_mutation_runs_in_order():
+    view = _make_view(3)
+    data = [
+        {"query": "{ hello }"},
+        {"query": "mutation { doSomething }"},
+    ]
+
+    assert view._dispatch_concurrent_batch(_request(), data) is None
+
+
+def test_batch_concurrency_disabled_by_default():
+    view = _make_view(0)
+    data = [{"query": "{ hello }"}, {"query": "{ hello }"}]
+
+    assert view.batch_max_concurrency == 1
+    assert view._dispatch_concurrent_batch(_request(), data) is None
@@ -0,0 +1,81 @@
+import graphene
+import pytest
+from graphql import parse
+
+from rail_django.core.incremental import (
+    execute_incremental,
+    get_incremental_directives,
+    is_deferred_selection,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _Item(graphene.ObjectType):
+    id = graphene.Int()
+    detail = graphene.String()
+
+    def resolve_detail(root, info):
+        return f"detail-{root['id']}"
+
+
+def _build_schema(seen):
+    class Query(graphene.ObjectType):
+        items = graphene.List(_Item)
+        total = graphene.Int()
+
+        def resolve_items(root, info):
+            seen["detail_deferred"] = is_deferred_selection(info, "detail")
+            return [{"id": index} for index in range(3)]
+
+        def resolve_total(root, info):
+            seen["total"] = True
+            return 3
+
+    return graphene.Schema(query=Query, directives=get_incremental_directives()).graphql_schema
+
+
+def _run(query, seen=None):
+    seen = {} if seen is None else seen
+    result, pending = execute_incremental(_build_schema(seen), parse(query))
+    return result, pending, seen
+
+
+def test_deferred_fragment_runs_after_initial_result():
+    result, pending, seen = _run('{ items { id } ... @defer(label: "t") { total } }')
+
+    assert result.data == {"items": [{"id": 0}, {"id": 1}, {"id": 2}]}
+    assert "total" not in seen
+    assert pending.has_next
+
+    payloads = list(pending)
+    assert [(payload.path, payload.label, payload.data, has_next) for payload, has_next in payloads] == [
+        ([], "t", {"total": 3}, False)
+    ]
+
+
+def test_stream_returns_initial_count_then_remaining_items():
+    result, pending, seen = _run(
+        "{ items @stream(initialCount: 1) { id ... @defer { detail } } }"
+    )
+
+    assert result.data == {"items": [{"id": 0}]}
+    assert seen["detail_deferred"] is True
+    payloads = [payload for payload, _has_next in pending]
+    assert payloads[0].path == ["items", 1]
+    assert payloads[0].items == [{"id": 1}, {"id": 2}]
+    assert [payload.data for payload in payloads[1:]] == [
+        {"detail": "detail-0"},
+        {"detail": "detail-1"},
+        {"detail": "detail-2"},
+    ]
+
+
+def test_disabled_directives_execute_inline():
+    result, pending, seen = _run(
+        "{ items @stream(if: false) { id ... @defer(if: false) { detail } } }"
+    )
+
+    assert result.data["items"][2] == {"id": 2, "detail": "detail-2"}
+    assert seen["detail_deferred"] is False
+    assert not pending.has_next
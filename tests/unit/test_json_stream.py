@@ -0,0 +1,78 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from rail_django.utils.json_stream import iter_json
+
+pytestmark = pytest.mark.unit
+
+
+def _encode(value, **kwargs):
+    return b"".join(iter_json(value, **kwargs))
+
+
+def test_iter_json_matches_compact_json_dumps():
+    value = {
+        "data": {
+            "items": [
+                {"id": "1", "name": "café", "price": 1.5, "active": True},
+                {"id": "2", "name": None, "tags": [], "meta": {}},
+            ],
+            "count": 2,
+            "ratio": float("nan"),
+        }
+    }
+
+    expected = json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    assert _encode(value) == expected
+    assert _encode(value, chunk_size=1) == expected
+
+
+def test_iter_json_serializes_rail_scalar_values_as_strings():
+    moment = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    identifier = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+    payload = json.loads(
+        _encode(
+            {
+                "amount": Decimal("10.50"),
+                "at": moment,
+                "day": moment.date(),
+                "id": identifier,
+            }
+        )
+    )
+
+    assert payload == {
+        "amount": "10.50",
+        "at": moment.isoformat(),
+        "day": "2024-01-02",
+        "id": str(identifier),
+    }
+
+
+def test_iter_json_yields_bounded_chunks():
+    value = {"items": [{"id": index} for index in range(1000)]}
+
+    chunks = list(iter_json(value, chunk_size=256))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) < 512 for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == value
+
+
+def test_iter_json_uses_fast_encoder_with_fallback():
+    def encoder(item):
+        if "price" in item:
+            raise TypeError("unsupported")
+        return json.dumps(item, separators=(",", ":")).encode("utf-8")
+
+    value = {"items": [{"id": 1}, {"price": Decimal("2.00")}]}
+
+    assert json.loads(_encode(value, encoder=encoder)) == {
+        "items": [{"id": 1}, {"price": "2.00"}]
+    }
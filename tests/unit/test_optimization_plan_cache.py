@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from graphql import parse
+from graphql.pyutils import Path
+
+from rail_django.core.document_cache import REQUEST_DOCUMENT_ATTR, CachedDocument
+from rail_django.extensions.optimization.config import QueryOptimizationConfig
+from rail_django.extensions.optimization.optimizer import QueryOptimizer
+from rail_django.extensions.optimization.plan_cache import QueryPlanCache
+from test_app.models import Post
+
+pytestmark = pytest.mark.unit
+
+QUERY = "query Posts { posts { title category { name } tags { name } } }"
+
+
+def _info(entry, path=None, context=None):
+    operation = entry.document.definitions[0]
+    if context is None:
+        context = SimpleNamespace(**{REQUEST_DOCUMENT_ATTR: entry})
+    return SimpleNamespace(
+        context=context,
+        operation=operation,
+        fragments={},
+        field_nodes=[operation.selection_set.selections[0]],
+        path=path or Path(None, "posts", "Query"),
+        field_name="posts",
+    )
+
+
+def _entry(query=QUERY, query_hash="hash-1"):
+    return CachedDocument(query_hash=query_hash, document=parse(query))
+
+
+def test_plan_is_built_once_per_document_and_path():
+    optimizer = QueryOptimizer(QueryOptimizationConfig(), "default")
+    entry = _entry()
+
+    with mock.patch.object(
+        optimizer.analyzer, "analyze_query", wraps=optimizer.analyzer.analyze_query
+    ) as analyze:
+        first = optimizer.get_plan(_info(entry), Post)
+        second = optimizer.get_plan(_info(entry), Post)
+
+    assert first is second
+    assert analyze.call_count == 1
+    assert first.select_related == ("category",)
+    assert [plan.lookup for plan in first.prefetch_related] == ["tags"]
+    assert "title" in first.only_fields
+    assert optimizer.plan_cache.get_stats()["hits"] == 1
+
+
+def test_list_indices_share_a_plan_but_other_paths_do_not():
+    optimizer = QueryOptimizer(QueryOptimizationConfig())
+    entry = _entry()
+    root = Path(None, "posts", "Query")
+
+    first = optimizer.get_plan(_info(entry, Path(Path(root, 0, None), "tags", "Post")), Post)
+    second = optimizer.get_plan(_info(entry, Path(Path(root, 3, None), "tags", "Post")), Post)
+    optimizer.get_plan(_info(entry, root), Post)
+
+    assert first is second
+    assert len(optimizer.plan_cache) == 2
+
+
+def test_executions_without_cached_document_are_not_memoized():
+    optimizer = QueryOptimizer(QueryOptimizationConfig())
+    entry = _entry()
+
+    optimizer.get_plan(_info(entry, context=SimpleNamespace()), Post)
+
+    assert len(optimizer.plan_cache) == 0
+
+
+def test_plan_cache_is_bounded():
+    cache = QueryPlanCache(max_size=2)
+    for index in range(3):
+        cache.set(("key", index), object())
+
+    assert len(cache) == 2
+    assert cache.get(("key", 0)) is None
+    assert QueryPlanCache(max_size=0).get_stats()["max_size"] == 0
@@ -47,3 +47,34 @@ def test_optimizer_filters_invalid_prefetch_paths():
 
     assert valid == ["order_items"]
     assert invalid == ["items__tags"]
+
+
+def test_analyzer_maps_camel_case_selections_to_model_paths():
+    analyzer = QueryAnalyzer(QueryOptimizationConfig())
+
+    normalized = analyzer._normalize_model_field_paths(
+        {"items", "pageInfo", "items__orderItems", "items__orderItems__unitPrice"}
+    )
+
+    assert normalized == {"order_items", "order_items__unit_price"}
+
+
+def test_optimizer_plans_nested_prefetch_levels():
+    optimizer = QueryOptimizer(QueryOptimizationConfig())
+    requested_fields = {
+        "name",
+        "order_items",
+        "order_items__unit_price",
+        "order_items__product",
+        "order_items__product__name",
+    }
+
+    plans = optimizer._build_prefetch_plans(
+        Product, requested_fields, ["order_items"], depth=1
+    )
+
+    assert len(plans) == 1
+    plan = plans[0]
+    assert plan.lookup == "order_items"
+    assert plan.select_related == ("product",)
+    assert {"id", "unit_price", "product_id"} <= set(plan.only_fields)
@@ -132,3 +132,102 @@ def test_resolve_total_count_falls_back_to_exact_below_threshold(
     assert total_count == 42
     assert is_estimated is False
     assert queryset.count_calls == 1
+
+
+def test_normalize_count_mode_accepts_count_service_modes(monkeypatch) -> None:
+    monkeypatch.setattr(pagination, "model_version_signals_connected", lambda: True)
+    assert pagination._normalize_count_mode("Cached") == "cached"
+    assert pagination._normalize_count_mode("capped") == "capped"
+    assert pagination._normalize_count_mode("ESTIMATED") == "estimated"
+
+
+def test_cached_count_mode_requires_model_version_signals(monkeypatch) -> None:
+    monkeypatch.setattr(pagination, "model_version_signals_connected", lambda: False)
+    assert pagination._normalize_count_mode("cached") == "exact"
+
+
+@pytest.mark.django_db
+def test_cached_count_is_invalidated_by_writes() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from test_app.models import Category
+
+    Category.objects.create(name="Alpha")
+    Category.objects.create(name="Beta")
+    queryset = Category.objects.filter(name__startswith="A")
+    settings = SimpleNamespace(count_cache_timeout=60)
+
+    def resolve() -> tuple[int, bool]:
+        return pagination._resolve_total_count(
+            queryset, {}, count_mode="cached", has_property_ordering=False, settings=settings
+        )
+
+    assert resolve() == (1, False)
+    with CaptureQueriesContext(connection) as queries:
+        assert resolve() == (1, False)
+    assert len(queries.captured_queries) == 0
+
+    Category.objects.create(name="Another")
+    assert resolve() == (2, False)
+
+
+@pytest.mark.django_db
+def test_cached_count_is_invalidated_by_writes_to_subquery_tables() -> None:
+    from decimal import Decimal
+
+    from django.db.models import Exists, OuterRef
+
+    from rail_django.generators.queries.counting import cached_count
+    from test_app.models import Category, Product
+
+    category = Category.objects.create(name="Garden")
+    queryset = Category.objects.filter(
+        Exists(Product.objects.filter(category=OuterRef("pk")))
+    )
+    assert cached_count(queryset) == 0
+
+    Product.objects.create(name="Hoe", price=Decimal("12"), category=category)
+
+    assert cached_count(queryset) == 1
+
+
+@pytest.mark.django_db
+def test_capped_count_reports_at_least_the_cap() -> None:
+    from test_app.models import Category
+
+    for index in range(5):
+        Category.objects.create(name=f"Category {index}")
+
+    def resolve(cap: int) -> tuple[int, bool]:
+        return pagination._resolve_total_count(
+            Category.objects.all(),
+            {},
+            count_mode="capped",
+            has_property_ordering=False,
+            settings=SimpleNamespace(count_cap=cap),
+        )
+
+    assert resolve(3) == (3, True)
+    assert resolve(10) == (5, False)
+
+
+def test_estimated_mode_uses_explain_for_filtered_queries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queryset = _StubQuerySet(count_value=42)
+    monkeypatch.setattr(
+        pagination, "_can_use_estimated_count", lambda *_args, **_kwargs: False
+    )
+    monkeypatch.setattr(pagination, "explain_row_estimate", lambda *_args: 7_500)
+
+    total_count, is_estimated = pagination._resolve_total_count(
+        queryset,
+        {"where": {"id": {"gt": 1}}},
+        count_mode="estimated",
+        has_property_ordering=False,
+        settings=SimpleNamespace(),
+    )
+
+    assert (total_count, is_estimated) == (7_500, True)
+    assert queryset.count_calls == 0
@@ -3,15 +3,23 @@ Unit tests for persisted query handling.
 """
 
 from hashlib import sha256
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
+import graphene
 import pytest
 from django.core.cache import caches
 from django.test import override_settings
+from graphql import NoUnusedFragmentsRule
 
+from rail_django.core.middleware.performance import QueryComplexityMiddleware
 from rail_django.extensions.persisted_queries import (
     PERSISTED_QUERY_HASH_MISMATCH,
     PERSISTED_QUERY_NOT_FOUND,
     PERSISTED_QUERY_NOT_ALLOWED,
+    REQUEST_PERSISTED_QUERY_ATTR,
+    clear_compiled_persisted_queries,
+    compile_persisted_queries,
     resolve_persisted_query,
 )
 from rail_django.testing import override_rail_settings
@@ -170,3 +178,145 @@ def test_persisted_query_hash_mismatch():
         assert resolution.has_error()
         assert resolution.error_code == PERSISTED_QUERY_HASH_MISMATCH
 
+
+class _PingQuery(graphene.ObjectType):
+    ping = graphene.String()
+
+
+def _patched_registry(schema):
+    builder = Mock()
+    builder.get_schema_version.return_value = 1
+    registry = Mock()
+    registry.get_schema_builder.return_value = builder
+    registry.get_schema_instance.return_value = schema
+    return patch("rail_django.core.registry.schema_registry", registry)
+
+
+def test_compiled_allowlist_resolves_hash_to_compiled_document():
+    query = "{ ping }"
+    sha = _hash(query)
+    invalid = "{ missing }"
+    schema = graphene.Schema(query=_PingQuery)
+    payload = {"extensions": {"persistedQuery": {"sha256Hash": sha}}}
+
+    clear_compiled_persisted_queries()
+    with _patched_registry(schema), override_rail_settings(
+        global_settings={
+            "persisted_query_settings": {
+                "enabled": True,
+                "enforce_allowlist": True,
+                "compile_allowlist": True,
+                "allowlist": {sha: query, _hash(invalid): invalid},
+            }
+        }
+    ):
+        compiled = compile_persisted_queries("test")
+        resolution = resolve_persisted_query(payload, schema_name="test")
+
+    clear_compiled_persisted_queries()
+    assert list(compiled) == [sha]
+    assert compiled[sha].operation_type == "query"
+    assert not resolution.has_error()
+    assert resolution.query == query
+    assert resolution.compiled is compiled[sha]
+
+
+def test_compiled_allowlist_is_reused_until_schema_version_changes():
+    query = "{ ping }"
+    sha = _hash(query)
+    schema = graphene.Schema(query=_PingQuery)
+
+    clear_compiled_persisted_queries()
+    with _patched_registry(schema) as registry, override_rail_settings(
+        global_settings={
+            "persisted_query_settings": {
+                "enabled": True,
+                "compile_allowlist": True,
+                "allowlist": {sha: query},
+            }
+        }
+    ):
+        first = compile_persisted_queries("test")
+        assert compile_persisted_queries("test") is first
+
+        registry.get_schema_builder.return_value.get_schema_version.return_value = 2
+        assert compile_persisted_queries("test") is not first
+
+    clear_compiled_persisted_queries()
+
+
+def test_compiled_allowlist_skips_registry_lookups_while_current():
+    query = "{ ping }"
+    schema = graphene.Schema(query=_PingQuery)
+
+    clear_compiled_persisted_queries()
+    with _patched_registry(schema) as registry, override_rail_settings(
+        global_settings={
+            "persisted_query_settings": {
+                "enabled": True,
+                "compile_allowlist": True,
+                "allowlist": {_hash(query): query},
+            }
+        }
+    ):
+        for _ in range(3):
+            compile_persisted_queries("test")
+
+    clear_compiled_persisted_queries()
+    assert registry.get_schema_instance.call_count == 1
+
+
+def test_compiled_allowlist_validates_with_the_view_rules():
+    query = "{ ping }"
+    sha = _hash(query)
+    schema = graphene.Schema(query=_PingQuery)
+    rules = [NoUnusedFragmentsRule]
+
+    clear_compiled_persisted_queries()
+    with _patched_registry(schema), override_rail_settings(
+        global_settings={
+            "persisted_query_settings": {
+                "enabled": True,
+                "compile_allowlist": True,
+                "allowlist": {sha: query},
+            }
+        }
+    ):
+        compiled = compile_persisted_queries("test", validation_rules=rules)[sha]
+        resolution = resolve_persisted_query(
+            {"extensions": {"persistedQuery": {"sha256Hash": sha}}},
+            schema_name="test",
+            validation_rules=rules,
+        )
+
+    clear_compiled_persisted_queries()
+    assert resolution.compiled is compiled
+    assert compiled.entry.get_validation_errors(schema.graphql_schema, rules) == []
+
+
+def test_complexity_middleware_reuses_compiled_scores():
+    query = "{ ping }"
+    schema = graphene.Schema(query=_PingQuery)
+
+    clear_compiled_persisted_queries()
+    with _patched_registry(schema), override_rail_settings(
+        global_settings={
+            "persisted_query_settings": {
+                "enabled": True,
+                "compile_allowlist": True,
+                "allowlist": {_hash(query): query},
+            }
+        }
+    ):
+        compiled = compile_persisted_queries("test")[_hash(query)]
+    clear_compiled_persisted_queries()
+
+    middleware = QueryComplexityMiddleware()
+    middleware.complexity_analyzer = Mock()
+    context = SimpleNamespace(**{REQUEST_PERSISTED_QUERY_ATTR: compiled})
+
+    assert middleware._analyze_document(context, compiled.document) == (
+        compiled.depth,
+        compiled.complexity,
+    )
+    middleware.complexity_analyzer.analyze_document.assert_not_called()
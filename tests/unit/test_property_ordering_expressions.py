@@ -0,0 +1,94 @@
+"""
+Unit tests for property ordering pushed down to SQL through ORM expressions.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Upper
+from django.test.utils import CaptureQueriesContext
+
+from rail_django.core.decorators import ordering_expression
+from rail_django.core.meta.config import OrderingConfig
+from rail_django.generators.introspector import ModelIntrospector
+from rail_django.generators.queries import ordering
+from rail_django.generators.queries.base import QueryOrderingHelper
+from test_app.models import Category
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+@pytest.fixture
+def category_properties(monkeypatch):
+    @property
+    @ordering_expression(Upper("name"))
+    def shouting_name(self):
+        return self.name.upper()
+
+    @property
+    def labelled_name(self):
+        return f"# {self.name}"
+
+    monkeypatch.setattr(Category, "shouting_name", shouting_name, raising=False)
+    monkeypatch.setattr(Category, "labelled_name", labelled_name, raising=False)
+    ModelIntrospector.clear_cache()
+    yield
+    ModelIntrospector.clear_cache()
+
+
+def _helper(ordering_config, settings=None):
+    query_generator = SimpleNamespace(
+        _normalize_ordering_specs=lambda specs, config: list(specs or []),
+        _apply_count_annotations_for_ordering=lambda qs, model, specs: (qs, specs),
+        _split_order_specs=ordering.split_order_specs,
+        _apply_property_ordering=ordering.apply_property_ordering,
+    )
+    return QueryOrderingHelper(
+        query_generator,
+        Category,
+        ordering_config,
+        settings or SimpleNamespace(max_property_ordering_results=1000),
+    )
+
+
+def test_decorated_property_is_ordered_in_sql(category_properties):
+    for name in ("beta", "Alpha", "gamma"):
+        Category.objects.create(name=name)
+
+    queryset, items, has_prop_ordering, _ = _helper(OrderingConfig()).apply(
+        Category.objects.all(), ["-shouting_name"]
+    )
+
+    assert items is None
+    assert has_prop_ordering is False
+    with CaptureQueriesContext(connection) as queries:
+        names = [category.name for category in queryset]
+    assert names == ["gamma", "beta", "Alpha"]
+    assert "ORDER BY UPPER" in queries.captured_queries[0]["sql"].upper()
+
+
+def test_meta_expressions_take_precedence_and_accept_callables(category_properties):
+    for name in ("bb", "a", "ccc"):
+        Category.objects.create(name=name)
+    config = OrderingConfig(
+        expressions={"labelled_name": lambda: Concat(Value("#"), F("name"))}
+    )
+
+    queryset, items, _, _ = _helper(config).apply(Category.objects.all(), ["labelled_name"])
+
+    assert items is None
+    assert [category.name for category in queryset] == ["a", "bb", "ccc"]
+
+
+def test_properties_without_expression_still_sort_in_python(category_properties):
+    for name in ("b", "a"):
+        Category.objects.create(name=name)
+
+    _, items, has_prop_ordering, _ = _helper(OrderingConfig()).apply(
+        Category.objects.all(), ["labelled_name"]
+    )
+
+    assert has_prop_ordering is True
+    assert [category.name for category in items] == ["a", "b"]
@@ -32,3 +32,66 @@ def test_in_memory_cache_versions_bump():
     assert backend.get_version("schema") == bumped
 
 
+def test_in_memory_cache_evicts_least_recently_used():
+    backend = InMemoryQueryCacheBackend(max_entries=2)
+    backend.set("alpha", 1)
+    backend.set("beta", 2)
+    assert backend.get("alpha") == 1
+    backend.set("gamma", 3)
+
+    assert backend.get("beta") is None
+    assert backend.get("alpha") == 1
+    assert backend.get_stats()["evictions"] == 1
+
+
+def test_in_memory_cache_respects_byte_budget():
+    backend = InMemoryQueryCacheBackend(max_bytes=2048)
+    backend.set("small", "x" * 100)
+    backend.set("huge", "x" * 4096)
+    backend.set("medium", "y" * 1990)
+
+    assert backend.get("huge") is None
+    assert backend.get("small") is None
+    assert backend.get("medium") == "y" * 1990
+    assert backend.get_stats()["bytes"] <= 2048
+
+
+def test_two_tier_cache_serves_hot_entries_locally():
+    from django.core.cache import cache
+
+    from rail_django.extensions.query_cache import TwoTierQueryCacheBackend
+
+    cache.clear()
+    writer = TwoTierQueryCacheBackend(key_prefix="test_two_tier")
+    reader = TwoTierQueryCacheBackend(key_prefix="test_two_tier")
+    writer.set("alpha", {"value": 1})
+
+    assert reader.get("alpha") == {"value": 1}
+    with patch.object(TwoTierQueryCacheBackend, "shared") as shared:
+        assert reader.get("alpha") == {"value": 1}
+        shared.get.assert_not_called()
+    assert reader.get("missing") is None
+
+    stats = reader.get_stats()
+    assert (stats["local_hits"], stats["remote_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_two_tier_cache_refreshes_versions_after_ttl():
+    from django.core.cache import cache
+
+    from rail_django.extensions.query_cache import TwoTierQueryCacheBackend
+
+    cache.clear()
+    first = TwoTierQueryCacheBackend(key_prefix="test_two_tier", version_ttl=5)
+    second = TwoTierQueryCacheBackend(key_prefix="test_two_tier", version_ttl=5)
+    with patch("rail_django.extensions.query_cache.time.time") as now:
+        now.return_value = 1000.0
+        initial = first.get_version("schema")
+        assert second.get_version("schema") == initial
+
+        bumped = first.bump_version("schema")
+        assert first.get_version("schema") == bumped
+        assert second.get_version("schema") == initial
+
+        now.return_value = 1006.0
+        assert second.get_version("schema") == bumped
@@ -0,0 +1,153 @@
+"""
+Unit tests for the indexed quick search backends (SQLite FTS5 path).
+"""
+
+import time
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rail_django.generators.filters import quick_search
+from rail_django.generators.filters.mixins import QuickFilterMixin
+from test_app.models import Category, Product
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_fts5_cache():
+    quick_search._fts5_columns_cache.clear()
+    yield
+    quick_search._fts5_columns_cache.clear()
+
+
+@pytest.fixture
+def products():
+    category = Category.objects.create(name="Outdoor")
+    return [
+        Product.objects.create(name="Running shoes", price=Decimal("80"), category=category),
+        Product.objects.create(name="Trail runner", price=Decimal("95")),
+        Product.objects.create(name="Wool socks", price=Decimal("12")),
+    ]
+
+
+def _names(q):
+    return sorted(Product.objects.filter(q).values_list("name", flat=True))
+
+
+def test_auto_backend_keeps_icontains_without_index(products):
+    assert quick_search.resolve_quick_search_backend(Product) == "icontains"
+    q = QuickFilterMixin().build_quick_filter_q(Product, "hoe", ["name"])
+    assert _names(q) == ["Running shoes"]
+
+
+def test_fts5_index_serves_prefix_search_and_tracks_writes(products):
+    fields = quick_search.get_indexable_fields(Product, ["name", "category__name", "price"])
+    assert [field.name for field in fields] == ["name"]
+
+    created = quick_search.ensure_quick_search_indexes(Product, fields)
+    assert created == [quick_search.fts5_table_name(Product)]
+    assert quick_search.ensure_quick_search_indexes(Product, fields) == []
+    assert quick_search.resolve_quick_search_backend(Product) == "fts5"
+
+    mixin = QuickFilterMixin()
+    with CaptureQueriesContext(connection) as queries:
+        assert _names(mixin.build_quick_filter_q(Product, "run", ["name"])) == [
+            "Running shoes",
+            "Trail runner",
+        ]
+    assert "MATCH" in queries.captured_queries[-1]["sql"]
+    assert _names(mixin.build_quick_filter_q(Product, "trail run", ["name"])) == ["Trail runner"]
+
+    socks = products[2]
+    socks.name = "Running socks"
+    socks.save()
+    products[0].delete()
+    Product.objects.create(name="Runway lamp", price=Decimal("40"))
+    assert _names(mixin.build_quick_filter_q(Product, "run", ["name"])) == [
+        "Running socks",
+        "Runway lamp",
+        "Trail runner",
+    ]
+
+
+def test_unindexed_paths_fall_back_to_icontains(products):
+    fields = quick_search.get_indexable_fields(Product, ["name"])
+    quick_search.ensure_quick_search_indexes(Product, fields)
+
+    q = quick_search.build_text_search_q(Product, "outdo", ["name", "category__name"])
+    assert _names(q) == ["Running shoes"]
+    q = quick_search.build_text_search_q(Product, "run", ["name"], backend="icontains")
+    assert _names(q) == ["Running shoes", "Trail runner"]
+
+
+def test_management_command_creates_rebuilds_and_drops(products, monkeypatch):
+    monkeypatch.setattr(
+        "rail_django.management.commands.manage_quick_search_indexes.get_quick_search_fields",
+        lambda model: quick_search.get_indexable_fields(model, ["name"]),
+    )
+
+    out = StringIO()
+    call_command("manage_quick_search_indexes", "--model", "test_app.Product", stdout=out)
+    assert "Created test_app_product_quick_fts" in out.getvalue()
+    assert _names(quick_search.build_text_search_q(Product, "sock", ["name"])) == ["Wool socks"]
+
+    out = StringIO()
+    call_command("manage_quick_search_indexes", "--model", "test_app.Product", stdout=out)
+    assert "up to date" in out.getvalue()
+
+    out = StringIO()
+    call_command(
+        "manage_quick_search_indexes", "--model", "test_app.Product", "--rebuild", stdout=out
+    )
+    assert "Rebuilt" in out.getvalue()
+
+    out = StringIO()
+    call_command(
+        "manage_quick_search_indexes", "--model", "test_app.Product", "--drop", stdout=out
+    )
+    assert "Dropped" in out.getvalue()
+    assert quick_search.resolve_quick_search_backend(Product) == "icontains"
+
+
+def test_fts5_table_lookup_expires(products, monkeypatch):
+    fields = quick_search.get_indexable_fields(Product, ["name"])
+    quick_search.ensure_quick_search_indexes(Product, fields)
+    assert quick_search.resolve_quick_search_backend(Product) == "fts5"
+
+    # Another process drops the table.
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE {quick_search.fts5_table_name(Product)}")
+    now = time.monotonic()
+    monkeypatch.setattr(
+        quick_search.time, "monotonic", lambda: now + quick_search.FTS5_COLUMNS_TTL + 1
+    )
+
+    assert quick_search.resolve_quick_search_backend(Product) == "icontains"
+    assert _names(quick_search.build_text_search_q(Product, "sock", ["name"])) == ["Wool socks"]
+
+
+def test_postgres_indexes_are_created_concurrently(monkeypatch):
+    cursor = MagicMock()
+    cursor.fetchall.return_value = [(f"{quick_search._index_prefix(Product)}_trgm_stale",)]
+    schema_editor = MagicMock()
+    postgres = MagicMock(vendor="postgresql", in_atomic_block=False)
+    postgres.ops.quote_name = lambda name: f'"{name}"'
+    postgres.cursor.return_value.__enter__.return_value = cursor
+    postgres.introspection.get_constraints.return_value = {}
+    postgres.schema_editor.return_value.__enter__.return_value = schema_editor
+    monkeypatch.setattr(quick_search, "connections", {"default": postgres})
+
+    fields = quick_search.get_indexable_fields(Product, ["name"])
+    created = quick_search.ensure_quick_search_indexes(Product, fields, backend="trigram")
+
+    assert len(created) == 1
+    postgres.schema_editor.assert_called_once_with(atomic=False)
+    assert schema_editor.add_index.call_args.kwargs == {"concurrently": True}
+    executed = [call.args[0] for call in cursor.execute.call_args_list]
+    assert any(sql.startswith("DROP INDEX CONCURRENTLY IF EXISTS") for sql in executed)
@@ -0,0 +1,288 @@
+"""
+Tests for the per-request relation batch loaders.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from graphql import GraphQLError
+
+from rail_django.core.execution import PeerTrackingExecutionContext, add_peers
+from rail_django.generators.introspector import ModelIntrospector
+from rail_django.generators.types import (
+    ForwardObjectLoader,
+    TypeGenerator,
+    get_loader_registry,
+)
+from test_app.models import Attachment, Category, Comment, OrderItem, Post, Product, Profile, Tag
+
+
+@pytest.mark.unit
+class TestRelationDataloaders(TestCase):
+    def setUp(self):
+        ModelIntrospector.clear_cache()
+        self.type_generator = TypeGenerator()
+        self.categories = [Category.objects.create(name=f"Category {i}") for i in range(3)]
+        self.tags = [Tag.objects.create(name=f"Tag {i}") for i in range(3)]
+        self.posts = []
+        for index, category in enumerate(self.categories):
+            post = Post.objects.create(title=f"Post {index}", category=category)
+            post.tags.set(self.tags[: index + 1])
+            self.posts.append(post)
+
+    def _fresh_posts(self, context):
+        posts = list(Post.objects.order_by("pk"))
+        add_peers(context, posts)
+        return posts
+
+    def _resolve_all(self, field_name, instances, context):
+        post_type = self.type_generator.generate_object_type(type(instances[0]))
+        resolver = getattr(post_type, f"resolve_{field_name}")
+        info = SimpleNamespace(context=context)
+        with CaptureQueriesContext(connection) as queries:
+            results = [resolver(instance, info) for instance in instances]
+        return results, len(queries.captured_queries)
+
+    def test_forward_foreign_keys_are_loaded_in_one_query(self):
+        context = SimpleNamespace()
+        posts = self._fresh_posts(context)
+
+        categories, query_count = self._resolve_all("category", posts, context)
+
+        self.assertEqual(query_count, 1)
+        self.assertEqual([c.name for c in categories], ["Category 0", "Category 1", "Category 2"])
+
+    def test_forward_loader_reads_through_the_base_manager(self):
+        class HiddenManager(models.Manager):
+            def get_queryset(self):
+                return super().get_queryset().none()
+
+        hidden = HiddenManager()
+        hidden.model = Category
+        loader = ForwardObjectLoader(
+            Category,
+            Post._meta.get_field("category"),
+            tenant_field="name",
+            tenant_id="another tenant",
+        )
+
+        with patch.object(Category._meta, "default_manager", hidden):
+            loaded = loader.batch_load([self.categories[0].pk])
+
+        self.assertEqual(loaded, {self.categories[0].pk: self.categories[0]})
+
+    def test_many_to_many_is_loaded_through_the_join_table(self):
+        context = SimpleNamespace()
+        posts = self._fresh_posts(context)
+
+        tags, query_count = self._resolve_all("tags", posts, context)
+
+        self.assertEqual(query_count, 2)
+        self.assertEqual([len(post_tags) for post_tags in tags], [1, 2, 3])
+
+    def test_reverse_many_to_many_is_batched(self):
+        context = SimpleNamespace()
+        tags = list(Tag.objects.order_by("pk"))
+        add_peers(context, tags)
+
+        posts, query_count = self._resolve_all("posts", tags, context)
+
+        self.assertEqual(query_count, 2)
+        self.assertEqual([len(tag_posts) for tag_posts in posts], [3, 2, 1])
+
+    def test_reverse_foreign_keys_are_batched_and_filters_bypass_the_loader(self):
+        context = SimpleNamespace()
+        categories = list(Category.objects.order_by("pk"))
+        add_peers(context, categories)
+
+        posts, query_count = self._resolve_all("posts", categories, context)
+        self.assertEqual(query_count, 1)
+        self.assertEqual([[p.title for p in group] for group in posts], [["Post 0"], ["Post 1"], ["Post 2"]])
+
+        category_type = self.type_generator.generate_object_type(Category)
+        filtered = category_type.resolve_posts(
+            categories[0], SimpleNamespace(context=context), filters={"title": "Nope"}
+        )
+        self.assertEqual(list(filtered), [])
+
+    def test_generic_relations_are_batched_per_content_type(self):
+        product_ct = ContentType.objects.get_for_model(Product)
+        post_ct = ContentType.objects.get_for_model(Post)
+        products = [
+            Product.objects.create(name=f"Product {i}", price=Decimal("1.00"))
+            for i in range(2)
+        ]
+        for product in products:
+            Attachment.objects.create(name=f"{product.name}.pdf", content_type=product_ct, object_id=product.pk)
+        Attachment.objects.create(name="post.pdf", content_type=post_ct, object_id=products[0].pk)
+        context = SimpleNamespace()
+        add_peers(context, products)
+
+        attachments, query_count = self._resolve_all("attachments", products, context)
+
+        self.assertEqual(query_count, 1)
+        self.assertEqual(
+            [[a.name for a in group] for group in attachments],
+            [["Product 0.pdf"], ["Product 1.pdf"]],
+        )
+
+    def test_reverse_one_to_one_is_batched(self):
+        users = [
+            get_user_model().objects.create_user(username=f"user_{i}", password="password")
+            for i in range(3)
+        ]
+        Profile.objects.create(user=users[0], bio="first")
+        Profile.objects.create(user=users[2], bio="third")
+        context = SimpleNamespace()
+        users = list(get_user_model().objects.filter(pk__in=[u.pk for u in users]).order_by("pk"))
+        add_peers(context, users)
+
+        profiles, query_count = self._resolve_all("profile", users, context)
+
+        self.assertEqual(query_count, 1)
+        self.assertEqual([p.bio if p else None for p in profiles], ["first", None, "third"])
+
+    def test_loaders_are_shared_per_request(self):
+        context = SimpleNamespace()
+        registry = get_loader_registry(context)
+
+        self.assertIs(get_loader_registry(context), registry)
+        self.assertIsNot(get_loader_registry(SimpleNamespace()), registry)
+
+    def test_tenant_lookup_errors_fall_back_to_the_scoped_queryset(self):
+        context = SimpleNamespace()
+        posts = self._fresh_posts(context)
+        post_type = self.type_generator.generate_object_type(Post)
+        broken = patch(
+            "rail_django.extensions.multitenancy.applicator.get_multitenancy_settings",
+            side_effect=RuntimeError("broken tenant settings"),
+        )
+
+        with broken, patch(
+            "rail_django.extensions.multitenancy.get_multitenancy_settings",
+            side_effect=RuntimeError("broken tenant settings"),
+        ):
+            with self.assertRaisesMessage(GraphQLError, "Tenant scope enforcement failed"):
+                post_type.resolve_tags(posts[0], SimpleNamespace(context=context))
+
+    def test_lists_from_custom_root_fields_are_batched(self):
+        self.type_generator.generate_object_type(Category)
+        self.type_generator.generate_object_type(Tag)
+        post_type = self.type_generator.generate_object_type(Post)
+        query_type = type(
+            "Query",
+            (graphene.ObjectType,),
+            {
+                "posts": graphene.List(post_type),
+                "resolve_posts": lambda root, info: Post.objects.order_by("pk"),
+            },
+        )
+        schema = graphene.Schema(query=query_type)
+
+        with CaptureQueriesContext(connection) as queries:
+            result = schema.execute(
+                "{ posts { title category { name } tags { name } } }",
+                context_value=SimpleNamespace(),
+                execution_context_class=PeerTrackingExecutionContext,
+            )
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["posts"]), 3)
+        self.assertEqual(len(queries.captured_queries), 4)
+
+    def test_relation_counts_use_one_grouped_query(self):
+        context = SimpleNamespace()
+        posts = self._fresh_posts(context)
+        categories = list(Category.objects.order_by("pk"))
+        add_peers(context, categories)
+
+        tag_counts, tag_query_count = self._resolve_all("tags_count", posts, context)
+        post_counts, post_query_count = self._resolve_all("posts_count", categories, context)
+
+        self.assertEqual((tag_query_count, post_query_count), (1, 1))
+        self.assertEqual(tag_counts, [1, 2, 3])
+        self.assertEqual(post_counts, [1, 1, 1])
+
+    def test_relation_stats_use_one_grouped_query_per_filter(self):
+        products = [
+            Product.objects.create(name=f"Product {i}", price=Decimal("1.00"))
+            for i in range(3)
+        ]
+        for quantity in (1, 2, 3):
+            OrderItem.objects.create(product=products[0], quantity=quantity, unit_price=Decimal("2.00"))
+        OrderItem.objects.create(product=products[1], quantity=5, unit_price=Decimal("4.00"))
+        context = SimpleNamespace()
+        add_peers(context, products)
+
+        stats, query_count = self._resolve_all("order_items_stats", products, context)
+
+        self.assertEqual(query_count, 1)
+        self.assertEqual([s["total_count"] for s in stats], [3, 1, 0])
+        self.assertEqual([s["quantity_sum"] for s in stats], [6, 5, 0])
+        self.assertIsNone(stats[2]["quantity_avg"])
+
+        product_type = self.type_generator.generate_object_type(Product)
+        info = SimpleNamespace(context=context)
+        with CaptureQueriesContext(connection) as queries:
+            filtered = [
+                product_type.resolve_order_items_stats(product, info, filters={"quantity__gt": 1})
+                for product in products
+            ]
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertEqual([s["total_count"] for s in filtered], [2, 1, 0])
+
+    def test_limited_and_ordered_relation_lists_use_one_windowed_query(self):
+        for post in self.posts:
+            for index in range(4):
+                Comment.objects.create(post=post, content=f"{post.title} comment {index}")
+        context = SimpleNamespace()
+        posts = self._fresh_posts(context)
+        post_type = self.type_generator.generate_object_type(Post)
+        info = SimpleNamespace(context=context)
+
+        with CaptureQueriesContext(connection) as queries:
+            latest = [
+                post_type.resolve_comments(post, info, limit=2, order_by=["-id"])
+                for post in posts
+            ]
+
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertIn("ROW_NUMBER", queries.captured_queries[0]["sql"].upper())
+        self.assertEqual(
+            [[c.content for c in group] for group in latest],
+            [[f"{post.title} comment 3", f"{post.title} comment 2"] for post in posts],
+        )
+
+    def test_filtered_many_to_many_lists_are_batched(self):
+        context = SimpleNamespace()
+        posts = self._fresh_posts(context)
+        post_type = self.type_generator.generate_object_type(Post)
+        info = SimpleNamespace(context=context)
+
+        with CaptureQueriesContext(connection) as queries:
+            tags = [
+                post_type.resolve_tags(post, info, filters={"name": "Tag 1"}, order_by=["name"])
+                for post in posts
+            ]
+
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertEqual([[t.name for t in group] for group in tags], [[], ["Tag 1"], ["Tag 1"]])
+
+    def test_relation_list_arguments_are_validated(self):
+        context = SimpleNamespace()
+        posts = self._fresh_posts(context)
+        post_type = self.type_generator.generate_object_type(Post)
+        info = SimpleNamespace(context=context)
+
+        with self.assertRaises(GraphQLError):
+            post_type.resolve_comments(posts[0], info, limit=-1)
+        with self.assertRaises(GraphQLError):
+            post_type.resolve_comments(posts[0], info, order_by=["missing"])
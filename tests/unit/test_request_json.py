@@ -0,0 +1,67 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from django.test import RequestFactory
+
+from rail_django.testing import override_rail_settings
+from rail_django.utils.request import get_json_decoder, get_request_json
+
+pytestmark = pytest.mark.unit
+
+
+def _post(payload):
+    return RequestFactory().post(
+        "/graphql/gql/", data=json.dumps(payload), content_type="application/json"
+    )
+
+
+def test_request_json_is_decoded_once():
+    request = _post({"query": "{ hello }"})
+
+    with patch(
+        "rail_django.utils.request._default_json_loads",
+        wraps=lambda raw: json.loads(raw.decode("utf-8")),
+    ) as loads_mock:
+        first = get_request_json(request)
+        first["query"] = "{ other }"
+        second = get_request_json(request)
+
+    assert loads_mock.call_count == 1
+    assert second == {"query": "{ other }"}
+
+
+def test_request_json_redecodes_replaced_body():
+    request = _post({"query": "{ hello }"})
+    get_request_json(request)
+
+    request._body = json.dumps({"query": "{ other }"}).encode("utf-8")
+
+    assert get_request_json(request) == {"query": "{ other }"}
+
+
+def test_request_json_invalid_body_raises_value_error():
+    request = RequestFactory().post(
+        "/graphql/gql/", data="{not json", content_type="application/json"
+    )
+
+    with pytest.raises(ValueError):
+        get_request_json(request)
+    with pytest.raises(ValueError):
+        get_request_json(request)
+
+
+def test_json_decoder_is_pluggable():
+    with override_rail_settings(
+        global_settings={"performance_settings": {"json_decoder": "json.loads"}}
+    ):
+        assert get_json_decoder() is json.loads
+
+    with override_rail_settings(
+        global_settings={
+            "performance_settings": {"json_decoder": "missing_module.loads"}
+        }
+    ):
+        decoder = get_json_decoder()
+
+    assert decoder(b'{"a": 1}') == {"a": 1}
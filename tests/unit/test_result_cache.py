@@ -0,0 +1,155 @@
+"""
+Unit tests for the model-dependency-tracked query result cache.
+"""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from graphene_django import DjangoObjectType
+
+from rail_django.core import model_versions, services
+from rail_django.core.model_versions import (
+    batched_model_version_bumps,
+    clear_local_model_versions,
+    get_model_version,
+    get_model_version_map,
+    model_version_signals_required,
+)
+from rail_django.extensions.optimization import optimize_query
+from rail_django.extensions.query_cache import (
+    InMemoryQueryCacheBackend,
+    TwoTierQueryCacheBackend,
+)
+from test_app.models import Category, Product, Tag
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+class ResultCacheCategoryType(DjangoObjectType):
+    class Meta:
+        model = Category
+        fields = ("id", "name")
+
+
+class ResultCacheProductType(DjangoObjectType):
+    class Meta:
+        model = Product
+        fields = ("id", "name", "category")
+
+
+class Query(graphene.ObjectType):
+    products = graphene.List(ResultCacheProductType)
+
+    @staticmethod
+    @optimize_query(enable_caching=True)
+    def resolve_products(root, info):
+        return list(Product.objects.select_related("category").order_by("name"))
+
+
+schema = graphene.Schema(query=Query)
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = InMemoryQueryCacheBackend()
+    monkeypatch.setattr(services, "_query_cache_factory", lambda schema_name: backend)
+    return backend
+
+
+@pytest.fixture
+def category():
+    category = Category.objects.create(name="Garden")
+    Product.objects.create(name="Hoe", price=Decimal("12"), category=category)
+    Product.objects.create(name="Rake", price=Decimal("15"), category=category)
+    return category
+
+
+def _run(query="{ products { name category { name } } }"):
+    result = schema.execute(query)
+    assert result.errors is None
+    return result.data["products"]
+
+
+def test_repeated_query_is_served_without_sql(backend, category):
+    first = _run()
+    with CaptureQueriesContext(connection) as queries:
+        assert _run() == first
+    assert len(queries) == 0
+
+
+def test_write_to_a_joined_model_invalidates_the_entry(backend, category):
+    assert _run()[0]["category"]["name"] == "Garden"
+
+    category.name = "Yard"
+    category.save()
+
+    assert [item["category"]["name"] for item in _run()] == ["Yard", "Yard"]
+
+
+def test_write_to_an_unrelated_model_keeps_the_entry(backend, category):
+    _run()
+    Tag.objects.create(name="unrelated")
+    with CaptureQueriesContext(connection) as queries:
+        _run()
+    assert len(queries) == 0
+
+
+def test_batched_bumps_collapse_to_one_per_model():
+    before = get_model_version(Tag)
+    with batched_model_version_bumps():
+        Tag.objects.create(name="a")
+        Tag.objects.create(name="b")
+        assert get_model_version(Tag) == before
+    assert get_model_version(Tag) != before
+
+
+def test_model_version_signals_are_required_only_by_version_keyed_features(settings):
+    settings.RAIL_DJANGO_GRAPHQL = {"performance_settings": {"enable_query_caching": False}}
+    settings.RAIL_DJANGO_GRAPHQL_SCHEMAS = {}
+    assert model_version_signals_required() is False
+
+    settings.RAIL_DJANGO_GRAPHQL_SCHEMAS = {
+        "reports": {"query_settings": {"default_count_mode": "cached"}}
+    }
+    assert model_version_signals_required() is True
+    assert model_version_signals_required({"performance_settings": {"http_conditional_caching": True}})
+
+
+def test_model_versions_are_kept_locally_for_max_age():
+    clear_local_model_versions()
+    get_model_version_map([Product, Category], max_age=60)
+
+    with patch.object(model_versions.cache, "get_many") as get_many:
+        versions = get_model_version_map([Product, Category], max_age=60)
+        get_model_version_map([Product])
+
+    assert get_many.call_count == 1
+    assert versions == get_model_version_map([Product, Category])
+
+
+def test_local_model_versions_see_bumps_from_this_process():
+    clear_local_model_versions()
+    before = get_model_version_map([Tag], max_age=60)
+
+    Tag.objects.create(name="bumped")
+
+    with patch.object(model_versions.cache, "get_many") as get_many:
+        after = get_model_version_map([Tag], max_age=60)
+    get_many.assert_not_called()
+    assert after != before
+    assert after == get_model_version_map([Tag])
+
+
+def test_two_tier_backend_trusts_model_versions_for_its_version_ttl(monkeypatch, category):
+    backend = TwoTierQueryCacheBackend(version_ttl=60)
+    monkeypatch.setattr(services, "_query_cache_factory", lambda schema_name: backend)
+    clear_local_model_versions()
+    _run()
+
+    with patch.object(model_versions.cache, "get_many") as get_many:
+        _run()
+    get_many.assert_not_called()
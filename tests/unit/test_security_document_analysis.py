@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import graphene
+import pytest
+
+from rail_django.core.document_cache import get_document_cache
+from rail_django.core.performance import QueryComplexityAnalyzer
+from rail_django.security.graphql import GraphQLSecurityAnalyzer, SecurityConfig
+
+pytestmark = pytest.mark.unit
+
+
+class _Item(graphene.ObjectType):
+    id = graphene.ID()
+    name = graphene.String()
+
+
+class _Query(graphene.ObjectType):
+    items = graphene.List(_Item, limit=graphene.Int())
+
+
+_SCHEMA = graphene.Schema(query=_Query).graphql_schema
+
+
+def _document(query: str):
+    return get_document_cache().get_document(query).document
+
+
+def test_security_analysis_is_memoized_per_document():
+    analyzer = GraphQLSecurityAnalyzer(SecurityConfig())
+    document = _document("query Items { items(limit: 50) { id name } }")
+
+    with patch.object(
+        analyzer,
+        "_build_document_analysis",
+        wraps=analyzer._build_document_analysis,
+    ) as build_mock:
+        first = analyzer.analyze_query(document, _SCHEMA)
+        second = analyzer.analyze_query(document, _SCHEMA)
+
+    assert build_mock.call_count == 1
+    assert first.complexity == second.complexity
+    assert first.depth == 2
+    assert first.fields == ["items", "items.id", "items.name"]
+    assert first.blocked_reasons is not second.blocked_reasons
+
+
+def test_security_analysis_evaluates_variable_list_sizes_per_request():
+    analyzer = GraphQLSecurityAnalyzer(SecurityConfig())
+    document = _document(
+        "query Items($limit: Int) { items(limit: $limit) { id name } }"
+    )
+
+    small = analyzer.analyze_query(document, _SCHEMA, variables={"limit": 10})
+    large = analyzer.analyze_query(document, _SCHEMA, variables={"limit": 100})
+    missing = analyzer.analyze_query(document, _SCHEMA)
+
+    assert small.complexity < missing.complexity < large.complexity
+
+
+def test_complexity_analyzer_memoizes_document_analysis():
+    analyzer = QueryComplexityAnalyzer()
+    document = _document("{ items { id name } }")
+
+    with patch.object(
+        analyzer, "_visit_document", wraps=analyzer._visit_document
+    ) as visit_mock:
+        assert analyzer.analyze_document(document) == analyzer.analyze_document(
+            document
+        )
+
+    assert visit_mock.call_count == 1
@@ -0,0 +1,91 @@
+"""
+Unit tests for single-flight recomputation and stale-while-revalidate entries.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from rail_django.core.single_flight import SingleFlight, pack_entry, unpack_entry
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_entries_turn_stale_after_timeout_but_are_kept():
+    with patch("rail_django.core.single_flight.time.time") as now:
+        now.return_value = 1000.0
+        entry, storage_timeout = pack_entry({"rows": []}, 60, stale_ttl=30)
+        assert storage_timeout == 90
+        assert unpack_entry(entry) == ({"rows": []}, True)
+
+        now.return_value = 1061.0
+        assert unpack_entry(entry) == ({"rows": []}, False)
+
+    assert unpack_entry({"legacy": True}) == ({"legacy": True}, True)
+    assert unpack_entry(None) is None
+
+
+def test_concurrent_misses_compute_once():
+    flight = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        cache.set("value", "computed")
+        return "computed"
+
+    def lookup():
+        value = cache.get("value")
+        return (value, True) if value is not None else None
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.run("k", compute, lookup)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["computed"] * 8
+    assert len(calls) == 1
+
+
+def test_stale_value_is_served_while_another_worker_holds_the_lease():
+    flight = SingleFlight()
+    cache.add(flight._lease_key("k"), "other-worker", 30)
+
+    result = flight.run(
+        "k",
+        lambda: pytest.fail("must not recompute"),
+        lambda: ("stale", False),
+    )
+
+    assert result == "stale"
+    assert flight.get_stats()["stale_served"] == 1
+
+
+def test_waits_for_the_lease_holder_result():
+    flight = SingleFlight(poll_interval=0.01)
+    cache.add(flight._lease_key("k"), "other-worker", 30)
+    threading.Timer(0.1, lambda: cache.set("value", "from-other-worker")).start()
+
+    def lookup():
+        value = cache.get("value")
+        return (value, True) if value is not None else None
+
+    result = flight.run("k", lambda: pytest.fail("must not recompute"), lookup)
+
+    assert result == "from-other-worker"